@@ -526,6 +526,24 @@ def kubernetes_manager(config_manager: ConfigManager):
         raise InfrastructureError(f"Failed to initialize Kubernetes manager: {e}")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def cluster_snapshot_services() -> Generator[None, None, None]:
+    """
+    Stop the shared cluster snapshot services at the end of the session.
+    
+    Services are created on first use by fixtures, job verification and the
+    load testers; their background refresher threads keep listing the
+    cluster until stopped.
+    
+    Yields:
+        None
+    """
+    yield
+    
+    from src.infrastructure.cluster_snapshot import shutdown_cluster_snapshot_services
+    shutdown_cluster_snapshot_services()
+
+
 @pytest.fixture(scope="session")
 def ssh_manager(config_manager: ConfigManager):
     """
@@ -1067,12 +1085,24 @@ def pod_monitor(request, config_manager):
         logger.info("REAL-TIME POD MONITORING: Starting...")
         logger.info("=" * 80)
         
+        # gRPC job pods are discovered from the shared cluster snapshot when
+        # Kubernetes access is available (same refresh as the load fixtures)
+        cluster_snapshots = None
+        try:
+            from src.infrastructure.cluster_snapshot import get_cluster_snapshot_service
+            cluster_snapshots = get_cluster_snapshot_service(
+                request.getfixturevalue("kubernetes_manager"), namespace
+            )
+        except (Exception, pytest.skip.Exception) as e:
+            logger.debug(f"Cluster snapshot not available for pod monitoring: {e}")
+        
         # Initialize monitor
         monitor = PodLogMonitor(
             ssh_host=ssh_host,
             ssh_user=ssh_user,
             ssh_password=ssh_password,
-            namespace=namespace
+            namespace=namespace,
+            cluster_snapshots=cluster_snapshots
         )
         
         # Connect
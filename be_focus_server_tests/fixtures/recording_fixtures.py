@@ -22,15 +22,18 @@ Author: QA Automation Architect
 Date: 2025-12-01
 """
 
+import bisect
 import pytest
 import logging
+import math
+import random
 import time
 import pymongo
 import threading
 import socket
 from datetime import datetime, timedelta, timezone
 from typing import List, Tuple, Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # Thread-safe lock for MongoDB tunnel operations
 _mongodb_tunnel_lock = threading.Lock()
@@ -101,11 +104,77 @@ class Recording:
         return (self.start_time, self.start_time + actual_duration)
 
 
+class RecordingIndex:
+    """
+    Duration index over a list of recordings.
+    
+    Recordings are sorted by duration; for every position the earliest list
+    position among the recordings at least that long is precomputed, so
+    "first recording (in list order) of at least N seconds" and random window
+    sampling are a binary search instead of a scan.
+    """
+    
+    def __init__(self, recordings: List[Recording]):
+        self.recordings = recordings
+        order = sorted(range(len(recordings)), key=lambda i: recordings[i].end_time_ms - recordings[i].start_time_ms)
+        self._order = order
+        self._durations_ms = [recordings[i].end_time_ms - recordings[i].start_time_ms for i in order]
+        # Same float as Recording.duration_seconds, so the bisection agrees
+        # exactly with `duration_seconds >= min_duration_seconds`
+        self._durations_s = [duration_ms / 1000 for duration_ms in self._durations_ms]
+        
+        # _first_position[k] = min list position among _order[k:]
+        self._first_position = list(order)
+        for k in range(len(order) - 2, -1, -1):
+            self._first_position[k] = min(self._first_position[k], self._first_position[k + 1])
+    
+    def __len__(self) -> int:
+        return len(self.recordings)
+    
+    def _eligible_from(self, min_duration_seconds: float) -> int:
+        """Index into the duration order of the shortest recording of at least min_duration_seconds."""
+        return bisect.bisect_left(self._durations_s, min_duration_seconds)
+    
+    def first_with_min_duration(self, min_duration_seconds: float) -> Optional[Recording]:
+        """First recording in list order lasting at least min_duration_seconds."""
+        k = self._eligible_from(min_duration_seconds)
+        if k == len(self._order):
+            return None
+        return self.recordings[self._first_position[k]]
+    
+    def count_with_min_duration(self, min_duration_seconds: float) -> int:
+        """Number of recordings lasting at least min_duration_seconds."""
+        return len(self._order) - self._eligible_from(min_duration_seconds)
+    
+    def sample_window(self, duration_seconds: float, rng: Optional[random.Random] = None) -> Optional[Tuple[int, int]]:
+        """
+        Random window of duration_seconds inside a random recording that is long enough.
+        
+        Args:
+            duration_seconds: Window length
+            rng: Random generator (default: module random), seed it for reproducible runs
+            
+        Returns:
+            (start_time_ms, end_time_ms), or None if no recording is long enough
+        """
+        rng = rng or random
+        k = self._eligible_from(duration_seconds)
+        if k == len(self._order):
+            return None
+        position = rng.randrange(k, len(self._order))
+        recording = self.recordings[self._order[position]]
+        # A recording within a millisecond of duration_seconds is used whole
+        window_ms = min(math.ceil(duration_seconds * 1000), self._durations_ms[position])
+        start_ms = rng.randint(recording.start_time_ms, recording.end_time_ms - window_ms)
+        return (start_ms, start_ms + window_ms)
+
+
 @dataclass
 class RecordingsInfo:
     """Information about available recordings in MongoDB."""
     recordings: List[Recording]
     query_time: datetime
+    _index: Optional[RecordingIndex] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def has_recordings(self) -> bool:
@@ -132,10 +201,18 @@ class RecordingsInfo:
         Returns:
             Recording object or None if no suitable recording found
         """
-        for recording in self.recordings:
-            if recording.duration_seconds >= min_duration_seconds:
-                return recording
-        return None
+        return self.index.first_with_min_duration(min_duration_seconds)
+    
+    @property
+    def index(self) -> RecordingIndex:
+        """Duration index of the recordings (built on first use)."""
+        if self._index is None or self._index.recordings is not self.recordings:
+            self._index = RecordingIndex(self.recordings)
+        return self._index
+    
+    def sample_window(self, duration_seconds: float, rng: Optional[random.Random] = None) -> Optional[Tuple[int, int]]:
+        """Random (start_time_ms, end_time_ms) window of duration_seconds (see RecordingIndex.sample_window)."""
+        return self.index.sample_window(duration_seconds, rng)
     
     def get_longest_recording(self) -> Optional[Recording]:
         """Get the longest available recording."""
@@ -482,6 +559,179 @@ def _cleanup_mongodb_ssh_tunnel():
 # MongoDB Direct Query Functions
 # =============================================================================
 
+def _connect_recordings_db(config_manager) -> Tuple[Any, Any]:
+    """
+    Connect to the recordings MongoDB: through the SSH tunnel when it can be
+    set up, directly otherwise.
+    
+    Returns:
+        (client, database); the caller closes the client
+        
+    Raises:
+        Exception: If MongoDB cannot be reached
+    """
+    # Setup SSH tunnel for MongoDB
+    tunnel_setup = _setup_mongodb_ssh_tunnel(config_manager)
+    use_tunnel = tunnel_setup
+    
+    # Get MongoDB config
+    mongo_config = config_manager.get_database_config()
+    
+    # Determine connection host and port
+    if use_tunnel:
+        # Use tunnel manager to ensure healthy connection
+        manager = _get_mongodb_tunnel_manager(config_manager)
+        if not manager.ensure_healthy():
+            logger.warning("MongoDB tunnel unhealthy, falling back to direct connection")
+            use_tunnel = False
+            mongo_host = mongo_config["host"]
+            mongo_port = mongo_config["port"]
+        else:
+            # Port-forward runs on remote host with --address 0.0.0.0
+            # So we connect to the remote host, not localhost
+            mongo_host = manager.get_connection_host()
+            mongo_port = mongo_config.get("port", 27017)
+            logger.info(f"Using SSH tunnel: connecting to {mongo_host}:{mongo_port} (port-forward on remote host)")
+    else:
+        # Direct connection (fallback)
+        mongo_host = mongo_config["host"]
+        mongo_port = mongo_config["port"]
+        logger.info(f"Using direct connection: {mongo_host}:{mongo_port}")
+    
+    # Connect to MongoDB with retry logic
+    client = None
+    max_retries = 2
+    
+    for attempt in range(max_retries):
+        try:
+            logger.debug(f"MongoDB connection attempt {attempt + 1}/{max_retries} to {mongo_host}:{mongo_port}")
+            client = pymongo.MongoClient(
+                host=mongo_host,
+                port=mongo_port,
+                username=mongo_config["username"],
+                password=mongo_config["password"],
+                authSource=mongo_config.get("auth_source", "prisma"),
+                serverSelectionTimeoutMS=10000,
+                connectTimeoutMS=10000,
+                socketTimeoutMS=30000
+            )
+            
+            # Test connection
+            client.admin.command('ping')
+            break  # Success
+            
+        except Exception as e:
+            logger.warning(f"MongoDB connection attempt {attempt + 1} failed: {e}")
+            if client:
+                try:
+                    client.close()
+                except Exception:
+                    pass
+                client = None
+            
+            # If tunnel was used and failed, try direct connection as fallback
+            if attempt == 0 and use_tunnel:
+                logger.info("Tunnel connection failed, trying direct connection as fallback...")
+                mongo_host = mongo_config["host"]
+                mongo_port = mongo_config["port"]
+                use_tunnel = False
+            elif attempt == max_retries - 1:
+                raise  # Re-raise on last attempt
+    
+    if not client:
+        raise Exception("Failed to connect to MongoDB after all retry attempts")
+    
+    # Get database
+    db_name = mongo_config.get("database", "prisma")
+    db = client[db_name]
+    
+    logger.info(f"✅ Connected to MongoDB: {mongo_host}:{mongo_port}/{db_name}")
+    
+    return client, db
+
+
+def _environment_guids(db, current_env: str) -> List[str]:
+    """
+    GUIDs of the recordings collections of an environment (from base_paths).
+    
+    CRITICAL: Each environment has its own GUIDs/collections:
+      - kefar_saba: /prisma/root/recordings/segy → 24774bcb-a6f6-4e23-aa49-c100ad717bf0
+      - staging: /prisma/root/recordings → 25b4875f-5785-4b24-8895-121039474bcd, 873ea296-a3a3-4c22-a880-608766f004cd
+    We MUST query only the GUIDs for the current environment, NOT mix data from different environments!
+    """
+    base_paths = db["base_paths"]
+    
+    # Map environment to base_path patterns
+    # Each environment has specific base_path patterns that identify its collections
+    env_base_paths = {
+        "staging": ["/prisma/root/recordings"],
+        "kefar_saba": ["/prisma/root/recordings/segy"],
+        "production": ["/prisma/root/recordings/segy"],  # kefar_saba is alias for production
+    }
+    
+    # Get base_path patterns for current environment
+    target_base_paths = env_base_paths.get(current_env, [])
+    
+    if not target_base_paths:
+        logger.warning(f"Unknown environment '{current_env}', trying all base_paths")
+        target_base_paths = ["/prisma/root/recordings", "/prisma/root/recordings/segy"]
+    
+    logger.info(f"Looking for base_paths for environment '{current_env}': {target_base_paths}")
+    
+    # Find base_paths documents for current environment ONLY
+    env_base_path_docs = []
+    for base_path_pattern in target_base_paths:
+        docs = list(base_paths.find({
+            "base_path": base_path_pattern,
+            "is_archive": False
+        }))
+        env_base_path_docs.extend(docs)
+    
+    if not env_base_path_docs:
+        # Log all available base_paths for debugging
+        all_docs = list(base_paths.find({"is_archive": False}))
+        available_paths = [d.get('base_path', 'N/A') for d in all_docs]
+        logger.warning(f"No base_paths documents found for environment '{current_env}'. Available paths: {available_paths}")
+        return []
+    
+    # Extract GUIDs ONLY from current environment's base_paths
+    guids = []
+    for doc in env_base_path_docs:
+        guid = doc.get("guid")
+        if not guid:
+            guid = doc.get("_id")
+            if isinstance(guid, dict):
+                guid = str(guid)
+        
+        if guid:
+            guid_str = str(guid)
+            # Only add GUIDs that look like valid UUIDs (format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx)
+            if len(guid_str) == 36 and guid_str.count('-') == 4:
+                guids.append(guid_str)
+                base_path_val = doc.get('base_path', 'N/A')
+                logger.info(f"Found GUID for environment '{current_env}' from base_path '{base_path_val}': {guid_str}")
+    
+    if not guids:
+        logger.warning(f"No valid GUIDs found for environment '{current_env}'")
+    
+    return guids
+
+
+def _to_epoch_ms(value: Any) -> int:
+    """
+    Convert a MongoDB timestamp to epoch milliseconds.
+    
+    IMPORTANT: MongoDB stores datetimes as naive UTC, but Python's timestamp()
+    assumes local timezone. We need to treat the datetime as UTC explicitly.
+    """
+    if isinstance(value, datetime):
+        # Treat naive datetime as UTC (MongoDB stores UTC)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+    return int(value)
+
+
 def fetch_recordings_from_mongodb(
     config_manager,
     max_recordings: int = 100,
@@ -516,149 +766,18 @@ def fetch_recordings_from_mongodb(
     """
     logger.info(f"Querying MongoDB directly for ALL recordings in time range: last {weeks_back} weeks (no filters)...")
     
-    # Setup SSH tunnel for MongoDB
-    tunnel_setup = _setup_mongodb_ssh_tunnel(config_manager)
-    use_tunnel = tunnel_setup
-    
     # MongoDB client - will be closed in finally block
     client = None
     
     try:
-        # Get MongoDB config
-        mongo_config = config_manager.get_database_config()
-        
-        # Determine connection host and port
-        if use_tunnel:
-            # Use tunnel manager to ensure healthy connection
-            manager = _get_mongodb_tunnel_manager(config_manager)
-            if not manager.ensure_healthy():
-                logger.warning("MongoDB tunnel unhealthy, falling back to direct connection")
-                use_tunnel = False
-                mongo_host = mongo_config["host"]
-                mongo_port = mongo_config["port"]
-            else:
-                # Port-forward runs on remote host with --address 0.0.0.0
-                # So we connect to the remote host, not localhost
-                mongo_host = manager.get_connection_host()
-                mongo_port = mongo_config.get("port", 27017)
-                logger.info(f"Using SSH tunnel: connecting to {mongo_host}:{mongo_port} (port-forward on remote host)")
-        else:
-            # Direct connection (fallback)
-            mongo_host = mongo_config["host"]
-            mongo_port = mongo_config["port"]
-            logger.info(f"Using direct connection: {mongo_host}:{mongo_port}")
-        
-        # Connect to MongoDB with retry logic
-        max_retries = 2
-        
-        for attempt in range(max_retries):
-            try:
-                logger.debug(f"MongoDB connection attempt {attempt + 1}/{max_retries} to {mongo_host}:{mongo_port}")
-                client = pymongo.MongoClient(
-                    host=mongo_host,
-                    port=mongo_port,
-                    username=mongo_config["username"],
-                    password=mongo_config["password"],
-                    authSource=mongo_config.get("auth_source", "prisma"),
-                    serverSelectionTimeoutMS=10000,
-                    connectTimeoutMS=10000,
-                    socketTimeoutMS=30000
-                )
-                
-                # Test connection
-                client.admin.command('ping')
-                break  # Success
-                
-            except Exception as e:
-                logger.warning(f"MongoDB connection attempt {attempt + 1} failed: {e}")
-                if client:
-                    try:
-                        client.close()
-                    except Exception:
-                        pass
-                    client = None
-                
-                # If tunnel was used and failed, try direct connection as fallback
-                if attempt == 0 and use_tunnel:
-                    logger.info("Tunnel connection failed, trying direct connection as fallback...")
-                    mongo_host = mongo_config["host"]
-                    mongo_port = mongo_config["port"]
-                    use_tunnel = False
-                elif attempt == max_retries - 1:
-                    raise  # Re-raise on last attempt
-        
-        if not client:
-            raise Exception("Failed to connect to MongoDB after all retry attempts")
-        
-        # Get database
-        db_name = mongo_config.get("database", "prisma")
-        db = client[db_name]
-        
-        logger.info(f"✅ Connected to MongoDB: {mongo_host}:{mongo_port}/{db_name}")
+        client, db = _connect_recordings_db(config_manager)
         
         # Step 1: Identify current environment and get GUIDs ONLY for that environment
-        # CRITICAL: Each environment has its own GUIDs/collections:
-        #   - kefar_saba: /prisma/root/recordings/segy → 24774bcb-a6f6-4e23-aa49-c100ad717bf0
-        #   - staging: /prisma/root/recordings → 25b4875f-5785-4b24-8895-121039474bcd, 873ea296-a3a3-4c22-a880-608766f004cd
-        # We MUST query only the GUIDs for the current environment, NOT mix data from different environments!
-        
         current_env = config_manager.get_current_environment()
         logger.info(f"Current environment: {current_env}")
         
-        base_paths = db["base_paths"]
-        
-        # Map environment to base_path patterns
-        # Each environment has specific base_path patterns that identify its collections
-        env_base_paths = {
-            "staging": ["/prisma/root/recordings"],
-            "kefar_saba": ["/prisma/root/recordings/segy"],
-            "production": ["/prisma/root/recordings/segy"],  # kefar_saba is alias for production
-        }
-        
-        # Get base_path patterns for current environment
-        target_base_paths = env_base_paths.get(current_env, [])
-        
-        if not target_base_paths:
-            logger.warning(f"Unknown environment '{current_env}', trying all base_paths")
-            target_base_paths = ["/prisma/root/recordings", "/prisma/root/recordings/segy"]
-        
-        logger.info(f"Looking for base_paths for environment '{current_env}': {target_base_paths}")
-        
-        # Find base_paths documents for current environment ONLY
-        env_base_path_docs = []
-        for base_path_pattern in target_base_paths:
-            docs = list(base_paths.find({
-                "base_path": base_path_pattern,
-                "is_archive": False
-            }))
-            env_base_path_docs.extend(docs)
-        
-        if not env_base_path_docs:
-            # Log all available base_paths for debugging
-            all_docs = list(base_paths.find({"is_archive": False}))
-            available_paths = [d.get('base_path', 'N/A') for d in all_docs]
-            logger.warning(f"No base_paths documents found for environment '{current_env}'. Available paths: {available_paths}")
-            return RecordingsInfo(recordings=[], query_time=datetime.now())
-        
-        # Extract GUIDs ONLY from current environment's base_paths
-        guids = []
-        for doc in env_base_path_docs:
-            guid = doc.get("guid")
-            if not guid:
-                guid = doc.get("_id")
-                if isinstance(guid, dict):
-                    guid = str(guid)
-            
-            if guid:
-                guid_str = str(guid)
-                # Only add GUIDs that look like valid UUIDs (format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx)
-                if len(guid_str) == 36 and guid_str.count('-') == 4:
-                    guids.append(guid_str)
-                    base_path_val = doc.get('base_path', 'N/A')
-                    logger.info(f"Found GUID for environment '{current_env}' from base_path '{base_path_val}': {guid_str}")
-        
+        guids = _environment_guids(db, current_env)
         if not guids:
-            logger.warning(f"No valid GUIDs found for environment '{current_env}'")
             return RecordingsInfo(recordings=[], query_time=datetime.now())
         
         logger.info(f"Found {len(guids)} GUID collections for environment '{current_env}': {guids}")
@@ -744,27 +863,8 @@ def fetch_recordings_from_mongodb(
                         continue
                     
                     # Convert datetime to epoch milliseconds
-                    # IMPORTANT: MongoDB stores datetimes as naive UTC, but Python's timestamp()
-                    # assumes local timezone. We need to treat the datetime as UTC explicitly.
-                    if isinstance(start_time, datetime):
-                        # Treat naive datetime as UTC (MongoDB stores UTC)
-                        if start_time.tzinfo is None:
-                            start_utc = start_time.replace(tzinfo=timezone.utc)
-                            start_ms = int(start_utc.timestamp() * 1000)
-                        else:
-                            start_ms = int(start_time.timestamp() * 1000)
-                    else:
-                        start_ms = int(start_time)
-                    
-                    if isinstance(end_time, datetime):
-                        # Treat naive datetime as UTC (MongoDB stores UTC)
-                        if end_time.tzinfo is None:
-                            end_utc = end_time.replace(tzinfo=timezone.utc)
-                            end_ms = int(end_utc.timestamp() * 1000)
-                        else:
-                            end_ms = int(end_time.timestamp() * 1000)
-                    else:
-                        end_ms = int(end_time)
+                    start_ms = _to_epoch_ms(start_time)
+                    end_ms = _to_epoch_ms(end_time)
                     
                     # Calculate duration for logging
                     duration_seconds = (end_ms - start_ms) / 1000.0
@@ -1035,9 +1135,10 @@ def mongodb_tunnel_session_cleanup(config_manager, request):
 @pytest.fixture(scope="session")
 def mongodb_recordings_info(config_manager) -> RecordingsInfo:
     """
-    Session-scoped fixture that fetches available recordings DIRECTLY from MongoDB.
+    Session-scoped fixture with the available recordings from MongoDB.
     
-    This fixture queries MongoDB ONCE per test session and caches the results.
+    Served by the local recordings catalog (see recordings_catalog), which
+    queries MongoDB only when it is stale, and only for new recordings.
     Uses direct MongoDB connection (not Focus Server API).
     
     Usage:
@@ -1048,7 +1149,8 @@ def mongodb_recordings_info(config_manager) -> RecordingsInfo:
             recording = mongodb_recordings_info.get_recording(min_duration_seconds=60)
             start_time, end_time = recording.get_time_range(60)
     """
-    return fetch_recordings_from_mongodb(config_manager)
+    from be_focus_server_tests.fixtures.recordings_catalog import load_recordings_info
+    return load_recordings_info(config_manager)
 
 
 @pytest.fixture
@@ -0,0 +1,374 @@
+"""
+Recordings Catalog - Local Cache of MongoDB Recordings
+======================================================
+
+On-disk SQLite catalog of the recordings of each environment, so historic
+load tests do not rediscover them in MongoDB on every call.
+
+fetch_recordings_from_mongodb resolves base_paths, counts and sorts every GUID
+collection and rebuilds Recording objects each time it is called; the historic
+load testers and the investigation-constraints test each did that again. The
+catalog keeps (environment, guid, recording id, start, end) rows and is
+refreshed incrementally: per GUID collection only recordings starting at or
+after the watermark (the start of the newest recording, or of the oldest one
+still being recorded) are read in full. Recordings removed from MongoDB are
+found by reading just the ids of the covered range, and GUID collections no
+longer listed for the environment are dropped. While the catalog is younger than
+max_age_seconds, reads need no MongoDB round trip at all; the returned
+RecordingsInfo carries a duration index (RecordingIndex) for O(log n)
+get_recording(min_duration) and random window sampling.
+
+Usage:
+    ```python
+    info = load_recordings_info(config_manager, max_recordings=500, weeks_back=4)
+    recording = info.get_recording(min_duration_seconds=60)
+    start_ms, end_ms = info.sample_window(30)
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import logging
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from be_focus_server_tests.fixtures.recording_fixtures import (
+    Recording,
+    RecordingsInfo,
+    _connect_recordings_db,
+    _environment_guids,
+    _to_epoch_ms,
+    fetch_recordings_from_mongodb,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default catalog file (one file for all environments; rows are keyed by environment)
+DEFAULT_CATALOG_PATH = Path(tempfile.gettempdir()) / "focus_recordings_catalog.sqlite"
+
+# Catalog age up to which reads skip MongoDB entirely
+DEFAULT_MAX_AGE_SECONDS = 300.0
+
+# Documents fetched per MongoDB batch during a refresh
+REFRESH_BATCH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recordings (
+    environment TEXT NOT NULL,
+    guid TEXT NOT NULL,
+    recording_id TEXT NOT NULL,
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    PRIMARY KEY (environment, guid, recording_id)
+);
+CREATE INDEX IF NOT EXISTS idx_recordings_start ON recordings (environment, start_ms);
+CREATE INDEX IF NOT EXISTS idx_recordings_duration ON recordings (environment, duration_ms);
+CREATE TABLE IF NOT EXISTS watermarks (
+    environment TEXT NOT NULL,
+    guid TEXT NOT NULL,
+    watermark_ms INTEGER NOT NULL,
+    covered_since_ms INTEGER NOT NULL,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (environment, guid)
+);
+"""
+
+
+class RecordingsCatalog:
+    """
+    SQLite catalog of the recordings of one environment.
+
+    Thread-safe; one connection shared behind a lock (reads are
+    milliseconds, refreshes are rare).
+    """
+
+    def __init__(self, environment: str, path: Optional[Path] = None):
+        """
+        Args:
+            environment: Environment name (rows of other environments are ignored)
+            path: SQLite file (default: DEFAULT_CATALOG_PATH; ":memory:" for tests)
+        """
+        self.environment = environment
+        self.path = str(path or DEFAULT_CATALOG_PATH)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    # --- Freshness ---
+
+    def age_seconds(self) -> Optional[float]:
+        """
+        Seconds since the least recently refreshed GUID collection (None if never refreshed).
+
+        Only the GUIDs of the last refresh count: refresh() drops the others.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT MIN(refreshed_at) FROM watermarks WHERE environment = ?", (self.environment,)
+            ).fetchone()
+        return None if row[0] is None else time.time() - row[0]
+
+    def covers(self, since_ms: int) -> bool:
+        """True if every refreshed GUID collection has been read back to since_ms."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COUNT(*), MAX(covered_since_ms) FROM watermarks WHERE environment = ?",
+                (self.environment,)
+            ).fetchone()
+        return row[0] > 0 and row[1] <= since_ms
+
+    # --- Refresh ---
+
+    def refresh(self, db: Any, guids: List[str], since_ms: int) -> int:
+        """
+        Bring the catalog up to date from MongoDB.
+
+        A GUID collection seen before is read from its watermark on; a new
+        one (or one not yet covering since_ms) is read back to since_ms.
+        Cataloged recordings overlapping since_ms that are no longer in their
+        collection are removed, as are GUID collections no longer in guids.
+
+        Args:
+            db: MongoDB database with the GUID collections
+            guids: Recordings collections of this environment
+            since_ms: Oldest start time the catalog must cover (epoch ms)
+
+        Returns:
+            Number of recordings inserted or updated
+        """
+        with self._lock:
+            state = {
+                guid: (watermark_ms, covered_since_ms)
+                for guid, watermark_ms, covered_since_ms in self._connection.execute(
+                    "SELECT guid, watermark_ms, covered_since_ms FROM watermarks WHERE environment = ?",
+                    (self.environment,)
+                )
+            }
+
+        existing = set(db.list_collection_names())
+        current = [guid for guid in guids if guid in existing]
+        if len(current) < len(guids):
+            logger.debug(f"Collections {sorted(set(guids) - existing)} do not exist, skipping")
+        self._drop_guids([guid for guid in state if guid not in current])
+
+        since = datetime.fromtimestamp(since_ms / 1000, tz=timezone.utc)
+        overlapping = {"$or": [{"start_time": {"$gte": since}}, {"end_time": {"$gte": since}}]}
+        upserted = 0
+        for guid in current:
+            watermark_ms, covered_since_ms = state.get(guid, (None, None))
+            if watermark_ms is None or covered_since_ms > since_ms:
+                # First read (or wider range): everything still overlapping since_ms
+                rows, new_watermark_ms, live_ids = self._read_collection(db[guid], guid, overlapping)
+                covered_since_ms = since_ms
+            else:
+                watermark = datetime.fromtimestamp(watermark_ms / 1000, tz=timezone.utc)
+                rows, new_watermark_ms, _ = self._read_collection(
+                    db[guid], guid, {"start_time": {"$gte": watermark}}
+                )
+                live_ids = self._read_ids(db[guid], overlapping)
+            if new_watermark_ms is None:
+                new_watermark_ms = watermark_ms if watermark_ms is not None else since_ms
+
+            with self._lock, self._connection:
+                removed = [
+                    (self.environment, guid, recording_id)
+                    for (recording_id,) in self._connection.execute(
+                        "SELECT recording_id FROM recordings WHERE environment = ? AND guid = ? AND end_ms >= ?",
+                        (self.environment, guid, since_ms)
+                    )
+                    if recording_id not in live_ids
+                ]
+                self._connection.executemany(
+                    "DELETE FROM recordings WHERE environment = ? AND guid = ? AND recording_id = ?", removed
+                )
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO recordings "
+                    "(environment, guid, recording_id, start_ms, end_ms, duration_ms) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO watermarks "
+                    "(environment, guid, watermark_ms, covered_since_ms, refreshed_at) VALUES (?, ?, ?, ?, ?)",
+                    (self.environment, guid, new_watermark_ms, covered_since_ms, time.time())
+                )
+            upserted += len(rows)
+            logger.info(
+                f"📊 Recordings catalog: {len(rows)} new/updated, {len(removed)} removed recordings from '{guid}'"
+            )
+
+        return upserted
+
+    def _drop_guids(self, guids: List[str]):
+        """Remove GUID collections (and their recordings) no longer listed for the environment."""
+        if not guids:
+            return
+        keys = [(self.environment, guid) for guid in guids]
+        with self._lock, self._connection:
+            self._connection.executemany("DELETE FROM recordings WHERE environment = ? AND guid = ?", keys)
+            self._connection.executemany("DELETE FROM watermarks WHERE environment = ? AND guid = ?", keys)
+        logger.info(f"📊 Recordings catalog: dropped {len(guids)} collections no longer in '{self.environment}'")
+
+    @staticmethod
+    def _read_ids(collection: Any, query: Dict[str, Any]) -> Set[str]:
+        """Ids of the matching recordings (no other fields are transferred)."""
+        cursor = collection.find(query, {"_id": 1}).batch_size(REFRESH_BATCH_SIZE)
+        return {str(doc["_id"]) for doc in cursor}
+
+    def _read_collection(
+        self, collection: Any, guid: str, query: Dict[str, Any]
+    ) -> Tuple[List[tuple], Optional[int], Set[str]]:
+        """
+        Read matching recordings of one collection.
+
+        Returns:
+            (catalog rows, next watermark, ids of every matching recording):
+            the watermark is the start of the oldest recording still in
+            progress (no end_time yet), else of the newest recording
+        """
+        rows = []
+        ids = set()
+        newest_start_ms = None
+        open_start_ms = None
+        cursor = collection.find(query, {"start_time": 1, "end_time": 1}).batch_size(REFRESH_BATCH_SIZE)
+        for doc in cursor:
+            ids.add(str(doc["_id"]))
+            start_time = doc.get("start_time")
+            if not start_time:
+                continue
+            start_ms = _to_epoch_ms(start_time)
+            newest_start_ms = start_ms if newest_start_ms is None else max(newest_start_ms, start_ms)
+
+            end_time = doc.get("end_time")
+            if not end_time:
+                # Still recording: re-read it next time
+                open_start_ms = start_ms if open_start_ms is None else min(open_start_ms, start_ms)
+                continue
+            end_ms = _to_epoch_ms(end_time)
+            rows.append((self.environment, guid, str(doc["_id"]), start_ms, end_ms, end_ms - start_ms))
+
+        return rows, open_start_ms if open_start_ms is not None else newest_start_ms, ids
+
+    # --- Reads ---
+
+    def recordings(self, since_ms: int, limit: Optional[int] = None) -> List[Recording]:
+        """Recordings ending at or after since_ms, most recent first."""
+        sql = (
+            "SELECT start_ms, end_ms FROM recordings WHERE environment = ? AND end_ms >= ? "
+            "ORDER BY start_ms DESC"
+        )
+        params: Tuple[Any, ...] = (self.environment, since_ms)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [Recording(start_time_ms=start_ms, end_time_ms=end_ms) for start_ms, end_ms in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM recordings WHERE environment = ?", (self.environment,)
+            ).fetchone()[0]
+
+
+# =============================================================================
+# Shared Catalog
+# =============================================================================
+
+_catalogs_lock = threading.Lock()
+_catalogs: Dict[Tuple[str, str], RecordingsCatalog] = {}
+
+
+def get_recordings_catalog(config_manager, path: Optional[Path] = None) -> RecordingsCatalog:
+    """
+    The process-wide catalog of the current environment.
+
+    The file is mongodb.recordings_catalog_path if configured, else
+    DEFAULT_CATALOG_PATH.
+    """
+    environment = config_manager.get_current_environment()
+    if path is None:
+        configured = config_manager.get_database_config().get("recordings_catalog_path")
+        path = Path(configured).expanduser() if configured else DEFAULT_CATALOG_PATH
+    key = (environment, str(path))
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = RecordingsCatalog(environment, path)
+            _catalogs[key] = catalog
+        return catalog
+
+
+def load_recordings_info(
+    config_manager,
+    max_recordings: int = 100,
+    weeks_back: int = 4,
+    max_age_seconds: Optional[float] = None
+) -> RecordingsInfo:
+    """
+    Recordings of the last weeks_back weeks from the catalog, most recent first.
+
+    MongoDB is only contacted when the catalog is older than max_age_seconds
+    (default: mongodb.recordings_catalog_max_age_seconds, else
+    DEFAULT_MAX_AGE_SECONDS) or does not reach back weeks_back weeks. If the
+    refresh fails, the catalog is served as is; if there is no usable catalog,
+    this falls back to fetch_recordings_from_mongodb.
+
+    Args:
+        config_manager: ConfigManager instance
+        max_recordings: Maximum recordings to return
+        weeks_back: Number of weeks back to search
+        max_age_seconds: Maximum catalog age served without a refresh
+
+    Returns:
+        RecordingsInfo (with a duration index for get_recording / sample_window)
+    """
+    if max_age_seconds is None:
+        max_age_seconds = float(
+            config_manager.get_database_config().get("recordings_catalog_max_age_seconds", DEFAULT_MAX_AGE_SECONDS)
+        )
+    since_ms = int((datetime.now(timezone.utc) - timedelta(weeks=weeks_back)).timestamp() * 1000)
+
+    try:
+        catalog = get_recordings_catalog(config_manager)
+    except sqlite3.Error as e:
+        logger.warning(f"Recordings catalog unavailable ({e}), querying MongoDB directly")
+        return fetch_recordings_from_mongodb(config_manager, max_recordings=max_recordings, weeks_back=weeks_back)
+
+    age = catalog.age_seconds()
+    if age is None or age > max_age_seconds or not catalog.covers(since_ms):
+        client = None
+        try:
+            client, db = _connect_recordings_db(config_manager)
+            guids = _environment_guids(db, catalog.environment)
+            catalog.refresh(db, guids, since_ms)
+        except Exception as e:
+            if age is None:
+                logger.error(f"Failed to build recordings catalog: {e}")
+                return fetch_recordings_from_mongodb(config_manager, max_recordings=max_recordings, weeks_back=weeks_back)
+            logger.warning(f"Recordings catalog refresh failed, serving {age:.0f}s old catalog: {e}")
+        finally:
+            if client:
+                client.close()
+    else:
+        logger.debug(f"Recordings catalog is {age:.0f}s old, no MongoDB query needed")
+
+    recordings = catalog.recordings(since_ms, limit=max_recordings)
+    logger.info(
+        f"✅ {len(recordings)} recordings from catalog of '{catalog.environment}' "
+        f"({catalog.count()} cataloged, last {weeks_back} weeks)"
+    )
+    return RecordingsInfo(recordings=recordings, query_time=datetime.now())
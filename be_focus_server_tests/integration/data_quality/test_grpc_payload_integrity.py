@@ -0,0 +1,186 @@
+"""
+Integration Tests - Data Quality: gRPC Payload Integrity
+========================================================
+
+Data quality tests on the decoded gRPC spectrogram payload (main_data),
+not just the per-frame global_minimum/global_maximum summary.
+
+Checks per frame:
+    - main_data decodes to exactly data_shape_y x data_shape_x samples
+    - No NaN/Inf samples
+    - Decoded min/max lie within the frame's global_minimum/global_maximum
+    - Row timestamps are monotonic
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import pytest
+import logging
+import time
+
+import numpy as np
+
+from src.apis.focus_server_api import FocusServerAPI
+from src.apis.grpc_client import GrpcStreamClient
+from src.apis.grpc_frame_decoder import FrameDecodeError, FrameRingBuffer, decode_frame, frame_timestamps
+from src.models.focus_server_models import ConfigureRequest, ViewType
+
+logger = logging.getLogger(__name__)
+
+
+# Frames to validate per test
+FRAMES_TO_VALIDATE = 50
+
+# Time to wait after job creation before connecting to gRPC
+POD_STARTUP_DELAY_SECONDS = 5
+
+# gRPC connection attempts (linear backoff)
+MAX_GRPC_CONNECT_RETRIES = 3
+GRPC_RETRY_DELAY_SECONDS = 1.5
+
+# Tolerance when comparing decoded samples to the frame's global min/max
+AMPLITUDE_TOLERANCE = 1e-3
+
+
+@pytest.fixture
+def live_payload_stream(focus_server_api: FocusServerAPI, config_manager):
+    """Configure a live job and yield a connected GrpcStreamClient."""
+    config_request = ConfigureRequest(
+        displayTimeAxisDuration=10,
+        nfftSelection=1024,
+        displayInfo={"height": 1000},
+        channels={"min": 1, "max": 50},
+        frequencyRange={"min": 0, "max": 500},
+        start_time=None,
+        end_time=None,
+        view_type=ViewType.MULTICHANNEL
+    )
+    response = focus_server_api.configure_streaming_job(config_request)
+    job_id = response.job_id
+
+    if not response.stream_url or not response.stream_port:
+        pytest.skip(f"No gRPC stream info in response for job {job_id}")
+
+    time.sleep(POD_STARTUP_DELAY_SECONDS)
+
+    client = GrpcStreamClient(config_manager=config_manager, connection_timeout=30)
+    last_error = None
+    for attempt in range(MAX_GRPC_CONNECT_RETRIES):
+        try:
+            client.connect(response.stream_url, int(response.stream_port))
+            break
+        except ConnectionError as e:
+            last_error = e
+            time.sleep(GRPC_RETRY_DELAY_SECONDS)
+    else:
+        pytest.skip(f"gRPC connection failed - pod may not be ready: {last_error}")
+
+    try:
+        yield client
+    finally:
+        client.disconnect()
+        try:
+            focus_server_api.cancel_job(job_id)
+        except Exception:
+            pass
+
+
+@pytest.mark.integration
+@pytest.mark.data_quality
+@pytest.mark.grpc
+@pytest.mark.live
+class TestGrpcPayloadIntegrity:
+    """
+    Test suite for decoded gRPC payload integrity.
+    """
+
+    def test_decoded_payload_matches_frame_summary(self, live_payload_stream: GrpcStreamClient):
+        """
+        Test: Decoded main_data is complete, finite and within global min/max.
+
+        Steps:
+            1. Create live job and connect to gRPC
+            2. Decode main_data of each frame with np.frombuffer (no copies)
+            3. Validate shape, finiteness, amplitude bounds and timestamps
+
+        Expected:
+            Every frame's payload matches its declared shape and summary fields.
+        """
+        logger.info("=" * 80)
+        logger.info("TEST: Data Quality - gRPC Payload Integrity")
+        logger.info("=" * 80)
+
+        issues = []
+        frames_checked = 0
+        samples_checked = 0
+
+        for i, frame in enumerate(live_payload_stream.stream_data(
+            stream_id=0, max_frames=FRAMES_TO_VALIDATE, timeout=30
+        )):
+            frames_checked += 1
+            try:
+                data = decode_frame(frame)
+            except FrameDecodeError as e:
+                issues.append(f"Frame {i + 1}: {e}")
+                continue
+
+            samples_checked += data.size
+            if data.size == 0:
+                issues.append(f"Frame {i + 1}: Empty payload")
+                continue
+
+            non_finite = data.size - int(np.isfinite(data).sum())
+            if non_finite:
+                issues.append(f"Frame {i + 1}: {non_finite} NaN/Inf samples")
+                continue
+
+            data_min, data_max = float(data.min()), float(data.max())
+            if data_min < frame.global_minimum - AMPLITUDE_TOLERANCE or \
+                    data_max > frame.global_maximum + AMPLITUDE_TOLERANCE:
+                issues.append(
+                    f"Frame {i + 1}: Payload range [{data_min:.3f}, {data_max:.3f}] outside "
+                    f"global range [{frame.global_minimum:.3f}, {frame.global_maximum:.3f}]"
+                )
+
+            timestamps = frame_timestamps(frame)
+            if timestamps.size > 1 and np.any(np.diff(timestamps) < 0):
+                issues.append(f"Frame {i + 1}: Row timestamps not monotonic")
+
+        if frames_checked == 0:
+            pytest.skip("No frames received - live data source may not be active")
+
+        logger.info(f"  Frames checked: {frames_checked}")
+        logger.info(f"  Samples checked: {samples_checked}")
+        logger.info(f"  Issues found: {len(issues)}")
+        for issue in issues[:5]:
+            logger.warning(f"  ⚠️  {issue}")
+
+        assert not issues, f"{len(issues)} payload integrity issues (first: {issues[0]})"
+
+    def test_payload_batched_into_ring_buffer(self, live_payload_stream: GrpcStreamClient):
+        """
+        Test: Frames batched into a preallocated ring buffer stay contiguous in time.
+
+        Expected:
+            The buffered rows are finite and their timestamps are monotonic.
+        """
+        ring = None
+
+        for frame in live_payload_stream.stream_data(
+            stream_id=0, max_frames=FRAMES_TO_VALIDATE, timeout=30
+        ):
+            if ring is None:
+                ring = FrameRingBuffer(capacity_rows=4096, row_width=frame.data_shape_x)
+            ring.append(frame)
+
+        if ring is None or len(ring) == 0:
+            pytest.skip("No frames received - live data source may not be active")
+
+        rows = ring.latest()
+        timestamps = ring.latest_timestamps()
+
+        logger.info(f"  Buffered: {ring}")
+
+        assert np.isfinite(rows).all(), "Buffered payload contains NaN/Inf samples"
+        assert not np.any(np.diff(timestamps) < 0), "Buffered row timestamps not monotonic"
@@ -18,6 +18,8 @@ import os
 from typing import Dict, Any, List, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from src.infrastructure.cluster_snapshot import get_cluster_snapshot_service
+
 logger = logging.getLogger(__name__)
 
 # Module-level set to track job IDs created during test execution
@@ -202,21 +204,17 @@ def auto_cleanup_jobs(focus_server_api, request):
             
             # Check which jobs still exist in K8s (if k8s_manager available)
             if k8s_manager:
-                still_existing = []
-                for job_id in list(remaining_jobs):
-                    try:
-                        # Check if grpc-job exists (job name format: grpc-job-{job_id})
-                        jobs = k8s_manager.get_jobs()
-                        job_name_prefix = f"grpc-job-{job_id}"
-                        # Job name might have suffix, so check if it starts with prefix
-                        if any(j.get("name", "").startswith(job_name_prefix) for j in jobs):
-                            still_existing.append(job_id)
-                    except Exception as e:
-                        # If we can't check, assume it still exists
-                        logger.debug(f"Could not check job {job_id} existence: {e}")
-                        still_existing.append(job_id)
-                
-                remaining_jobs = set(still_existing)
+                try:
+                    # One shared cluster snapshot per check, not one job list per job
+                    snapshot = get_cluster_snapshot_service(k8s_manager).get(max_age=AUTO_CLEANUP_CHECK_INTERVAL)
+                    # Job name format: grpc-job-{job_id}, possibly with a suffix
+                    remaining_jobs = {
+                        job_id for job_id in remaining_jobs
+                        if snapshot.jobs_with_prefix(f"grpc-job-{job_id}")
+                    }
+                except Exception as e:
+                    # If we can't check, assume they still exist
+                    logger.debug(f"Could not check job existence: {e}")
                 
                 if remaining_jobs:
                     logger.debug(f"  Check {checks_performed}: {len(remaining_jobs)} jobs still exist")
@@ -240,22 +238,19 @@ def auto_cleanup_jobs(focus_server_api, request):
                 aggressive_cleanup_count = 0
                 aggressive_failed_count = 0
                 
-                for job_id in remaining_jobs:
-                    try:
-                        # Delete grpc-job
-                        if k8s_manager.delete_job(f"grpc-job-{job_id}"):
+                try:
+                    # grpc-job and cleanup-job (might not exist) of every job, in parallel
+                    deleted = k8s_manager.delete_jobs(
+                        [f"grpc-job-{job_id}" for job_id in remaining_jobs]
+                        + [f"cleanup-job-{job_id}" for job_id in remaining_jobs]
+                    )
+                    for job_id in remaining_jobs:
+                        if deleted.get(f"grpc-job-{job_id}"):
                             aggressive_cleanup_count += 1
                             logger.debug(f"  Deleted grpc-job-{job_id}")
-                        
-                        # Delete cleanup-job
-                        try:
-                            k8s_manager.delete_job(f"cleanup-job-{job_id}")
-                        except:
-                            pass  # cleanup-job might not exist
-                        
-                    except Exception as e:
-                        aggressive_failed_count += 1
-                        logger.error(f"  Failed to delete job {job_id} via K8s: {e}")
+                except Exception as e:
+                    aggressive_failed_count = len(remaining_jobs)
+                    logger.error(f"  Failed to delete jobs via K8s: {e}")
                 
                 logger.warning(f"  Aggressive cleanup: {aggressive_cleanup_count} deleted, {aggressive_failed_count} failed")
             else:
@@ -385,8 +380,7 @@ def system_monitor(config_manager, request):
             
             if self.k8s_manager:
                 try:
-                    pods = self.k8s_manager.get_pods()
-                    self.metrics.pod_count_start = len([p for p in pods if 'grpc-job' in p.get('name', '')])
+                    self.metrics.pod_count_start = self._count_grpc_job_pods(max_age=0)
                     self.metrics.pod_count_max = self.metrics.pod_count_start
                 except:
                     pass
@@ -404,12 +398,19 @@ def system_monitor(config_manager, request):
                 
                 if self.k8s_manager:
                     try:
-                        pods = self.k8s_manager.get_pods()
-                        pod_count = len([p for p in pods if 'grpc-job' in p.get('name', '')])
+                        pod_count = self._count_grpc_job_pods()
                         self.metrics.pod_count_max = max(self.metrics.pod_count_max, pod_count)
                     except:
                         pass
         
+        def _count_grpc_job_pods(self, max_age: Optional[float] = None) -> int:
+            """Running (non-terminated) grpc-job pods, from the shared cluster snapshot."""
+            snapshot = get_cluster_snapshot_service(self.k8s_manager).get(max_age=max_age)
+            return len([
+                p for p in snapshot.active_pods()
+                if 'grpc-job' in p.get('metadata', {}).get('name', '')
+            ])
+        
         def stop(self) -> SystemMetrics:
             """Stop monitoring and return collected metrics."""
             self._monitoring = False
@@ -421,8 +422,7 @@ def system_monitor(config_manager, request):
             
             if self.k8s_manager:
                 try:
-                    pods = self.k8s_manager.get_pods()
-                    self.metrics.pod_count_end = len([p for p in pods if 'grpc-job' in p.get('name', '')])
+                    self.metrics.pod_count_end = self._count_grpc_job_pods(max_age=0)
                 except:
                     pass
             
@@ -0,0 +1,335 @@
+"""
+Distributed Job Load - Multi-Process Load Generation
+=====================================================
+
+Coordinator/worker mode for the job load testers, so one machine can use all
+of its cores to push configure + stream load at the Focus Server.
+
+- The coordinator spawns N worker processes. Each worker builds its own
+  tester through a picklable factory (API sessions and gRPC channels cannot
+  cross process boundaries) and prepares it, e.g. by loading recordings.
+- All workers and the coordinator then wait on a shared Barrier, so every
+  worker starts sending jobs at the same moment.
+- Workers run their share of _execute_single_job calls on a local thread
+  pool. Each JobResult is streamed back over a queue as soon as it
+  completes, and each worker sends its serialized latency histograms at
+  the end.
+- The coordinator merges the result streams and histograms into one
+  LoadTestResult. A worker that crashes or times out before sending its
+  histograms still contributes the results it streamed: the coordinator
+  records their latencies itself. K8s verification runs there in one batch.
+
+Usage:
+    ```python
+    from be_focus_server_tests.load.job_load_tester import build_job_tester
+
+    result = live_tester.run_distributed_load_test(
+        num_jobs=40,
+        num_workers=4,
+        concurrent_jobs_per_worker=5,
+        worker_factory=build_job_tester,
+        worker_factory_kwargs={"job_type": "live", "environment": "staging"},
+    )
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+
+from src.utils.latency_histogram import PhaseLatencyRecorder
+
+from be_focus_server_tests.load.k8s_job_verification import verify_jobs_batch_from_k8s
+
+if TYPE_CHECKING:
+    from be_focus_server_tests.load.job_load_tester import (
+        BaseJobLoadTester, JobResult, LoadTestResult
+    )
+
+logger = logging.getLogger(__name__)
+
+# Queue message kinds (worker -> coordinator)
+_MSG_RESULT = "result"
+_MSG_DONE = "done"
+
+
+def split_jobs(num_jobs: int, num_workers: int) -> List[int]:
+    """
+    Split num_jobs across workers as evenly as possible.
+
+    Returns:
+        Job count per worker (the first workers get the remainder)
+    """
+    base, extra = divmod(num_jobs, num_workers)
+    return [base + (1 if i < extra else 0) for i in range(num_workers)]
+
+
+def _worker_main(
+    worker_id: int,
+    worker_factory: Callable[..., 'BaseJobLoadTester'],
+    worker_factory_kwargs: Dict[str, Any],
+    num_jobs: int,
+    concurrent_jobs: int,
+    start_barrier,
+    result_queue,
+    barrier_timeout: float
+) -> None:
+    """Worker process entry point: build, wait for start, run, stream results."""
+    from be_focus_server_tests.load.job_load_tester import BaseJobLoadTester
+
+    try:
+        tester = worker_factory(**worker_factory_kwargs)
+        tester.prepare()
+    except Exception as e:
+        # Without this worker the synchronized start is impossible
+        start_barrier.abort()
+        result_queue.put((_MSG_DONE, worker_id, None, f"Worker setup failed: {e}"))
+        return
+
+    try:
+        start_barrier.wait(timeout=barrier_timeout)
+    except threading.BrokenBarrierError:
+        result_queue.put((_MSG_DONE, worker_id, None, "Start barrier broken"))
+        return
+
+    latency = PhaseLatencyRecorder()
+    error = None
+
+    try:
+        if num_jobs > 0:
+            with ThreadPoolExecutor(max_workers=max(1, concurrent_jobs)) as executor:
+                futures = [executor.submit(tester._execute_single_job) for _ in range(num_jobs)]
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result.success:
+                        BaseJobLoadTester._record_latencies([result], latency)
+                    result_queue.put((_MSG_RESULT, worker_id, result, None))
+    except Exception as e:
+        error = f"Worker failed: {e}"
+
+    result_queue.put((_MSG_DONE, worker_id, latency.to_dict(), error))
+
+
+class DistributedJobLoadCoordinator:
+    """
+    Fans a job load test out across local worker processes.
+
+    The coordinator's own tester (the one run_distributed_load_test is called
+    on) is only used for aggregation and K8s verification; jobs run in the
+    workers.
+    """
+
+    def __init__(
+        self,
+        tester: 'BaseJobLoadTester',
+        worker_factory: Callable[..., 'BaseJobLoadTester'],
+        worker_factory_kwargs: Optional[Dict[str, Any]] = None,
+        num_workers: Optional[int] = None,
+        start_method: str = "spawn",
+        barrier_timeout_seconds: float = 300.0,
+        result_timeout_seconds: float = 600.0
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            tester: Tester used for result aggregation (and its k8s_manager)
+            worker_factory: Picklable (module-level) callable that builds a
+                            tester inside each worker process
+            worker_factory_kwargs: Picklable keyword arguments for worker_factory
+            num_workers: Worker processes (default: CPU count)
+            start_method: multiprocessing start method ("spawn" is safe with
+                          gRPC; "fork" is not)
+            barrier_timeout_seconds: Max time for all workers to get ready
+            result_timeout_seconds: Max silence from workers before giving up
+        """
+        self.tester = tester
+        self.worker_factory = worker_factory
+        self.worker_factory_kwargs = worker_factory_kwargs or {}
+        self.num_workers = num_workers or multiprocessing.cpu_count()
+        self.start_method = start_method
+        self.barrier_timeout = barrier_timeout_seconds
+        self.result_timeout = result_timeout_seconds
+
+        self.worker_errors: Dict[int, str] = {}
+
+    def run(
+        self,
+        num_jobs: int,
+        concurrent_jobs_per_worker: int = 3,
+        test_name: Optional[str] = None
+    ) -> 'LoadTestResult':
+        """
+        Run the distributed load test.
+
+        Args:
+            num_jobs: Total jobs across all workers
+            concurrent_jobs_per_worker: Thread pool size inside each worker
+            test_name: Test name (auto-generated if None)
+
+        Returns:
+            LoadTestResult merged from all workers
+
+        Raises:
+            RuntimeError: If the workers could not start together
+        """
+        tester = self.tester
+        if test_name is None:
+            test_name = f"{tester.job_type.value.title()} Job Distributed Load Test"
+
+        jobs_per_worker = split_jobs(num_jobs, self.num_workers)
+
+        logger.info("")
+        logger.info("=" * 80)
+        logger.info(f"🚀 {tester.job_type.value.upper()} JOB LOAD TEST (distributed) - Starting...")
+        logger.info("=" * 80)
+        logger.info(f"   Type: {tester.job_type.value}")
+        logger.info(f"   Total Jobs: {num_jobs}")
+        logger.info(f"   Workers: {self.num_workers} processes")
+        logger.info(f"   Concurrent per Worker: {concurrent_jobs_per_worker}")
+        logger.info(f"   Frames per Job: {tester.frames_to_receive}")
+        logger.info("=" * 80)
+
+        ctx = multiprocessing.get_context(self.start_method)
+        start_barrier = ctx.Barrier(self.num_workers + 1)
+        result_queue = ctx.Queue()
+        self.worker_errors = {}
+
+        processes = [
+            ctx.Process(
+                target=_worker_main,
+                args=(
+                    worker_id,
+                    self.worker_factory,
+                    self.worker_factory_kwargs,
+                    jobs_per_worker[worker_id],
+                    concurrent_jobs_per_worker,
+                    start_barrier,
+                    result_queue,
+                    self.barrier_timeout,
+                ),
+                name=f"load-worker-{worker_id}",
+                daemon=True,
+            )
+            for worker_id in range(self.num_workers)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            start_barrier.wait(timeout=self.barrier_timeout)
+        except threading.BrokenBarrierError:
+            self._drain_setup_errors(result_queue)
+            self._stop(processes)
+            raise RuntimeError(
+                f"Distributed load test could not start: {self.worker_errors or 'barrier timeout'}"
+            )
+
+        start_time = datetime.now()
+        start_timestamp = time.time()
+        logger.info(f"   All {self.num_workers} workers started")
+
+        all_results, latency = self._collect(result_queue, processes, num_jobs)
+
+        end_time = datetime.now()
+        duration_seconds = time.time() - start_timestamp
+        self._stop(processes)
+
+        for worker_id, error in sorted(self.worker_errors.items()):
+            logger.warning(f"⚠️  Worker {worker_id}: {error}")
+
+        if tester.k8s_manager:
+            job_ids = [r.job_id for r in all_results if r.success and r.job_id]
+            if job_ids:
+                try:
+                    tester._k8s_verifications.extend(verify_jobs_batch_from_k8s(
+                        kubernetes_manager=tester.k8s_manager,
+                        job_ids=job_ids,
+                        namespace="panda",
+                        timeout=30
+                    ))
+                except Exception as e:
+                    logger.debug(f"K8s batch verification failed: {e}")
+
+        return tester._calculate_results(
+            test_name, start_time, end_time, duration_seconds, all_results,
+            latency=latency
+        )
+
+    def _collect(self, result_queue, processes, num_jobs: int):
+        """Merge JobResult streams and histograms until every worker is done."""
+        from be_focus_server_tests.load.job_load_tester import BaseJobLoadTester
+
+        all_results: List['JobResult'] = []
+        latency = PhaseLatencyRecorder()
+        done = set()
+        # Successful results per worker, until its histograms arrive
+        pending: Dict[int, List['JobResult']] = {}
+        last_message = time.time()
+
+        while len(done) < len(processes):
+            try:
+                kind, worker_id, payload, error = result_queue.get(timeout=1.0)
+            except queue.Empty:
+                # A worker that died without reporting will never finish
+                for worker_id, process in enumerate(processes):
+                    if worker_id not in done and not process.is_alive() and result_queue.empty():
+                        done.add(worker_id)
+                        self.worker_errors[worker_id] = f"exited with code {process.exitcode}"
+                        BaseJobLoadTester._record_latencies(pending.pop(worker_id, []), latency)
+                if time.time() - last_message > self.result_timeout:
+                    for worker_id in range(len(processes)):
+                        if worker_id not in done:
+                            done.add(worker_id)
+                            self.worker_errors[worker_id] = "no result before timeout"
+                            BaseJobLoadTester._record_latencies(pending.pop(worker_id, []), latency)
+                continue
+
+            last_message = time.time()
+
+            if kind == _MSG_RESULT:
+                all_results.append(payload)
+                if payload.success:
+                    pending.setdefault(worker_id, []).append(payload)
+                status = "✅" if payload.success else "❌"
+                logger.info(
+                    f"{status} [{payload.job_type.value}] Job {len(all_results)}/{num_jobs} "
+                    f"(worker {worker_id}): {payload.job_id} ({payload.total_duration_ms:.0f}ms)"
+                )
+            elif kind == _MSG_DONE:
+                done.add(worker_id)
+                streamed = pending.pop(worker_id, [])
+                if payload:
+                    latency.merge(PhaseLatencyRecorder.from_dict(payload))
+                else:
+                    BaseJobLoadTester._record_latencies(streamed, latency)
+                if error:
+                    self.worker_errors[worker_id] = error
+
+        return all_results, latency
+
+    def _drain_setup_errors(self, result_queue) -> None:
+        deadline = time.time() + 2.0
+        while time.time() < deadline:
+            try:
+                kind, worker_id, _, error = result_queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            if kind == _MSG_DONE and error:
+                self.worker_errors[worker_id] = error
+
+    @staticmethod
+    def _stop(processes) -> None:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=5)
@@ -18,6 +18,10 @@ The difference is in the payload:
 - Live: start_time=None, end_time=None
 - Historic: start_time and end_time from available recordings
 
+run_load_test() drives jobs from a thread pool (closed loop);
+run_open_loop_load_test() drives them from an arrival schedule on an asyncio
+event loop (see async_job_orchestrator).
+
 Author: QA Automation Architect
 Date: 2025-11-30
 """
@@ -32,6 +36,8 @@ from datetime import datetime
 from enum import Enum
 from statistics import mean
 
+from src.utils.latency_histogram import PhaseLatencyRecorder
+
 # Import K8s verification module
 from be_focus_server_tests.load.k8s_job_verification import (
     verify_job_from_k8s,
@@ -91,6 +97,13 @@ class JobResult:
     # Historic-specific
     start_time: Optional[int] = None
     end_time: Optional[int] = None
+    # Open-loop runs: delay between the scheduled and the actual job start
+    schedule_lag_ms: float = 0.0
+    
+    @property
+    def response_time_ms(self) -> float:
+        """Latency measured from the intended start (corrects coordinated omission)."""
+        return self.schedule_lag_ms + self.total_duration_ms
     
     @property
     def configure_time_ms(self) -> float:
@@ -151,6 +164,16 @@ class LoadTestResult:
     error_rate: float
     errors_by_type: Dict[str, int] = field(default_factory=dict)
     
+    # Open-loop scheduling (0 for closed-loop runs)
+    avg_schedule_lag_ms: float = 0.0
+    max_schedule_lag_ms: float = 0.0
+    
+    # Tail latency (HDR histogram)
+    p999_total_time_ms: float = 0.0
+    p9999_total_time_ms: float = 0.0
+    phase_latency_percentiles: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    latency_histograms: Dict[str, Any] = field(default_factory=dict)
+    
     # All results
     all_job_results: List[JobResult] = field(default_factory=list)
     
@@ -179,11 +202,32 @@ class LoadTestResult:
             f"   • P50: {self.p50_total_time_ms:.0f}ms",
             f"   • P95: {self.p95_total_time_ms:.0f}ms",
             f"   • P99: {self.p99_total_time_ms:.0f}ms",
+            f"   • P99.9: {self.p999_total_time_ms:.0f}ms",
+            f"   • P99.99: {self.p9999_total_time_ms:.0f}ms",
             "",
             f"📡 Phase Breakdown:",
             f"   • Avg Configure: {self.avg_configure_time_ms:.0f}ms",
             f"   • Avg gRPC Connect: {self.avg_grpc_connect_time_ms:.0f}ms",
-            "",
+        ]
+        
+        for phase, pcts in self.phase_latency_percentiles.items():
+            if phase == "total":
+                continue
+            lines.append(
+                f"   • {phase}: P50 {pcts.get('p50', 0):.0f}ms / "
+                f"P95 {pcts.get('p95', 0):.0f}ms / P99 {pcts.get('p99', 0):.0f}ms"
+            )
+        lines.append("")
+        
+        if self.max_schedule_lag_ms > 0:
+            lines.extend([
+                f"🗓️  Schedule Lag (intended → actual start):",
+                f"   • Average: {self.avg_schedule_lag_ms:.0f}ms",
+                f"   • Max: {self.max_schedule_lag_ms:.0f}ms",
+                "",
+            ])
+        
+        lines += [
             f"📦 Streaming:",
             f"   • Total Frames: {self.total_frames_received}",
             f"   • Avg per Job: {self.avg_frames_received:.1f}",
@@ -230,6 +274,8 @@ class BaseJobLoadTester(ABC):
         stream_timeout_seconds: float = 30.0,
         # Stream configuration
         frames_to_receive: int = 5,
+        # Open-loop (asyncio) runs
+        async_grpc_client_factory: Optional[Callable] = None,
     ):
         """
         Initialize base job load tester.
@@ -243,9 +289,12 @@ class BaseJobLoadTester(ABC):
             grpc_connect_timeout_seconds: Timeout for gRPC connect
             stream_timeout_seconds: Timeout for streaming
             frames_to_receive: Frames to receive per job
+            async_grpc_client_factory: Factory to create AsyncGrpcStreamClient
+                                       (used by run_open_loop_load_test)
         """
         self.focus_server_api = focus_server_api
         self.grpc_client_factory = grpc_client_factory
+        self.async_grpc_client_factory = async_grpc_client_factory
         
         self.max_grpc_connect_retries = max_grpc_connect_retries
         self.grpc_connect_retry_delay_ms = grpc_connect_retry_delay_ms
@@ -280,6 +329,15 @@ class BaseJobLoadTester(ABC):
         """
         pass
     
+    def prepare(self) -> None:
+        """
+        Load anything jobs need before the load starts (no-op by default).
+        
+        Called by distributed workers before the start barrier so that setup
+        work is not measured as load.
+        """
+        pass
+    
     def _execute_single_job(self) -> JobResult:
         """Execute a single job from start to finish."""
         start_time = time.time()
@@ -529,30 +587,134 @@ class BaseJobLoadTester(ABC):
             test_name, start_time, end_time, duration_seconds, all_results
         )
     
+    def run_open_loop_load_test(
+        self,
+        num_jobs: int = 10,
+        arrival=None,
+        max_in_flight: Optional[int] = None,
+        test_name: Optional[str] = None
+    ) -> LoadTestResult:
+        """
+        Run an open-loop load test on an asyncio event loop.
+        
+        Jobs start on the arrival schedule regardless of how many are still
+        running, and timings are measured from each job's intended start.
+        See async_job_orchestrator for details.
+        
+        Args:
+            num_jobs: Total jobs to execute
+            arrival: ArrivalSchedule (default: constant 1 job/second)
+            max_in_flight: Optional cap on concurrently running jobs
+            test_name: Test name (auto-generated if None)
+            
+        Returns:
+            LoadTestResult with all metrics
+        """
+        from be_focus_server_tests.load.async_job_orchestrator import (
+            ArrivalSchedule,
+            AsyncJobOrchestrator
+        )
+        
+        orchestrator = AsyncJobOrchestrator(self, max_in_flight=max_in_flight)
+        return orchestrator.run_sync(
+            num_jobs=num_jobs,
+            arrival=arrival or ArrivalSchedule(),
+            test_name=test_name
+        )
+    
+    @staticmethod
+    def _record_latencies(
+        results: List[JobResult],
+        latency: Optional[PhaseLatencyRecorder] = None
+    ) -> PhaseLatencyRecorder:
+        """
+        Record per-phase and total latencies of jobs into HDR histograms.
+        
+        Keys are JobPhase values (successful phases only) plus "total"
+        (JobResult.response_time_ms).
+        
+        Args:
+            results: Job results to record
+            latency: Recorder to add to (a new one if None)
+        """
+        if latency is None:
+            latency = PhaseLatencyRecorder()
+        latency.histogram("total")
+        for r in results:
+            latency.record("total", r.response_time_ms)
+            for p in r.phases:
+                if p.success:
+                    latency.record(p.phase.value, p.duration_ms)
+        return latency
+    
+    def run_distributed_load_test(
+        self,
+        num_jobs: int,
+        worker_factory: Callable[..., 'BaseJobLoadTester'],
+        worker_factory_kwargs: Optional[Dict[str, Any]] = None,
+        num_workers: Optional[int] = None,
+        concurrent_jobs_per_worker: int = 3,
+        test_name: Optional[str] = None
+    ) -> LoadTestResult:
+        """
+        Run a load test across several local worker processes.
+        
+        Each worker builds its own tester with worker_factory (see
+        build_job_tester), all workers start together, and their results and
+        latency histograms are merged into one LoadTestResult. See
+        distributed_job_load for details.
+        
+        Args:
+            num_jobs: Total jobs across all workers
+            worker_factory: Picklable callable that builds a tester in a worker
+            worker_factory_kwargs: Keyword arguments for worker_factory
+            num_workers: Worker processes (default: CPU count)
+            concurrent_jobs_per_worker: Concurrent jobs inside each worker
+            test_name: Test name (auto-generated if None)
+            
+        Returns:
+            LoadTestResult with all metrics
+        """
+        from be_focus_server_tests.load.distributed_job_load import DistributedJobLoadCoordinator
+        
+        coordinator = DistributedJobLoadCoordinator(
+            self,
+            worker_factory=worker_factory,
+            worker_factory_kwargs=worker_factory_kwargs,
+            num_workers=num_workers
+        )
+        return coordinator.run(
+            num_jobs=num_jobs,
+            concurrent_jobs_per_worker=concurrent_jobs_per_worker,
+            test_name=test_name
+        )
+    
     def _calculate_results(
         self,
         test_name: str,
         start_time: datetime,
         end_time: datetime,
         duration_seconds: float,
-        all_results: List[JobResult]
+        all_results: List[JobResult],
+        latency: Optional[PhaseLatencyRecorder] = None
     ) -> LoadTestResult:
-        """Calculate aggregate metrics."""
+        """
+        Calculate aggregate metrics.
+        
+        Args:
+            latency: Pre-recorded histograms of the successful jobs (e.g. merged
+                     from worker processes); recorded from all_results if None
+        """
         successful = [r for r in all_results if r.success]
         failed = [r for r in all_results if not r.success]
         
-        total_times = [r.total_duration_ms for r in successful] if successful else [0]
+        if latency is None:
+            latency = self._record_latencies(successful)
+        total_hist = latency.histogram("total")
+        
         configure_times = [r.configure_time_ms for r in successful] if successful else [0]
         grpc_times = [r.grpc_connect_time_ms for r in successful] if successful else [0]
         
-        sorted_times = sorted(total_times)
-        
-        def percentile(data: List[float], p: float) -> float:
-            if not data:
-                return 0.0
-            idx = int(len(data) * p / 100)
-            return data[min(idx, len(data) - 1)]
-        
         total_frames = sum(r.frames_received for r in all_results)
         avg_frames = mean([r.frames_received for r in successful]) if successful else 0
         
@@ -560,6 +722,8 @@ class BaseJobLoadTester(ABC):
         jobs_with_retries = sum(1 for r in all_results if r.total_retries > 0)
         avg_retries = mean([r.total_retries for r in all_results]) if all_results else 0
         
+        schedule_lags = [r.schedule_lag_ms for r in all_results] or [0.0]
+        
         errors_by_type: Dict[str, int] = {}
         for r in failed:
             if r.error:
@@ -575,12 +739,12 @@ class BaseJobLoadTester(ABC):
             total_jobs=len(all_results),
             successful_jobs=len(successful),
             failed_jobs=len(failed),
-            avg_total_time_ms=mean(total_times) if total_times else 0,
-            min_total_time_ms=min(total_times) if total_times else 0,
-            max_total_time_ms=max(total_times) if total_times else 0,
-            p50_total_time_ms=percentile(sorted_times, 50),
-            p95_total_time_ms=percentile(sorted_times, 95),
-            p99_total_time_ms=percentile(sorted_times, 99),
+            avg_total_time_ms=total_hist.mean,
+            min_total_time_ms=total_hist.min,
+            max_total_time_ms=total_hist.max,
+            p50_total_time_ms=total_hist.percentile(50),
+            p95_total_time_ms=total_hist.percentile(95),
+            p99_total_time_ms=total_hist.percentile(99),
             avg_configure_time_ms=mean(configure_times) if configure_times else 0,
             avg_grpc_connect_time_ms=mean(grpc_times) if grpc_times else 0,
             avg_frames_received=avg_frames,
@@ -590,6 +754,14 @@ class BaseJobLoadTester(ABC):
             avg_retries_per_job=avg_retries,
             error_rate=len(failed) / len(all_results) * 100 if all_results else 0,
             errors_by_type=errors_by_type,
+            avg_schedule_lag_ms=mean(schedule_lags),
+            max_schedule_lag_ms=max(schedule_lags),
+            p999_total_time_ms=total_hist.percentile(99.9),
+            p9999_total_time_ms=total_hist.percentile(99.99),
+            phase_latency_percentiles={
+                name: latency.percentiles(name) for name in latency.names
+            },
+            latency_histograms=latency.to_dict(),
             all_job_results=all_results
         )
         
@@ -717,8 +889,9 @@ class HistoricJobLoadTester(BaseJobLoadTester):
         Args:
             config_manager: ConfigManager instance (required for MongoDB access)
             recording_duration_seconds: Duration of recording to request
-            min_duration_seconds: Minimum recording duration to search for
-            max_duration_seconds: Maximum recording duration to search for
+                (shorter recordings are requested whole)
+            min_duration_seconds: Ignored - kept for backward compatibility
+            max_duration_seconds: Ignored - kept for backward compatibility
             weeks_back: Number of weeks back to search in MongoDB
             max_recordings_to_load: Maximum recordings to load from MongoDB
             **kwargs: Base class and common arguments
@@ -735,7 +908,7 @@ class HistoricJobLoadTester(BaseJobLoadTester):
         self.view_type = view_type
         self.recording_duration_seconds = recording_duration_seconds
         
-        # MongoDB query parameters
+        # Catalog query parameters (durations are not filtered on)
         self.min_duration_seconds = min_duration_seconds
         self.max_duration_seconds = max_duration_seconds
         self.weeks_back = weeks_back
@@ -749,6 +922,10 @@ class HistoricJobLoadTester(BaseJobLoadTester):
     def job_type(self) -> JobType:
         return JobType.HISTORIC
     
+    def prepare(self) -> None:
+        """Load the recordings list up front instead of on the first job."""
+        self._get_available_recordings()
+    
     def _get_available_recordings_from_mongodb(self) -> List[tuple]:
         """
         Get available recordings DIRECTLY from MongoDB using base_paths collection.
@@ -758,7 +935,7 @@ class HistoricJobLoadTester(BaseJobLoadTester):
         2. Query base_paths collection for base_path="/prisma/root/recordings", is_archive=False
         3. Get guid from the document
         4. Query collection named {guid} for recordings
-        5. Filter by deleted=False, duration, and time range
+        5. Filter by deleted=False and time range (recordings of any duration)
         
         Returns:
             List of (start_time_ms, end_time_ms) tuples
@@ -771,19 +948,17 @@ class HistoricJobLoadTester(BaseJobLoadTester):
             return []
         
         try:
-            from be_focus_server_tests.fixtures.recording_fixtures import fetch_recordings_from_mongodb
+            from be_focus_server_tests.fixtures.recordings_catalog import load_recordings_info
             
-            logger.info(f"Querying MongoDB for historic recordings...")
-            logger.info(f"  - Duration: {self.min_duration_seconds}-{self.max_duration_seconds}s")
+            logger.info(f"Loading historic recordings (recordings catalog)...")
+            logger.info(f"  - Duration: any (jobs request up to {self.recording_duration_seconds}s)")
             logger.info(f"  - Time range: last {self.weeks_back} weeks")
             logger.info(f"  - Max recordings: {self.max_recordings_to_load}")
             
-            # Query MongoDB directly using base_paths collection
-            recordings_info = fetch_recordings_from_mongodb(
+            # Local catalog, refreshed incrementally from the base_paths GUID collections
+            recordings_info = load_recordings_info(
                 config_manager=self.config_manager,
                 max_recordings=self.max_recordings_to_load,
-                min_duration_seconds=self.min_duration_seconds,
-                max_duration_seconds=self.max_duration_seconds,
                 weeks_back=self.weeks_back
             )
             
@@ -910,13 +1085,15 @@ def create_live_job_tester(
     frequency_min: int = 0,
     frequency_max: int = 500,
     nfft: int = 1024,
+    request_log_mode: str = "compact",
     **kwargs
 ) -> LiveJobLoadTester:
     """Factory to create LiveJobLoadTester."""
     from src.apis.focus_server_api import FocusServerAPI
-    from src.apis.grpc_client import GrpcStreamClient
+    from src.apis.grpc_client import GrpcStreamClient, AsyncGrpcStreamClient
     
     api = FocusServerAPI(config_manager)
+    api.set_request_logging(request_log_mode)
     
     def grpc_factory(connection_timeout: int = 30):
         return GrpcStreamClient(
@@ -924,9 +1101,16 @@ def create_live_job_tester(
             connection_timeout=connection_timeout
         )
     
+    def async_grpc_factory(connection_timeout: int = 30):
+        return AsyncGrpcStreamClient(
+            config_manager=config_manager,
+            connection_timeout=connection_timeout
+        )
+    
     return LiveJobLoadTester(
         focus_server_api=api,
         grpc_client_factory=grpc_factory,
+        async_grpc_client_factory=async_grpc_factory,
         channels_min=channels_min,
         channels_max=channels_max,
         frequency_min=frequency_min,
@@ -949,6 +1133,7 @@ def create_historic_job_tester(
     max_duration_seconds: float = 10.0,
     weeks_back: int = 2,
     max_recordings_to_load: int = 100,
+    request_log_mode: str = "compact",
     **kwargs
 ) -> HistoricJobLoadTester:
     """
@@ -964,16 +1149,18 @@ def create_historic_job_tester(
         frequency_max: Max frequency Hz
         nfft: NFFT selection
         recording_duration_seconds: Duration of recording to request
-        min_duration_seconds: Minimum recording duration to search for in MongoDB
-        max_duration_seconds: Maximum recording duration to search for in MongoDB
+        min_duration_seconds: Ignored - kept for backward compatibility
+        max_duration_seconds: Ignored - kept for backward compatibility
         weeks_back: Number of weeks back to search in MongoDB
         max_recordings_to_load: Maximum recordings to load from MongoDB for load testing
+        request_log_mode: FocusServerAPI request logging ("compact" or "verbose")
         **kwargs: Other arguments passed to HistoricJobLoadTester
     """
     from src.apis.focus_server_api import FocusServerAPI
-    from src.apis.grpc_client import GrpcStreamClient
+    from src.apis.grpc_client import GrpcStreamClient, AsyncGrpcStreamClient
     
     api = FocusServerAPI(config_manager)
+    api.set_request_logging(request_log_mode)
     
     def grpc_factory(connection_timeout: int = 30):
         return GrpcStreamClient(
@@ -981,9 +1168,16 @@ def create_historic_job_tester(
             connection_timeout=connection_timeout
         )
     
+    def async_grpc_factory(connection_timeout: int = 30):
+        return AsyncGrpcStreamClient(
+            config_manager=config_manager,
+            connection_timeout=connection_timeout
+        )
+    
     return HistoricJobLoadTester(
         focus_server_api=api,
         grpc_client_factory=grpc_factory,
+        async_grpc_client_factory=async_grpc_factory,
         config_manager=config_manager,  # Pass config_manager for MongoDB access
         channels_min=channels_min,
         channels_max=channels_max,
@@ -998,3 +1192,23 @@ def create_historic_job_tester(
         **kwargs
     )
 
+
+def build_job_tester(job_type: str, environment: str, **kwargs) -> BaseJobLoadTester:
+    """
+    Build a Live or Historic tester from an environment name.
+    
+    Module-level and driven only by picklable arguments, so it can be used as
+    the worker_factory of run_distributed_load_test.
+    
+    Args:
+        job_type: "live" or "historic"
+        environment: Environment name for ConfigManager (e.g. "staging")
+        **kwargs: Arguments for create_live_job_tester / create_historic_job_tester
+    """
+    from config.config_manager import ConfigManager
+    
+    config_manager = ConfigManager(environment)
+    
+    if JobType(job_type) == JobType.HISTORIC:
+        return create_historic_job_tester(config_manager, **kwargs)
+    return create_live_job_tester(config_manager, **kwargs)
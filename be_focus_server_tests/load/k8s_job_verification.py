@@ -27,13 +27,15 @@ Author: QA Automation Architect
 Date: 2025-12-07
 """
 
-import json
 import re
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from src.core.exceptions import InfrastructureError
+from src.infrastructure.cluster_snapshot import get_cluster_snapshot_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,6 +100,49 @@ class K8sJobVerification:
                    f"pod: {self.pod_name} ({self.pod_status})")
 
 
+# =============================================================================
+# Pod Lookup
+# =============================================================================
+
+def _job_pod_pattern(job_id: str) -> str:
+    """
+    Pod name prefix of a job (e.g., "1-1637" → "grpc-job-1-1637").
+    
+    The pod name format is: grpc-job-{job_number}-{job_sequence}-{random_suffix}
+    """
+    parts = job_id.split("-")
+    if len(parts) >= 2:
+        return f"grpc-job-{parts[0]}-{parts[1]}"
+    return f"grpc-job-{job_id}"
+
+
+def _find_job_pods(
+    kubernetes_manager,
+    pod_patterns: List[str],
+    namespace: str,
+    timeout: Optional[float] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    First pod (API JSON) whose name starts with each pattern, or None.
+    
+    Pods come from the process-wide cluster snapshot. If a pattern is not in
+    it - the pod of a job created moments ago can be newer than the snapshot -
+    one fresh snapshot is taken for all patterns. timeout bounds each list
+    call of a refresh made here.
+    
+    Raises:
+        InfrastructureError: If the pods cannot be listed
+    """
+    snapshots = get_cluster_snapshot_service(kubernetes_manager, namespace)
+    snapshot = snapshots.get(timeout=timeout)
+    found = {pattern: next(iter(snapshot.pods_with_prefix(pattern)), None) for pattern in pod_patterns}
+    
+    if any(pod is None for pod in found.values()):
+        snapshot = snapshots.get(max_age=0, timeout=timeout)
+        found = {pattern: next(iter(snapshot.pods_with_prefix(pattern)), None) for pattern in pod_patterns}
+    return found
+
+
 # =============================================================================
 # Core Verification Functions
 # =============================================================================
@@ -121,7 +166,7 @@ def verify_job_from_k8s(
         kubernetes_manager: KubernetesManager instance
         job_id: The Focus Server job ID (e.g., "1-1637")
         namespace: Kubernetes namespace (default: "panda")
-        timeout: Command timeout in seconds
+        timeout: Timeout of each list call if the cluster snapshot is refreshed
         
     Returns:
         K8sJobVerification with all extracted information
@@ -134,33 +179,10 @@ def verify_job_from_k8s(
     )
     
     try:
-        # Convert job_id to pod name pattern (e.g., "1-1637" → "grpc-job-1-1637-*")
-        # The pod name format is: grpc-job-{job_number}-{job_sequence}-{random_suffix}
-        parts = job_id.split("-")
-        if len(parts) >= 2:
-            job_number = parts[0]
-            job_sequence = parts[1]
-            pod_pattern = f"grpc-job-{job_number}-{job_sequence}"
-        else:
-            pod_pattern = f"grpc-job-{job_id}"
-        
-        # Find the pod using kubectl
-        cmd = f"get pods -n {namespace} -o json"
-        result = kubernetes_manager._execute_kubectl_via_ssh(cmd, timeout=timeout)
-        
-        if not result["success"]:
-            verification.verification_error = f"Failed to list pods: {result.get('stderr', 'Unknown error')}"
-            return verification
-        
-        # Parse pods and find matching pod
-        pods_data = json.loads(result["stdout"])
-        matching_pod = None
+        pod_pattern = _job_pod_pattern(job_id)
         
-        for pod in pods_data.get("items", []):
-            pod_name = pod.get("metadata", {}).get("name", "")
-            if pod_name.startswith(pod_pattern):
-                matching_pod = pod
-                break
+        # Find the pod in the shared cluster snapshot
+        matching_pod = _find_job_pods(kubernetes_manager, [pod_pattern], namespace, timeout)[pod_pattern]
         
         if not matching_pod:
             verification.verification_error = f"No pod found matching pattern: {pod_pattern}"
@@ -229,8 +251,8 @@ def verify_job_from_k8s(
         
         verification.verified = True
         
-    except json.JSONDecodeError as e:
-        verification.verification_error = f"Failed to parse kubectl output: {e}"
+    except InfrastructureError as e:
+        verification.verification_error = f"Failed to list pods: {e}"
     except Exception as e:
         verification.verification_error = f"Verification error: {str(e)}"
     
@@ -276,7 +298,7 @@ def verify_jobs_batch_from_k8s(
     timeout: int = 30
 ) -> List[K8sJobVerification]:
     """
-    Verify multiple jobs from Kubernetes in a single kubectl call.
+    Verify multiple jobs from Kubernetes from one cluster snapshot.
     
     More efficient than calling verify_job_from_k8s for each job.
     
@@ -284,7 +306,7 @@ def verify_jobs_batch_from_k8s(
         kubernetes_manager: KubernetesManager instance
         job_ids: List of job IDs to verify
         namespace: Kubernetes namespace
-        timeout: Total timeout for the kubectl call
+        timeout: Timeout of each list call if the cluster snapshot is refreshed
         
     Returns:
         List of K8sJobVerification results
@@ -292,32 +314,9 @@ def verify_jobs_batch_from_k8s(
     verifications = []
     
     try:
-        # Get all pods in one call
-        cmd = f"get pods -n {namespace} -o json"
-        result = kubernetes_manager._execute_kubectl_via_ssh(cmd, timeout=timeout)
-        
-        if not result["success"]:
-            # Return empty verifications with error
-            for job_id in job_ids:
-                v = K8sJobVerification(
-                    job_id=job_id,
-                    pod_name="",
-                    pod_status="Unknown",
-                    job_type=JobType.UNKNOWN,
-                    verification_error=f"Failed to list pods: {result.get('stderr', 'Unknown error')}"
-                )
-                verifications.append(v)
-            return verifications
-        
-        pods_data = json.loads(result["stdout"])
-        pods_list = pods_data.get("items", [])
-        
-        # Create a mapping of pod patterns to pods
-        pod_map = {}
-        for pod in pods_list:
-            pod_name = pod.get("metadata", {}).get("name", "")
-            if pod_name.startswith("grpc-job-"):
-                pod_map[pod_name] = pod
+        # All pods come from one shared cluster snapshot
+        pod_patterns = {job_id: _job_pod_pattern(job_id) for job_id in job_ids}
+        pods_by_pattern = _find_job_pods(kubernetes_manager, list(pod_patterns.values()), namespace, timeout)
         
         # Verify each job
         for job_id in job_ids:
@@ -328,21 +327,8 @@ def verify_jobs_batch_from_k8s(
                 job_type=JobType.UNKNOWN
             )
             
-            # Convert job_id to pod name pattern
-            parts = job_id.split("-")
-            if len(parts) >= 2:
-                job_number = parts[0]
-                job_sequence = parts[1]
-                pod_pattern = f"grpc-job-{job_number}-{job_sequence}"
-            else:
-                pod_pattern = f"grpc-job-{job_id}"
-            
-            # Find matching pod
-            matching_pod = None
-            for pod_name, pod in pod_map.items():
-                if pod_name.startswith(pod_pattern):
-                    matching_pod = pod
-                    break
+            pod_pattern = pod_patterns[job_id]
+            matching_pod = pods_by_pattern[pod_pattern]
             
             if not matching_pod:
                 verification.verification_error = f"No pod found matching pattern: {pod_pattern}"
@@ -403,14 +389,14 @@ def verify_jobs_batch_from_k8s(
             verification.verified = True
             verifications.append(verification)
         
-    except json.JSONDecodeError as e:
+    except InfrastructureError as e:
         for job_id in job_ids:
             v = K8sJobVerification(
                 job_id=job_id,
                 pod_name="",
                 pod_status="Unknown",
                 job_type=JobType.UNKNOWN,
-                verification_error=f"Failed to parse kubectl output: {e}"
+                verification_error=f"Failed to list pods: {e}"
             )
             verifications.append(v)
     except Exception as e:
@@ -25,6 +25,8 @@ from enum import Enum
 from statistics import mean, median, stdev
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from be_focus_server_tests.load.job_load_tester import BaseJobLoadTester
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,6 +77,11 @@ class LiveJobResult:
     error: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
     
+    @property
+    def response_time_ms(self) -> float:
+        """Latency of the job (closed-loop runs have no schedule lag)."""
+        return self.total_duration_ms
+    
     @property
     def configure_time_ms(self) -> float:
         """Time spent in configure phase."""
@@ -151,6 +158,12 @@ class LiveJobLoadTestResult:
     error_rate: float
     errors_by_type: Dict[str, int] = field(default_factory=dict)
     
+    # Tail latency (HDR histogram)
+    p999_total_time_ms: float = 0.0
+    p9999_total_time_ms: float = 0.0
+    phase_latency_percentiles: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    latency_histograms: Dict[str, Any] = field(default_factory=dict)
+    
     # All results
     all_job_results: List[LiveJobResult] = field(default_factory=list)
     
@@ -176,10 +189,23 @@ class LiveJobLoadTestResult:
             f"   • P50: {self.p50_total_time_ms:.0f}ms",
             f"   • P95: {self.p95_total_time_ms:.0f}ms",
             f"   • P99: {self.p99_total_time_ms:.0f}ms",
+            f"   • P99.9: {self.p999_total_time_ms:.0f}ms",
+            f"   • P99.99: {self.p9999_total_time_ms:.0f}ms",
             "",
             f"📡 Phase Breakdown:",
             f"   • Avg Configure Time: {self.avg_configure_time_ms:.0f}ms",
             f"   • Avg gRPC Connect Time: {self.avg_grpc_connect_time_ms:.0f}ms (includes retries)",
+        ]
+        
+        for phase, pcts in self.phase_latency_percentiles.items():
+            if phase == "total":
+                continue
+            lines.append(
+                f"   • {phase}: P50 {pcts.get('p50', 0):.0f}ms / "
+                f"P95 {pcts.get('p95', 0):.0f}ms / P99 {pcts.get('p99', 0):.0f}ms"
+            )
+        
+        lines += [
             "",
             f"📦 gRPC Streaming:",
             f"   • Total Frames Received: {self.total_frames_received}",
@@ -569,20 +595,13 @@ class LiveJobLoadTester:
         successful = [r for r in all_results if r.success]
         failed = [r for r in all_results if not r.success]
         
-        # Timing metrics from successful jobs
-        total_times = [r.total_duration_ms for r in successful] if successful else [0]
+        # Timing metrics from successful jobs (HDR histograms per phase)
+        latency = BaseJobLoadTester._record_latencies(successful)
+        total_hist = latency.histogram("total")
+        
         configure_times = [r.configure_time_ms for r in successful] if successful else [0]
         grpc_connect_times = [r.grpc_connect_time_ms for r in successful] if successful else [0]
         
-        # Sort for percentiles
-        sorted_times = sorted(total_times)
-        
-        def percentile(data: List[float], p: float) -> float:
-            if not data:
-                return 0.0
-            index = int(len(data) * p / 100)
-            return data[min(index, len(data) - 1)]
-        
         # Frame metrics
         total_frames = sum(r.frames_received for r in all_results)
         avg_frames = mean([r.frames_received for r in successful]) if successful else 0
@@ -607,12 +626,12 @@ class LiveJobLoadTester:
             total_jobs=len(all_results),
             successful_jobs=len(successful),
             failed_jobs=len(failed),
-            avg_total_time_ms=mean(total_times) if total_times else 0,
-            min_total_time_ms=min(total_times) if total_times else 0,
-            max_total_time_ms=max(total_times) if total_times else 0,
-            p50_total_time_ms=percentile(sorted_times, 50),
-            p95_total_time_ms=percentile(sorted_times, 95),
-            p99_total_time_ms=percentile(sorted_times, 99),
+            avg_total_time_ms=total_hist.mean,
+            min_total_time_ms=total_hist.min,
+            max_total_time_ms=total_hist.max,
+            p50_total_time_ms=total_hist.percentile(50),
+            p95_total_time_ms=total_hist.percentile(95),
+            p99_total_time_ms=total_hist.percentile(99),
             avg_configure_time_ms=mean(configure_times) if configure_times else 0,
             avg_grpc_connect_time_ms=mean(grpc_connect_times) if grpc_connect_times else 0,
             avg_frames_received=avg_frames,
@@ -622,6 +641,12 @@ class LiveJobLoadTester:
             avg_retries_per_job=avg_retries,
             error_rate=len(failed) / len(all_results) * 100 if all_results else 0,
             errors_by_type=errors_by_type,
+            p999_total_time_ms=total_hist.percentile(99.9),
+            p9999_total_time_ms=total_hist.percentile(99.99),
+            phase_latency_percentiles={
+                name: latency.percentiles(name) for name in latency.names
+            },
+            latency_histograms=latency.to_dict(),
             all_job_results=all_results
         )
         
@@ -643,6 +668,7 @@ def create_live_job_load_tester(
     frequency_max: int = 500,
     nfft: int = 1024,
     display_height: int = 600,
+    request_log_mode: str = "compact",
     **kwargs
 ) -> LiveJobLoadTester:
     """
@@ -656,6 +682,7 @@ def create_live_job_load_tester(
         frequency_max: Max frequency Hz (default: 500)
         nfft: NFFT selection (default: 1024)
         display_height: Display height (default: 600)
+        request_log_mode: FocusServerAPI request logging ("compact" or "verbose")
         **kwargs: Additional args for LiveJobLoadTester
         
     Returns:
@@ -666,6 +693,7 @@ def create_live_job_load_tester(
     
     # Create API client
     api = FocusServerAPI(config_manager)
+    api.set_request_logging(request_log_mode)
     
     # Create gRPC client factory
     def grpc_factory(connection_timeout: int = 30):
@@ -304,29 +304,25 @@ class GradualHistoricJobLoadTester:
             List of (start_time_ms, end_time_ms) tuples
         """
         try:
-            from be_focus_server_tests.fixtures.recording_fixtures import fetch_recordings_from_mongodb
+            from be_focus_server_tests.fixtures.recordings_catalog import load_recordings_info
             
             logger.info(f"🔍 Querying MongoDB for historic recordings...")
             logger.info(f"   Time range: last {self.cfg.WEEKS_BACK} weeks from NOW")
             logger.info(f"   Duration filter: {self.cfg.MIN_DURATION_SECONDS}-{self.cfg.MAX_DURATION_SECONDS}s")
             
             # Try with configured weeks_back first
-            recordings_info = fetch_recordings_from_mongodb(
+            recordings_info = load_recordings_info(
                 config_manager=self.config_manager,
                 max_recordings=self.cfg.MAX_RECORDINGS_TO_LOAD,
-                min_duration_seconds=self.cfg.MIN_DURATION_SECONDS,
-                max_duration_seconds=self.cfg.MAX_DURATION_SECONDS,
                 weeks_back=self.cfg.WEEKS_BACK
             )
             
             # If no recordings found, try extending the search range
             if not recordings_info.has_recordings:
                 logger.warning(f"No recordings in last {self.cfg.WEEKS_BACK} weeks, trying 8 weeks...")
-                recordings_info = fetch_recordings_from_mongodb(
+                recordings_info = load_recordings_info(
                     config_manager=self.config_manager,
                     max_recordings=self.cfg.MAX_RECORDINGS_TO_LOAD,
-                    min_duration_seconds=self.cfg.MIN_DURATION_SECONDS,
-                    max_duration_seconds=600.0,  # Up to 10 minutes
                     weeks_back=8  # 2 months back
                 )
             
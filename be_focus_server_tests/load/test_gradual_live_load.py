@@ -93,7 +93,9 @@ class LiveJobHandle:
     Represents an active Live Job with CONTINUOUS streaming.
     
     Each job runs a background thread that continuously receives frames
-    to keep the gRPC stream alive.
+    to keep the gRPC stream alive. When created with a stream_handle from an
+    AsyncStreamMultiplexer, the stream is instead a coroutine on the shared
+    event loop and this class only forwards status and stop().
     """
     
     def __init__(
@@ -102,22 +104,55 @@ class LiveJobHandle:
         stream_url: str,
         stream_port: int,
         grpc_client: Any,
+        stream_handle: Optional[Any] = None,
     ):
         self.job_id = job_id
         self.stream_url = stream_url
         self.stream_port = stream_port
         self.grpc_client = grpc_client
+        self.stream_handle = stream_handle
         self.created_at = datetime.now()
         self.is_active = True
-        self.frames_received = 0
-        self.error: Optional[str] = None
+        self._frames_received = 0
+        self._error: Optional[str] = None
         
         # Background streaming
         self._stop_event = threading.Event()
         self._stream_thread: Optional[threading.Thread] = None
     
+    @property
+    def frames_received(self) -> int:
+        """Frames received so far on this job's stream."""
+        if self.stream_handle is not None:
+            return self.stream_handle.frames_received
+        return self._frames_received
+    
+    @frames_received.setter
+    def frames_received(self, value: int) -> None:
+        self._frames_received = value
+    
+    @property
+    def error(self) -> Optional[str]:
+        """Last stream error (if any)."""
+        if self.stream_handle is not None and self.stream_handle.error:
+            return self.stream_handle.error
+        return self._error
+    
+    @error.setter
+    def error(self, value: Optional[str]) -> None:
+        self._error = value
+    
+    def is_streaming(self) -> bool:
+        """Check whether the job's stream consumer is still running."""
+        if self.stream_handle is not None:
+            return self.stream_handle.is_alive
+        return self._stream_thread is not None and self._stream_thread.is_alive()
+    
     def start_streaming(self) -> bool:
         """Start continuous background streaming to keep connection alive."""
+        if self.stream_handle is not None:
+            return self.stream_handle.is_alive  # Started by the multiplexer
+        
         if self._stream_thread and self._stream_thread.is_alive():
             return True  # Already streaming
         
@@ -173,6 +208,11 @@ class LiveJobHandle:
             return True
         
         try:
+            if self.stream_handle is not None:
+                stopped = self.stream_handle.stop()
+                self.is_active = False
+                return stopped
+            
             # Signal thread to stop
             self._stop_event.set()
             
@@ -359,6 +399,8 @@ class GradualLiveLoadTester:
         max_consecutive_failures: int = 3,         # Stop after N consecutive failed steps
         # K8s verification
         k8s_manager=None,
+        # Streaming engine
+        use_async_streams: bool = False,           # One asyncio loop for all streams instead of a thread per job
     ):
         """
         Initialize Gradual Load Tester.
@@ -379,6 +421,8 @@ class GradualLiveLoadTester:
             pod_startup_delay_sec: Initial delay after job creation to allow pod startup
             frames_to_receive: Frames to receive for validation
             max_consecutive_failures: Stop test after N consecutive failed steps (default: 3)
+            use_async_streams: Hold all gRPC streams on one AsyncStreamMultiplexer
+                               event loop instead of one thread per job (for 100+ jobs)
         """
         from src.apis.focus_server_api import FocusServerAPI
         from src.apis.grpc_client import GrpcStreamClient
@@ -421,6 +465,11 @@ class GradualLiveLoadTester:
             )
         self.grpc_client_factory = grpc_factory
         
+        # Async streaming engine (created lazily on first job)
+        self.use_async_streams = use_async_streams
+        self._stream_mux = None
+        self._stream_mux_lock = threading.Lock()
+        
         # Active jobs tracking
         self.active_jobs: List[LiveJobHandle] = []
         
@@ -448,9 +497,25 @@ class GradualLiveLoadTester:
             f"   Max Jobs: {max_jobs}\n"
             f"   Step Interval: {step_interval_sec}s\n"
             f"   Max Consecutive Failures: {max_consecutive_failures} (early termination)\n"
+            f"   Streaming Engine: {'asyncio multiplexer' if use_async_streams else 'thread per job'}\n"
             f"   Monitoring Interval: {self._monitoring_interval_sec}s (status updates every 2 minutes)"
         )
     
+    def _get_stream_mux(self):
+        """Get (and start on first use) the shared AsyncStreamMultiplexer."""
+        from src.apis.grpc_client import AsyncStreamMultiplexer
+        
+        with self._stream_mux_lock:
+            if self._stream_mux is None:
+                self._stream_mux = AsyncStreamMultiplexer(
+                    config_manager=self.config_manager,
+                    connection_timeout=30,
+                    max_connect_retries=self.max_grpc_connect_retries,
+                    connect_retry_delay=self.grpc_connect_retry_delay_ms / 1000,
+                )
+                self._stream_mux.start()
+            return self._stream_mux
+    
     def _create_single_job(self) -> Optional[LiveJobHandle]:
         """
         Create a single Live Job and connect to its gRPC stream.
@@ -489,6 +554,24 @@ class GradualLiveLoadTester:
                 logger.debug(f"Job {job_id}: Waiting {self.pod_startup_delay_sec}s for pod startup...")
                 time.sleep(self.pod_startup_delay_sec)
             
+            if self.use_async_streams:
+                # Step 3+4 (async): connect and start streaming on the shared event loop
+                # (the multiplexer applies the same retries with exponential backoff)
+                stream_handle = self._get_stream_mux().add_stream(
+                    job_id=job_id,
+                    stream_url=stream_url,
+                    stream_port=stream_port
+                )
+                handle = LiveJobHandle(
+                    job_id=job_id,
+                    stream_url=stream_url,
+                    stream_port=stream_port,
+                    grpc_client=None,
+                    stream_handle=stream_handle,
+                )
+                self._verify_job_type(job_id)
+                return handle
+            
             # Step 3: Connect to gRPC with retries and exponential backoff
             grpc_client = self.grpc_client_factory(connection_timeout=30)  # 30s timeout (reduced from 60s)
             
@@ -534,21 +617,7 @@ class GradualLiveLoadTester:
                 logger.debug(f"Job {job_id}: Stream thread started, waiting for frames...")
             
             # K8s verification for job type
-            if self.k8s_manager:
-                try:
-                    verification = verify_job_from_k8s(
-                        kubernetes_manager=self.k8s_manager,
-                        job_id=job_id,
-                        namespace="panda",
-                        timeout=15
-                    )
-                    self._k8s_verifications.append(verification)
-                    
-                    if verification.verified:
-                        job_type_emoji = "🔴" if verification.is_live() else "🕐"
-                        logger.debug(f"   {job_type_emoji} K8s: {job_id} = {verification.job_type.value.upper()}")
-                except Exception as verify_error:
-                    logger.debug(f"K8s verification failed for {job_id}: {verify_error}")
+            self._verify_job_type(job_id)
             
             return handle
             
@@ -564,6 +633,26 @@ class GradualLiveLoadTester:
             
             return None
     
+    def _verify_job_type(self, job_id: str) -> None:
+        """Verify the job type in K8s (if a K8s manager is available)."""
+        if not self.k8s_manager:
+            return
+        
+        try:
+            verification = verify_job_from_k8s(
+                kubernetes_manager=self.k8s_manager,
+                job_id=job_id,
+                namespace="panda",
+                timeout=15
+            )
+            self._k8s_verifications.append(verification)
+            
+            if verification.verified:
+                job_type_emoji = "🔴" if verification.is_live() else "🕐"
+                logger.debug(f"   {job_type_emoji} K8s: {job_id} = {verification.job_type.value.upper()}")
+        except Exception as verify_error:
+            logger.debug(f"K8s verification failed for {job_id}: {verify_error}")
+    
     def _create_jobs_batch(self, count: int, burst_mode: bool = False) -> List[LiveJobHandle]:
         """
         Create a batch of Live Jobs.
@@ -665,8 +754,8 @@ class GradualLiveLoadTester:
                 dead_count += 1
                 continue
             
-            # Check if streaming thread is alive
-            if job_handle._stream_thread and job_handle._stream_thread.is_alive():
+            # Check if streaming thread (or async stream task) is alive
+            if job_handle.is_streaming():
                 alive_count += 1
                 total_frames += job_handle.frames_received
             else:
@@ -1260,7 +1349,9 @@ class GradualLiveLoadTester:
             try:
                 # Disconnect gRPC - this is all we need to do!
                 # The K8s cleanup-job will detect low CPU and delete everything
-                if job_handle.grpc_client:
+                if job_handle.stream_handle is not None:
+                    job_handle.stop()
+                elif job_handle.grpc_client:
                     try:
                         job_handle.grpc_client.disconnect()
                         logger.debug(f"   ✓ Disconnected gRPC for job {job_handle.job_id}")
@@ -1279,6 +1370,10 @@ class GradualLiveLoadTester:
         
         self.active_jobs.clear()
         
+        if self._stream_mux is not None:
+            self._stream_mux.shutdown()
+            self._stream_mux = None
+        
         success = len(cleanup_errors) == 0 or (jobs_cleaned > 0)
         
         logger.info(f"   Cleaned up {jobs_cleaned} jobs")
@@ -1856,6 +1951,40 @@ class TestGradualLoadCustomConfig:
         logger.info(f"\n✅ High concurrency test completed")
         logger.info(f"   Max Concurrent: {result.max_concurrent_jobs}")
     
+    @pytest.mark.slow
+    def test_high_concurrency_async_streams(self, config_manager, gradual_load_sla):
+        """
+        Test: High concurrency gradual load with the asyncio streaming engine.
+        
+        Same pattern as test_high_concurrency_gradual, but all gRPC streams
+        share one AsyncStreamMultiplexer event loop instead of one thread per
+        job, so the load generator is not the bottleneck at 100+ streams.
+        """
+        logger.info(f"\n[GRADUAL LOAD] High Concurrency (async streams): 10 → 100 (step 10)")
+        
+        tester = GradualLiveLoadTester(
+            config_manager=config_manager,
+            initial_jobs=10,
+            step_increment=10,
+            max_jobs=100,
+            step_interval_sec=8,
+            sla=gradual_load_sla,
+            max_grpc_connect_retries=3,
+            grpc_connect_retry_delay_ms=2000,
+            max_consecutive_failures=3,
+            use_async_streams=True
+        )
+        
+        result = tester.run_test(
+            test_name="High Concurrency Async Streams (10→100, step 10)"
+        )
+        
+        assert result.cleanup_successful, "Cleanup must succeed"
+        assert result.total_steps >= 8, f"Expected 8+ steps, got {result.total_steps}"
+        
+        logger.info(f"\n✅ High concurrency (async streams) test completed")
+        logger.info(f"   Max Concurrent: {result.max_concurrent_jobs}")
+    
     @pytest.mark.xray("PZ-LOAD-312")
     @pytest.mark.slow
     def test_burst_then_gradual_30_to_100(self, config_manager, gradual_load_sla):
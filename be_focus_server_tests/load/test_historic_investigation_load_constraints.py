@@ -119,16 +119,14 @@ def get_available_recordings(config_manager, min_duration: float = 5.0, max_dura
         List of (start_time_ms, end_time_ms) tuples from current environment only
     """
     try:
-        from be_focus_server_tests.fixtures.recording_fixtures import fetch_recordings_from_mongodb
+        from be_focus_server_tests.fixtures.recordings_catalog import load_recordings_info
         
         current_env = config_manager.get_current_environment()
         logger.info(f"Fetching recordings for environment: {current_env}")
         
-        info = fetch_recordings_from_mongodb(
+        info = load_recordings_info(
             config_manager=config_manager,
             max_recordings=HistoricInvestigationConfig.MAX_RECORDINGS_TO_LOAD,
-            min_duration_seconds=min_duration,  # Ignored by fetch_recordings_from_mongodb
-            max_duration_seconds=max_duration,  # Ignored by fetch_recordings_from_mongodb
             weeks_back=HistoricInvestigationConfig.WEEKS_BACK
         )
         
@@ -217,6 +217,30 @@ class TestLiveJobLoad:
         
         assert result.avg_retries_per_job <= live_sla['max_avg_retries'], \
             f"Avg retries {result.avg_retries_per_job:.2f} too high ({env})"
+    
+    def test_open_loop_poisson_live_load(self, live_tester, live_sla):
+        """Test: Live jobs at a Poisson arrival rate (open-loop, no coordinated omission)."""
+        from be_focus_server_tests.load.async_job_orchestrator import (
+            ArrivalModel, ArrivalSchedule
+        )
+        
+        env = get_environment()
+        
+        logger.info(f"\n[LIVE] Open-Loop Poisson Load")
+        
+        result = live_tester.run_open_loop_load_test(
+            num_jobs=10,
+            arrival=ArrivalSchedule(model=ArrivalModel.POISSON, rate_per_second=0.5),
+            test_name="Open-Loop Live (Poisson)"
+        )
+        
+        success_rate = 100 - result.error_rate
+        assert success_rate >= live_sla['min_success_rate'], \
+            f"Open-loop success rate {success_rate:.1f}% below threshold ({env})"
+        
+        # Percentiles include time spent behind schedule
+        assert result.p95_total_time_ms < live_sla['total_p95_ms'], \
+            f"P95 {result.p95_total_time_ms:.0f}ms exceeds {live_sla['total_p95_ms']}ms ({env})"
 
 
 # =============================================================================
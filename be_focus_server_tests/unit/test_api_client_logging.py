@@ -0,0 +1,131 @@
+"""
+Unit Tests - API Client Request Logging
+=======================================
+
+Unit tests for the compact (sampled, background) request logging mode of
+BaseAPIClient.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import logging
+import subprocess
+import sys
+import textwrap
+
+import pytest
+import requests
+
+from src.core.api_client import (
+    BaseAPIClient,
+    REQUEST_LOGGER_NAME,
+    flush_request_logger,
+)
+from src.core.exceptions import APIError
+
+
+def _response(status_code: int, body: bytes = b'{"ok": true}') -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers["content-type"] = "application/json"
+    response.reason = "OK" if status_code < 400 else "Error"
+    return response
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def request_records():
+    """Capture records emitted by the background request log writer."""
+    handler = _RecordingHandler()
+    root = logging.getLogger()
+    root.addHandler(handler)
+    yield handler.records
+    flush_request_logger()
+    root.removeHandler(handler)
+
+
+def _client(monkeypatch, status_code: int = 200, **kwargs) -> BaseAPIClient:
+    client = BaseAPIClient("http://focus.test", log_mode="compact", **kwargs)
+    monkeypatch.setattr(client.session, "request", lambda *a, **kw: _response(status_code))
+    return client
+
+
+@pytest.mark.unit
+class TestCompactRequestLogging:
+    """Unit tests for BaseAPIClient compact logging mode."""
+
+    def test_only_sampled_requests_are_logged(self, monkeypatch, request_records):
+        """Test: One record per log_sample_every fast, successful requests."""
+        client = _client(monkeypatch, log_sample_every=10, slow_request_ms=60000)
+        for _ in range(25):
+            assert client.get("/channels").status_code == 200
+        flush_request_logger()
+
+        api_records = [r for r in request_records if r.name == REQUEST_LOGGER_NAME]
+        assert len(api_records) == 2
+        assert [r.api_request["request_number"] for r in api_records] == [10, 20]
+        assert api_records[0].api_request["url"] == "http://focus.test/channels"
+
+    def test_errors_are_always_logged(self, monkeypatch, request_records):
+        """Test: Failed requests are logged at WARNING and still raise APIError."""
+        client = _client(monkeypatch, status_code=500, log_sample_every=0)
+        with pytest.raises(APIError):
+            client.post("/configure", json={"a": 1})
+        flush_request_logger()
+
+        api_records = [r for r in request_records if r.name == REQUEST_LOGGER_NAME]
+        assert len(api_records) == 1
+        assert api_records[0].levelno == logging.WARNING
+        assert api_records[0].api_request["status"] == 500
+
+    def test_slow_requests_are_logged(self, monkeypatch, request_records):
+        """Test: Requests slower than slow_request_ms are always logged."""
+        client = _client(monkeypatch, log_sample_every=0, slow_request_ms=0)
+        client.get("/ack")
+        flush_request_logger()
+
+        api_records = [r for r in request_records if r.name == REQUEST_LOGGER_NAME]
+        assert len(api_records) == 1
+        assert api_records[0].api_request["slow"] is True
+
+    def test_bodies_are_not_logged(self, monkeypatch, request_records, caplog):
+        """Test: Compact mode never logs request or response bodies."""
+        client = _client(monkeypatch, log_sample_every=1)
+        with caplog.at_level(logging.DEBUG):
+            client.post("/configure", json={"secret_payload": 1})
+        flush_request_logger()
+
+        assert "secret_payload" not in caplog.text
+        assert all("secret_payload" not in r.getMessage() for r in request_records)
+
+    def test_invalid_mode(self):
+        """Test: Unknown log modes are rejected."""
+        with pytest.raises(ValueError):
+            BaseAPIClient("http://focus.test", log_mode="chatty")
+
+    def test_queued_records_are_flushed_at_exit(self):
+        """Test: Records still queued when the interpreter exits are written."""
+        script = textwrap.dedent("""
+            import logging, sys
+            from src.core.api_client import get_request_logger
+            logging.basicConfig(stream=sys.stdout, format="%(message)s")
+            logger = get_request_logger()
+            for n in range(1000):
+                logger.warning("request %d", n)
+        """)
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=60
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines()[-1] == "request 999"
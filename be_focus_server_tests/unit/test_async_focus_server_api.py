@@ -0,0 +1,257 @@
+"""
+Unit Tests - Async Focus Server API
+===================================
+
+Unit tests for AsyncFocusServerAPI against an in-process aiohttp server:
+typed endpoint parsing, keep-alive pooling, per-host concurrency limits,
+retries and circuit breaker behaviour.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import socket
+
+import pytest
+from aiohttp import web
+
+from src.apis import async_focus_server_api
+from src.apis.async_focus_server_api import AsyncFocusServerAPI
+from src.core.exceptions import APIError, NetworkError
+from src.models.focus_server_models import ConfigureRequest
+
+_CONFIGURE_RESPONSE = {
+    "status": "success",
+    "frequencies_list": [0.0, 1.0],
+    "lines_dt": 0.1,
+    "channel_to_stream_index": {"1": 0},
+    "stream_amount": 1,
+    "job_id": "job-1",
+    "frequencies_amount": 2,
+    "channel_amount": 1,
+    "stream_port": "30123",
+    "stream_url": "127.0.0.1",
+    "view_type": 0,
+}
+
+
+class _FakeConfig:
+    """Minimal config manager: dot-key lookups over a flat dict."""
+
+    def __init__(self, base_url: str, **overrides):
+        self.base_url = base_url
+        self.values = {
+            "api_client.retry.max_attempts": 2,
+            "api_client.retry.backoff_factor": 0.01,
+            "api_client.timeout": 5,
+            **overrides,
+        }
+
+    def get_api_config(self):
+        return {"base_url": self.base_url}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class _FocusServerStub:
+    """In-process Focus Server with call counters."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.hits = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.peers = set()
+        self.fail_until = 0
+
+    def _track(self, request, name):
+        self.hits[name] = self.hits.get(name, 0) + 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+
+    async def configure(self, request):
+        self._track(request, "configure")
+        await request.json()
+        return web.json_response(_CONFIGURE_RESPONSE)
+
+    async def live_metadata(self, request):
+        self._track(request, "live_metadata")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.hits["live_metadata"] <= self.fail_until:
+            return web.json_response({"error": "busy"}, status=503)
+        return web.json_response({"prr": 1000.0, "number_of_channels": 8})
+
+    async def fiber(self, request):
+        self._track(request, "fiber")
+        return web.json_response({"error": "Waiting for fiber"}, status=503)
+
+    async def waterfall(self, request):
+        self._track(request, "waterfall")
+        task_id = request.match_info["task_id"]
+        if task_id == "data":
+            return web.json_response([{"rows": [], "current_max_amp": 1.0, "current_min_amp": 0.0}], status=201)
+        if task_id == "exited":
+            return web.Response(status=208)
+        if task_id == "missing":
+            return web.json_response({"error": "Consumer not found"}, status=404)
+        return web.Response(status=200)
+
+    async def metadata(self, request):
+        self._track(request, "metadata")
+        if request.match_info["task_id"] == "missing":
+            return web.json_response({"error": "Invalid task_id"}, status=404)
+        return web.json_response({"prr": 2000.0, "dtype": "float32"}, status=201)
+
+    async def delete_job(self, request):
+        self._track(request, "delete_job")
+        if request.match_info["job_id"] == "missing":
+            return web.json_response({"error": "not found"}, status=404)
+        return web.json_response({})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/configure", self.configure)
+        app.router.add_get("/live_metadata", self.live_metadata)
+        app.router.add_get("/fiber", self.fiber)
+        app.router.add_get("/waterfall/{task_id}/{row_count}", self.waterfall)
+        app.router.add_get("/metadata/{task_id}", self.metadata)
+        app.router.add_delete("/job/{job_id}", self.delete_job)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture
+async def focus_server():
+    stub = _FocusServerStub()
+    stub.base_url = await stub.start()
+    yield stub
+    await stub.runner.cleanup()
+
+
+def _closed_port_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+@pytest.mark.unit
+class TestAsyncFocusServerAPI:
+    """Unit tests for AsyncFocusServerAPI."""
+
+    async def test_typed_endpoints(self, focus_server):
+        """Test: Typed methods parse responses like FocusServerAPI."""
+        async with AsyncFocusServerAPI(_FakeConfig(focus_server.base_url)) as api:
+            request = ConfigureRequest(
+                displayTimeAxisDuration=10,
+                nfftSelection=1024,
+                displayInfo={"height": 1000},
+                channels={"min": 1, "max": 50},
+                frequencyRange={"min": 0, "max": 500},
+                start_time=None,
+                end_time=None,
+                view_type=0,
+            )
+            configured = await api.configure_streaming_job(request)
+            assert configured.job_id == "job-1"
+
+            assert (await api.get_waterfall("data", 10)).status_code == 201
+            assert (await api.get_waterfall("none", 10)).data is None
+            assert (await api.get_waterfall("exited", 10)).status_code == 208
+            assert (await api.get_waterfall("missing", 10)).message == "Consumer not found for task_id"
+
+            metadata = await api.get_task_metadata("task")
+            assert metadata.metadata.prr == 2000.0
+            assert (await api.get_task_metadata("missing")).status_code == 404
+
+            assert (await api.get_live_metadata_flat()).number_of_channels == 8
+            assert await api.cancel_job("job-1") is True
+            assert await api.cancel_job("missing") is False
+
+    async def test_waterfall_columns_fast_path(self, focus_server):
+        """Test: get_waterfall_columns decodes to NumPy and maps statuses."""
+        config = _FakeConfig(focus_server.base_url, **{"api_client.waterfall.validate_every": 1})
+        async with AsyncFocusServerAPI(config) as api:
+            data = await api.get_waterfall_columns("data", 10)
+            missing = await api.get_waterfall_columns("missing", 10)
+
+        assert data.status_code == 201
+        assert data.columns.num_rows == 0
+        assert data.validated is True
+        assert missing.status_code == 404
+        assert missing.columns is None
+
+    async def test_connections_are_kept_alive(self, focus_server):
+        """Test: Sequential requests reuse one pooled connection."""
+        async with AsyncFocusServerAPI(_FakeConfig(focus_server.base_url)) as api:
+            for _ in range(10):
+                await api.get_live_metadata_flat()
+        assert focus_server.hits["live_metadata"] == 10
+        assert len(focus_server.peers) == 1
+
+    async def test_per_host_concurrency_limit(self, focus_server):
+        """Test: No more than max_connections_per_host requests in flight."""
+        focus_server.delay = 0.05
+        async with AsyncFocusServerAPI(
+            _FakeConfig(focus_server.base_url), max_connections_per_host=3
+        ) as api:
+            results = await asyncio.gather(*(api.get_live_metadata_flat() for _ in range(12)))
+        assert len(results) == 12
+        assert focus_server.max_in_flight == 3
+
+    async def test_retries_on_server_errors(self, focus_server):
+        """Test: 5xx responses are retried with backoff."""
+        focus_server.fail_until = 2
+        async with AsyncFocusServerAPI(_FakeConfig(focus_server.base_url)) as api:
+            metadata = await api.get_live_metadata_flat()
+        assert metadata.prr == 1000.0
+        assert focus_server.hits["live_metadata"] == 3
+
+    async def test_waiting_for_fiber_is_not_retried(self, focus_server):
+        """Test: A 'waiting for fiber' 503 raises immediately."""
+        async with AsyncFocusServerAPI(_FakeConfig(focus_server.base_url)) as api:
+            with pytest.raises(APIError, match="waiting for fiber") as exc_info:
+                await api.get("/fiber")
+        assert exc_info.value.status_code == 503
+        assert focus_server.hits["fiber"] == 1
+
+    async def test_circuit_breaker_opens_on_connection_failures(self):
+        """Test: After 5 connection failures requests fail fast."""
+        config = _FakeConfig(_closed_port_url(), **{"api_client.retry.max_attempts": 0})
+        async with AsyncFocusServerAPI(config) as api:
+            for _ in range(5):
+                with pytest.raises(NetworkError, match="Connection failed"):
+                    await api.get("/live_metadata")
+            assert api.circuit_breaker.get_state() == "OPEN"
+
+            with pytest.raises(NetworkError, match="Circuit breaker is open"):
+                await api.get("/live_metadata")
+
+    async def test_retries_count_as_one_breaker_failure(self):
+        """Test: A request that fails after all retries is one breaker failure."""
+        config = _FakeConfig(_closed_port_url(), **{
+            "api_client.retry.max_attempts": 3,
+            "api_client.retry.backoff_factor": 0.0,
+        })
+        async with AsyncFocusServerAPI(config) as api:
+            for expected in (1, 2):
+                with pytest.raises(NetworkError, match="Connection failed"):
+                    await api.get("/live_metadata")
+                assert api.circuit_breaker.get_failure_count() == expected
+            assert api.circuit_breaker.get_state() == "CLOSED"
+
+    def test_http2_falls_back_without_httpx(self, monkeypatch):
+        """Test: http2=True without httpx uses the HTTP/1.1 aiohttp pool."""
+        monkeypatch.setattr(async_focus_server_api, "HTTPX_AVAILABLE", False)
+        api = AsyncFocusServerAPI(_FakeConfig("http://focus.test"), http2=True)
+        assert api.http2 is False
@@ -0,0 +1,256 @@
+"""
+Unit Tests - Async gRPC Stream Client
+======================================
+
+Unit tests for AsyncGrpcStreamClient and AsyncStreamMultiplexer against an
+in-process pandadatastream server.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import threading
+import time
+
+import grpc
+import pytest
+
+from src.apis.grpc_client import (
+    AsyncGrpcStreamClient,
+    AsyncStreamMultiplexer,
+    StreamMetrics,
+)
+from src.models.proto_generated import pandadatastream_pb2, pandadatastream_pb2_grpc
+
+
+class _FakeDataStreamService(pandadatastream_pb2_grpc.DataStreamServiceServicer):
+    """Streams small frames forever (or max_frames) with a short interval."""
+
+    def __init__(self, interval: float = 0.01, max_frames: int = 0):
+        self.interval = interval
+        self.max_frames = max_frames
+
+    async def StreamData(self, request, context):
+        sent = 0
+        while not self.max_frames or sent < self.max_frames:
+            sent += 1
+            yield pandadatastream_pb2.DataStream(
+                start_channel=1,
+                end_channel=4,
+                data_shape_x=4,
+                data_shape_y=2,
+                global_minimum=-float(sent),
+                global_maximum=float(sent),
+            )
+            await asyncio.sleep(self.interval)
+
+
+async def _start_server(servicer) -> tuple:
+    server = grpc.aio.server()
+    pandadatastream_pb2_grpc.add_DataStreamServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    return server, port
+
+
+@pytest.mark.unit
+class TestStreamMetrics:
+    """Unit tests for StreamMetrics.record_frame."""
+
+    def test_record_frame_tracks_rows_and_amplitude(self):
+        """Test: Frames update counters and amplitude range."""
+        metrics = StreamMetrics()
+        metrics.record_frame(pandadatastream_pb2.DataStream(
+            data_shape_y=3, global_minimum=-1.0, global_maximum=2.0
+        ))
+        metrics.record_frame(pandadatastream_pb2.DataStream(
+            data_shape_y=5, global_minimum=-4.0, global_maximum=1.0
+        ))
+
+        assert metrics.frames_received == 2
+        assert metrics.total_rows == 8
+        assert metrics.min_amplitude == -4.0
+        assert metrics.max_amplitude == 2.0
+
+
+@pytest.mark.unit
+class TestAsyncGrpcStreamClient:
+    """Unit tests for AsyncGrpcStreamClient."""
+
+    async def test_stream_max_frames(self):
+        """Test: stream_data stops at max_frames and records metrics."""
+        server, port = await _start_server(_FakeDataStreamService())
+        try:
+            async with AsyncGrpcStreamClient(connection_timeout=5) as client:
+                await client.connect("127.0.0.1", port)
+                frames = [f async for f in client.stream_data(max_frames=5, timeout=5)]
+
+                assert len(frames) == 5
+                assert client.metrics.frames_received == 5
+                assert client.metrics.total_rows == 10
+                assert client.metrics.max_amplitude == 5.0
+        finally:
+            await server.stop(None)
+
+    async def test_stream_ends_on_server_eof(self):
+        """Test: A finished server stream ends the generator cleanly."""
+        server, port = await _start_server(_FakeDataStreamService(max_frames=3))
+        try:
+            async with AsyncGrpcStreamClient(connection_timeout=5) as client:
+                await client.connect("127.0.0.1", port)
+                frames = [f async for f in client.stream_data(timeout=5)]
+                assert len(frames) == 3
+        finally:
+            await server.stop(None)
+
+    async def test_per_frame_timeout(self):
+        """Test: No frame within the timeout raises TimeoutError."""
+        server, port = await _start_server(_FakeDataStreamService(interval=2.0))
+        try:
+            async with AsyncGrpcStreamClient(connection_timeout=5) as client:
+                await client.connect("127.0.0.1", port)
+                with pytest.raises(TimeoutError):
+                    async for _ in client.stream_data(timeout=0.3):
+                        pass
+                assert client.metrics.frames_received == 1
+                assert client.metrics.errors == 1
+        finally:
+            await server.stop(None)
+
+    async def test_stream_without_connect(self):
+        """Test: Streaming before connect raises ConnectionError."""
+        client = AsyncGrpcStreamClient()
+        with pytest.raises(ConnectionError):
+            async for _ in client.stream_data():
+                pass
+
+
+@pytest.mark.unit
+class TestAsyncStreamMultiplexer:
+    """Unit tests for AsyncStreamMultiplexer."""
+
+    async def test_many_streams_on_one_loop(self):
+        """Test: Many concurrent streams share one event loop."""
+        server, port = await _start_server(_FakeDataStreamService())
+        mux = AsyncStreamMultiplexer(connection_timeout=5, frame_timeout=5)
+        try:
+            handles = await asyncio.gather(*(
+                mux.open_stream(f"job-{i}", "127.0.0.1", port) for i in range(50)
+            ))
+            await asyncio.sleep(0.3)
+
+            assert mux.active_count == 50
+            assert all(h.frames_received > 0 for h in handles)
+            assert set(mux.metrics_snapshot()) == {f"job-{i}" for i in range(50)}
+
+            assert await mux.close_all() == 50
+            assert mux.active_count == 0
+        finally:
+            await server.stop(None)
+
+    async def test_stream_restarts_after_server_eof(self):
+        """Test: A finished stream is re-opened and metrics keep accumulating."""
+        server, port = await _start_server(_FakeDataStreamService(max_frames=2))
+        mux = AsyncStreamMultiplexer(connection_timeout=5, frame_timeout=5, reconnect_delay=0.05)
+        try:
+            handle = await mux.open_stream("job-1", "127.0.0.1", port)
+            await asyncio.sleep(0.5)
+
+            assert handle.stream_restarts >= 1
+            assert handle.frames_received > 2
+            await mux.close_stream("job-1")
+            assert not handle.is_alive
+        finally:
+            await server.stop(None)
+
+    async def test_stream_reconnects_on_new_channel_after_error(self):
+        """Test: After a server restart the stream resumes on a fresh channel."""
+        server, port = await _start_server(_FakeDataStreamService())
+        mux = AsyncStreamMultiplexer(connection_timeout=5, frame_timeout=5, reconnect_delay=0.05)
+        try:
+            handle = await mux.open_stream("job-1", "127.0.0.1", port)
+            await asyncio.sleep(0.2)
+            old_channel = handle.client._channel
+
+            await server.stop(None)
+            await asyncio.sleep(0.2)
+            assert handle.error is not None
+
+            server = grpc.aio.server()
+            pandadatastream_pb2_grpc.add_DataStreamServiceServicer_to_server(
+                _FakeDataStreamService(), server
+            )
+            server.add_insecure_port(f"127.0.0.1:{port}")
+            await server.start()
+
+            frames_before = handle.frames_received
+            deadline = time.time() + 5
+            while handle.frames_received == frames_before and time.time() < deadline:
+                await asyncio.sleep(0.05)
+
+            assert handle.frames_received > frames_before
+            assert handle.client._channel is not old_channel
+            await mux.close_stream("job-1")
+        finally:
+            await server.stop(None)
+
+    async def test_connect_failure(self):
+        """Test: Unreachable target raises ConnectionError after retries."""
+        mux = AsyncStreamMultiplexer(
+            connection_timeout=0.2, max_connect_retries=2, connect_retry_delay=0.01
+        )
+        with pytest.raises(ConnectionError):
+            await mux.open_stream("job-x", "127.0.0.1", 1)
+        assert mux.get_handle("job-x") is None
+
+    def test_sync_bridge(self):
+        """Test: start()/add_stream()/shutdown() work from a plain thread."""
+        loop = asyncio.new_event_loop()
+        server, port = loop.run_until_complete(_start_server(_FakeDataStreamService()))
+
+        server_thread = threading.Thread(target=loop.run_forever, daemon=True)
+        server_thread.start()
+
+        mux = AsyncStreamMultiplexer(connection_timeout=5, frame_timeout=5)
+        mux.start()
+        try:
+            handle = mux.add_stream("job-1", "127.0.0.1", port, timeout=10)
+            deadline = time.time() + 5
+            while handle.frames_received == 0 and time.time() < deadline:
+                time.sleep(0.05)
+
+            assert handle.is_alive
+            assert handle.frames_received > 0
+            assert handle.stop() is True
+            assert not handle.is_alive
+        finally:
+            assert mux.shutdown() == 0
+            asyncio.run_coroutine_threadsafe(server.stop(None), loop).result(5)
+            loop.call_soon_threadsafe(loop.stop)
+            server_thread.join(5)
+            loop.close()
+
+    def test_shutdown_leaves_loop_open_while_thread_runs(self):
+        """Test: shutdown() only closes the loop once its thread has exited."""
+        mux = AsyncStreamMultiplexer()
+        mux.start()
+        release = threading.Event()
+        # Keep the loop thread busy past shutdown()'s join timeout
+        mux._loop.call_soon_threadsafe(release.wait, 10)
+        loop, thread = mux._loop, mux._loop_thread
+
+        original_join = thread.join
+        thread.join = lambda timeout=None: original_join(0.1)
+        try:
+            mux.shutdown(timeout=0.1)
+            assert thread.is_alive()
+            assert not loop.is_closed()
+        finally:
+            release.set()
+            thread.join = original_join
+
+        thread.join(5)
+        mux.shutdown()
+        assert not thread.is_alive()
+        assert loop.is_closed()
@@ -0,0 +1,248 @@
+"""
+Unit Tests - Async Job Load Orchestrator
+=========================================
+
+Unit tests for the open-loop arrival schedules and AsyncJobOrchestrator
+against an in-process /configure endpoint and pandadatastream server.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+
+from be_focus_server_tests.load.async_job_orchestrator import (
+    ArrivalModel,
+    ArrivalSchedule,
+    AsyncJobOrchestrator,
+)
+from be_focus_server_tests.load.job_load_tester import LiveJobLoadTester
+from be_focus_server_tests.load.k8s_job_verification import (
+    JobType as K8sJobType,
+    K8sJobVerification,
+)
+from be_focus_server_tests.unit.test_async_grpc_client import (
+    _FakeDataStreamService,
+    _start_server,
+)
+
+
+async def _start_configure_app(grpc_port: int, delay: float = 0.0):
+    """Serve POST /configure returning a job on the fake gRPC server."""
+    counter = {"jobs": 0}
+
+    async def configure(request):
+        await request.json()
+        counter["jobs"] += 1
+        if delay:
+            await asyncio.sleep(delay)
+        return web.json_response({
+            "status": "success",
+            "frequencies_list": [0.0, 1.0],
+            "lines_dt": 0.1,
+            "channel_to_stream_index": {"1": 0},
+            "stream_amount": 1,
+            "job_id": f"job-{counter['jobs']}",
+            "frequencies_amount": 2,
+            "channel_amount": 1,
+            "stream_port": str(grpc_port),
+            "stream_url": "127.0.0.1",
+            "view_type": 0,
+        })
+
+    app = web.Application()
+    app.router.add_post("/configure", configure)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _make_tester(base_url: str) -> LiveJobLoadTester:
+    api = SimpleNamespace(base_url=base_url, verify_ssl=False)
+    return LiveJobLoadTester(
+        focus_server_api=api,
+        grpc_client_factory=None,
+        frames_to_receive=3,
+        max_grpc_connect_retries=2,
+        grpc_connect_retry_delay_ms=10,
+        configure_timeout_seconds=5,
+        grpc_connect_timeout_seconds=5,
+        stream_timeout_seconds=5,
+    )
+
+
+@pytest.mark.unit
+class TestArrivalSchedule:
+    """Unit tests for ArrivalSchedule offsets."""
+
+    def test_constant_rate(self):
+        """Test: Constant arrivals are evenly spaced."""
+        offsets = ArrivalSchedule(rate_per_second=4.0).offsets(5)
+        assert offsets == pytest.approx([0.0, 0.25, 0.5, 0.75, 1.0])
+
+    def test_poisson_is_seeded_and_averages_to_rate(self):
+        """Test: Poisson arrivals are reproducible and match the mean rate."""
+        schedule = ArrivalSchedule(model=ArrivalModel.POISSON, rate_per_second=10.0, seed=7)
+        offsets = schedule.offsets(2000)
+
+        assert offsets == schedule.offsets(2000)
+        assert offsets == sorted(offsets)
+        assert 2000 / offsets[-1] == pytest.approx(10.0, rel=0.1)
+
+    def test_step_rate_increases(self):
+        """Test: Step arrivals get denser every interval."""
+        schedule = ArrivalSchedule(
+            model=ArrivalModel.STEP, rate_per_second=1.0,
+            step_increment=1.0, step_interval_seconds=2.0
+        )
+        assert schedule.rate_at(0.5) == 1.0
+        assert schedule.rate_at(2.5) == 2.0
+        assert schedule.rate_at(4.0) == 3.0
+        assert schedule.offsets(4) == pytest.approx([0.0, 1.0, 2.0, 2.5])
+
+    def test_spike_window(self):
+        """Test: Spike arrivals use the spike rate only inside the window."""
+        schedule = ArrivalSchedule(
+            model=ArrivalModel.SPIKE, rate_per_second=1.0,
+            spike_rate_per_second=10.0, spike_start_seconds=2.0, spike_duration_seconds=1.0
+        )
+        offsets = schedule.offsets(20)
+        in_spike = [o for o in offsets if 2.0 <= o < 3.0]
+
+        assert len(in_spike) == 10
+        assert schedule.rate_at(3.5) == 1.0
+
+    def test_invalid_rate(self):
+        """Test: Non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            ArrivalSchedule(rate_per_second=0)
+
+
+@pytest.mark.unit
+class TestAsyncJobOrchestrator:
+    """Unit tests for AsyncJobOrchestrator."""
+
+    async def test_open_loop_run(self):
+        """Test: All jobs run configure -> connect -> stream -> disconnect."""
+        server, grpc_port = await _start_server(_FakeDataStreamService())
+        runner, base_url = await _start_configure_app(grpc_port)
+        try:
+            tester = _make_tester(base_url)
+            result = await AsyncJobOrchestrator(tester).run(
+                num_jobs=10,
+                arrival=ArrivalSchedule(rate_per_second=50.0),
+            )
+
+            assert result.total_jobs == 10
+            assert result.successful_jobs == 10
+            assert result.total_frames_received == 30
+            assert len({r.job_id for r in result.all_job_results}) == 10
+        finally:
+            await runner.cleanup()
+            await server.stop(None)
+
+    async def test_in_flight_cap_is_charged_as_latency(self):
+        """Test: Waiting for an in-flight slot counts as schedule lag."""
+        server, grpc_port = await _start_server(_FakeDataStreamService())
+        runner, base_url = await _start_configure_app(grpc_port, delay=0.2)
+        try:
+            tester = _make_tester(base_url)
+            result = await AsyncJobOrchestrator(tester, max_in_flight=1).run(
+                num_jobs=4,
+                arrival=ArrivalSchedule(rate_per_second=100.0),
+            )
+
+            assert result.successful_jobs == 4
+            assert result.max_schedule_lag_ms >= 400
+            for job in result.all_job_results:
+                assert job.response_time_ms == pytest.approx(
+                    job.schedule_lag_ms + job.total_duration_ms
+                )
+            assert result.max_total_time_ms >= result.max_schedule_lag_ms
+        finally:
+            await runner.cleanup()
+            await server.stop(None)
+
+    async def test_prepare_and_payloads_run_off_the_loop(self):
+        """Test: prepare() and payload creation run once per run, in worker threads."""
+        loop_thread = threading.get_ident()
+        calls = []
+
+        class _Tester(LiveJobLoadTester):
+            def prepare(self):
+                calls.append(("prepare", threading.get_ident()))
+
+            def _create_config_payload(self):
+                calls.append(("payload", threading.get_ident()))
+                if len(calls) == 2:
+                    raise ValueError("no recordings")
+                return super()._create_config_payload()
+
+        tester = _Tester(
+            focus_server_api=SimpleNamespace(base_url="http://127.0.0.1:1", verify_ssl=False),
+            grpc_client_factory=None,
+            configure_timeout_seconds=5,
+        )
+        result = await AsyncJobOrchestrator(tester).run(
+            num_jobs=3,
+            arrival=ArrivalSchedule(rate_per_second=100.0),
+        )
+
+        assert [name for name, _ in calls] == ["prepare", "payload", "payload", "payload"]
+        assert all(thread != loop_thread for _, thread in calls)
+        assert result.failed_jobs == 3
+        assert sum("no recordings" in r.error for r in result.all_job_results) == 1
+
+    async def test_configure_failure_is_recorded(self):
+        """Test: An unreachable /configure fails the job instead of the run."""
+        tester = _make_tester("http://127.0.0.1:1")
+        result = await AsyncJobOrchestrator(tester).run(
+            num_jobs=2,
+            arrival=ArrivalSchedule(rate_per_second=100.0),
+        )
+
+        assert result.failed_jobs == 2
+        assert all("Configure failed" in r.error for r in result.all_job_results)
+
+    async def test_k8s_verification_is_batched(self, monkeypatch):
+        """Test: Completed job IDs are verified in batches, not per job."""
+        from be_focus_server_tests.load import async_job_orchestrator
+
+        batches = []
+
+        def fake_batch_verify(kubernetes_manager, job_ids, namespace, timeout):
+            batches.append(list(job_ids))
+            return [
+                K8sJobVerification(
+                    job_id=j, pod_name=f"grpc-job-{j}", pod_status="Running",
+                    job_type=K8sJobType.LIVE, verified=True
+                )
+                for j in job_ids
+            ]
+
+        monkeypatch.setattr(async_job_orchestrator, "verify_jobs_batch_from_k8s", fake_batch_verify)
+
+        server, grpc_port = await _start_server(_FakeDataStreamService())
+        runner, base_url = await _start_configure_app(grpc_port)
+        try:
+            tester = _make_tester(base_url)
+            tester.k8s_manager = object()
+            await AsyncJobOrchestrator(tester, k8s_batch_size=4).run(
+                num_jobs=8,
+                arrival=ArrivalSchedule(rate_per_second=100.0),
+            )
+
+            assert sum(len(b) for b in batches) == 8
+            assert all(len(b) <= 4 for b in batches)
+            assert len(tester._k8s_verifications) == 8
+        finally:
+            await runner.cleanup()
+            await server.stop(None)
@@ -0,0 +1,179 @@
+"""
+Unit Tests - Cluster Snapshot
+=============================
+
+Unit tests for the shared, TTL-cached cluster snapshot: indexes, coalesced
+refreshes across concurrent readers, stale-on-error serving, the background
+refresher and job verification on top of it. The cluster is a fake
+KubernetesManager that counts list calls.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from be_focus_server_tests.load.k8s_job_verification import JobType, verify_jobs_batch_from_k8s
+from src.core.exceptions import InfrastructureError
+from src.infrastructure.cluster_snapshot import (
+    ClusterSnapshot,
+    ClusterSnapshotService,
+    shutdown_cluster_snapshot_services,
+)
+
+
+def _pod(name, phase="Running", job_name=None, command=None):
+    labels = {"batch.kubernetes.io/job-name": job_name} if job_name else {}
+    return {
+        "metadata": {"name": name, "labels": labels},
+        "spec": {"containers": [{"command": command or ["focus-job"]}]},
+        "status": {"phase": phase},
+    }
+
+
+class _Cluster:
+    """KubernetesManager stand-in: list_objects_json with latency and a call log."""
+
+    def __init__(self, pods=(), jobs=(), latency=0.0):
+        self.objects = {"pod": list(pods), "job": list(jobs), "deployment": []}
+        self.latency = latency
+        self.calls = []
+        self.timeouts = []
+        self.fail = False
+        self.k8s_config = {"namespace": "panda", "snapshot_ttl_seconds": 5}
+        self._lock = threading.Lock()
+
+    def list_objects_json(self, kind, namespace=None, field_selector=None, timeout=30):
+        with self._lock:
+            self.calls.append(kind)
+            self.timeouts.append(timeout)
+        time.sleep(self.latency)
+        if self.fail:
+            raise InfrastructureError("connection refused")
+        return list(self.objects[kind]), str(len(self.calls))
+
+
+@pytest.fixture(autouse=True)
+def shared_services():
+    yield
+    shutdown_cluster_snapshot_services()
+
+
+@pytest.mark.unit
+class TestClusterSnapshot:
+    """Unit tests for ClusterSnapshot indexes."""
+
+    def test_prefix_and_job_indexes(self):
+        """Test: Prefix lookups, phase filter and job id lookups (label or name)."""
+        snapshot = ClusterSnapshot(
+            namespace="panda",
+            taken_at=time.time(),
+            pods=[
+                _pod("mongodb-0"),
+                _pod("grpc-job-1-12-xyz", job_name="grpc-job-1-12"),
+                _pod("grpc-job-1-2-abc", phase="Succeeded"),
+                _pod("grpc-job-cleanup-1-2-q", phase="Pending"),
+            ],
+            jobs=[{"metadata": {"name": "grpc-job-1-2"}}, {"metadata": {"name": "grpc-job-1-12"}}],
+        )
+
+        names = lambda objs: [o["metadata"]["name"] for o in objs]
+        assert names(snapshot.pods_with_prefix("grpc-job-")) == [
+            "grpc-job-1-12-xyz", "grpc-job-1-2-abc", "grpc-job-cleanup-1-2-q"
+        ]
+        assert names(snapshot.pods_with_prefix("grpc-job-", phase="Running")) == ["grpc-job-1-12-xyz"]
+        assert names(snapshot.active_pods()) == ["mongodb-0", "grpc-job-1-12-xyz", "grpc-job-cleanup-1-2-q"]
+        assert names(snapshot.pods_for_job("1-12")) == ["grpc-job-1-12-xyz"]
+        assert names(snapshot.pods_for_job("1-2")) == ["grpc-job-1-2-abc"]
+        assert snapshot.job("1-2")["metadata"]["name"] == "grpc-job-1-2"
+        assert snapshot.job("1") is None
+        assert names(snapshot.jobs_with_prefix("grpc-job-1-1")) == ["grpc-job-1-12"]
+
+
+@pytest.mark.unit
+class TestClusterSnapshotService:
+    """Unit tests for ClusterSnapshotService."""
+
+    def test_concurrent_readers_share_one_refresh(self):
+        """Test: 10 concurrent readers cost one pass of list calls."""
+        cluster = _Cluster(pods=[_pod("grpc-job-1-1-a")], latency=0.1)
+        service = ClusterSnapshotService(cluster, background=False)
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            snapshots = list(pool.map(lambda _: service.get(), range(10)))
+
+        assert cluster.calls == ["pod", "job", "deployment"]
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert service.stats()["reads"] == 10
+
+    def test_ttl_and_forced_refresh(self):
+        """Test: Reads within the TTL are cached; max_age=0 takes a new snapshot."""
+        cluster = _Cluster()
+        service = ClusterSnapshotService(cluster, ttl_seconds=60, background=False)
+
+        first = service.get()
+        assert service.get() is first
+        cluster.objects["pod"].append(_pod("grpc-job-2-1-a"))
+        fresh = service.get(max_age=0)
+
+        assert service.refreshes == 2
+        assert fresh.pods_for_job("2-1") and fresh.taken_at >= first.taken_at
+
+    def test_stale_snapshot_served_on_error(self):
+        """Test: A failed refresh serves the previous snapshot; with none it raises."""
+        cluster = _Cluster(pods=[_pod("mongodb-0")])
+        service = ClusterSnapshotService(cluster, ttl_seconds=0, background=False)
+        previous = service.get()
+
+        cluster.fail = True
+        assert service.get() is previous
+        assert service.failed_refreshes == 1
+
+        with pytest.raises(InfrastructureError):
+            ClusterSnapshotService(cluster, background=False).get()
+
+    def test_background_refresher(self):
+        """Test: While read, the snapshot is refreshed every TTL; idle, it stops."""
+        cluster = _Cluster()
+        service = ClusterSnapshotService(cluster, ttl_seconds=0.1, idle_seconds=0.3)
+
+        service.get()
+        time.sleep(0.35)
+        refreshed_while_read = service.refreshes
+        time.sleep(0.4)
+        idle_refreshes = service.refreshes - refreshed_while_read
+        service.stop()
+
+        assert refreshed_while_read >= 2
+        assert idle_refreshes <= 1
+
+
+@pytest.mark.unit
+class TestJobVerificationFromSnapshot:
+    """Unit tests for job verification reading the shared snapshot."""
+
+    def test_batch_verification_refreshes_once_for_new_pods(self):
+        """Test: Jobs missing from the snapshot trigger one fresh snapshot, not a list per job."""
+        cluster = _Cluster(pods=[_pod("grpc-job-1-1-a", command=["focus", "--time-start", "1", "--time-end", "2"])])
+        verify_jobs_batch_from_k8s(cluster, ["1-1"], namespace="panda")
+        cluster.objects["pod"] += [_pod("grpc-job-1-2-b"), _pod("grpc-job-1-3-c")]
+        cluster.calls.clear()
+
+        verifications = verify_jobs_batch_from_k8s(cluster, ["1-1", "1-2", "1-3", "1-4"], namespace="panda")
+
+        assert cluster.calls == ["pod", "job", "deployment"]
+        assert [v.job_type for v in verifications] == [JobType.HISTORIC, JobType.LIVE, JobType.LIVE, JobType.UNKNOWN]
+        assert verifications[3].verification_error == "No pod found matching pattern: grpc-job-1-4"
+
+    def test_verification_timeout_bounds_the_refresh(self):
+        """Test: The verification timeout is passed to the list calls of the refresh."""
+        cluster = _Cluster(pods=[_pod("grpc-job-1-1-a")])
+
+        verify_jobs_batch_from_k8s(cluster, ["1-1", "1-2"], namespace="panda", timeout=7)
+
+        assert cluster.calls == ["pod", "job", "deployment"] * 2
+        assert cluster.timeouts == [7] * 6
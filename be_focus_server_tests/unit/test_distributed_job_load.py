@@ -0,0 +1,130 @@
+"""
+Unit Tests - Distributed Job Load
+=================================
+
+Unit tests for the multi-process coordinator/worker mode of the job load
+testers, using a tester whose jobs never leave the worker process.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import os
+import time
+
+import pytest
+
+from be_focus_server_tests.load.distributed_job_load import (
+    DistributedJobLoadCoordinator,
+    split_jobs,
+)
+from be_focus_server_tests.load.job_load_tester import (
+    BaseJobLoadTester,
+    JobPhase,
+    JobResult,
+    JobType,
+    PhaseMetrics,
+)
+
+
+class _LocalJobTester(BaseJobLoadTester):
+    """Tester whose jobs succeed locally after a short sleep."""
+
+    def __init__(self, job_ms: float = 20.0, fail_every: int = 0, crash_after: int = 0):
+        super().__init__(focus_server_api=None, grpc_client_factory=None)
+        self.job_ms = job_ms
+        self.fail_every = fail_every
+        self.crash_after = crash_after
+        self._jobs = 0
+
+    @property
+    def job_type(self) -> JobType:
+        return JobType.LIVE
+
+    def _create_config_payload(self):
+        return {}
+
+    def _execute_single_job(self) -> JobResult:
+        with self._lock:
+            self._jobs += 1
+            job_number = self._jobs
+        time.sleep(self.job_ms / 1000)
+        if self.crash_after and job_number > self.crash_after:
+            # Give the queue feeder time to flush the earlier results, then die
+            time.sleep(0.5)
+            os._exit(3)
+        success = not (self.fail_every and job_number % self.fail_every == 0)
+        return JobResult(
+            job_type=self.job_type,
+            job_id=f"{os.getpid()}-{job_number}",
+            success=success,
+            total_duration_ms=self.job_ms,
+            phases=[PhaseMetrics(phase=JobPhase.CONFIGURE, duration_ms=self.job_ms, success=success)],
+            frames_received=2 if success else 0,
+            error=None if success else "Configure failed: boom",
+        )
+
+
+def _build_local_tester(**kwargs) -> _LocalJobTester:
+    return _LocalJobTester(**kwargs)
+
+
+def _build_broken_tester(**kwargs) -> _LocalJobTester:
+    raise RuntimeError("cannot reach focus server")
+
+
+@pytest.mark.unit
+class TestDistributedJobLoad:
+    """Unit tests for DistributedJobLoadCoordinator."""
+
+    def test_split_jobs(self):
+        """Test: Jobs are split evenly with the remainder on the first workers."""
+        assert split_jobs(10, 4) == [3, 3, 2, 2]
+        assert split_jobs(2, 4) == [1, 1, 0, 0]
+
+    def test_results_and_histograms_are_merged(self):
+        """Test: Results from all workers end up in one LoadTestResult."""
+        coordinator = DistributedJobLoadCoordinator(
+            _LocalJobTester(),
+            worker_factory=_build_local_tester,
+            worker_factory_kwargs={"job_ms": 20.0, "fail_every": 5},
+            num_workers=3,
+            barrier_timeout_seconds=60,
+        )
+        result = coordinator.run(num_jobs=30, concurrent_jobs_per_worker=2)
+
+        assert result.total_jobs == 30
+        assert result.failed_jobs == 6
+        assert result.total_frames_received == 48
+        assert len({r.job_id.split("-")[0] for r in result.all_job_results}) == 3
+        assert result.latency_histograms["total"]["count"] == 24
+        assert result.phase_latency_percentiles["configure"]["p99"] == pytest.approx(20.0, rel=1e-2)
+        assert coordinator.worker_errors == {}
+
+    def test_crashed_worker_results_keep_their_latencies(self):
+        """Test: A worker that dies before sending histograms still counts in them."""
+        coordinator = DistributedJobLoadCoordinator(
+            _LocalJobTester(),
+            worker_factory=_build_local_tester,
+            worker_factory_kwargs={"job_ms": 20.0, "crash_after": 2},
+            num_workers=2,
+            barrier_timeout_seconds=60,
+        )
+        result = coordinator.run(num_jobs=8, concurrent_jobs_per_worker=1)
+
+        assert result.total_jobs == 4
+        assert result.latency_histograms["total"]["count"] == 4
+        assert result.phase_latency_percentiles["configure"]["p50"] == pytest.approx(20.0, rel=1e-2)
+        assert coordinator.worker_errors == {0: "exited with code 3", 1: "exited with code 3"}
+
+    def test_worker_setup_failure_aborts_start(self):
+        """Test: A worker that cannot build its tester aborts the barrier."""
+        coordinator = DistributedJobLoadCoordinator(
+            _LocalJobTester(),
+            worker_factory=_build_broken_tester,
+            num_workers=2,
+            barrier_timeout_seconds=60,
+        )
+        with pytest.raises(RuntimeError, match="could not start"):
+            coordinator.run(num_jobs=4)
+        assert any("cannot reach focus server" in e for e in coordinator.worker_errors.values())
@@ -0,0 +1,129 @@
+"""
+Unit Tests - gRPC Frame Decoder
+================================
+
+Unit tests for decoding pandadatastream main_data payloads into NumPy.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import numpy as np
+import pytest
+
+from src.apis.grpc_frame_decoder import (
+    DecodedFrame,
+    FrameDecodeError,
+    FrameRingBuffer,
+    decode_frame,
+    frame_shape,
+)
+from src.models.proto_generated import pandadatastream_pb2
+
+
+def _make_frame(rows: int, width: int, start: float = 0.0, chunked: bool = False, z=None):
+    """Build a DataStream frame whose payload is a float32 ramp."""
+    depth = z or 1
+    data = np.arange(start, start + rows * width * depth, dtype='<f4')
+    if chunked:
+        chunks = [row.tobytes() for row in data.reshape(-1, width)]
+    else:
+        chunks = [data.tobytes()]
+    frame = pandadatastream_pb2.DataStream(
+        data_shape_x=width,
+        data_shape_y=rows,
+        main_data=chunks,
+        timestamp_in_milis=list(range(int(start), int(start) + rows)),
+    )
+    if z is not None:
+        frame.data_shape_z = z
+    return frame, data
+
+
+@pytest.mark.unit
+class TestDecodeFrame:
+    """Unit tests for decode_frame."""
+
+    def test_single_chunk_is_zero_copy_view(self):
+        """Test: Single-chunk payloads decode to a read-only view."""
+        frame, expected = _make_frame(rows=3, width=4)
+        decoded = decode_frame(frame)
+
+        assert decoded.shape == (3, 4)
+        np.testing.assert_array_equal(decoded.ravel(), expected)
+        assert not decoded.flags.writeable
+        assert not decoded.flags.owndata
+
+    def test_multi_chunk_payload(self):
+        """Test: Row-chunked payloads are reassembled in order."""
+        frame, expected = _make_frame(rows=5, width=2, chunked=True)
+        decoded = decode_frame(frame)
+
+        assert decoded.shape == (5, 2)
+        np.testing.assert_array_equal(decoded.ravel(), expected)
+
+    def test_three_dimensional_shape(self):
+        """Test: data_shape_z > 1 yields a (z, rows, x) array."""
+        frame, expected = _make_frame(rows=2, width=3, z=2)
+        assert frame_shape(frame) == (2, 2, 3)
+        np.testing.assert_array_equal(decode_frame(frame).ravel(), expected)
+
+    def test_size_mismatch_raises(self):
+        """Test: Payload size not matching the declared shape raises."""
+        frame, _ = _make_frame(rows=3, width=4)
+        frame.data_shape_y = 4
+        with pytest.raises(FrameDecodeError):
+            decode_frame(frame)
+
+    def test_decoded_frame(self):
+        """Test: DecodedFrame carries timestamps and row count."""
+        frame, _ = _make_frame(rows=3, width=4, start=10)
+        decoded = DecodedFrame.from_frame(frame)
+
+        assert decoded.rows == 3
+        np.testing.assert_array_equal(decoded.timestamps_ms, [10, 11, 12])
+
+
+@pytest.mark.unit
+class TestFrameRingBuffer:
+    """Unit tests for FrameRingBuffer."""
+
+    def test_append_without_wrap(self):
+        """Test: Rows are stored in order until capacity."""
+        ring = FrameRingBuffer(capacity_rows=10, row_width=4)
+        frame, expected = _make_frame(rows=3, width=4)
+
+        assert ring.append(frame) == 3
+        assert len(ring) == 3
+        np.testing.assert_array_equal(ring.latest().ravel(), expected)
+
+    def test_wrap_keeps_newest_rows(self):
+        """Test: Wrapping overwrites the oldest rows; latest() stays ordered."""
+        ring = FrameRingBuffer(capacity_rows=5, row_width=2)
+        payloads = []
+        for i in range(4):
+            frame, data = _make_frame(rows=2, width=2, start=i * 100, chunked=(i % 2 == 1))
+            ring.append(frame)
+            payloads.append(data.reshape(-1, 2))
+
+        all_rows = np.concatenate(payloads)
+        assert ring.is_full
+        np.testing.assert_array_equal(ring.latest(), all_rows[-5:])
+        np.testing.assert_array_equal(ring.latest(2), all_rows[-2:])
+        assert ring.latest_timestamps().tolist() == [101, 200, 201, 300, 301]
+        assert ring.rows_appended == 8
+
+    def test_frame_larger_than_capacity(self):
+        """Test: An oversize frame keeps only its newest rows."""
+        ring = FrameRingBuffer(capacity_rows=3, row_width=2)
+        frame, data = _make_frame(rows=5, width=2)
+        ring.append(frame)
+
+        np.testing.assert_array_equal(ring.latest(), data.reshape(-1, 2)[-3:])
+
+    def test_width_mismatch_raises(self):
+        """Test: Frames of another row width are rejected."""
+        ring = FrameRingBuffer(capacity_rows=10, row_width=4)
+        frame, _ = _make_frame(rows=2, width=3)
+        with pytest.raises(FrameDecodeError):
+            ring.append(frame)
@@ -0,0 +1,199 @@
+"""
+Unit Tests - Kubectl List Stream
+================================
+
+Unit tests for streamed kubectl list output: the incremental list parser
+(arbitrary chunk boundaries, metadata, truncation), SSHManager.stream_stdout
+over a fake channel and KubernetesManager.list_objects_json filtering items
+on the fly in SSH mode.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import json
+import socket
+
+import pytest
+
+from src.core.exceptions import InfrastructureError
+from src.infrastructure.kubectl_list_stream import KubectlListParser, iter_list_items
+from src.infrastructure.kubernetes_manager import KubernetesManager
+from src.infrastructure.ssh_manager import SSHManager
+
+
+def _pod_list(count, rv="4711"):
+    return {
+        "apiVersion": "v1",
+        "kind": "PodList",
+        "metadata": {"resourceVersion": rv},
+        "items": [
+            {
+                "metadata": {"name": f"grpc-job-{n}-a" if n % 2 else f"mongodb-{n}", "labels": {"x": "]}\"{\\"}},
+                "spec": {"containers": [{"command": ["focus", "--name", "é"]}]},
+                "status": {"phase": "Running"},
+            }
+            for n in range(count)
+        ],
+    }
+
+
+def _chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class _Channel:
+    """paramiko Channel stand-in: scripted stdout, stderr and exit status."""
+
+    def __init__(self, stdout_chunks, exit_code=0, stderr=b""):
+        self.stdout_chunks = list(stdout_chunks)
+        self.exit_code = exit_code
+        self.stderr = stderr
+        self.closed = False
+
+    def exec_command(self, command):
+        self.command = command
+
+    def settimeout(self, timeout):
+        pass
+
+    def recv(self, size):
+        if not self.stdout_chunks:
+            return b""
+        chunk = self.stdout_chunks.pop(0)
+        if chunk is None:
+            raise socket.timeout()
+        return chunk
+
+    def recv_exit_status(self):
+        return self.exit_code
+
+    def recv_stderr_ready(self):
+        return bool(self.stderr)
+
+    def recv_stderr(self, size):
+        data, self.stderr = self.stderr, b""
+        return data
+
+    def close(self):
+        self.closed = True
+
+
+class _Client:
+    def __init__(self, channel):
+        self.channel = channel
+
+    def get_transport(self):
+        return self
+
+    def open_session(self):
+        return self.channel
+
+
+class _SSHConfig:
+    def get_ssh_config(self):
+        return {}
+
+
+class _StreamingSSH:
+    """SSHManager stand-in for KubernetesManager: stdout streamed in small chunks."""
+
+    connected = True
+
+    def __init__(self, listing):
+        self.data = json.dumps(listing, indent=4).encode()
+        self.commands = []
+
+    def stream_stdout(self, command, timeout=60, chunk_size=65536):
+        self.commands.append(command)
+        yield from _chunks(self.data, 1000)
+
+
+class _K8sConfig:
+    def get_kubernetes_config(self):
+        return {"namespace": "panda", "use_kubectl_proxy": False}
+
+
+@pytest.mark.unit
+class TestKubectlListParser:
+    """Unit tests for KubectlListParser / iter_list_items."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+    def test_items_and_metadata_across_chunk_boundaries(self, chunk_size):
+        """Test: Items equal json.loads of the whole document however it is chunked."""
+        listing = _pod_list(20)
+        parser = KubectlListParser()
+
+        items = list(iter_list_items(_chunks(json.dumps(listing, ensure_ascii=False).encode(), chunk_size), parser))
+
+        assert items == listing["items"]
+        assert parser.metadata == {"resourceVersion": "4711"}
+        assert parser.items_seen == 20
+
+    def test_buffer_is_bounded_by_one_item(self):
+        """Test: Only the item being read is buffered, not the document."""
+        data = json.dumps(_pod_list(2000), indent=4).encode()
+        parser = KubectlListParser()
+        peak = 0
+        for chunk in _chunks(data, 4096):
+            parser.feed(chunk)
+            peak = max(peak, len(parser._buffer))
+
+        assert parser.items_seen == 2000
+        assert peak < 4096 + 1024
+
+    def test_truncated_document_raises(self):
+        """Test: A document cut off mid-item is an error, not a shorter list."""
+        data = json.dumps(_pod_list(3)).encode()
+
+        with pytest.raises(ValueError):
+            list(iter_list_items([data[:-40]]))
+
+
+@pytest.mark.unit
+class TestStreamStdout:
+    """Unit tests for SSHManager.stream_stdout."""
+
+    def _manager(self, channel):
+        manager = SSHManager(_SSHConfig())
+        manager.ssh_client = _Client(channel)
+        manager.connected = True
+        return manager
+
+    def test_yields_chunks_and_releases_channel(self):
+        """Test: stdout chunks are yielded as received; the channel and its slot are released."""
+        channel = _Channel([b'{"items"', None, b": []}"])
+        manager = self._manager(channel)
+
+        assert list(manager.stream_stdout("kubectl get pods -o json")) == [b'{"items"', b": []}"]
+        assert channel.closed
+        assert manager._channel_slots.acquire(blocking=False)
+
+    def test_non_zero_exit_raises_with_stderr(self):
+        """Test: A failing command raises after its output, with stderr in the message."""
+        channel = _Channel([b"partial"], exit_code=1, stderr=b'Error from server (NotFound): "x" not found\n')
+        manager = self._manager(channel)
+
+        with pytest.raises(InfrastructureError, match="NotFound"):
+            list(manager.stream_stdout("kubectl get --raw /apis/x"))
+        assert channel.closed
+
+
+@pytest.mark.unit
+class TestListObjectsStreaming:
+    """Unit tests for KubernetesManager.list_objects_json in SSH mode."""
+
+    def test_predicate_filters_items_on_the_fly(self, monkeypatch):
+        """Test: Only grpc-job pods are kept; the resourceVersion comes from the list metadata."""
+        monkeypatch.setattr(KubernetesManager, "_load_k8s_config", lambda self: None)
+        manager = KubernetesManager(_K8sConfig())
+        manager.use_ssh_fallback = True
+        manager.ssh_manager = _StreamingSSH(_pod_list(50))
+
+        items, resource_version = manager.list_objects_json(
+            "pod", predicate=lambda pod: pod["metadata"]["name"].startswith("grpc-job-")
+        )
+
+        assert [item["metadata"]["name"] for item in items] == [f"grpc-job-{n}-a" for n in range(1, 50, 2)]
+        assert resource_version == "4711"
+        assert manager.ssh_manager.commands == ["kubectl -n panda get --raw '/api/v1/namespaces/panda/pods'"]
@@ -0,0 +1,250 @@
+"""
+Unit Tests - Kubectl Proxy
+==========================
+
+Unit tests for the persistent kubectl channel of SSH fallback mode: the
+local port forward, KubernetesManager reads served by a stub `kubectl proxy`
+(API server with injected latency) and the fallback to kubectl exec.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import json
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.core.exceptions import InfrastructureError
+from src.infrastructure.kubectl_proxy import READY_PATTERN
+from src.infrastructure.kubernetes_manager import KubernetesManager
+from src.infrastructure.ssh_manager import LocalPortForward
+
+
+def _pod(name, ready=True, phase="Running"):
+    return {
+        "metadata": {"name": name, "namespace": "panda", "labels": {"app": name.split("-")[0]}},
+        "spec": {"nodeName": "node-1"},
+        "status": {
+            "phase": phase,
+            "conditions": [{"type": "Ready", "status": "True" if ready else "False"}],
+            "containerStatuses": [{"restartCount": 2}],
+        },
+    }
+
+
+class _StubApiServer:
+    """Local stand-in for `kubectl proxy`: answers GETs after `latency` seconds."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.paths = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                stub.paths.append((url.path, parse_qs(url.query)))
+                time.sleep(stub.latency)
+                if url.path.endswith("/pods"):
+                    body = {"items": [_pod("mongodb-0"), _pod("rabbitmq-0", ready=False)]}
+                elif url.path.endswith("/jobs"):
+                    body = {"items": [{"metadata": {"name": "grpc-job-1"}, "status": {"succeeded": 1}}]}
+                elif url.path.endswith("/endpoints"):
+                    body = {"items": [{"metadata": {"name": "mongodb"}, "subsets": []}]}
+                else:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.port = self.server.server_port
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _Transport:
+    """paramiko Transport stand-in: a direct-tcpip channel is a plain TCP connection."""
+
+    def __init__(self):
+        self.channels = 0
+
+    def is_active(self):
+        return True
+
+    def open_channel(self, kind, destination, source):
+        assert kind == "direct-tcpip"
+        self.channels += 1
+        return socket.create_connection(destination)
+
+
+class _ProxyChannel:
+    """The channel running `kubectl proxy` on the remote host."""
+
+    closed = False
+
+    def exit_status_ready(self):
+        return False
+
+    def close(self):
+        self.closed = True
+
+
+class _SSH:
+    """SSHManager stand-in; `kubectl proxy` output is scripted, exec calls are recorded."""
+
+    connected = True
+
+    def __init__(self, proxy_port=None):
+        self.proxy_port = proxy_port
+        self.transport = _Transport()
+        self.background = []
+        self.commands = []
+
+    def start_background_command(self, command, ready_pattern, timeout=15):
+        self.background.append(command)
+        assert ready_pattern == READY_PATTERN
+        if self.proxy_port is None:
+            raise InfrastructureError("kubectl: command not found")
+        match = re.search(ready_pattern, f"Starting to serve on 127.0.0.1:{self.proxy_port}\r\n")
+        return _ProxyChannel(), match
+
+    def forward_local_port(self, remote_host, remote_port, local_port=0):
+        return LocalPortForward(self.transport, remote_host, remote_port, local_port)
+
+    def execute_command(self, command, timeout=60):
+        self.commands.append(command)
+        return {"success": True, "stdout": json.dumps({"items": []}), "stderr": "", "exit_code": 0}
+
+    def stream_stdout(self, command, timeout=60, chunk_size=65536):
+        self.commands.append(command)
+        yield json.dumps({"items": []}).encode()
+
+
+class _Config:
+    def get_kubernetes_config(self):
+        return {"namespace": "panda"}
+
+
+@pytest.fixture
+def api_server():
+    server = _StubApiServer(latency=0.3)
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(KubernetesManager, "_load_k8s_config", lambda self: None)
+    k8s = KubernetesManager(_Config())
+    k8s.use_ssh_fallback = True
+    yield k8s
+    if k8s._kubectl_proxy is not None:
+        k8s._kubectl_proxy.close()
+
+
+@pytest.mark.unit
+class TestLocalPortForward:
+    """Unit tests for LocalPortForward."""
+
+    def test_tunnels_each_connection_over_a_channel(self, api_server):
+        """Test: Connections to the local port reach the remote port, one channel each."""
+        transport = _Transport()
+        forward = LocalPortForward(transport, "127.0.0.1", api_server.port)
+        try:
+            for _ in range(2):
+                with socket.create_connection(("127.0.0.1", forward.local_port)) as conn:
+                    conn.sendall(b"GET /api/v1/namespaces/panda/pods HTTP/1.1\r\nHost: x\r\n\r\n")
+                    assert conn.recv(4096).startswith(b"HTTP/1.1 200")
+            assert transport.channels == 2
+            assert forward.active
+        finally:
+            forward.close()
+        assert not forward.active
+
+
+@pytest.mark.unit
+class TestKubectlProxyReads:
+    """Unit tests for KubernetesManager reads through the kubectl proxy."""
+
+    def test_reads_share_proxy_and_run_concurrently(self, manager, api_server):
+        """Test: get_pods / get_jobs / get_endpoints run in parallel over one proxy, no kubectl exec."""
+        manager.ssh_manager = _SSH(proxy_port=api_server.port)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            pods, jobs, endpoints = [
+                future.result()
+                for future in [
+                    pool.submit(manager.get_pods, "panda", "app in (mongodb,rabbitmq)"),
+                    pool.submit(manager.get_jobs, "panda"),
+                    pool.submit(manager.get_endpoints, "panda"),
+                ]
+            ]
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.6  # Three 0.3s requests, not serialized
+        assert manager.ssh_manager.background == ["kubectl proxy --port=0"]
+        assert manager.ssh_manager.commands == []
+        assert [(p["name"], p["ready"], p["labels"]["app"]) for p in pods] == [
+            ("mongodb-0", "True", "mongodb"), ("rabbitmq-0", "False", "rabbitmq")
+        ]
+        assert pods[0]["restart_count"] == 2
+        assert jobs[0]["succeeded"] == 1
+        assert endpoints[0]["name"] == "mongodb"
+
+        pod_path, pod_query = next(entry for entry in api_server.paths if entry[0].endswith("/pods"))
+        assert pod_path == "/api/v1/namespaces/panda/pods"
+        assert pod_query["labelSelector"] == ["app in (mongodb,rabbitmq)"]
+        assert pod_query["fieldSelector"] == ["status.phase!=Succeeded,status.phase!=Failed"]
+
+    def test_missing_pod_is_none(self, manager, api_server):
+        """Test: A 404 from the proxy is a missing pod, not an error."""
+        manager.ssh_manager = _SSH(proxy_port=api_server.port)
+        api_server.latency = 0
+
+        assert manager.get_pod_by_name("missing-0", namespace="panda") is None
+        assert manager.ssh_manager.commands == []
+
+    def test_falls_back_to_exec_and_backs_off(self, manager):
+        """Test: If the proxy cannot start, reads use kubectl exec and the start is not retried at once."""
+        manager.ssh_manager = _SSH(proxy_port=None)
+
+        assert manager.get_jobs("panda") == []
+        assert manager.get_endpoints("panda") == []
+
+        assert manager.ssh_manager.background == ["kubectl proxy --port=0"]
+        assert manager.ssh_manager.commands == [
+            "kubectl -n panda get jobs -o json", "kubectl -n panda get endpoints -n panda -o json"
+        ]
+
+    def test_disabled_by_config(self, manager):
+        """Test: use_kubectl_proxy: false keeps the per-call kubectl exec path."""
+        manager.k8s_config["use_kubectl_proxy"] = False
+        manager.ssh_manager = _SSH(proxy_port=1)
+
+        manager.get_jobs("panda")
+
+        assert manager.ssh_manager.background == []
+        assert len(manager.ssh_manager.commands) == 1
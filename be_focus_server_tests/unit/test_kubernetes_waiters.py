@@ -0,0 +1,186 @@
+"""
+Unit Tests - Kubernetes Manager Waiters
+=======================================
+
+Unit tests for the watch-driven waits of KubernetesManager (pod ready /
+deleted, deployment scale) over the Kubernetes watch API and over a
+streaming kubectl watch in SSH fallback mode. Watch streams are scripted,
+no cluster needed.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import json
+import time
+
+import pytest
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from src.infrastructure import kubernetes_manager
+from src.infrastructure.kubernetes_manager import KubernetesManager
+
+
+def _pod_json(phase="Running", ready=True, name="mongodb-0"):
+    conditions = [{"type": "Ready", "status": "True" if ready else "False"}]
+    return {"metadata": {"name": name}, "status": {"phase": phase, "conditions": conditions}}
+
+
+class _ScriptedWatch:
+    """Stands in for kubernetes.watch.Watch; each stream() call plays the next script."""
+
+    scripts = []
+    calls = []
+
+    def stream(self, func, namespace, **kwargs):
+        _ScriptedWatch.calls.append(kwargs)
+        for item in _ScriptedWatch.scripts.pop(0) if _ScriptedWatch.scripts else []:
+            if isinstance(item, Exception):
+                raise item
+            if isinstance(item, float):
+                time.sleep(item)
+                continue
+            yield {"type": item[0], "object": None, "raw_object": item[1]}
+
+    def stop(self):
+        pass
+
+
+class _Api:
+    """CoreV1Api / AppsV1Api stand-in returning scripted lists."""
+
+    def __init__(self, *lists):
+        self.lists = list(lists)
+        self.api_client = client.ApiClient()
+
+    def _next(self, namespace, field_selector=None):
+        assert field_selector.startswith("metadata.name=")
+        return self.lists.pop(0)
+
+    list_namespaced_pod = _next
+    list_namespaced_deployment = _next
+
+
+class _SSH:
+    """SSHManager stand-in: one list response and one streamed watch."""
+
+    connected = True
+
+    def __init__(self, listing, watch_lines):
+        self.listing = listing
+        self.watch_lines = watch_lines
+        self.commands = []
+
+    def execute_command(self, command, timeout=60):
+        self.commands.append(command)
+        return {"success": True, "stdout": json.dumps(self.listing), "stderr": "", "exit_code": 0}
+
+    def stream_stdout(self, command, timeout=60, chunk_size=65536):
+        self.commands.append(command)
+        yield json.dumps(self.listing).encode()
+
+    def stream_lines(self, command, timeout=60):
+        self.commands.append(command)
+        for line in self.watch_lines:
+            yield json.dumps(line)
+
+
+class _Config:
+    def get_kubernetes_config(self):
+        return {"namespace": "panda"}
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(KubernetesManager, "_load_k8s_config", lambda self: None)
+    monkeypatch.setattr(kubernetes_manager.watch, "Watch", _ScriptedWatch)
+    _ScriptedWatch.scripts, _ScriptedWatch.calls = [], []
+    return KubernetesManager(_Config())
+
+
+def _pod_list(*pods, rv="100"):
+    return client.V1PodList(items=list(pods), metadata=client.V1ListMeta(resource_version=rv))
+
+
+@pytest.mark.unit
+class TestWatchWaiters:
+    """Unit tests for KubernetesManager.wait_for_object and the waits built on it."""
+
+    def test_pod_ready_returns_on_event(self, manager):
+        """Test: wait_for_pod_ready returns on the Ready event and records sub-second timing."""
+        pending = client.V1Pod(
+            metadata=client.V1ObjectMeta(name="mongodb-0"), status=client.V1PodStatus(phase="Pending")
+        )
+        manager.k8s_core_v1 = manager.k8s_apps_v1 = _Api(_pod_list(pending))
+        _ScriptedWatch.scripts = [[
+            ("MODIFIED", _pod_json(phase="Running", ready=False)),
+            0.2,
+            ("MODIFIED", _pod_json()),
+            ("MODIFIED", _pod_json(phase="Failed")),
+        ]]
+
+        assert manager.wait_for_pod_ready("mongodb-0", namespace="panda", timeout=30)
+
+        result = manager.last_wait
+        assert (result.condition_met, result.events) == (True, 2)
+        assert 0.2 <= result.elapsed_seconds < 1.0
+        assert _ScriptedWatch.calls[0]["resource_version"] == "100"
+        assert _ScriptedWatch.calls[0]["field_selector"] == "metadata.name=mongodb-0"
+
+    def test_failed_pod_gives_up(self, manager):
+        """Test: A pod entering Failed ends the wait with False immediately."""
+        manager.k8s_core_v1 = manager.k8s_apps_v1 = _Api(_pod_list())
+        _ScriptedWatch.scripts = [[("ADDED", _pod_json(phase="Failed", ready=False))]]
+
+        assert not manager.wait_for_pod_ready("mongodb-0", namespace="panda", timeout=30)
+        assert manager.last_wait.elapsed_seconds < 1.0
+
+    def test_pod_deletion_and_relist_after_gone(self, manager):
+        """Test: A 410 watch error re-lists; the DELETED event completes the wait."""
+        pod = client.V1Pod(metadata=client.V1ObjectMeta(name="mongodb-0"), status=client.V1PodStatus(phase="Running"))
+        manager.k8s_core_v1 = manager.k8s_apps_v1 = _Api(_pod_list(pod, rv="1"), _pod_list(pod, rv="7"))
+        _ScriptedWatch.scripts = [
+            [ApiException(status=410, reason="Gone")],
+            [("MODIFIED", _pod_json()), ("DELETED", _pod_json())],
+        ]
+
+        manager._wait_for_pod_deletion("mongodb-0", "panda", timeout=30)
+
+        assert [call["resource_version"] for call in _ScriptedWatch.calls] == ["1", "7"]
+        assert manager.last_wait.condition_met
+        assert manager.last_wait.last_object is None
+
+    def test_deployment_scale_already_reached(self, manager):
+        """Test: A condition that already holds returns after the list, without a watch."""
+        deployment = client.V1Deployment(
+            metadata=client.V1ObjectMeta(name="mongodb"),
+            spec=client.V1DeploymentSpec(selector=client.V1LabelSelector(), template=client.V1PodTemplateSpec()),
+            status=client.V1DeploymentStatus(ready_replicas=1),
+        )
+        manager.k8s_core_v1 = manager.k8s_apps_v1 = _Api(
+            client.V1DeploymentList(items=[deployment], metadata=client.V1ListMeta(resource_version="5"))
+        )
+
+        manager._wait_for_deployment_scale("mongodb", 1, "panda", timeout=30)
+
+        assert _ScriptedWatch.calls == []
+        assert manager.wait_history[-1].events == 0
+
+    def test_ssh_fallback_streams_one_watch(self, manager):
+        """Test: SSH mode lists once and follows a single streamed kubectl watch."""
+        manager.use_ssh_fallback = True
+        manager.ssh_manager = _SSH(
+            {"metadata": {"resourceVersion": "42"}, "items": [_pod_json(phase="Pending", ready=False)]},
+            [
+                {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "43"}}},
+                {"type": "MODIFIED", "object": _pod_json()},
+            ],
+        )
+
+        assert manager.wait_for_pod_ready("mongodb-0", namespace="panda", timeout=30)
+
+        list_command, watch_command = manager.ssh_manager.commands
+        assert "get --raw '/api/v1/namespaces/panda/pods?fieldSelector=metadata.name%3Dmongodb-0'" in list_command
+        assert "watch=1" in watch_command and "resourceVersion=42" in watch_command
+        assert manager.last_wait.events == 1
@@ -0,0 +1,129 @@
+"""
+Unit Tests - Latency Histogram
+==============================
+
+Unit tests for the HDR-style LatencyHistogram and PhaseLatencyRecorder used
+by the job load testers.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import json
+import math
+import random
+
+import pytest
+
+from src.utils.latency_histogram import (
+    DEFAULT_PERCENTILES,
+    LatencyHistogram,
+    PhaseLatencyRecorder,
+)
+
+
+def _exact_percentile(sorted_values, p):
+    return sorted_values[max(1, math.ceil(p / 100 * len(sorted_values))) - 1]
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Unit tests for LatencyHistogram."""
+
+    def test_percentiles_within_precision(self):
+        """Test: Tail percentiles stay within 0.1% of the exact value."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(5, 1.5) for _ in range(50000)]
+        hist = LatencyHistogram(significant_figures=3)
+        hist.record_many(values)
+
+        exact = sorted(values)
+        for p in DEFAULT_PERCENTILES:
+            expected = _exact_percentile(exact, p)
+            assert hist.percentile(p) == pytest.approx(expected, rel=2e-3, abs=1e-3)
+
+        assert hist.count == 50000
+        assert hist.min == pytest.approx(min(values), abs=1e-3)
+        assert hist.max == pytest.approx(max(values), abs=1e-3)
+        assert hist.mean == pytest.approx(sum(values) / len(values), rel=1e-6)
+
+    def test_percentiles_matches_single_queries(self):
+        """Test: percentiles() gives the same values as percentile()."""
+        hist = LatencyHistogram()
+        hist.record_many(range(1, 1001))
+
+        labelled = hist.percentiles((50, 99, 99.9))
+        assert labelled == {
+            "p50": hist.percentile(50),
+            "p99": hist.percentile(99),
+            "p99.9": hist.percentile(99.9),
+        }
+        assert labelled["p50"] == pytest.approx(500, rel=1e-3)
+
+    def test_empty_histogram(self):
+        """Test: Empty histogram reports zeros."""
+        hist = LatencyHistogram()
+        assert hist.count == 0
+        assert hist.percentile(99) == 0.0
+        assert hist.mean == 0.0
+        assert set(hist.percentiles()) == {"p50", "p75", "p90", "p95", "p99", "p99.9", "p99.99"}
+
+    def test_merge_equals_single_histogram(self):
+        """Test: Merging per-worker histograms is exact."""
+        rng = random.Random(1)
+        values = [rng.uniform(1, 5000) for _ in range(10000)]
+
+        combined = LatencyHistogram()
+        combined.record_many(values)
+
+        parts = [LatencyHistogram() for _ in range(4)]
+        for i, value in enumerate(values):
+            parts[i % 4].record(value)
+        merged = LatencyHistogram()
+        for part in parts:
+            merged.merge(part)
+
+        assert merged.to_dict() == combined.to_dict()
+
+    def test_merge_rejects_different_precision(self):
+        """Test: Histograms with different precision cannot be merged."""
+        with pytest.raises(ValueError):
+            LatencyHistogram(2).merge(LatencyHistogram(3))
+
+    def test_serialization_roundtrip(self):
+        """Test: to_dict()/from_dict() survive JSON and keep percentiles."""
+        hist = LatencyHistogram()
+        hist.record_many([0.5, 12.0, 250.0, 250.0, 90000.0])
+
+        restored = LatencyHistogram.from_dict(json.loads(json.dumps(hist.to_dict())))
+        assert restored.count == 5
+        assert restored.percentiles() == hist.percentiles()
+        assert restored.max == 90000.0
+
+
+@pytest.mark.unit
+class TestPhaseLatencyRecorder:
+    """Unit tests for PhaseLatencyRecorder."""
+
+    def test_record_and_merge_phases(self):
+        """Test: Phases are recorded separately and merge by name."""
+        a = PhaseLatencyRecorder()
+        a.record("configure", 100.0)
+        a.record("grpc_connect", 2000.0)
+
+        b = PhaseLatencyRecorder()
+        b.record("configure", 300.0)
+        b.record("stream_data", 50.0)
+
+        a.merge(PhaseLatencyRecorder.from_dict(b.to_dict()))
+
+        assert set(a.names) == {"configure", "grpc_connect", "stream_data"}
+        assert a.histogram("configure").count == 2
+        assert a.percentiles("configure")["p99"] == pytest.approx(300.0, rel=1e-3)
+        assert a.summary()["grpc_connect"]["max"] == 2000.0
+
+    def test_unknown_phase_percentiles(self):
+        """Test: Unrecorded phases report zeros without creating a histogram."""
+        recorder = PhaseLatencyRecorder()
+        assert recorder.percentiles("disconnect")["p50"] == 0.0
+        assert recorder.names == ()
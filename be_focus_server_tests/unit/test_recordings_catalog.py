@@ -0,0 +1,252 @@
+"""
+Unit Tests - Recordings Catalog
+===============================
+
+Unit tests for the local recordings catalog: the duration index behind
+RecordingsInfo.get_recording / sample_window, incremental refreshes by
+start_time watermark and reads served without MongoDB while the catalog is
+fresh. MongoDB is a fake database of GUID collections.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from be_focus_server_tests.fixtures import recordings_catalog
+from be_focus_server_tests.fixtures.recording_fixtures import Recording, RecordingsInfo, _to_epoch_ms
+from be_focus_server_tests.fixtures.recordings_catalog import RecordingsCatalog, load_recordings_info
+
+
+GUID = "25b4875f-5785-4b24-8895-121039474bcd"
+
+
+def _utc(minutes_ago):
+    """Naive UTC datetime, as MongoDB returns it."""
+    return (datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)).replace(tzinfo=None, microsecond=0)
+
+
+def _matches(doc, query):
+    if "$or" in query:
+        return any(_matches(doc, clause) for clause in query["$or"])
+    for key, condition in query.items():
+        value = doc.get(key)
+        if value is None or _to_epoch_ms(value) < _to_epoch_ms(condition["$gte"]):
+            return False
+    return True
+
+
+class _Cursor(list):
+    def batch_size(self, size):
+        return self
+
+
+class _Collection:
+    def __init__(self):
+        self.docs = []
+        self.queries = []
+
+    def add(self, start_minutes_ago, duration_minutes=None):
+        end = _utc(start_minutes_ago - duration_minutes) if duration_minutes is not None else None
+        doc = {"_id": f"rec-{len(self.docs)}", "start_time": _utc(start_minutes_ago), "end_time": end}
+        self.docs.append(doc)
+        return doc
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+        return _Cursor(dict(doc) for doc in self.docs if _matches(doc, query))
+
+
+class _Database:
+    def __init__(self):
+        self.collections = {GUID: _Collection()}
+
+    def list_collection_names(self):
+        return list(self.collections)
+
+    def __getitem__(self, name):
+        return self.collections[name]
+
+
+class _Config:
+    def __init__(self, path):
+        self.path = path
+
+    def get_current_environment(self):
+        return "staging"
+
+    def get_database_config(self):
+        return {"recordings_catalog_path": str(self.path)}
+
+
+def _since(weeks):
+    return int((datetime.now(timezone.utc) - timedelta(weeks=weeks)).timestamp() * 1000)
+
+
+@pytest.mark.unit
+class TestRecordingIndex:
+    """Unit tests for RecordingIndex through RecordingsInfo."""
+
+    def test_get_recording_matches_linear_scan(self):
+        """Test: get_recording returns the first recording in list order that is long enough."""
+        rng = random.Random(7)
+        recordings = [Recording(start, start + rng.randint(1, 600) * 1000) for start in range(0, 10**9, 10**6)]
+        info = RecordingsInfo(recordings=recordings, query_time=datetime.now())
+
+        for min_duration in (0, 1, 59.5, 60, 300, 599, 600, 601):
+            expected = next((r for r in recordings if r.duration_seconds >= min_duration), None)
+            assert info.get_recording(min_duration_seconds=min_duration) is expected
+
+    def test_fractional_durations_match_linear_scan(self):
+        """Test: Sub-millisecond minimum durations select the same recordings as the scan."""
+        recordings = [Recording(0, 59_999), Recording(100_000, 160_000), Recording(200_000, 200_001)]
+        info = RecordingsInfo(recordings=recordings, query_time=datetime.now())
+        rng = random.Random(3)
+
+        for min_duration in (0.0005, 0.001, 0.0011, 59.9985, 59.999, 59.9995, 60.0, 60.0001):
+            eligible = [r for r in recordings if r.duration_seconds >= min_duration]
+            assert info.get_recording(min_duration_seconds=min_duration) is (eligible[0] if eligible else None)
+            assert info.index.count_with_min_duration(min_duration) == len(eligible)
+
+        # 2.007 * 1000 == 2007.0000000000002: the 2007 ms recording is used whole
+        short = RecordingsInfo(recordings=[Recording(300_000, 302_007)], query_time=datetime.now())
+        assert short.sample_window(2.007, rng) == (300_000, 302_007)
+
+    def test_sample_window_stays_inside_long_enough_recordings(self):
+        """Test: Sampled windows have the requested length and lie inside one eligible recording."""
+        recordings = [Recording(0, 10_000), Recording(100_000, 160_000), Recording(500_000, 530_000)]
+        info = RecordingsInfo(recordings=recordings, query_time=datetime.now())
+        rng = random.Random(1)
+
+        windows = [info.sample_window(30, rng) for _ in range(200)]
+
+        assert all(end - start == 30_000 for start, end in windows)
+        assert all(
+            any(r.start_time_ms <= start and end <= r.end_time_ms for r in recordings[1:]) for start, end in windows
+        )
+        assert {start >= 500_000 for start, _ in windows} == {True, False}
+        assert info.sample_window(61, rng) is None
+
+
+@pytest.mark.unit
+class TestRecordingsCatalog:
+    """Unit tests for RecordingsCatalog refreshes."""
+
+    def test_incremental_refresh_by_watermark(self):
+        """Test: Later refreshes read from the watermark; an open recording is re-read until it ends."""
+        db = _Database()
+        collection = db.collections[GUID]
+        collection.add(120, 10)
+        collection.add(60, 5)
+        open_doc = collection.add(30)
+        catalog = RecordingsCatalog("staging", ":memory:")
+
+        assert catalog.refresh(db, [GUID], _since(4)) == 2
+        open_doc["end_time"] = _utc(20)
+        collection.add(10, 5)
+        assert catalog.refresh(db, [GUID], _since(4)) == 2
+
+        assert "$or" in collection.queries[0]
+        assert _to_epoch_ms(collection.queries[1]["start_time"]["$gte"]) == _to_epoch_ms(open_doc["start_time"])
+        assert [r.duration_seconds for r in catalog.recordings(_since(4))] == [300, 600, 300, 600]
+
+    def test_wider_range_rereads_collection(self):
+        """Test: Asking for more weeks than covered reads the collection back to the new start."""
+        db = _Database()
+        db.collections[GUID].add(60 * 24 * 7 * 6, 10)
+        catalog = RecordingsCatalog("staging", ":memory:")
+
+        catalog.refresh(db, [GUID], _since(4))
+        assert catalog.covers(_since(4)) and not catalog.covers(_since(8))
+        catalog.refresh(db, [GUID], _since(8))
+
+        assert len(catalog.recordings(_since(8))) == 1
+
+    def test_deleted_recordings_are_removed(self):
+        """Test: Recordings deleted in MongoDB leave the catalog on the next refresh."""
+        db = _Database()
+        collection = db.collections[GUID]
+        kept = collection.add(120, 10)
+        deleted = collection.add(60, 5)
+        collection.add(30, 5)
+        catalog = RecordingsCatalog("staging", ":memory:")
+        catalog.refresh(db, [GUID], _since(4))
+
+        collection.docs.remove(deleted)
+        catalog.refresh(db, [GUID], _since(4))
+
+        assert catalog.count() == 2
+        assert [r.duration_seconds for r in catalog.recordings(_since(4))] == [300, 600]
+        assert _to_epoch_ms(collection.queries[1]["start_time"]["$gte"]) > _to_epoch_ms(kept["start_time"])
+
+    def test_vanished_guid_is_dropped(self):
+        """Test: A GUID no longer listed loses its recordings and does not keep the catalog stale."""
+        other = "0f1e2d3c-0000-4000-8000-000000000000"
+        db = _Database()
+        db.collections[GUID].add(60, 5)
+        db.collections[other] = _Collection()
+        db.collections[other].add(90, 5)
+        catalog = RecordingsCatalog("staging", ":memory:")
+        catalog.refresh(db, [GUID, other], _since(4))
+        catalog._connection.execute("UPDATE watermarks SET refreshed_at = 0")
+
+        catalog.refresh(db, [GUID], _since(4))
+
+        assert catalog.count() == 1
+        assert catalog.age_seconds() < 60
+
+
+@pytest.mark.unit
+class TestLoadRecordingsInfo:
+    """Unit tests for load_recordings_info."""
+
+    def test_fresh_catalog_needs_no_mongodb(self, tmp_path, monkeypatch):
+        """Test: Within max_age the catalog is served without connecting to MongoDB."""
+        db = _Database()
+        db.collections[GUID].add(60, 5)
+        connects = []
+
+        class _Client:
+            def close(self):
+                pass
+
+        def connect(config_manager):
+            connects.append(config_manager)
+            return _Client(), db
+
+        monkeypatch.setattr(recordings_catalog, "_connect_recordings_db", connect)
+        monkeypatch.setattr(recordings_catalog, "_environment_guids", lambda db, env: [GUID])
+        config = _Config(tmp_path / "catalog.sqlite")
+
+        first = load_recordings_info(config, max_age_seconds=300)
+        second = load_recordings_info(config, max_age_seconds=300)
+        load_recordings_info(config, max_age_seconds=0)
+
+        assert len(connects) == 2
+        assert first.recordings == second.recordings
+        assert second.get_recording(min_duration_seconds=300).duration_seconds == 300
+
+    def test_failed_refresh_serves_catalog(self, tmp_path, monkeypatch):
+        """Test: If MongoDB is down, a stale catalog is served instead of nothing."""
+        db = _Database()
+        db.collections[GUID].add(60, 5)
+        config = _Config(tmp_path / "catalog.sqlite")
+        monkeypatch.setattr(recordings_catalog, "_environment_guids", lambda db, env: [GUID])
+
+        class _Client:
+            def close(self):
+                pass
+
+        monkeypatch.setattr(recordings_catalog, "_connect_recordings_db", lambda config_manager: (_Client(), db))
+        load_recordings_info(config)
+
+        def unreachable(config_manager):
+            raise ConnectionError("MongoDB unreachable")
+
+        monkeypatch.setattr(recordings_catalog, "_connect_recordings_db", unreachable)
+        info = load_recordings_info(config, max_age_seconds=0)
+
+        assert info.count == 1
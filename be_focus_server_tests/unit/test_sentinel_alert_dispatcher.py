@@ -0,0 +1,218 @@
+"""
+Unit Tests - Sentinel Alert Dispatcher
+======================================
+
+Unit tests for asynchronous alert delivery against a local stub webhook
+server with injected latency and failures: non-blocking dispatch, retries
+with backoff, digests of coalesced anomalies and the bounded cooldown map.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.sentinel.core.alert_dispatcher import DEFAULT_DELIVERY, AlertDispatcher, _ChannelWorker, _CooldownMap
+from src.sentinel.core.models import Anomaly, AnomalyCategory, AnomalySeverity, RunContext
+
+
+class _StubWebhook:
+    """Local webhook receiver: sleeps `latency` per request, fails the first `failures`."""
+
+    def __init__(self, latency: float = 0.0, failures: int = 0):
+        self.latency = latency
+        self.failures = failures
+        self.payloads = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                time.sleep(stub.latency)
+                if stub.failures > 0:
+                    stub.failures -= 1
+                    self.send_response(500)
+                else:
+                    stub.payloads.append(body)
+                    self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/alerts"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def webhook():
+    stubs = []
+
+    def make(**kwargs):
+        stubs.append(_StubWebhook(**kwargs))
+        return stubs[-1]
+
+    yield make
+    for stub in stubs:
+        stub.close()
+
+
+def _dispatcher(url: str, **delivery) -> AlertDispatcher:
+    return AlertDispatcher({
+        "channels": [{"type": "webhook", "webhook_url": url, "severity_min": "info"}],
+        "alert_delivery": {"retry_backoff_seconds": 0.05, **delivery},
+    })
+
+
+def _anomaly(title: str, component: str = "pod-a", severity=AnomalySeverity.WARNING) -> Anomaly:
+    return Anomaly(
+        run_id="run-1", title=title, severity=severity,
+        category=AnomalyCategory.INFRASTRUCTURE, affected_component=component
+    )
+
+
+CONTEXT = RunContext(run_id="run-1", pipeline="smoke")
+
+
+@pytest.mark.unit
+class TestAsyncDelivery:
+    """Unit tests for per-channel alert workers."""
+
+    def test_dispatch_does_not_wait_for_slow_channel(self, webhook):
+        """Test: dispatch_anomaly returns while a 0.5s webhook is still being called."""
+        stub = webhook(latency=0.5)
+        dispatcher = _dispatcher(stub.url, coalesce_window_seconds=0)
+
+        started = time.monotonic()
+        for n in range(3):
+            dispatcher.dispatch_anomaly(_anomaly(f"restart {n}", component=f"pod-{n}"), CONTEXT)
+        elapsed = time.monotonic() - started
+        assert dispatcher.flush(timeout=5)
+
+        assert elapsed < 0.2
+        assert [p["anomaly"]["title"] for p in stub.payloads] == ["restart 0", "restart 1", "restart 2"]
+        assert dispatcher.get_delivery_stats()["webhook-0"]["sent"] == 3
+        dispatcher.stop()
+
+    def test_retries_with_backoff(self, webhook):
+        """Test: A failing endpoint is retried until it accepts the alert."""
+        stub = webhook(failures=2)
+        dispatcher = _dispatcher(stub.url, coalesce_window_seconds=0, max_retries=3)
+
+        dispatcher.dispatch_anomaly(_anomaly("pod crash"), CONTEXT)
+        assert dispatcher.flush(timeout=5)
+
+        stats = dispatcher.get_delivery_stats()["webhook-0"]
+        assert (stats["sent"], stats["retries"], stats["failed"]) == (1, 2, 0)
+        assert len(stub.payloads) == 1
+        dispatcher.stop()
+
+    def test_gives_up_after_max_retries(self, webhook):
+        """Test: After max_retries the alert is counted as failed and the worker moves on."""
+        stub = webhook(failures=10)
+        dispatcher = _dispatcher(stub.url, coalesce_window_seconds=0, max_retries=1)
+
+        dispatcher.dispatch_anomaly(_anomaly("pod crash"), CONTEXT)
+        assert dispatcher.flush(timeout=5)
+
+        assert dispatcher.get_delivery_stats()["webhook-0"]["failed"] == 1
+        dispatcher.stop()
+
+    def test_burst_is_coalesced_into_digest(self, webhook):
+        """Test: The first anomaly goes out at once, the rest of the window as one digest."""
+        stub = webhook(latency=0.05)
+        dispatcher = _dispatcher(stub.url, coalesce_window_seconds=0.3)
+
+        for n in range(5):
+            dispatcher.dispatch_anomaly(_anomaly(f"restart {n}"), CONTEXT)
+        dispatcher.dispatch_anomaly(_anomaly("oom", severity=AnomalySeverity.CRITICAL), CONTEXT)
+        dispatcher.dispatch_anomaly(_anomaly("other pod", component="pod-b"), CONTEXT)
+        time.sleep(0.2)
+        assert len(stub.payloads) == 2  # Leading edge of each component, digest still open
+
+        time.sleep(0.4)
+        digest = stub.payloads[-1]["anomaly"]
+        assert len(stub.payloads) == 3
+        assert digest["title"] == "5 more infrastructure anomalies on pod-a"
+        assert digest["severity"] == "critical"
+        assert digest["metadata"]["count"] == 5
+        assert dispatcher.get_delivery_stats()["webhook-0"]["coalesced"] == 5
+        dispatcher.stop()
+
+    def test_stop_sends_open_digests(self, webhook):
+        """Test: stop() delivers digests whose window has not closed yet."""
+        stub = webhook()
+        dispatcher = _dispatcher(stub.url, coalesce_window_seconds=60)
+        for n in range(3):
+            dispatcher.dispatch_anomaly(_anomaly(f"restart {n}"), CONTEXT)
+
+        dispatcher.stop(timeout=5)
+
+        assert [p["anomaly"]["title"] for p in stub.payloads] == [
+            "restart 0", "2 more infrastructure anomalies on pod-a"
+        ]
+
+    def test_stop_timeout_keeps_single_worker(self):
+        """Test: A worker still sending after stop(timeout) is not replaced by a second one."""
+        release = threading.Event()
+        senders = []
+
+        def send(anomaly, context):
+            senders.append(threading.current_thread())
+            release.wait(5)
+
+        worker = _ChannelWorker("slow", send, {**DEFAULT_DELIVERY, "coalesce_window_seconds": 0})
+        worker.submit(_anomaly("restart 0", component="pod-0"), CONTEXT)
+        worker.stop(timeout=0.05)
+        worker.submit(_anomaly("restart 1", component="pod-1"), CONTEXT)
+
+        release.set()
+        assert worker.flush(timeout=5)
+        worker.stop(timeout=5)
+
+        assert len(senders) == 2 and senders[0] is senders[1]
+        assert worker._thread is None
+        worker.submit(_anomaly("restart 2", component="pod-2"), CONTEXT)
+        worker.stop(timeout=5)
+        assert len(senders) == 3 and senders[2] is not senders[0]
+
+
+@pytest.mark.unit
+class TestCooldown:
+    """Unit tests for the bounded cooldown map."""
+
+    def test_cooldown_suppresses_repeats(self, webhook):
+        """Test: The same anomaly is alerted once per cooldown."""
+        stub = webhook()
+        dispatcher = _dispatcher(stub.url, coalesce_window_seconds=0)
+        anomaly = _anomaly("restart")
+
+        dispatcher.dispatch_anomaly(anomaly, CONTEXT)
+        dispatcher.dispatch_anomaly(anomaly, CONTEXT)
+        dispatcher.flush(timeout=5)
+
+        assert len(stub.payloads) == 1
+        assert anomaly.alerted
+        dispatcher.stop()
+
+    def test_size_cap_and_ttl_eviction(self):
+        """Test: The map never exceeds max_entries and expired keys are evicted."""
+        cooldowns = _CooldownMap(ttl_seconds=0.1, max_entries=3)
+        for n in range(10):
+            assert cooldowns.acquire(f"key-{n}")
+        assert len(cooldowns) == 3
+        assert not cooldowns.acquire("key-9")
+
+        time.sleep(0.15)
+        assert cooldowns.acquire("key-9")
+        assert len(cooldowns) == 1
@@ -0,0 +1,254 @@
+"""
+Unit Tests - Sentinel Live Event Stream
+=======================================
+
+Unit tests for RunEventBus fan-out (filters, bounded queues, replay) and the
+SSE / WebSocket feeds of the async Sentinel API.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from src.sentinel.api import run_query
+from src.sentinel.api.run_query import RunQuery
+from src.sentinel.api.stream_app import SentinelStreamAPI
+from src.sentinel.core.models import RunContext, RunStatus
+from src.sentinel.core.run_event_bus import RunEventBus
+
+
+class _Service:
+    """The SentinelService surface used by the API."""
+
+    def __init__(self, *contexts):
+        self.event_bus = RunEventBus(max_queue=100)
+        self.runs = {context.run_id: context for context in contexts}
+        self.version = 0
+        self.queries = 0
+
+    def get_run(self, run_id):
+        return self.runs.get(run_id)
+
+    def get_active_runs(self):
+        return {run_id: c for run_id, c in self.runs.items() if c.is_active()}
+
+    def query_runs_page(self, **query):
+        self.queries += 1
+        runs = [{"run_id": run_id, "pipeline": query["pipeline"]} for run_id in self.runs]
+        return {"runs": runs, "next_cursor": None}
+
+    def history_version(self):
+        return self.version
+
+    def detect_run_from_webhook(self, webhook_data):
+        return self.runs.get(webhook_data.get("run_id"))
+
+
+def _publish_from_thread(bus, *events):
+    thread = threading.Thread(target=lambda: [bus.publish(*event) for event in events])
+    thread.start()
+    thread.join()
+
+
+@pytest.mark.unit
+class TestRunEventBus:
+    """Unit tests for RunEventBus."""
+
+    async def test_fan_out_and_filters(self):
+        """Test: Events published from another thread reach every matching subscriber."""
+        bus = RunEventBus()
+        run_a = bus.subscribe(run_id="a")
+        anomalies = bus.subscribe(event_types=["anomaly"])
+        everything = bus.subscribe()
+
+        _publish_from_thread(bus, ("a", "test", {"n": 1}), ("b", "anomaly", {"n": 2}), ("a", "anomaly", {"n": 3}))
+        await asyncio.sleep(0.05)
+
+        assert [e.data["n"] for e in run_a.drain()] == [1, 3]
+        assert [e.data["n"] for e in anomalies.drain()] == [2, 3]
+        assert [e.seq for e in everything.drain()] == [1, 2, 3]
+        assert json.loads(bus.publish("a", "job", {"x": datetime(2026, 1, 1)}).payload)["data"] == {
+            "x": "2026-01-01 00:00:00"
+        }
+        assert bus.stats()["subscribers"] == 3
+
+    async def test_slow_subscriber_drops_oldest(self):
+        """Test: A full queue drops its oldest events without affecting others."""
+        bus = RunEventBus(max_queue=3)
+        slow = bus.subscribe()
+        for n in range(10):
+            bus.publish("a", "test", {"n": n})
+        await asyncio.sleep(0.01)
+
+        assert [e.data["n"] for e in slow.drain()] == [7, 8, 9]
+        assert slow.dropped == 7
+        assert bus.stats()["dropped"] == 7
+
+    async def test_concurrent_publishers_deliver_every_seq_in_order(self):
+        """Test: Events published from several threads all arrive, in seq order."""
+        bus = RunEventBus(max_queue=100_000)
+        subscription = bus.subscribe()
+        threads = [
+            threading.Thread(target=lambda: [bus.publish("a", "test", {}) for _ in range(20_000)])
+            for _ in range(4)
+        ]
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads between seq assignment and fan-out
+        try:
+            for thread in threads:
+                thread.start()
+            await asyncio.to_thread(lambda: [thread.join() for thread in threads])
+        finally:
+            sys.setswitchinterval(switch_interval)
+        while subscription.last_seq < bus.last_seq:
+            await asyncio.sleep(0.01)
+
+        assert [event.seq for event in subscription.drain()] == list(range(1, 80_001))
+        assert subscription.dropped == 0
+
+    async def test_replay_after_last_seq(self):
+        """Test: Subscribing with last_seq replays missed events exactly once."""
+        bus = RunEventBus(replay_size=5)
+        for n in range(8):
+            bus.publish("a", "test", {"n": n})
+
+        resumed = bus.subscribe(last_seq=5)
+        bus.publish("a", "test", {"n": 8})
+        await asyncio.sleep(0.01)
+
+        assert [e.seq for e in resumed.drain()] == [6, 7, 8, 9]
+        bus.unsubscribe(resumed)
+        assert bus.stats()["subscribers"] == 0
+
+
+@pytest.fixture
+async def stream_api():
+    context = RunContext(run_id="run-1", pipeline="smoke", status=RunStatus.RUNNING)
+    service = _Service(context)
+    client = TestClient(TestServer(SentinelStreamAPI(service, heartbeat_seconds=0.2).app))
+    await client.start_server()
+    yield service, client
+    await client.close()
+
+
+async def _wait_for_subscriber(bus, count=1):
+    while bus.stats()["subscribers"] < count:
+        await asyncio.sleep(0.01)
+
+
+def _parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            events.append(fields)
+    return events
+
+
+@pytest.mark.unit
+class TestSentinelStreamAPI:
+    """Unit tests for the async API feeds."""
+
+    async def test_sse_snapshot_deltas_and_end(self, stream_api):
+        """Test: SSE sends a snapshot, then deltas with ids, and ends with the run."""
+        service, client = stream_api
+        response = await client.get("/api/runs/run-1/events")
+        assert response.headers["Content-Type"] == "text/event-stream"
+        await _wait_for_subscriber(service.event_bus)
+
+        service.event_bus.publish("other", "test", {"test_id": "x"})
+        service.event_bus.publish("run-1", "test", {"test_id": "api:t1", "status": "passed"})
+        service.event_bus.publish("run-1", "run", {"status": "completed"})
+        events = _parse_sse(await response.text())
+
+        assert [e["event"] for e in events] == ["snapshot", "test", "run"]
+        assert json.loads(events[0]["data"])["pipeline"] == "smoke"
+        assert json.loads(events[1]["data"])["data"]["test_id"] == "api:t1"
+        assert events[1]["id"] == "2"
+        assert service.event_bus.stats()["subscribers"] == 0
+
+    async def test_sse_resume_with_last_event_id(self, stream_api):
+        """Test: Last-Event-ID replays missed events instead of a snapshot."""
+        service, client = stream_api
+        for n in range(3):
+            service.event_bus.publish("run-1", "test", {"n": n})
+        service.event_bus.publish("run-1", "run", {"status": "failed"})
+
+        response = await client.get("/api/runs/run-1/events", headers={"Last-Event-ID": "1"})
+        events = _parse_sse(await response.text())
+
+        assert [e["id"] for e in events] == ["2", "3", "4"]
+
+    async def test_finished_run_feeds_end_after_snapshot(self, stream_api):
+        """Test: A run that already has a final status gets its snapshot and the feed ends."""
+        service, client = stream_api
+        service.runs["run-1"].status = RunStatus.COMPLETED
+
+        response = await asyncio.wait_for(client.get("/api/runs/run-1/events"), timeout=2)
+        events = _parse_sse(await asyncio.wait_for(response.text(), timeout=2))
+        ws = await client.ws_connect("/api/runs/run-1/ws")
+        snapshot = await ws.receive_json(timeout=2)
+        closed = await ws.receive(timeout=2)
+
+        assert [e["event"] for e in events] == ["snapshot"]
+        assert snapshot["data"]["status"] == "completed"
+        assert closed.type.name == "CLOSE"
+        assert service.event_bus.stats()["subscribers"] == 0
+
+    async def test_websocket_feed(self, stream_api):
+        """Test: WebSocket sends the snapshot and then one JSON message per event."""
+        service, client = stream_api
+        ws = await client.ws_connect("/api/runs/run-1/ws")
+        snapshot = await ws.receive_json(timeout=2)
+        await _wait_for_subscriber(service.event_bus)
+
+        service.event_bus.publish("run-1", "anomaly", {"title": "Pod restarted"})
+        message = await ws.receive_json(timeout=2)
+
+        assert (snapshot["type"], snapshot["data"]["run_id"]) == ("snapshot", "run-1")
+        assert (message["type"], message["data"]["title"]) == ("anomaly", "Pod restarted")
+        await ws.close()
+
+    async def test_rest_endpoints(self, stream_api):
+        """Test: REST endpoints match the Flask API."""
+        service, client = stream_api
+
+        assert (await (await client.get("/api/runs/run-1")).json())["run_id"] == "run-1"
+        assert (await client.get("/api/runs/missing/events")).status == 404
+        assert (await (await client.get("/api/runs?pipeline=smoke")).json())["count"] == 1
+        webhook = await client.post("/api/webhooks/github", json={"run_id": "run-1"})
+        assert await webhook.json() == {"status": "detected", "run_id": "run-1"}
+        assert (await (await client.get("/api/stats")).json())["active_runs"] == 1
+
+    async def test_run_list_etag(self, stream_api):
+        """Test: A matching If-None-Match returns 304 without querying until the version changes."""
+        service, client = stream_api
+        first = await client.get("/api/runs?fields=run_id,status")
+        etag = first.headers["ETag"]
+
+        cached = await client.get("/api/runs?fields=run_id,status", headers={"If-None-Match": etag})
+        assert (cached.status, service.queries) == (304, 1)
+
+        service.version += 1
+        refreshed = await client.get("/api/runs?fields=run_id,status", headers={"If-None-Match": etag})
+        assert (refreshed.status, service.queries) == (200, 2)
+        assert (await client.get("/api/runs?fields=password")).status == 400
+        assert (await client.get("/api/runs?cursor=bogus")).status == 400
+
+    def test_etag_changes_across_restarts(self, monkeypatch):
+        """Test: The same data version in another process gives a different ETag."""
+        query = RunQuery(pipeline="smoke")
+        before_restart = query.etag(3)
+        assert query.etag(3) == before_restart
+
+        monkeypatch.setattr(run_query, "_PROCESS_NONCE", "restarted")
+        assert query.etag(3) != before_restart
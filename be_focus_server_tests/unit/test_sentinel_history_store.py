@@ -0,0 +1,360 @@
+"""
+Unit Tests - Sentinel Run History Store
+=======================================
+
+Unit tests for the write-behind RunHistoryStore: batched upserts on SQLite,
+incremental progress saves of live runs, coalescing and failure recovery;
+the materialized baseline rollups with p95 duration regression rules; and
+keyset-paginated run queries.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import statistics
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.sentinel.core.anomaly_engine import AnomalyEngine
+from src.sentinel.core.baseline_rollups import MetricRollup
+from src.sentinel.core.models import (
+    Anomaly,
+    RunContext,
+    RunStatus,
+    SuiteRun,
+    TestCaseRun,
+    TestStatus,
+)
+from src.sentinel.core.run_history_store import RunHistoryStore, decode_cursor
+
+
+def _store(tmp_path, **write_behind) -> RunHistoryStore:
+    return RunHistoryStore({
+        "database": {"type": "sqlite", "path": str(tmp_path / "history.db"), "write_behind": write_behind}
+    })
+
+
+def _run(tests: int = 10) -> RunContext:
+    context = RunContext(run_id="run-1", pipeline="smoke", environment="staging", status=RunStatus.RUNNING)
+    context.start_time = datetime(2026, 10, 16, 12, 0)
+    context.add_suite(SuiteRun(suite_name="api", run_id=context.run_id))
+    for n in range(tests):
+        context.add_test(TestCaseRun(
+            test_id=f"api:test_{n}", test_name=f"test_{n}", suite_name="api", run_id=context.run_id
+        ))
+    return context
+
+
+def _rows(store: RunHistoryStore, sql: str, *params):
+    return [dict(row) for row in store.db_connection.execute(sql, params).fetchall()]
+
+
+@pytest.mark.unit
+class TestWriteBehind:
+    """Unit tests for write-behind persistence."""
+
+    def test_progress_writes_only_changed_tests(self, tmp_path):
+        """Test: After the first save, a progress save rewrites only dirty tests."""
+        store = _store(tmp_path)
+        context = _run(tests=100)
+
+        store.save_progress(context)
+        assert store.flush(timeout=5)
+        assert store.get_write_stats()["tests_written"] == 100
+
+        context.set_test_status("api:test_3", TestStatus.FAILED)
+        test = context.tests["api:test_4"]
+        test.start_time, test.end_time = context.start_time, context.start_time + timedelta(seconds=2)
+        context.mark_test_dirty("api:test_4")
+        store.save_progress(context)
+        assert store.flush(timeout=5)
+
+        assert store.get_write_stats()["tests_written"] == 102
+        assert store.get_run("run-1")["failed_tests"] == 1
+        assert _rows(store, "SELECT status FROM tests WHERE test_id = ?", "api:test_3") == [{"status": "failed"}]
+        assert _rows(store, "SELECT duration_seconds FROM tests WHERE test_id = ?", "api:test_4") == [
+            {"duration_seconds": 2.0}
+        ]
+        store.stop()
+
+    def test_final_save_and_anomalies(self, tmp_path):
+        """Test: save_run writes status, suite counters and only new anomalies."""
+        store = _store(tmp_path)
+        context = _run(tests=3)
+        context.anomalies.append(Anomaly(run_id="run-1", title="first"))
+        store.save_progress(context)
+        store.flush(timeout=5)
+
+        context.anomalies.append(Anomaly(run_id="run-1", title="second"))
+        context.set_test_status("api:test_0", TestStatus.PASSED)
+        context.status = RunStatus.COMPLETED
+        context.end_time = context.start_time + timedelta(minutes=1)
+        store.save_run(context)
+        store.stop()
+
+        run = store.get_run("run-1")
+        assert (run["status"], run["passed_tests"], run["duration_seconds"]) == ("completed", 1, 60.0)
+        assert _rows(store, "SELECT total_tests, passed_tests FROM suites") == [
+            {"total_tests": 3, "passed_tests": 1}
+        ]
+        assert sorted(r["title"] for r in _rows(store, "SELECT title FROM anomalies")) == ["first", "second"]
+        assert [r["run_id"] for r in store.query_runs(pipeline="smoke")] == ["run-1"]
+
+    def test_saves_coalesce(self, tmp_path):
+        """Test: Saves queued while the writer is busy are merged per run."""
+        store = _store(tmp_path)
+        entered, gate = threading.Event(), threading.Event()
+        original = store._execute_upserts
+
+        def slow_upserts(cursor, rows):
+            entered.set()
+            gate.wait(5)
+            original(cursor, rows)
+
+        store._execute_upserts = slow_upserts
+        context = _run(tests=5)
+        store.save_progress(context)
+        assert entered.wait(5)  # writer holds the first save
+        for n in range(50):
+            store.save_progress(context)
+        assert store.get_write_stats()["pending_runs"] == 1
+
+        gate.set()
+        store.stop()
+        assert store.get_write_stats()["batches"] == 2
+
+    def test_failed_write_rewrites_run(self, tmp_path):
+        """Test: After a failed batch the next save writes the whole run again."""
+        store = _store(tmp_path, enabled=False)
+        context = _run(tests=4)
+        store.save_progress(context)
+
+        def failing_upserts(cursor, rows):
+            raise RuntimeError("disk full")
+
+        original = store._execute_upserts
+        store._execute_upserts = failing_upserts
+        context.set_test_status("api:test_1", TestStatus.FAILED)
+        store.save_progress(context)
+        store._execute_upserts = original
+
+        store.save_progress(context)
+        stats = store.get_write_stats()
+        assert (stats["errors"], stats["tests_written"]) == (1, 8)
+        assert store.get_run("run-1")["failed_tests"] == 1
+
+    def test_failed_batch_is_rolled_back(self, tmp_path, monkeypatch):
+        """Test: A batch failing part-way leaves none of its rows behind."""
+        store = _store(tmp_path, enabled=False)
+        original = store._execute_upserts
+
+        def upserts_then_fail(cursor, rows):
+            original(cursor, rows)
+            raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(store, "_execute_upserts", upserts_then_fail)
+        store.save_run(_finished_run("run-1", datetime.now(), 60.0))
+
+        assert store.get_write_stats()["errors"] == 1
+        for table in ("runs", "tests", "run_rollups", "rolled_up_runs"):
+            assert _rows(store, f"SELECT COUNT(*) AS n FROM {table}") == [{"n": 0}]
+
+    def test_sqlite_pragmas(self, tmp_path):
+        """Test: The SQLite connection uses WAL with synchronous=NORMAL."""
+        store = _store(tmp_path)
+        assert store.db_connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert store.db_connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def _finished_run(run_id: str, start: datetime, seconds: float, failed: int = 0, test_seconds: float = 1.0):
+    context = RunContext(run_id=run_id, pipeline="smoke", environment="staging", status=RunStatus.COMPLETED)
+    context.start_time, context.end_time = start, start + timedelta(seconds=seconds)
+    for n in range(4):
+        test = TestCaseRun(
+            test_id=f"api:test_{n}", test_name=f"test_{n}", suite_name="api", run_id=run_id,
+            status=TestStatus.FAILED if n < failed else TestStatus.PASSED
+        )
+        test.duration_seconds = test_seconds * (n + 1)
+        context.add_test(test)
+    return context
+
+
+@pytest.mark.unit
+class TestBaselineRollups:
+    """Unit tests for materialized baselines."""
+
+    def test_metric_rollup_merge_is_exact(self):
+        """Test: Merged mean/variance equal those of the combined values."""
+        values = [3.0, 8.5, 1.25, 40.0, 7.0, 7.0, 12.0]
+        left, right = MetricRollup(), MetricRollup()
+        for value in values[:3]:
+            left.add(value)
+        for value in values[3:]:
+            right.add(value)
+        left.merge(MetricRollup.from_json(right.to_json()))
+
+        assert left.count == len(values)
+        assert left.mean == pytest.approx(statistics.mean(values))
+        assert left.variance == pytest.approx(statistics.variance(values))
+        assert left.quantile(1.0) == 40.0
+
+    def test_baseline_from_rollups(self, tmp_path):
+        """Test: Finished runs roll up once per day; get_baseline adds percentiles."""
+        store = _store(tmp_path, enabled=False)
+        today = datetime.now().replace(hour=8)
+        durations = [100.0 + n for n in range(20)]
+        for n, seconds in enumerate(durations):
+            store.save_run(_finished_run(f"run-{n}", today - timedelta(days=n % 3), seconds, failed=n % 2))
+        store.save_run(_finished_run("run-0", today, 100.0))  # Re-save is not counted again
+        live = _finished_run("live", today, 5000.0)
+        live.status = RunStatus.RUNNING
+        store.save_run(live)
+        store.save_run(_finished_run("old", today - timedelta(days=60), 5000.0))
+
+        baseline = store.get_baseline("smoke", "staging", days=30)
+
+        assert baseline["run_count"] == 20
+        assert baseline["avg_duration"] == pytest.approx(statistics.mean(durations))
+        assert baseline["duration_stddev"] == pytest.approx(statistics.stdev(durations))
+        assert baseline["duration_p95"] == pytest.approx(118.0, rel=0.03)
+        assert baseline["avg_failed_tests"] == 0.5
+        assert baseline["failure_rate_mean"] == pytest.approx(0.125)
+        assert _rows(store, "SELECT COUNT(*) AS n FROM run_rollups") == [{"n": 4}]
+        assert store.get_baselines(days=30)[("smoke", "staging")]["run_count"] == 20
+        assert store.get_baseline("smoke", "prod") is None
+
+        tests = store.get_test_baselines("smoke", "staging", days=30)
+        assert tests["api:test_0"]["failure_rate"] == 0.5
+        assert tests["api:test_3"]["duration_p95"] == pytest.approx(4.0, rel=0.03)
+
+    def test_rebuild_matches_incremental(self, tmp_path):
+        """Test: rebuild_rollups() recomputes the same baseline from stored runs."""
+        store = _store(tmp_path, enabled=False)
+        start = datetime.now()
+        for n in range(6):
+            store.save_run(_finished_run(f"run-{n}", start, 60.0 * (n + 1), failed=1))
+        before = store.get_baseline("smoke", "staging")
+        tests_before = store.get_test_baselines("smoke", "staging")
+
+        assert store.rebuild_rollups() == 6
+        assert store.get_baseline("smoke", "staging") == pytest.approx(before)
+        assert store.get_test_baselines("smoke", "staging") == tests_before
+        assert tests_before["api:test_0"]["run_count"] == 6
+
+    def test_failed_rebuild_keeps_rollups(self, tmp_path, monkeypatch):
+        """Test: A rebuild failing after its DELETEs rolls back to the old rollups."""
+        store = _store(tmp_path, enabled=False)
+        for n in range(3):
+            store.save_run(_finished_run(f"run-{n}", datetime.now(), 60.0))
+        before = store.get_baseline("smoke", "staging")
+
+        def failing_upserts(cursor, rows):
+            raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(store, "_execute_upserts", failing_upserts)
+        with pytest.raises(RuntimeError):
+            store.rebuild_rollups()
+
+        assert store.get_baseline("smoke", "staging") == pytest.approx(before)
+        assert _rows(store, "SELECT COUNT(*) AS n FROM rolled_up_runs") == [{"n": 3}]
+
+
+@pytest.mark.unit
+class TestDurationRegression:
+    """Unit tests for AnomalyEngine.detect_duration_regression."""
+
+    def test_p95_regressions(self, tmp_path):
+        """Test: Run and test durations past p95 * (1 + threshold) are reported."""
+        store = _store(tmp_path, enabled=False)
+        start = datetime.now()
+        for n in range(10):
+            store.save_run(_finished_run(f"run-{n}", start, 100.0 + n))
+        engine = AnomalyEngine({"anomaly_thresholds": {"test_duration_deviation_threshold": 0.2}})
+        baseline = store.get_baseline("smoke", "staging")
+        test_baselines = store.get_test_baselines("smoke", "staging")
+
+        assert engine.detect_duration_regression(_finished_run("ok", start, 120.0), baseline, test_baselines) == []
+
+        slow = _finished_run("slow", start, 200.0)
+        slow.tests["api:test_1"].duration_seconds = 10.0
+        anomalies = engine.detect_duration_regression(slow, baseline, test_baselines)
+
+        assert anomalies[0].title.startswith("Run duration regression: 200s vs p95 10")
+        assert anomalies[1].title == "1 test(s) slower than baseline p95"
+        assert anomalies[1].metadata["worst"][0]["test_id"] == "api:test_1"
+        assert slow.anomalies == anomalies
+
+    def test_needs_min_runs(self):
+        """Test: Baselines with too few runs are ignored."""
+        engine = AnomalyEngine()
+        context = _finished_run("slow", datetime.now(), 1000.0)
+        baseline = {"run_count": 2, "duration_p95": 10.0}
+
+        assert engine.detect_duration_regression(context, baseline) == []
+
+
+def _all_pages(store: RunHistoryStore, **query):
+    pages, cursor = [], None
+    while True:
+        page = store.query_runs_page(cursor=cursor, **query)
+        pages.append([run["run_id"] for run in page["runs"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.unit
+class TestRunQueries:
+    """Unit tests for keyset pagination and projection of query_runs."""
+
+    @pytest.mark.parametrize("backend", ["sqlite", "memory"])
+    def test_cursor_pages_cover_every_run_once(self, tmp_path, backend):
+        """Test: Cursor pages follow (start_time, run_id) desc, ties and NULL start times included."""
+        if backend == "sqlite":
+            store = _store(tmp_path, enabled=False)
+        else:
+            store = RunHistoryStore({"database": {"type": "memory"}})
+        start = datetime(2026, 10, 1)
+        for n in range(7):
+            store.save_run(_finished_run(f"run-{n}", start + timedelta(hours=n // 2), 60.0))
+        unstarted = _finished_run("run-x", start, 60.0)
+        unstarted.start_time = None
+        store.save_run(unstarted)
+
+        pages = _all_pages(store, pipeline="smoke", limit=3)
+
+        assert pages == [["run-6", "run-5", "run-4"], ["run-3", "run-2", "run-1"], ["run-0", "run-x"]]
+        assert store.query_runs(limit=2, offset=5) == store.query_runs(limit=2, cursor=store.query_runs_page(
+            limit=5
+        )["next_cursor"])
+
+    def test_projection_and_version(self, tmp_path):
+        """Test: fields limits the columns; data_version moves only on committed writes."""
+        store = _store(tmp_path, enabled=False)
+        assert store.data_version == 0
+        store.save_run(_finished_run("run-1", datetime(2026, 10, 1), 60.0))
+        version = store.data_version
+        store.query_runs()
+
+        page = store.query_runs_page(fields=["status"], limit=1)
+
+        assert page == {"runs": [{"status": "completed"}], "next_cursor": None}
+        assert store.data_version == version > 0
+        with pytest.raises(ValueError):
+            store.query_runs(fields=["status; DROP TABLE runs"])
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_filtered_page_uses_composite_index(self, tmp_path):
+        """Test: A pipeline/environment page is an index range scan without a sort step."""
+        store = _store(tmp_path, enabled=False)
+        plan = " ".join(row[3] for row in store.db_connection.execute(
+            "EXPLAIN QUERY PLAN SELECT run_id FROM runs WHERE pipeline = ? AND environment = ? "
+            "AND ((start_time, run_id) < (?, ?) OR start_time IS NULL) "
+            "ORDER BY start_time DESC NULLS LAST, run_id DESC LIMIT 11",
+            ("smoke", "staging", "2026-10-01", "run-1")
+        ).fetchall())
+
+        assert "idx_runs_pipeline_env_page" in plan
@@ -0,0 +1,206 @@
+"""
+Unit Tests - Sentinel Informer Cache
+====================================
+
+Unit tests for InformerCache indexes, ResourceInformer list/watch/resume
+behaviour (scripted watch streams, no cluster needed) and the K8sWatcher
+lookups served from the cache.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from src.sentinel.core import informer_cache
+from src.sentinel.core.informer_cache import InformerCache, ResourceInformer
+from src.sentinel.core.k8s_watcher import K8sWatcher
+from src.sentinel.core.models import RunContext
+
+
+def _pod(name, rv="1", namespace="panda", labels=None, job=None, phase="Running"):
+    owners = [client.V1OwnerReference(api_version="batch/v1", kind="Job", name=job, uid="u")] if job else None
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(
+            name=name, namespace=namespace, resource_version=rv, labels=labels, owner_references=owners
+        ),
+        status=client.V1PodStatus(phase=phase),
+    )
+
+
+def _pod_list(pods, rv):
+    return client.V1PodList(items=pods, metadata=client.V1ListMeta(resource_version=rv))
+
+
+class _ScriptedWatch:
+    """Stands in for kubernetes.watch.Watch; each stream() call plays the next script."""
+
+    scripts = []
+    calls = []
+    stop_event = None
+
+    def stream(self, func, **kwargs):
+        _ScriptedWatch.calls.append(kwargs)
+        if not _ScriptedWatch.scripts:
+            _ScriptedWatch.stop_event.set()
+            return
+        for item in _ScriptedWatch.scripts.pop(0):
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def scripted_watch(monkeypatch):
+    monkeypatch.setattr(informer_cache.watch, "Watch", _ScriptedWatch)
+    _ScriptedWatch.scripts = []
+    _ScriptedWatch.calls = []
+    _ScriptedWatch.stop_event = threading.Event()
+    return _ScriptedWatch
+
+
+@pytest.mark.unit
+class TestInformerCache:
+    """Unit tests for InformerCache."""
+
+    def test_label_and_owner_indexes_follow_updates(self):
+        """Test: Index entries move when labels/owners change and vanish on delete."""
+        cache = InformerCache()
+        cache.upsert("pod", _pod("p1", labels={"run-id": "r1"}, job="job-a"))
+        cache.upsert("pod", _pod("p2", labels={"run-id": "r1"}, job="job-b"))
+
+        assert {p.metadata.name for p in cache.by_label("pod", "run-id", "r1")} == {"p1", "p2"}
+        assert [p.metadata.name for p in cache.by_owner("pod", "Job", "job-a")] == ["p1"]
+
+        cache.upsert("pod", _pod("p1", rv="2", labels={"run-id": "r2"}, job="job-a"))
+        assert [p.metadata.name for p in cache.by_label("pod", "run-id", "r1")] == ["p2"]
+
+        cache.delete("pod", _pod("p1"))
+        assert cache.by_owner("pod", "Job", "job-a") == []
+        assert cache.get("pod", "panda", "p1") is None
+
+    def test_replace_returns_differences(self):
+        """Test: A re-list yields ADDED/MODIFIED/DELETED only for changes."""
+        cache = InformerCache()
+        cache.replace("pod", "panda", [_pod("keep"), _pod("change"), _pod("gone")])
+        cache.upsert("pod", _pod("other-ns", namespace="default"))
+
+        events = cache.replace("pod", "panda", [_pod("keep"), _pod("change", rv="2"), _pod("new")])
+
+        assert sorted((t, o.metadata.name) for t, o in events) == [
+            ("ADDED", "new"), ("DELETED", "gone"), ("MODIFIED", "change")
+        ]
+        assert cache.has_synced("pod", "panda")
+        assert len(cache.list("pod")) == 4
+
+
+@pytest.mark.unit
+class TestResourceInformer:
+    """Unit tests for ResourceInformer."""
+
+    def test_list_watch_resume_and_gone(self, scripted_watch):
+        """Test: Watches resume from the last resourceVersion; 410 triggers a diff re-list."""
+        lists = [
+            _pod_list([_pod("a", rv="10")], rv="10"),
+            _pod_list([_pod("a", rv="12"), _pod("c", rv="14")], rv="14"),
+        ]
+        list_calls = []
+
+        def list_func(**kwargs):
+            list_calls.append(kwargs)
+            return lists.pop(0)
+
+        scripted_watch.scripts = [
+            [{"type": "ADDED", "object": _pod("b", rv="11")}],
+            [{"type": "BOOKMARK", "object": _pod("", rv="13")}],
+            [ApiException(status=410, reason="Gone")],
+        ]
+        cache = InformerCache()
+        events = []
+        informer = ResourceInformer(
+            cache, "pod", "panda", list_func,
+            on_event=lambda obj, event_type, ns: events.append((event_type, obj.metadata.name)),
+            backoff_seconds=0.01,
+        )
+
+        informer.run(scripted_watch.stop_event)
+
+        assert [call["resource_version"] for call in scripted_watch.calls] == ["10", "11", "13", "14"]
+        assert all(call["allow_watch_bookmarks"] for call in scripted_watch.calls)
+        assert len(list_calls) == 2
+        # Initial list, watch event, then only the differences after 410
+        assert events == [("ADDED", "a"), ("ADDED", "b"), ("MODIFIED", "a"), ("ADDED", "c"), ("DELETED", "b")]
+        assert sorted(p.metadata.name for p in cache.list("pod")) == ["a", "c"]
+        assert (informer.relists, informer.resumes) == (2, 2)
+
+
+@pytest.mark.unit
+class TestK8sWatcherLookups:
+    """Unit tests for K8sWatcher lookups served from the cache."""
+
+    @pytest.fixture
+    def watcher(self):
+        watcher = K8sWatcher(None, namespaces=["panda"])
+        watcher.core_v1 = None  # Never call the API in these tests
+        return watcher
+
+    def test_run_context_by_owner_job(self, watcher):
+        """Test: Pods map to runs via run-id label or owning Job."""
+        by_job = RunContext(run_id="run-job", k8s_job_name="grpc-job-1")
+        by_label = RunContext(run_id="run-label")
+        watcher.register_run(by_job)
+        watcher.register_run(by_label)
+
+        assert watcher._find_run_context_for_pod(_pod("p", job="grpc-job-1")) is by_job
+        assert watcher._find_run_context_for_pod(_pod("p", labels={"run-id": "run-label"})) is by_label
+        assert watcher._find_run_context_for_pod(_pod("p", job="other")) is None
+
+        watcher.unregister_run("run-job")
+        assert watcher._find_run_context_for_pod(_pod("p", job="grpc-job-1")) is None
+
+    def test_pod_health_from_cache(self, watcher):
+        """Test: get_pod_health returns the cached pod's health without API calls."""
+        assert watcher.get_pod_health("p1", "panda") is None  # not synced, no client
+
+        watcher.cache.replace("pod", "panda", [_pod("p1", job="grpc-job-1", phase="Failed")])
+
+        health = watcher.get_pod_health("p1", "panda")
+        assert (health.pod_name, health.phase) == ("p1", "Failed")
+        assert watcher.get_pod_health("missing", "panda") is None
+        assert [p.metadata.name for p in watcher.get_pods_for_job("grpc-job-1")] == ["p1"]
+
+    def test_restart_after_slow_stop_does_not_revive_old_informers(self, watcher, monkeypatch):
+        """Test: Informer threads still running after stop_watching() exit once released."""
+        release = threading.Event()
+        stop_events = []
+
+        def run(informer, stop_event):
+            stop_events.append(stop_event)
+            release.wait(5)
+            while not stop_event.is_set():
+                stop_event.wait(0.01)
+
+        monkeypatch.setattr(ResourceInformer, "run", run)
+        watcher.core_v1 = SimpleNamespace(list_namespaced_pod=None)
+        watcher.batch_v1 = SimpleNamespace(list_namespaced_job=None)
+
+        watcher.start_watching()
+        first_threads = list(watcher._watch_threads)
+        watcher.stop_watching(timeout=0.01)
+        watcher.start_watching()
+        release.set()
+
+        for thread in first_threads:
+            thread.join(2)
+        assert not any(thread.is_alive() for thread in first_threads)
+        assert [event.is_set() for event in stop_events] == [True, True, False, False]
+
+        watcher.stop_watching()
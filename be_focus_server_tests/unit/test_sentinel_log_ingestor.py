@@ -0,0 +1,242 @@
+"""
+Unit Tests - Sentinel Async Log Ingestor
+========================================
+
+Unit tests for AsyncLogIngestor (multiplexing, resume after reconnect,
+overflow policies, cancellation) and KubernetesPodLogSource against an
+in-process aiohttp server.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+
+from src.sentinel.core.async_log_ingestor import (
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_OLDEST,
+    OVERFLOW_SAMPLE,
+    AsyncLogIngestor,
+    KubernetesPodLogSource,
+    PodLogGone,
+    PodLogStream,
+)
+
+HANG = object()
+
+
+def _ts(second: int, nanos: int = 0) -> str:
+    return f"2026-10-16T12:00:{second:02d}.{nanos:09d}Z"
+
+
+class _ScriptedSource:
+    """Per pod, a list of connections; each is a list of lines / exceptions / HANG."""
+
+    def __init__(self, scripts):
+        self.scripts = {pod: list(connections) for pod, connections in scripts.items()}
+        self.since_times = defaultdict(list)
+        self.cancelled = 0
+        self.closed = False
+
+    async def stream(self, pod_name, namespace, since_time=None):
+        self.since_times[pod_name].append(since_time)
+        if not self.scripts[pod_name]:
+            raise PodLogGone(pod_name)
+        for item in self.scripts[pod_name].pop(0):
+            if item is HANG:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    self.cancelled += 1
+                    raise
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    async def is_finished(self, pod_name, namespace):
+        return not self.scripts[pod_name]
+
+    async def close(self):
+        self.closed = True
+
+
+def _wait_until(predicate, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestAsyncLogIngestor:
+    """Unit tests for AsyncLogIngestor."""
+
+    def test_many_pods_share_one_thread(self):
+        """Test: 50 followed pods add one thread and deliver every line in order."""
+        pods = [f"grpc-job-{i}" for i in range(50)]
+        source = _ScriptedSource({
+            pod: [[f"{_ts(1, n)} {pod} line {n}" for n in range(100)]] for pod in pods
+        })
+        received = defaultdict(list)
+        finished = []
+        ingestor = AsyncLogIngestor(source, reconnect_delay_seconds=0.01, on_finished=finished.append)
+        threads_before = threading.active_count()
+
+        for pod in pods:
+            ingestor.follow(f"run:{pod}", pod, "panda", received[pod].append)
+        assert threading.active_count() - threads_before == 1
+
+        _wait_until(lambda: len(finished) == 50)
+        ingestor.stop()
+
+        assert all(received[pod] == [f"{pod} line {n}" for n in range(100)] for pod in pods)
+        assert ingestor.stream_ids() == []
+        assert source.closed
+        assert threading.active_count() == threads_before
+
+    def test_resume_skips_already_delivered_lines(self):
+        """Test: Reconnect passes sinceTime and drops the lines the server repeats."""
+        first = [f"{_ts(1, 1)} a", f"{_ts(1, 2)} b", f"{_ts(1, 2)} c", ConnectionError("reset")]
+        # sinceTime has second precision: the server sends the whole second again
+        second = [f"{_ts(1, 1)} a", f"{_ts(1, 2)} b", f"{_ts(1, 2)} c", f"{_ts(2)} d"]
+        source = _ScriptedSource({"pod": [first, second]})
+        received, finished = [], []
+        ingestor = AsyncLogIngestor(source, reconnect_delay_seconds=0.01, on_finished=finished.append)
+
+        ingestor.follow("run:pod", "pod", "panda", received.append)
+        _wait_until(lambda: finished)
+        ingestor.stop()
+
+        assert received == ["a", "b", "c", "d"]
+        assert source.since_times["pod"] == [None, _ts(1, 2)]
+
+    def test_unfollow_cancels_stream(self):
+        """Test: unfollow() cancels a hanging HTTP stream."""
+        source = _ScriptedSource({"pod": [[f"{_ts(1)} hello", HANG]]})
+        received = []
+        ingestor = AsyncLogIngestor(source)
+        ingestor.follow("run:pod", "pod", "panda", received.append)
+        assert ingestor.follow("run:pod", "pod", "panda", received.append) is False
+        _wait_until(lambda: received)
+
+        assert ingestor.unfollow("run:pod") is True
+        assert source.cancelled == 1
+        assert ingestor.stream_ids() == []
+        assert ingestor.unfollow("run:pod") is False
+        ingestor.stop()
+
+    def test_invalid_policy(self):
+        """Test: Unknown overflow policies are rejected."""
+        with pytest.raises(ValueError, match="overflow_policy"):
+            AsyncLogIngestor(_ScriptedSource({}), overflow_policy="ignore")
+
+
+@pytest.mark.unit
+class TestOverflowPolicies:
+    """Unit tests for the bounded per-pod buffer."""
+
+    @staticmethod
+    async def _fill(policy: str, lines: int, **kwargs):
+        ingestor = AsyncLogIngestor(_ScriptedSource({}), overflow_policy=policy, **kwargs)
+        stream = PodLogStream(
+            "s", "pod", "ns", on_line=print, queue=asyncio.Queue(maxsize=ingestor.buffer_lines)
+        )
+        for n in range(lines):
+            await ingestor._enqueue(stream, str(n))
+        buffered = [stream.queue.get_nowait() for _ in range(stream.queue.qsize())]
+        return buffered, stream.lines_dropped
+
+    async def test_drop_newest(self):
+        """Test: drop_newest keeps the first lines."""
+        assert await self._fill(OVERFLOW_DROP_NEWEST, 5, buffer_lines=2) == (["0", "1"], 3)
+
+    async def test_drop_oldest(self):
+        """Test: drop_oldest keeps the latest lines."""
+        assert await self._fill(OVERFLOW_DROP_OLDEST, 5, buffer_lines=2) == (["3", "4"], 3)
+
+    async def test_sample(self):
+        """Test: Above the watermark every Nth line is kept until the buffer is full."""
+        buffered, dropped = await self._fill(
+            OVERFLOW_SAMPLE, 20, buffer_lines=10, sample_every=2, sample_watermark=0.5
+        )
+        assert buffered == ["0", "1", "2", "3", "4", "6", "8", "10", "12", "14"]
+        assert dropped == 10
+
+
+class _KubeApiStub:
+    """Pod log and pod endpoints of the Kubernetes API."""
+
+    def __init__(self):
+        self.log_params = []
+        self.auth_headers = []
+
+    async def pod_log(self, request):
+        self.log_params.append(dict(request.query))
+        self.auth_headers.append(request.headers.get("Authorization"))
+        if request.match_info["pod"] == "missing":
+            return web.Response(status=404)
+        response = web.StreamResponse()
+        await response.prepare(request)
+        # Line boundaries do not follow chunk boundaries
+        for chunk in (f"{_ts(1)} first li".encode(), f"ne\n{_ts(2)} second\r\n{_ts(3)} tail".encode()):
+            await response.write(chunk)
+            await asyncio.sleep(0.01)
+        return response
+
+    async def pod(self, request):
+        phase = "Running" if request.match_info["pod"] == "running" else "Succeeded"
+        return web.json_response({"status": {"phase": phase}})
+
+
+@pytest.fixture
+async def kube_api():
+    stub = _KubeApiStub()
+    app = web.Application()
+    app.router.add_get("/api/v1/namespaces/{ns}/pods/{pod}/log", stub.pod_log)
+    app.router.add_get("/api/v1/namespaces/{ns}/pods/{pod}", stub.pod)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    configuration = SimpleNamespace(
+        host=f"http://127.0.0.1:{port}",
+        verify_ssl=False,
+        refresh_api_key_hook=None,
+        proxy=None,
+        get_api_key_with_prefix=lambda key: "Bearer token-1",
+    )
+    source = KubernetesPodLogSource(configuration)
+    yield stub, source
+    await source.close()
+    await runner.cleanup()
+
+
+@pytest.mark.unit
+class TestKubernetesPodLogSource:
+    """Unit tests for KubernetesPodLogSource."""
+
+    async def test_stream_lines_and_params(self, kube_api):
+        """Test: Lines are reassembled across chunks; follow/timestamps/sinceTime are sent."""
+        stub, source = kube_api
+        lines = [line async for line in source.stream("pod-0", "panda", since_time=_ts(1))]
+
+        assert lines == [f"{_ts(1)} first line", f"{_ts(2)} second", f"{_ts(3)} tail"]
+        assert stub.log_params == [{"follow": "true", "timestamps": "true", "sinceTime": _ts(1)}]
+        assert stub.auth_headers == ["Bearer token-1"]
+
+    async def test_missing_pod_and_finished(self, kube_api):
+        """Test: 404 raises PodLogGone; terminated pods are finished."""
+        _, source = kube_api
+        with pytest.raises(PodLogGone):
+            async for _ in source.stream("missing", "panda"):
+                pass
+        assert await source.is_finished("done", "panda") is True
+        assert await source.is_finished("running", "panda") is False
@@ -0,0 +1,144 @@
+"""
+Unit Tests - Sentinel Pattern Set
+=================================
+
+Unit tests for the PatternSet log line prefilter and its use in LogStreamer
+and RunDetector.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import logging
+import re
+
+import pytest
+
+from src.sentinel.core.log_streamer import LogStreamer
+from src.sentinel.core.pattern_set import PatternSet, required_literals
+from src.sentinel.core.run_context import RunContextManager
+from src.sentinel.core.run_detector import RunDetector
+from src.sentinel.core.models import RunContext, TestStatus
+
+
+LINES = [
+    "2026-10-16 INFO Sent frame 42 to consumer task-7",
+    "INFO TEST_START test=test_waterfall suite=api",
+    "test_config started ... test: test_config",
+    "ERROR TEST_FAIL test=test_grpc AssertionError",
+    "Traceback (most recent call last):",
+    "WARN pymongo TIMEOUT after 30000ms",
+    "RUN_START pipeline=smoke env=staging",
+    "plain line with key=123",
+    "Ünïcode line: ERROR in ﬁlter",
+    "\u212aelvin TEST_PASS test=k1",  # KELVIN SIGN folds to "k"
+    "",
+]
+
+
+def _naive(patterns, line):
+    return [(key, p.search(line).group(0)) for key, p in patterns if p.search(line)]
+
+
+def _log_streamer() -> LogStreamer:
+    streamer = LogStreamer.__new__(LogStreamer)
+    streamer.config = {}
+    streamer.logger = logging.getLogger(__name__)
+    streamer.test_patterns = streamer._load_test_patterns()
+    streamer.error_patterns = streamer._load_error_patterns()
+    streamer._build_pattern_sets()
+    streamer.on_test_event_callbacks = []
+    streamer.on_error_callbacks = []
+    return streamer
+
+
+@pytest.mark.unit
+class TestRequiredLiterals:
+    """Unit tests for required_literals()."""
+
+    @pytest.mark.parametrize("pattern, expected", [
+        (r"\b(?:error|ERROR|Error)\b.*", {"error"}),
+        (r"(?:RUN_END|run.*ended|completed run)", {"run_end", "ended", "completed run"}),
+        (r"RUN_START.*pipeline=(?P<p>\w+)", {"run_start"}),
+        (r"a(?:bc)+d?", {"bc"}),
+        (r"(?:abc)?\d+", None),
+        (r"(?:abc|\d)x", None),
+        (r"\w+=\d+", None),
+    ])
+    def test_extraction(self, pattern, expected):
+        """Test: Every match must contain one of the extracted literals."""
+        literals = required_literals(re.compile(pattern, re.IGNORECASE))
+        assert (set(literals) if literals else None) == expected
+
+
+@pytest.mark.unit
+class TestPatternSet:
+    """Unit tests for PatternSet."""
+
+    def test_same_matches_as_regex_loop(self):
+        """Test: iter_matches equals searching every pattern in order."""
+        streamer = _log_streamer()
+        patterns = list(streamer.test_patterns.items()) + [
+            ("ERR", p) for p in streamer.error_patterns
+        ] + [("KV", re.compile(r"\w+=\d+"))]
+        pattern_set = PatternSet(patterns)
+
+        for line in LINES:
+            got = [(key, match.group(0)) for key, match in pattern_set.iter_matches(line)]
+            assert got == _naive(patterns, line), line
+
+    def test_prefilter_rejects_lines(self):
+        """Test: Lines without any literal never reach the full regexes."""
+        pattern_set = PatternSet([("e", re.compile(r"\berror\b", re.IGNORECASE))])
+
+        assert pattern_set.first_match("INFO all good") is None
+        assert pattern_set.first_match("An ERROR occurred")[0] == "e"
+        assert pattern_set.stats()["lines_rejected"] == 1
+
+    def test_ungated_pattern_always_runs(self):
+        """Test: A pattern without literals is checked on every line."""
+        pattern_set = PatternSet([("e", re.compile("error")), ("n", re.compile(r"\d{3}"))])
+
+        assert pattern_set.first_match("status 503")[0] == "n"
+        assert pattern_set.stats()["lines_rejected"] == 0
+
+
+@pytest.mark.unit
+class TestLogClassification:
+    """Unit tests for LogStreamer/RunDetector using PatternSet."""
+
+    def test_log_streamer_events_and_errors(self):
+        """Test: Test events and error callbacks fire as before."""
+        streamer = _log_streamer()
+        events, errors = [], []
+        streamer.on_test_event_callbacks.append(lambda event, ctx: events.append(event))
+        streamer.on_error_callbacks.append(lambda line, ctx: errors.append(line))
+        context = RunContext()
+
+        for line in LINES:
+            streamer._process_log_line(line, "pod-0", context)
+
+        assert [(e.event_type, e.test_name) for e in events] == [
+            ("TEST_START", "test_waterfall"),
+            ("TEST_START", "test_config"),
+            ("TEST_FAIL", "test_grpc"),
+            ("RUN_START", None),
+            ("TEST_PASS", "k1"),
+        ]
+        assert events[2].status == TestStatus.FAILED
+        assert len(errors) == 4  # TEST_FAIL, Traceback, TIMEOUT, Ünïcode ERROR
+
+    def test_run_detector_first_rule_wins(self):
+        """Test: detect_from_log uses the first matching rule; bad rules are skipped."""
+        detector = RunDetector(RunContextManager(), {
+            "log_detection_rules": [
+                {"pattern": "RUN_START(", "run_id_extractor": "run_id"},
+                {"pattern": r"TEST RUN STARTED.*run_id=(?P<run_id>\S+)", "run_id_extractor": "run_id"},
+                {"pattern": r"STARTED", "pipeline_extractor": "pipeline"},
+            ]
+        })
+
+        assert detector.detect_from_log("nothing to see") is None
+        context = detector.detect_from_log("TEST RUN STARTED run_id=run-42", source="pod")
+        assert context.run_id == "run-42"
+        assert len(detector._rule_set) == 2
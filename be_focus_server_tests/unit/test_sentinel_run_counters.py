@@ -0,0 +1,142 @@
+"""
+Unit Tests - Sentinel Run Counters
+==================================
+
+Unit tests for the status-transition counters on RunContext and their
+maintenance by SentinelService._on_test_event.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from src.sentinel.core.anomaly_engine import AnomalyEngine
+from src.sentinel.core.models import RunContext, SuiteRun, TestCaseRun, TestEvent, TestStatus
+from src.sentinel.core.run_event_bus import RunEventBus
+from src.sentinel.main.sentinel_service import SentinelService
+
+RESULTS = [("TEST_PASS", TestStatus.PASSED), ("TEST_FAIL", TestStatus.FAILED), ("TEST_SKIP", TestStatus.SKIPPED)]
+
+
+def _test(test_id: str, suite_name: str = "suite_a", status: TestStatus = TestStatus.PENDING) -> TestCaseRun:
+    return TestCaseRun(test_id=test_id, test_name=test_id, suite_name=suite_name, run_id="run", status=status)
+
+
+def _synthetic_events(num_tests: int, num_suites: int):
+    rng = random.Random(7)
+    for i in range(num_tests):
+        suite_name, test_name = f"suite_{i % num_suites}", f"test_case_{i}"
+        yield TestEvent("TEST_START", test_name=test_name, suite_name=suite_name, status=TestStatus.RUNNING)
+        event_type, status = rng.choice(RESULTS)
+        yield TestEvent(event_type, test_name=test_name, suite_name=suite_name, status=status)
+
+
+def _service() -> SentinelService:
+    service = SentinelService.__new__(SentinelService)
+    service.anomaly_engine = AnomalyEngine({})
+    service.event_bus = RunEventBus()
+    return service
+
+
+@pytest.mark.unit
+class TestRunContextCounters:
+    """Unit tests for RunContext counters."""
+
+    def test_status_transitions_move_counts(self):
+        """Test: A test is counted once, under its latest status."""
+        context = RunContext()
+        context.add_test(_test("t1", status=TestStatus.RUNNING))
+        context.add_test(_test("t2", status=TestStatus.RUNNING))
+
+        context.set_test_status("t1", TestStatus.FAILED)
+        context.set_test_status("t1", TestStatus.PASSED)  # rerun passed
+        context.set_test_status("t2", TestStatus.FAILED)
+
+        assert context.total_tests() == 2
+        assert (context.passed_tests(), context.failed_tests()) == (1, 1)
+        assert context.status_count(TestStatus.RUNNING) == 0
+        assert context.failure_rate() == 0.5
+
+    def test_suite_counters_and_breakdown(self):
+        """Test: SuiteRun counters and suite_breakdown follow transitions."""
+        context = RunContext()
+        context.add_suite(SuiteRun(suite_name="suite_a", run_id="run"))
+        context.add_test(_test("a1", status=TestStatus.PASSED))
+        context.add_test(_test("a2", status=TestStatus.RUNNING))
+        context.add_test(_test("b1", suite_name="suite_b", status=TestStatus.SKIPPED))
+        context.set_test_status("a2", TestStatus.FAILED)
+
+        suite = context.suites["suite_a"]
+        assert (suite.total_tests, suite.passed_tests, suite.failed_tests) == (2, 1, 1)
+        assert suite.test_ids == ["a1", "a2"]
+
+        breakdown = context.suite_breakdown()
+        assert breakdown["suite_a"]["total"] == 2
+        assert breakdown["suite_a"]["failed"] == 1
+        assert breakdown["suite_b"]["skipped"] == 1
+
+    def test_suite_added_after_tests(self):
+        """Test: A late SuiteRun picks up the tests already counted for it."""
+        context = RunContext()
+        context.add_test(_test("a1", status=TestStatus.FAILED))
+
+        context.add_suite(SuiteRun(suite_name="suite_a", run_id="run"))
+
+        suite = context.suites["suite_a"]
+        assert (suite.total_tests, suite.failed_tests, suite.test_ids) == (1, 1, ["a1"])
+
+    def test_direct_insertion_is_recounted(self):
+        """Test: Tests put into context.tests directly are still counted."""
+        context = RunContext()
+        context.tests["t1"] = _test("t1", status=TestStatus.PASSED)
+        context.tests["t2"] = _test("t2", status=TestStatus.FAILED)
+
+        assert (context.passed_tests(), context.failed_tests()) == (1, 1)
+        assert context.failure_rate() == 0.5
+
+    def test_empty_run(self):
+        """Test: A run without tests has zero counts and failure rate."""
+        context = RunContext()
+        assert (context.total_tests(), context.failed_tests(), context.failure_rate()) == (0, 0, 0.0)
+        assert context.suite_breakdown() == {}
+
+
+@pytest.mark.unit
+class TestSentinelServiceTestEvents:
+    """Unit tests for SentinelService._on_test_event counter updates."""
+
+    def test_start_then_result_counts_once(self):
+        """Test: TEST_START followed by TEST_FAIL yields one failed test."""
+        context = RunContext()
+        service = _service()
+        service._on_test_event(TestEvent("TEST_START", test_name="t", suite_name="s", status=TestStatus.RUNNING), context)
+        service._on_test_event(TestEvent("TEST_FAIL", test_name="t", suite_name="s", status=TestStatus.FAILED), context)
+
+        suite = context.suites["s"]
+        assert (context.total_tests(), context.failed_tests()) == (1, 1)
+        assert (suite.total_tests, suite.failed_tests, suite.test_ids) == (1, 1, ["s:t"])
+        assert context.tests["s:t"].end_time is not None
+
+    def test_synthetic_stream_matches_scan(self):
+        """Test: Replaying 10k tests gives the same counts as a full scan."""
+        context = RunContext()
+        service = _service()
+        for event in _synthetic_events(num_tests=10_000, num_suites=20):
+            service._on_test_event(event, context)
+
+        scanned = Counter(test.status for test in context.tests.values())
+        assert context.total_tests() == 10_000
+        assert context.passed_tests() == scanned[TestStatus.PASSED]
+        assert context.failed_tests() == scanned[TestStatus.FAILED]
+        assert context.skipped_tests() == scanned[TestStatus.SKIPPED]
+        assert context.status_count(TestStatus.RUNNING) == 0
+
+        suite = context.suites["suite_3"]
+        suite_scan = Counter(context.tests[test_id].status for test_id in suite.test_ids)
+        assert suite.total_tests == len(suite.test_ids) == 500
+        assert suite.failed_tests == suite_scan[TestStatus.FAILED]
+        assert sum(entry["total"] for entry in context.suite_breakdown().values()) == 10_000
@@ -0,0 +1,226 @@
+"""
+Unit Tests - SSH Channel Pool
+=============================
+
+Unit tests for concurrent command execution over one SSH connection:
+bounded parallelism of execute_many, per-command failure isolation,
+retries of refused channels, the async API and the channel slots held by
+streamed commands. The SSH client is a fake whose commands take a fixed
+time.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import socket
+import threading
+import time
+
+import paramiko
+import pytest
+
+from src.core.exceptions import InfrastructureError
+from src.infrastructure.ssh_manager import SSHManager
+
+
+class _Stream:
+    def __init__(self, channel, data=b""):
+        self.channel = channel
+        self.data = data
+
+    def read(self):
+        return self.data
+
+
+class _Channel:
+    def __init__(self, client, command):
+        self.client = client
+        self.command = command
+
+    def settimeout(self, timeout):
+        pass
+
+    def recv_exit_status(self):
+        with self.client.lock:
+            self.client.running += 1
+            self.client.peak = max(self.client.peak, self.client.running)
+        try:
+            time.sleep(self.client.latency)
+            if "hang" in self.command:
+                raise socket.timeout()
+            return 1 if "false" in self.command else 0
+        finally:
+            with self.client.lock:
+                self.client.running -= 1
+
+    def close(self):
+        pass
+
+
+class _Client:
+    """paramiko.SSHClient stand-in: every exec_command takes `latency` seconds."""
+
+    def __init__(self, latency=0.0, refusals=0):
+        self.latency = latency
+        self.refusals = refusals
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.opened = 0
+
+    def exec_command(self, command, timeout=None):
+        with self.lock:
+            if self.refusals > 0:
+                self.refusals -= 1
+                raise paramiko.ChannelException(1, "Administratively prohibited")
+            self.opened += 1
+        channel = _Channel(self, command)
+        return None, _Stream(channel, f"out:{command}".encode()), _Stream(channel)
+
+
+class _SessionChannel:
+    """Session channel of a streamed command: stdout is sent in one chunk."""
+
+    def __init__(self, data):
+        self.data = data
+        self.closed = False
+
+    def exec_command(self, command):
+        self.command = command
+
+    def settimeout(self, timeout):
+        pass
+
+    def recv(self, size):
+        data, self.data = self.data, b""
+        return data
+
+    def close(self):
+        self.closed = True
+
+
+class _Transport:
+    """paramiko.Transport stand-in whose first `refusals` session opens are refused."""
+
+    def __init__(self, data=b"", refusals=0):
+        self.data = data
+        self.refusals = refusals
+        self.channels = []
+
+    def get_transport(self):
+        return self
+
+    def open_session(self):
+        if self.refusals > 0:
+            self.refusals -= 1
+            raise paramiko.ChannelException(1, "Administratively prohibited")
+        channel = _SessionChannel(self.data)
+        self.channels.append(channel)
+        return channel
+
+
+class _Config:
+    def __init__(self, **ssh):
+        self.ssh = ssh
+
+    def get_ssh_config(self):
+        return self.ssh
+
+
+@pytest.fixture
+def ssh():
+    def make(max_channels=3, **client):
+        manager = SSHManager(_Config(max_channels=max_channels))
+        manager.ssh_client = _Client(**client)
+        manager.connected = True
+        managers.append(manager)
+        return manager
+
+    managers = []
+    yield make
+    for manager in managers:
+        manager.ssh_client = None
+        manager.disconnect()
+
+
+@pytest.mark.unit
+class TestChannelPool:
+    """Unit tests for SSHManager.execute_many / submit_command / execute_command_async."""
+
+    def test_execute_many_runs_in_parallel_up_to_limit(self, ssh):
+        """Test: 6 commands of 0.2s on 3 channels take ~0.4s, results in order."""
+        manager = ssh(max_channels=3, latency=0.2)
+        commands = [f"kubectl logs grpc-job-{n}" for n in range(6)]
+
+        started = time.monotonic()
+        results = manager.execute_many(commands, timeout=5)
+        elapsed = time.monotonic() - started
+
+        assert [r["stdout"] for r in results] == [f"out:{c}" for c in commands]
+        assert all(r["success"] for r in results)
+        assert manager.ssh_client.peak == 3
+        assert 0.35 <= elapsed < 0.7
+
+    def test_failures_are_isolated(self, ssh):
+        """Test: A timed-out or failing command does not affect the others."""
+        manager = ssh(latency=0.01)
+
+        ok, failed, hung = manager.execute_many(["true", "false", "hang"], timeout=5)
+
+        assert ok["success"] and ok["exit_code"] == 0
+        assert not failed["success"] and failed["exit_code"] == 1
+        assert hung["exit_code"] is None and "timed out" in hung["stderr"]
+
+    def test_refused_channel_is_retried(self, ssh):
+        """Test: A channel refused by the server (MaxSessions) is retried."""
+        manager = ssh(refusals=2)
+
+        assert manager.execute_command("uptime")["success"]
+        assert manager.ssh_client.opened == 1
+
+    async def test_async_api(self, ssh):
+        """Test: execute_command_async runs commands concurrently without blocking the loop."""
+        manager = ssh(max_channels=4, latency=0.2)
+
+        started = time.monotonic()
+        results = await asyncio.gather(*(manager.execute_command_async(f"echo {n}") for n in range(4)))
+
+        assert time.monotonic() - started < 0.35
+        assert [r["stdout"] for r in results] == [f"out:echo {n}" for n in range(4)]
+
+
+@pytest.mark.unit
+class TestStreamedCommandChannels:
+    """Unit tests for the channel slots and retries of SSHManager.stream_lines."""
+
+    def test_stream_lines_holds_a_slot_until_closed(self, ssh):
+        """Test: A stream occupies one channel slot until the generator is closed."""
+        manager = ssh(max_channels=1)
+        manager.ssh_client = _Transport(b"ADDED pod-1\nMODIFIED pod-1\n")
+
+        lines = manager.stream_lines("kubectl get pods --watch", timeout=5)
+        assert next(lines) == "ADDED pod-1"
+        assert not manager._channel_slots.acquire(blocking=False)
+
+        lines.close()
+        assert manager.ssh_client.channels[0].closed
+        assert manager._channel_slots.acquire(blocking=False)
+
+    def test_stream_lines_waits_for_a_free_slot(self, ssh):
+        """Test: With every slot in use the stream gives up after its timeout."""
+        manager = ssh(max_channels=1)
+        manager.ssh_client = _Transport(b"x\n")
+        manager._channel_slots.acquire()
+
+        with pytest.raises(InfrastructureError, match="No free SSH channel"):
+            list(manager.stream_lines("kubectl get pods --watch", timeout=0.1))
+        assert manager.ssh_client.channels == []
+
+    def test_refused_stream_channel_is_retried(self, ssh):
+        """Test: A session channel refused by the server (MaxSessions) is retried."""
+        manager = ssh()
+        manager.ssh_client = _Transport(b"a\nb", refusals=2)
+
+        assert list(manager.stream_lines("kubectl get events --watch", timeout=5)) == ["a", "b"]
+        assert len(manager.ssh_client.channels) == 1
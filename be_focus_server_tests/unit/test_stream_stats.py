@@ -0,0 +1,193 @@
+"""
+Unit Tests - Stream Payload Statistics
+=======================================
+
+Unit tests for QuantileSketch and StreamStatsAccumulator.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import numpy as np
+import pytest
+
+from src.apis.grpc_client import StreamMetrics
+from src.apis.grpc_stream_stats import StreamStatsAccumulator
+from src.models.proto_generated import pandadatastream_pb2
+from src.utils.quantile_sketch import QuantileSketch
+
+
+@pytest.mark.unit
+class TestQuantileSketch:
+    """Unit tests for QuantileSketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test: Quantile estimates stay within the configured relative error."""
+        rng = np.random.default_rng(7)
+        values = rng.lognormal(mean=3.0, sigma=1.0, size=50_000)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.add_many(values)
+
+        for q in (0.5, 0.9, 0.99, 0.999):
+            expected = np.quantile(values, q, method="lower")
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+
+    def test_negative_and_zero_values(self):
+        """Test: Negative values and zeros are ordered correctly."""
+        sketch = QuantileSketch()
+        sketch.add_many([-100.0, -1.0, 0.0, 0.0, 1.0, 100.0])
+
+        assert sketch.quantile(0.0) == -100.0
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == 100.0
+        assert sketch.quantile(0.2) == pytest.approx(-1.0, rel=0.01)
+
+    def test_scalar_and_vector_paths_agree(self):
+        """Test: add() and add_many() produce the same sketch."""
+        values = np.linspace(0.5, 500.0, 1000)
+        a, b = QuantileSketch(), QuantileSketch()
+        for v in values:
+            a.add(float(v))
+        b.add_many(values)
+
+        assert a.to_dict() == b.to_dict()
+
+    def test_merge_and_serialization(self):
+        """Test: Merged sketches equal one sketch over all values; round-trips via dict."""
+        values = np.arange(1, 10_001, dtype=float)
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        whole.add_many(values)
+        left.add_many(values[:3000])
+        right.add_many(values[3000:])
+
+        restored = QuantileSketch.from_dict(left.to_dict())
+        restored.merge(right)
+
+        assert restored.count == whole.count
+        assert restored.quantiles((0.5, 0.99)) == whole.quantiles((0.5, 0.99))
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test: Sketches of different accuracy cannot be merged."""
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_nan_ignored_and_empty(self):
+        """Test: NaN values are ignored; empty sketch returns None."""
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) is None
+        sketch.add(float("nan"))
+        sketch.add_many([np.nan, np.inf])
+        assert sketch.count == 0
+
+    def test_add_ignores_infinite_values(self):
+        """Test: add() drops +/-Inf like add_many() instead of raising OverflowError."""
+        a, b = QuantileSketch(), QuantileSketch()
+        for v in (1.0, np.inf, -np.inf, 2.0):
+            a.add(float(v))
+        b.add_many([1.0, np.inf, -np.inf, 2.0])
+
+        assert a.count == 2
+        assert a.max == 2.0
+        assert a.to_dict() == b.to_dict()
+
+
+@pytest.mark.unit
+class TestStreamStatsAccumulator:
+    """Unit tests for StreamStatsAccumulator."""
+
+    def test_welford_matches_numpy(self):
+        """Test: Running mean/variance match a full-array computation."""
+        rng = np.random.default_rng(1)
+        frames = [rng.normal(5.0, 2.0, size=(8, 16)) for _ in range(20)]
+        stats = StreamStatsAccumulator()
+        for data in frames:
+            stats.update(data, start_channel=0, end_channel=15)
+
+        everything = np.concatenate([f.ravel() for f in frames])
+        assert stats.count == everything.size
+        assert stats.mean == pytest.approx(everything.mean())
+        assert stats.variance == pytest.approx(everything.var(ddof=1))
+
+    def test_nan_inf_counts(self):
+        """Test: NaN/Inf are counted and excluded from the statistics."""
+        data = np.array([[1.0, np.nan], [np.inf, 3.0]])
+        stats = StreamStatsAccumulator()
+        stats.update(data, start_channel=10, end_channel=11)
+
+        assert stats.nan_count == 1
+        assert stats.inf_count == 1
+        assert stats.count == 2
+        assert stats.mean == pytest.approx(2.0)
+        assert stats.channel_means() == {10: 1.0, 11: 3.0}
+
+    def test_per_channel_energy_and_dead_channels(self):
+        """Test: Per-channel energy is tracked and flat channels are reported dead."""
+        rng = np.random.default_rng(2)
+        stats = StreamStatsAccumulator()
+        for _ in range(5):
+            data = rng.normal(0.0, 1.0, size=(10, 4))
+            data[:, 2] = 0.0          # Silent channel 3
+            stats.update(data, start_channel=1, end_channel=4)
+
+        energy = stats.channel_energy()
+        assert set(energy) == {1, 2, 3, 4}
+        assert energy[3] == 0.0
+        assert stats.dead_channels() == [3]
+        assert stats.dead_channels(expected_channels=range(1, 7)) == [3, 5, 6]
+
+    def test_all_nan_channel_is_dead(self):
+        """Test: A channel that receives frames of only NaN is dead, not missing."""
+        stats = StreamStatsAccumulator()
+        data = np.ones((4, 3))
+        data[:, 1] = np.nan
+        stats.update(data, start_channel=1, end_channel=3)
+        stats.update(np.full((4, 3), np.nan), start_channel=1, end_channel=3)
+
+        assert stats.channel_means() == {1: 1.0, 3: 1.0}
+        assert stats.dead_channels(min_range=-1.0) == [2]
+        assert stats.dead_channels(min_range=-1.0, expected_channels=range(1, 5)) == [2, 4]
+
+    def test_single_sample_channel_not_flat(self):
+        """Test: A channel with one sample is not reported as a flat line."""
+        stats = StreamStatsAccumulator()
+        stats.update(np.array([[1.0, 2.0, 0.0]]), start_channel=0, end_channel=2)
+
+        assert stats.dead_channels() == [2]
+        stats.update(np.array([[1.0, 3.0, 0.0]]), start_channel=0, end_channel=2)
+        assert stats.dead_channels() == [0, 2]
+
+    def test_channel_layout_mismatch(self):
+        """Test: Frames whose shape does not fit the channel range skip per-channel stats."""
+        stats = StreamStatsAccumulator()
+        stats.update(np.ones((3, 5)), start_channel=1, end_channel=2)
+
+        assert stats.channel_layout_mismatches == 1
+        assert stats.count == 15
+
+    def test_amplitude_drift(self):
+        """Test: A shifted signal produces a large drift after the baseline."""
+        rng = np.random.default_rng(3)
+        stats = StreamStatsAccumulator(baseline_frames=50, drift_alpha=0.2)
+        for _ in range(50):
+            stats.update(rng.normal(10.0, 1.0, size=(4, 4)))
+        assert stats.amplitude_drift() == pytest.approx(0.0, abs=1e-9)
+
+        for _ in range(50):
+            stats.update(rng.normal(20.0, 1.0, size=(4, 4)))
+        assert stats.amplitude_drift() > 10
+
+    def test_stream_metrics_integration(self):
+        """Test: StreamMetrics feeds decoded frames to its payload accumulator."""
+        data = np.arange(8, dtype='<f4')
+        frame = pandadatastream_pb2.DataStream(
+            start_channel=1, end_channel=4,
+            data_shape_x=4, data_shape_y=2,
+            main_data=[data.tobytes()],
+        )
+        metrics = StreamMetrics(payload_stats=StreamStatsAccumulator())
+        metrics.record_frame(frame)
+
+        summary = metrics.to_dict()["payload_stats"]
+        assert summary["samples"] == 8
+        assert summary["mean"] == pytest.approx(3.5)
+        assert summary["channels_seen"] == 4
@@ -0,0 +1,188 @@
+"""
+Unit Tests - Waterfall Decoder
+==============================
+
+Unit tests for the fast-path (orjson + NumPy) waterfall decoder and
+FocusServerAPI.get_waterfall_columns.
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import json
+
+import numpy as np
+import pytest
+import pydantic
+import requests
+
+from src.apis import waterfall_decoder
+from src.apis.focus_server_api import FocusServerAPI
+from src.apis.waterfall_decoder import (
+    WaterfallDecodeError,
+    build_columns_response,
+    decode_waterfall,
+    validate_waterfall,
+)
+from src.core.exceptions import APIError
+
+
+def _body(rows_per_block=(3, 2), sensors=(4, 5, 6), bins=8) -> bytes:
+    blocks = []
+    t = 1_700_000_000_000
+    value = 0.0
+    for block_number, n_rows in enumerate(rows_per_block):
+        rows = []
+        for _ in range(n_rows):
+            sensor_data = []
+            for sensor_id in sensors:
+                sensor_data.append({"id": sensor_id, "intensity": [value + i for i in range(bins)]})
+                value += 0.25
+            rows.append({
+                "canvasId": f"canvas-{block_number}",
+                "sensors": sensor_data,
+                "startTimestamp": t,
+                "endTimestamp": t + 100,
+            })
+            t += 100
+        blocks.append({"rows": rows, "current_max_amp": 10.0 + block_number, "current_min_amp": -1.0})
+    return json.dumps(blocks).encode()
+
+
+@pytest.mark.unit
+class TestDecodeWaterfall:
+    """Unit tests for decode_waterfall()."""
+
+    def test_columns_match_pydantic_models(self):
+        """Test: Columns hold the same values as the validated models."""
+        body = _body()
+        columns = decode_waterfall(body, dtype=np.float64)
+        blocks = validate_waterfall(body)
+        rows = [row for block in blocks for row in block.rows]
+
+        assert columns.intensity.shape == (5, 3, 8)
+        assert columns.num_rows == len(rows)
+        assert columns.sensor_ids.tolist() == [4, 5, 6]
+        assert columns.end_timestamps.tolist() == [row.endTimestamp for row in rows]
+        assert columns.block_index.tolist() == [0, 0, 0, 1, 1]
+        assert columns.block_max_amp.tolist() == [10.0, 11.0]
+        assert columns.canvas_ids[-1] == "canvas-1"
+        expected = np.array([[s.intensity for s in row.sensors] for row in rows])
+        np.testing.assert_array_equal(columns.intensity, expected)
+
+    def test_default_dtype_is_float32(self):
+        """Test: Intensities default to float32."""
+        assert decode_waterfall(_body()).intensity.dtype == np.float32
+
+    def test_empty_blocks(self):
+        """Test: Blocks without rows decode to empty columns."""
+        columns = decode_waterfall(b'[{"rows": [], "current_max_amp": 0, "current_min_amp": 0}]')
+        assert columns.num_rows == 0
+        assert columns.intensity.shape == (0, 0, 0)
+
+    def test_ragged_rows_are_rejected(self):
+        """Test: Rows with different bin counts cannot be columnar."""
+        blocks = json.loads(_body(rows_per_block=(2,)))
+        blocks[0]["rows"][1]["sensors"][0]["intensity"].append(1.0)
+        with pytest.raises(WaterfallDecodeError, match="rectangular"):
+            decode_waterfall(json.dumps(blocks))
+
+    def test_different_sensor_ids_are_rejected(self):
+        """Test: All rows must carry the same sensors."""
+        blocks = json.loads(_body(rows_per_block=(2,)))
+        blocks[0]["rows"][1]["sensors"][0]["id"] = 99
+        with pytest.raises(WaterfallDecodeError, match="sensor ids"):
+            decode_waterfall(json.dumps(blocks))
+
+    def test_invalid_timestamps_are_rejected(self):
+        """Test: endTimestamp <= startTimestamp fails like the row validator."""
+        blocks = json.loads(_body(rows_per_block=(3,)))
+        row = blocks[0]["rows"][2]
+        row["endTimestamp"] = row["startTimestamp"]
+        with pytest.raises(WaterfallDecodeError, match="row 2"):
+            decode_waterfall(json.dumps(blocks))
+        assert decode_waterfall(json.dumps(blocks), check_timestamps=False).num_rows == 3
+
+    def test_malformed_body(self):
+        """Test: Missing keys and invalid JSON raise WaterfallDecodeError."""
+        with pytest.raises(WaterfallDecodeError):
+            decode_waterfall(b'[{"rows": [{"sensors": []}]}]')
+        with pytest.raises(WaterfallDecodeError):
+            decode_waterfall(b"not json")
+
+    def test_stdlib_json_fallback(self, monkeypatch):
+        """Test: Decoding works without orjson."""
+        monkeypatch.setattr(waterfall_decoder, "ORJSON_AVAILABLE", False)
+        assert decode_waterfall(_body()).num_rows == 5
+
+
+@pytest.mark.unit
+class TestBuildColumnsResponse:
+    """Unit tests for build_columns_response()."""
+
+    def test_status_messages(self):
+        """Test: Non-201 statuses carry no columns and the documented message."""
+        response = build_columns_response(208, b"")
+        assert response.columns is None
+        assert response.message == "Baby analyzer has exited"
+        with pytest.raises(APIError, match="Unexpected status code"):
+            build_columns_response(500, b"")
+
+    def test_sampled_validation_runs_pydantic(self):
+        """Test: validate=True catches what the fast path does not check."""
+        blocks = json.loads(_body(rows_per_block=(1,)))
+        blocks[0]["rows"][0]["sensors"] = [
+            {"id": -1, "intensity": [1.0]} for _ in range(1)
+        ]
+        body = json.dumps(blocks)
+
+        assert build_columns_response(201, body).columns.num_rows == 1
+        with pytest.raises(pydantic.ValidationError):
+            build_columns_response(201, body, validate=True)
+
+
+class _FakeConfig:
+    def __init__(self, **values):
+        self.values = values
+
+    def get_api_config(self):
+        return {"base_url": "http://focus.test"}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def _http_response(status_code: int, body: bytes = b"") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers["content-type"] = "application/json"
+    return response
+
+
+@pytest.mark.unit
+class TestFocusServerAPIWaterfallColumns:
+    """Unit tests for FocusServerAPI.get_waterfall_columns."""
+
+    def test_fast_path_with_sampled_validation(self, monkeypatch):
+        """Test: Columns are returned; every Nth call is also validated."""
+        api = FocusServerAPI(_FakeConfig(**{"api_client.waterfall.validate_every": 2}))
+        body = _body()
+        monkeypatch.setattr(api.session, "request", lambda *a, **kw: _http_response(201, body))
+
+        first = api.get_waterfall_columns("task", 5)
+        second = api.get_waterfall_columns("task", 5)
+
+        assert first.columns.intensity.shape == (5, 3, 8)
+        assert (first.validated, second.validated) == (False, True)
+
+    def test_not_found_is_a_result(self, monkeypatch):
+        """Test: 404 returns a response instead of raising."""
+        api = FocusServerAPI(_FakeConfig())
+        monkeypatch.setattr(
+            api.session, "request", lambda *a, **kw: _http_response(404, b'{"error": "no consumer"}')
+        )
+
+        response = api.get_waterfall_columns("missing", 5)
+        assert response.status_code == 404
+        assert response.message == "Consumer not found for task_id"
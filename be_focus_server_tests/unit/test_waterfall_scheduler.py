@@ -0,0 +1,259 @@
+"""
+Unit Tests - Waterfall Poll Scheduler
+=====================================
+
+Unit tests for WaterfallPollScheduler against scripted in-memory waterfall
+producers (no Focus Server needed).
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.apis.waterfall_decoder import build_columns_response
+from src.apis.waterfall_scheduler import (
+    FINISH_ERRORS,
+    FINISH_EXITED,
+    FINISH_NOT_FOUND,
+    WaterfallPollScheduler,
+)
+from src.core.exceptions import NetworkError
+from src.models.focus_server_models import WaterfallGetResponse
+
+
+def _rows_response(count: int) -> WaterfallGetResponse:
+    now_ms = int(time.time() * 1000)
+    rows = [
+        {
+            "canvasId": "c",
+            "sensors": [{"id": 0, "intensity": [1.0]}],
+            "startTimestamp": now_ms - 20,
+            "endTimestamp": now_ms - 10,
+        }
+        for _ in range(count)
+    ]
+    return WaterfallGetResponse(
+        status_code=201,
+        data=[{"rows": rows, "current_max_amp": 1.0, "current_min_amp": 0.0}],
+    )
+
+
+class _Producer:
+    """Rows become available at a fixed rate (plus an optional backlog)."""
+
+    def __init__(self, rows_per_second: float, total_rows: int, backlog: int = 0):
+        self.rows_per_second = rows_per_second
+        self.total_rows = total_rows
+        self.backlog = backlog
+        self.started = time.monotonic()
+        self.delivered = 0
+        self.polls_after_exit = 0
+        self.exited = False
+
+    def poll(self, row_count: int) -> WaterfallGetResponse:
+        if self.exited:
+            self.polls_after_exit += 1
+        if self.delivered >= self.total_rows:
+            self.exited = True
+            return WaterfallGetResponse(status_code=208)
+        produced = self.backlog + int((time.monotonic() - self.started) * self.rows_per_second)
+        available = min(produced, self.total_rows) - self.delivered
+        if available <= 0:
+            return WaterfallGetResponse(status_code=200)
+        count = min(available, row_count)
+        self.delivered += count
+        return _rows_response(count)
+
+
+class _FakeAsyncAPI:
+    """Async get_waterfall over per-task producers or fixed responses."""
+
+    def __init__(self, producers=None, fixed=None, delay: float = 0.0):
+        self.producers = producers or {}
+        self.fixed = fixed or {}
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_waterfall(self, task_id: str, row_count: int) -> WaterfallGetResponse:
+        self.calls.append((task_id, row_count))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if task_id in self.fixed:
+                result = self.fixed[task_id]
+                if isinstance(result, Exception):
+                    raise result
+                return result
+            return self.producers[task_id].poll(row_count)
+        finally:
+            self.in_flight -= 1
+
+
+class _FakeColumnsAPI(_FakeAsyncAPI):
+    """get_waterfall_columns over the same producers."""
+
+    async def get_waterfall_columns(self, task_id: str, row_count: int):
+        response = await self.get_waterfall(task_id, row_count)
+        body = json.dumps([block.model_dump() for block in response.data or []])
+        return build_columns_response(response.status_code, body)
+
+
+class _FakeSyncAPI:
+    """Blocking get_waterfall, as on FocusServerAPI."""
+
+    def __init__(self, producer: _Producer):
+        self.producer = producer
+
+    def get_waterfall(self, task_id: str, row_count: int) -> WaterfallGetResponse:
+        return self.producer.poll(row_count)
+
+
+def _scheduler(api, **kwargs) -> WaterfallPollScheduler:
+    options = {
+        "initial_interval_seconds": 0.01,
+        "min_interval_seconds": 0.01,
+        "max_interval_seconds": 0.2,
+        "empty_backoff": 2.0,
+        "target_rows_per_poll": 10,
+        "initial_row_count": 20,
+    }
+    options.update(kwargs)
+    return WaterfallPollScheduler(api, **options)
+
+
+@pytest.mark.unit
+class TestWaterfallPollScheduler:
+    """Unit tests for WaterfallPollScheduler."""
+
+    async def test_tasks_finish_on_208_with_all_rows(self):
+        """Test: Every row is delivered once and tasks stop after 208."""
+        producers = {f"task-{i}": _Producer(rows_per_second=200, total_rows=60) for i in range(5)}
+        api = _FakeAsyncAPI(producers)
+        received = {}
+        scheduler = _scheduler(
+            api,
+            on_rows=lambda task_id, response: received.__setitem__(
+                task_id, received.get(task_id, 0) + len(response.data[0].rows)
+            ),
+        )
+        for task_id in producers:
+            scheduler.add_task(task_id)
+
+        stats = await asyncio.wait_for(scheduler.run(), timeout=10)
+
+        assert received == {task_id: 60 for task_id in producers}
+        assert stats["finish_reasons"] == {FINISH_EXITED: 5}
+        assert stats["rows_received"] == 300
+        assert stats["row_latency_ms"]["count"] == 300
+        assert all(p.polls_after_exit == 0 for p in producers.values())
+
+    async def test_backlog_is_fetched_with_growing_row_count(self):
+        """Test: Full responses trigger immediate polls with doubled row_count."""
+        producer = _Producer(rows_per_second=0, total_rows=600, backlog=600)
+        api = _FakeAsyncAPI({"burst": producer})
+        scheduler = _scheduler(api, initial_row_count=50, max_row_count=400)
+        scheduler.add_task("burst")
+
+        await asyncio.wait_for(scheduler.run(), timeout=10)
+
+        row_counts = [row_count for _, row_count in api.calls]
+        assert row_counts[:4] == [50, 100, 200, 400]
+        assert producer.delivered == 600
+        assert scheduler.tasks["burst"].empty_polls == 0
+
+    async def test_idle_task_backs_off(self):
+        """Test: 200 responses stretch the interval up to the maximum."""
+        api = _FakeAsyncAPI(fixed={"idle": WaterfallGetResponse(status_code=200)})
+        scheduler = _scheduler(api, max_interval_seconds=0.16)
+        scheduler.add_task("idle")
+
+        await scheduler.run(duration_seconds=0.6)
+
+        state = scheduler.tasks["idle"]
+        # Fixed 10ms polling would need ~60 requests
+        assert state.empty_polls < 10
+        assert state.interval == pytest.approx(0.16)
+
+    async def test_not_found_and_errors_drop_tasks(self):
+        """Test: Repeated 404s or request errors stop polling a task."""
+        api = _FakeAsyncAPI(fixed={
+            "missing": WaterfallGetResponse(status_code=404),
+            "broken": NetworkError("Connection failed"),
+        })
+        scheduler = _scheduler(api, max_consecutive_not_found=3, max_consecutive_errors=2)
+        scheduler.add_task("missing")
+        scheduler.add_task("broken")
+
+        stats = await asyncio.wait_for(scheduler.run(), timeout=10)
+
+        assert scheduler.tasks["missing"].finish_reason == FINISH_NOT_FOUND
+        assert scheduler.tasks["missing"].polls == 3
+        assert scheduler.tasks["broken"].finish_reason == FINISH_ERRORS
+        assert stats["failed_polls"] == 2
+        assert stats["active_tasks"] == 0
+
+    async def test_failing_on_rows_does_not_stall_task(self):
+        """Test: An exception in on_rows is counted and the task still runs to 208."""
+        producer = _Producer(rows_per_second=300, total_rows=40)
+        calls = []
+
+        async def on_rows(task_id, response):
+            calls.append(task_id)
+            if len(calls) == 1:
+                raise ValueError("consumer bug")
+
+        scheduler = _scheduler(_FakeAsyncAPI({"task": producer}), on_rows=on_rows)
+        scheduler.add_task("task")
+
+        stats = await asyncio.wait_for(scheduler.run(), timeout=10)
+
+        assert stats["finish_reasons"] == {FINISH_EXITED: 1}
+        assert stats["rows_received"] == 40
+        assert stats["callback_errors"] == 1
+        assert "consumer bug" in scheduler.tasks["task"].last_error
+        assert len(calls) > 1
+
+    async def test_concurrent_polls_are_limited(self):
+        """Test: No more than max_concurrent_polls requests in flight."""
+        producers = {f"task-{i}": _Producer(rows_per_second=500, total_rows=20) for i in range(12)}
+        api = _FakeAsyncAPI(producers, delay=0.02)
+        scheduler = _scheduler(api, max_concurrent_polls=4)
+        for task_id in producers:
+            scheduler.add_task(task_id)
+
+        await asyncio.wait_for(scheduler.run(), timeout=10)
+
+        assert api.max_in_flight == 4
+        assert scheduler.active_task_count == 0
+
+    async def test_fast_path_uses_columns(self):
+        """Test: fast_path polls get_waterfall_columns and counts column rows."""
+        producers = {"task": _Producer(rows_per_second=300, total_rows=40)}
+        scheduler = _scheduler(_FakeColumnsAPI(producers), fast_path=True)
+        scheduler.add_task("task")
+
+        stats = await asyncio.wait_for(scheduler.run(), timeout=10)
+
+        assert stats["rows_received"] == 40
+        assert stats["row_latency_ms"]["count"] == 40
+        assert stats["finish_reasons"] == {FINISH_EXITED: 1}
+
+    def test_sync_api_runs_in_threads(self):
+        """Test: A blocking FocusServerAPI-style client works through run_sync()."""
+        producer = _Producer(rows_per_second=300, total_rows=30)
+        scheduler = _scheduler(_FakeSyncAPI(producer))
+        scheduler.add_task("task")
+
+        stats = scheduler.run_sync(duration_seconds=10)
+
+        assert stats["rows_received"] == 30
+        assert stats["finish_reasons"] == {FINISH_EXITED: 1}
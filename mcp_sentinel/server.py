@@ -262,13 +262,18 @@ async def list_tools():
         ),
         Tool(
             name="monitor_run",
-            description="Monitor a specific run in real-time (returns current status)",
+            description="Monitor a specific run in real-time (returns current status, optionally the changes over the next seconds)",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "run_id": {
                         "type": "string",
                         "description": "The run ID to monitor"
+                    },
+                    "wait_seconds": {
+                        "type": "number",
+                        "default": 0,
+                        "description": "Also collect live test/pod/job/anomaly changes for up to this many seconds"
                     }
                 },
                 "required": ["run_id"]
@@ -650,9 +655,32 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
                     text=f"Run '{run_id}' not found. It may have completed or not started yet."
                 )]
             
+            # Collect live changes from the service's event bus (no polling)
+            changes = []
+            wait_seconds = float(arguments.get("wait_seconds") or 0)
+            if wait_seconds > 0:
+                subscription = service.event_bus.subscribe(run_id=run_id)
+                deadline = asyncio.get_running_loop().time() + min(wait_seconds, 300)
+                try:
+                    while (remaining := deadline - asyncio.get_running_loop().time()) > 0:
+                        event = await subscription.get(timeout=remaining)
+                        if event is None:
+                            break
+                        changes.append(event)
+                        if event.event_type == "run" and event.data.get("status") != "running":
+                            break
+                finally:
+                    service.event_bus.unsubscribe(subscription)
+            
             result = f"Monitoring Run: {run_id}\n\n"
             result += format_run_context(context)
             
+            if wait_seconds > 0:
+                result += f"\n\nChanges ({len(changes)}):"
+                for event in changes[-50:]:  # Show last 50
+                    summary = ", ".join(f"{k}={v}" for k, v in event.data.items() if v is not None)
+                    result += f"\n  - [{event.event_type}] {summary}"
+            
             # Add real-time status
             if context.status.value == "running":
                 result += "\n\n⚠️ Run is currently active"
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Sentinel Log Line Classifier
+========================================
+
+Classifies a log corpus with the LogStreamer test/error patterns and the
+RunDetector rules, once with the per-pattern regex loop and once with
+PatternSet, checks both give identical results and prints lines/second.
+
+Capture a corpus from a chatty pod, e.g.:
+    kubectl logs -n panda deploy/focus-server --since=1h > focus_server.log
+
+Usage:
+    python scripts/sentinel/benchmark_log_classifier.py --corpus focus_server.log
+    python scripts/sentinel/benchmark_log_classifier.py --lines 200000   # synthetic corpus
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.sentinel.core.log_streamer import LogStreamer
+from src.sentinel.core.pattern_set import PatternSet
+from src.sentinel.core.run_detector import RunDetector
+
+
+# Synthetic Focus Server style output; roughly 1 in 50 lines is a marker or error
+NOISE_TEMPLATES = [
+    "{ts} INFO  [focus.server.grpc] Sent frame {n} to consumer {task} ({size} bytes)",
+    "{ts} DEBUG [focus.server.baby] Analyzer heartbeat task_id={task} rows={n}",
+    "{ts} INFO  [uvicorn.access] 10.0.0.{octet}:443 - \"GET /waterfall/{task}/200 HTTP/1.1\" 201",
+    "{ts} INFO  [focus.server.config] Configured task {task}: nfft=1024 channels=1-{n}",
+    "{ts} DEBUG [pika.channel] Basic.Ack delivery_tag={n}",
+]
+SIGNAL_TEMPLATES = [
+    "{ts} INFO  TEST_START test={test} suite={suite}",
+    "{ts} INFO  TEST_PASS test={test}",
+    "{ts} ERROR TEST_FAIL test={test} AssertionError: expected 201",
+    "{ts} ERROR [focus.server.grpc] Exception in stream handler for {task}",
+    "{ts} WARN  [pymongo] Timeout waiting for primary after 30000ms",
+    "{ts} INFO  RUN_START pipeline=regression env=staging",
+]
+
+
+def synthetic_corpus(num_lines: int, seed: int = 11) -> List[str]:
+    """Synthetic pod log lines (~2% test markers/errors)."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(num_lines):
+        templates = SIGNAL_TEMPLATES if rng.random() < 0.02 else NOISE_TEMPLATES
+        lines.append(rng.choice(templates).format(
+            ts=f"2026-10-16T12:{(i // 60) % 60:02d}:{i % 60:02d}.{i % 1000:03d}Z",
+            n=rng.randint(1, 100_000),
+            task=f"task-{rng.randint(1, 500)}",
+            size=rng.randint(1_000, 500_000),
+            octet=rng.randint(1, 254),
+            test=f"test_case_{i}",
+            suite=f"suite_{i % 20}",
+        ))
+    return lines
+
+
+def load_patterns() -> Tuple[dict, list, list]:
+    """Default LogStreamer test/error patterns and RunDetector rules (no K8s client)."""
+    streamer = LogStreamer.__new__(LogStreamer)
+    streamer.config = {}
+    streamer.logger = logging.getLogger("benchmark")
+    test_patterns = streamer._load_test_patterns()
+    error_patterns = streamer._load_error_patterns()
+    detector = RunDetector.__new__(RunDetector)
+    detector.config = {}
+    rules = [(rule, re.compile(rule.pattern, re.IGNORECASE)) for rule in detector._load_log_rules()]
+    return test_patterns, error_patterns, rules
+
+
+def loop_classifier(test_patterns, error_patterns, rules) -> Callable[[str], tuple]:
+    """Previous behaviour: every regex on every line."""
+    def classify(line: str) -> Tuple[Optional[str], bool, Optional[str]]:
+        event_type = next((key for key, p in test_patterns.items() if p.search(line)), None)
+        is_error = any(p.search(line) for p in error_patterns)
+        rule = next((r.pattern for r, p in rules if p.search(line)), None)
+        return event_type, is_error, rule
+    return classify
+
+
+def pattern_set_classifier(test_patterns, error_patterns, rules) -> Tuple[Callable[[str], tuple], list]:
+    """PatternSet prefilter, as used by LogStreamer/RunDetector."""
+    test_set = PatternSet(test_patterns.items())
+    error_set = PatternSet((p, p) for p in error_patterns)
+    rule_set = PatternSet(rules)
+
+    def classify(line: str) -> Tuple[Optional[str], bool, Optional[str]]:
+        first = test_set.first_match(line)
+        rule = rule_set.first_match(line)
+        return (
+            first[0] if first else None,
+            error_set.search_any(line),
+            rule[0].pattern if rule else None,
+        )
+    return classify, [("test", test_set), ("error", error_set), ("run", rule_set)]
+
+
+def time_classifier(classify: Callable[[str], tuple], lines: List[str], repeat: int) -> Tuple[float, list]:
+    """Best-of-repeat seconds for one pass over lines, plus the results."""
+    best = float("inf")
+    results = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [classify(line) for line in lines]
+        best = min(best, time.perf_counter() - started)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Sentinel log line classification")
+    parser.add_argument("--corpus", help="Captured log file (one line per log line)")
+    parser.add_argument("--lines", type=int, default=100_000, help="Synthetic corpus size")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes per classifier (best is reported)")
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+        source = args.corpus
+    else:
+        lines = synthetic_corpus(args.lines)
+        source = "synthetic"
+    print(f"Corpus: {source} ({len(lines):,} lines)")
+
+    patterns = load_patterns()
+    loop_seconds, loop_results = time_classifier(loop_classifier(*patterns), lines, args.repeat)
+    set_classify, pattern_sets = pattern_set_classifier(*patterns)
+    set_seconds, set_results = time_classifier(set_classify, lines, args.repeat)
+
+    mismatches = sum(1 for a, b in zip(loop_results, set_results) if a != b)
+    print(f"  regex loop : {loop_seconds:7.3f}s  ({len(lines) / loop_seconds:,.0f} lines/s)")
+    print(
+        f"  PatternSet : {set_seconds:7.3f}s  ({len(lines) / set_seconds:,.0f} lines/s, "
+        f"{loop_seconds / set_seconds:.1f}x faster)"
+    )
+    for name, pattern_set in pattern_sets:
+        stats = pattern_set.stats()
+        rejected = stats["lines_rejected"] / max(stats["lines_checked"], 1)
+        print(
+            f"  {name:5s} set: {stats['gated_patterns']}/{stats['patterns']} patterns gated, "
+            f"{rejected:.1%} of lines rejected by prefilter"
+        )
+    print(f"  mismatches : {mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
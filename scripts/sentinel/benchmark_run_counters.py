@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Sentinel Run Counters
+=================================
+
+Replays a synthetic test event stream (TEST_START + result per test) through
+SentinelService._on_test_event and compares the O(1) RunContext counters
+with the previous scan-all-tests readers.
+
+AnomalyEngine.detect_test_anomaly reads total/failed counts on every event,
+so with scanning readers a run of N tests costs O(N^2).
+
+Usage:
+    python scripts/sentinel/benchmark_run_counters.py --tests 10000 --suites 50
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.sentinel.core.anomaly_engine import AnomalyEngine
+from src.sentinel.core.models import RunContext, TestEvent, TestStatus
+from src.sentinel.core.run_event_bus import RunEventBus
+from src.sentinel.main.sentinel_service import SentinelService
+
+
+RESULT_EVENTS = [
+    ("TEST_PASS", TestStatus.PASSED),
+    ("TEST_FAIL", TestStatus.FAILED),
+    ("TEST_SKIP", TestStatus.SKIPPED),
+]
+
+
+class ScanningRunContext(RunContext):
+    """RunContext with the previous readers, which scan every test."""
+
+    def passed_tests(self) -> int:
+        return sum(1 for t in self.tests.values() if t.status == TestStatus.PASSED)
+
+    def failed_tests(self) -> int:
+        return sum(1 for t in self.tests.values() if t.status == TestStatus.FAILED)
+
+    def skipped_tests(self) -> int:
+        return sum(1 for t in self.tests.values() if t.status == TestStatus.SKIPPED)
+
+    def failure_rate(self) -> float:
+        total = self.total_tests()
+        return self.failed_tests() / total if total else 0.0
+
+
+def synthetic_events(num_tests: int, num_suites: int, seed: int = 7) -> List[TestEvent]:
+    """Events for num_tests tests spread over num_suites suites (~90% pass)."""
+    rng = random.Random(seed)
+    start = datetime(2026, 10, 16, 12, 0, 0)
+    events = []
+    for i in range(num_tests):
+        suite_name = f"suite_{i % num_suites}"
+        test_name = f"test_case_{i}"
+        timestamp = start + timedelta(milliseconds=10 * i)
+        events.append(TestEvent(
+            event_type="TEST_START", timestamp=timestamp,
+            test_name=test_name, suite_name=suite_name, status=TestStatus.RUNNING
+        ))
+        event_type, status = rng.choices(RESULT_EVENTS, weights=(90, 7, 3))[0]
+        events.append(TestEvent(
+            event_type=event_type, timestamp=timestamp + timedelta(milliseconds=5),
+            test_name=test_name, suite_name=suite_name, status=status
+        ))
+    return events
+
+
+def replay(events: List[TestEvent], context: RunContext) -> float:
+    """Feed events through SentinelService._on_test_event; returns seconds."""
+    # Only the test event path is exercised, no K8s/log/alert components needed
+    service = SentinelService.__new__(SentinelService)
+    service.anomaly_engine = AnomalyEngine({})
+    service.event_bus = RunEventBus()
+
+    started = time.perf_counter()
+    for event in events:
+        service._on_test_event(event, context)
+        # A dashboard polling the run summary
+        context.failure_rate()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Sentinel run counters")
+    parser.add_argument("--tests", type=int, default=10_000, help="Number of synthetic tests")
+    parser.add_argument("--suites", type=int, default=50, help="Number of suites")
+    parser.add_argument("--skip-scan", action="store_true", help="Only run the O(1) counters")
+    args = parser.parse_args()
+
+    events = synthetic_events(args.tests, args.suites)
+    print(f"Replaying {len(events):,} events ({args.tests:,} tests, {args.suites} suites)")
+
+    context = RunContext(run_id="bench-counters")
+    counter_seconds = replay(events, context)
+    print(
+        f"  counters: {counter_seconds:8.3f}s  "
+        f"({len(events) / counter_seconds:,.0f} events/s)"
+    )
+
+    if not args.skip_scan:
+        scan_context = ScanningRunContext(run_id="bench-scan")
+        scan_seconds = replay(events, scan_context)
+        print(
+            f"  scanning: {scan_seconds:8.3f}s  "
+            f"({len(events) / scan_seconds:,.0f} events/s, "
+            f"{scan_seconds / counter_seconds:.1f}x slower)"
+        )
+        assert (
+            context.passed_tests(), context.failed_tests(), context.skipped_tests()
+        ) == (
+            scan_context.passed_tests(), scan_context.failed_tests(), scan_context.skipped_tests()
+        ), "Counter mismatch"
+
+    print(
+        f"  totals: {context.total_tests()} tests, {context.passed_tests()} passed, "
+        f"{context.failed_tests()} failed, {context.skipped_tests()} skipped, "
+        f"failure rate {context.failure_rate():.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
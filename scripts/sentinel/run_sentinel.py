@@ -20,6 +20,7 @@ sys.path.insert(0, str(project_root))
 from config.config_manager import ConfigManager
 from src.sentinel.main.sentinel_service import SentinelService
 from src.sentinel.api.app import SentinelAPI
+from src.sentinel.api.stream_app import SentinelStreamAPI
 
 
 def setup_logging(level=logging.INFO):
@@ -142,7 +143,14 @@ def main():
         
         # Create and start API if enabled
         api_config = config.get("api", {})
-        if api_config.get("enabled", True):
+        if api_config.get("enabled", True) and api_config.get("mode", "flask") == "async":
+            _api = SentinelStreamAPI(
+                _sentinel_service,
+                heartbeat_seconds=api_config.get("heartbeat_seconds", 15)
+            )
+            logger.info(f"Starting async API server on {api_config.get('host', '0.0.0.0')}:{api_config.get('port', 5000)}")
+            _api.run(host=api_config.get("host", "0.0.0.0"), port=api_config.get("port", 5000))
+        elif api_config.get("enabled", True):
             _api = SentinelAPI(_sentinel_service)
             if _api.app:
                 logger.info(f"Starting API server on {api_config.get('host', '0.0.0.0')}:{api_config.get('port', 5000)}")
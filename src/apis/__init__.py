@@ -6,9 +6,11 @@ API clients for the Focus Server automation framework.
 """
 
 from .focus_server_api import FocusServerAPI
+from .async_focus_server_api import AsyncFocusServerAPI
 from .base_api_client import BaseAPIClient
 
 __all__ = [
     "FocusServerAPI",
+    "AsyncFocusServerAPI",
     "BaseAPIClient",
 ]
\ No newline at end of file
@@ -0,0 +1,815 @@
+"""
+Async Focus Server API Client
+=============================
+
+Asyncio counterpart of FocusServerAPI for load tests and pollers that keep
+hundreds of requests in flight from one event loop.
+
+- One pooled HTTP client per instance with keep-alive connections
+  (aiohttp by default; httpx with HTTP/2 when ``http2=True`` and httpx/h2
+  are installed)
+- Per-host concurrency limit: requests beyond ``max_connections_per_host``
+  wait for a slot instead of opening more sockets (or HTTP/2 streams)
+- Same circuit breaker semantics as BaseAPIClient (opens after 5
+  consecutive requests that failed with connection errors/timeouts after
+  all retries, half-opens after 60s)
+- Same retries (429/5xx and connection errors, exponential backoff), error
+  mapping (APIError / NetworkError / TimeoutError), "waiting for fiber" 503
+  handling and request logging modes as the sync client
+
+Usage:
+    ```python
+    from src.apis.async_focus_server_api import AsyncFocusServerAPI
+
+    async with AsyncFocusServerAPI(config_manager) as api:
+        response = await api.configure_streaming_job(ConfigureRequest(**payload))
+        waterfall = await api.get_waterfall(task_id, row_count=10)
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from src.apis.waterfall_decoder import WaterfallColumnsResponse, build_columns_response
+from src.core.api_client import RequestLoggingMixin
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from src.core.exceptions import APIError, NetworkError, TimeoutError, ValidationError
+from src.models.focus_server_models import (
+    ConfigureRequest, ConfigureResponse, ChannelRange, LiveMetadata,
+    RecordingsInTimeRangeRequest, RecordingsInTimeRangeResponse,
+    ConfigTaskRequest, ConfigTaskResponse, SensorsListResponse,
+    LiveMetadataFlat, WaterfallGetResponse, TaskMetadataGetResponse
+)
+
+# Same status codes the sync client's urllib3 Retry strategy retries on
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+@dataclass
+class AsyncAPIResponse:
+    """Fully read HTTP response, independent of the transport library."""
+
+    status_code: int
+    reason: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    content: bytes = b""
+    http_version: str = "HTTP/1.1"
+
+    @property
+    def text(self) -> str:
+        """Body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Body parsed as JSON (raises ValueError if it is not JSON)."""
+        return json.loads(self.content)
+
+
+class AsyncFocusServerAPI(RequestLoggingMixin):
+    """
+    Asyncio Focus Server API client on a pooled keep-alive HTTP client.
+
+    Exposes the same typed methods as FocusServerAPI as coroutines. The
+    HTTP client is created lazily inside the running event loop; call
+    close() (or use ``async with``) when done.
+    """
+
+    def __init__(
+        self,
+        config_manager,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None
+    ):
+        """
+        Initialize async Focus Server API client.
+
+        Args:
+            config_manager: Configuration manager instance
+            http2: Use HTTP/2 via httpx (default: api_client.async_client.http2)
+            max_connections: Total pool size (default: api_client.async_client.max_connections)
+            max_connections_per_host: Max concurrent requests per host
+                                      (default: api_client.async_client.max_connections_per_host)
+            keepalive_timeout: Seconds an idle pooled connection is kept open
+                               (default: api_client.async_client.keepalive_timeout)
+        """
+        api_config = config_manager.get_api_config()
+        base_url = api_config.get("base_url")
+        if not base_url:
+            raise ValidationError("Focus Server base URL not configured")
+
+        self.config_manager = config_manager
+        self.base_url = base_url.rstrip('/')
+        self.timeout = config_manager.get("api_client.timeout", 60)
+        self.max_retries = config_manager.get("api_client.retry.max_attempts", 3)
+        self.retry_backoff = config_manager.get("api_client.retry.backoff_factor", 1.0)
+        self.verify_ssl = config_manager.get("api_client.verify_ssl", False)
+        self.max_connections = max_connections or config_manager.get(
+            "api_client.async_client.max_connections", 200
+        )
+        self.max_connections_per_host = max_connections_per_host or config_manager.get(
+            "api_client.async_client.max_connections_per_host", 100
+        )
+        self.keepalive_timeout = keepalive_timeout or config_manager.get(
+            "api_client.async_client.keepalive_timeout", 30.0
+        )
+        if http2 is None:
+            http2 = config_manager.get("api_client.async_client.http2", False)
+
+        self.logger = logging.getLogger(__name__)
+
+        if http2 and not HTTPX_AVAILABLE:
+            self.logger.warning("httpx not installed - falling back to HTTP/1.1 (aiohttp)")
+            http2 = False
+        self.http2 = bool(http2)
+
+        self._request_counter = itertools.count(1)
+        self._request_logger: Optional[logging.Logger] = None
+        self.set_request_logging(
+            config_manager.get("api_client.logging.mode", self.LOG_MODE_VERBOSE),
+            config_manager.get("api_client.logging.sample_every", 100),
+            config_manager.get("api_client.logging.slow_request_ms", 1000.0)
+        )
+
+        # Same breaker settings as BaseAPIClient: only transport failures count
+        if self.http2:
+            self._timeout_errors = (httpx.TimeoutException,)
+            self._connection_errors = (httpx.TransportError,)
+            self._request_errors = (httpx.HTTPError,)
+        else:
+            self._timeout_errors = (asyncio.TimeoutError,)
+            self._connection_errors = (aiohttp.ClientConnectionError,)
+            self._request_errors = (aiohttp.ClientError,)
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=5,
+            timeout=60,
+            expected_exception=self._timeout_errors + self._connection_errors
+        )
+
+        self.waterfall_validate_every = config_manager.get("api_client.waterfall.validate_every", 0)
+        self._waterfall_fast_calls = 0
+
+        self._client = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+        self.logger.info(
+            f"Async Focus Server API client initialized for {self.base_url} "
+            f"({'HTTP/2' if self.http2 else 'HTTP/1.1'}, "
+            f"{self.max_connections_per_host} per host, SSL verify: {self.verify_ssl})"
+        )
+
+    # -------------------------------------------------------------------------
+    # Connection pool
+    # -------------------------------------------------------------------------
+
+    async def __aenter__(self) -> 'AsyncFocusServerAPI':
+        self._ensure_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @property
+    def _default_headers(self) -> Dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": "Focus-Server-Automation/1.0.0"
+        }
+
+    def _ensure_client(self):
+        """Create the pooled HTTP client on first use (inside the running loop)."""
+        if self._client is not None:
+            return self._client
+
+        if self.http2:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                verify=bool(self.verify_ssl),
+                timeout=self.timeout,
+                headers=self._default_headers,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_timeout
+                )
+            )
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=bool(self.verify_ssl)
+            )
+            self._client = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self._default_headers
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client and its keep-alive connections."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        if self.http2:
+            await client.aclose()
+        else:
+            await client.close()
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str):
+        """Hold one of the per-host concurrency slots for the request."""
+        host = urlsplit(url).netloc
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_slots[host] = slots
+        async with slots:
+            yield
+
+    # -------------------------------------------------------------------------
+    # Request handling
+    # -------------------------------------------------------------------------
+
+    def _build_url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    async def _transport_request(self, method: str, url: str, **kwargs) -> AsyncAPIResponse:
+        """Send one request on the pool and read the whole body."""
+        client = self._ensure_client()
+
+        if self.http2:
+            response = await client.request(method, url, **kwargs)
+            return AsyncAPIResponse(
+                status_code=response.status_code,
+                reason=response.reason_phrase,
+                headers=dict(response.headers),
+                content=response.content,
+                http_version=response.http_version
+            )
+
+        async with client.request(method, url, **kwargs) as response:
+            content = await response.read()
+            return AsyncAPIResponse(
+                status_code=response.status,
+                reason=response.reason or "",
+                headers=dict(response.headers),
+                content=content,
+                http_version=f"HTTP/{response.version.major}.{response.version.minor}"
+            )
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        allowed_statuses: Iterable[int] = (),
+        **kwargs
+    ) -> AsyncAPIResponse:
+        """
+        Send HTTP request with retries, circuit breaker and error mapping.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            allowed_statuses: Error status codes returned to the caller
+                              instead of raising APIError
+            **kwargs: ``json`` / ``params`` for the request
+
+        Returns:
+            Response object
+
+        Raises:
+            APIError: If request fails
+            NetworkError: If network error occurs or the circuit is open
+            TimeoutError: If request times out
+        """
+        url = self._build_url(endpoint)
+        request_number = next(self._request_counter)
+        start_time = time.perf_counter()
+        verbose = self._request_logger is None
+
+        if verbose:
+            self.logger.info(f">> {method} {url}")
+
+        # One breaker call per logical request (retries included), as in
+        # BaseAPIClient where urllib3 retries inside circuit_breaker.call()
+        try:
+            response = await self.circuit_breaker.call_async(
+                self._request_with_retries, method, url, **kwargs
+            )
+        except CircuitBreakerOpenError as e:
+            self._log_failure(method, url, start_time, request_number, "circuit_open", e)
+            raise NetworkError(f"Circuit breaker is open - server appears down: {e}") from e
+        except self._timeout_errors as e:
+            self._log_failure(method, url, start_time, request_number, "timeout", e)
+            raise TimeoutError(f"Request timed out after {self.timeout} seconds", self.timeout) from e
+        except self._connection_errors as e:
+            self._log_failure(method, url, start_time, request_number, "connection_error", e)
+            raise NetworkError(f"Connection failed: {e}") from e
+        except self._request_errors as e:
+            self._log_failure(method, url, start_time, request_number, "request_error", e)
+            raise APIError(f"Request failed: {e}") from e
+
+        waiting_for_fiber = self._is_waiting_for_fiber(response)
+
+        if verbose:
+            elapsed = (time.perf_counter() - start_time) * 1000
+            self.logger.info(
+                f"<< {response.status_code} {response.reason} ({elapsed:.2f}ms, {response.http_version})"
+            )
+            self.logger.debug(f"Response Body: {response.text[:500]}")
+        else:
+            self._log_request_record(method, url, response.status_code, start_time, request_number)
+
+        if response.status_code >= 400 and response.status_code not in allowed_statuses:
+            if waiting_for_fiber:
+                self.logger.warning("503 error due to 'waiting for fiber' - skipping retry")
+                raise APIError(
+                    message="System is waiting for fiber - cannot configure",
+                    status_code=503,
+                    response_body=response.json()
+                )
+            self._handle_http_error(response, url)
+
+        return response
+
+    async def _request_with_retries(self, method: str, url: str, **kwargs) -> AsyncAPIResponse:
+        """
+        Send one request, retrying transport errors and retryable statuses.
+
+        Returns:
+            Response of the last attempt
+
+        Raises:
+            The transport exception of the last attempt
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._host_slot(url):
+                    response = await self._transport_request(method, url, **kwargs)
+            except self._timeout_errors + self._connection_errors:
+                if attempt < self.max_retries:
+                    attempt = await self._backoff(attempt)
+                    continue
+                raise
+
+            if (
+                response.status_code in RETRY_STATUS_CODES
+                and attempt < self.max_retries
+                and not self._is_waiting_for_fiber(response)
+            ):
+                attempt = await self._backoff(attempt)
+                continue
+            return response
+
+    async def _backoff(self, attempt: int) -> int:
+        """Sleep before the next retry (1s, 2s, 4s with the default factor)."""
+        await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+        return attempt + 1
+
+    @staticmethod
+    def _is_waiting_for_fiber(response: AsyncAPIResponse) -> bool:
+        if response.status_code != 503:
+            return False
+        try:
+            error_data = response.json()
+            error_message = str(error_data.get('error', '') or error_data.get('message', '')).lower()
+        except (ValueError, KeyError, AttributeError):
+            return False
+        return 'waiting for fiber' in error_message or 'waiting_for_fiber' in error_message
+
+    def _log_failure(
+        self,
+        method: str,
+        url: str,
+        start_time: float,
+        request_number: int,
+        error: str,
+        exc: Exception
+    ) -> None:
+        if self._request_logger is not None:
+            self._log_request_record(method, url, None, start_time, request_number, error)
+        else:
+            elapsed = (time.perf_counter() - start_time) * 1000
+            self.logger.error(
+                f"[{error.upper()}] {method} {url} failed after {elapsed:.2f}ms: {exc}"
+            )
+
+    def _handle_http_error(self, response: AsyncAPIResponse, url: str):
+        """Raise APIError for an HTTP error response."""
+        status_code = response.status_code
+
+        try:
+            error_data = response.json()
+            error_message = error_data.get('error', error_data.get('message', 'Unknown error'))
+        except (ValueError, KeyError, AttributeError):
+            error_message = response.text or f"HTTP {status_code} error"
+
+        self.logger.error(f"HTTP {status_code} error for {url}: {error_message}")
+
+        raise APIError(
+            message=f"API call failed: {error_message}",
+            status_code=status_code,
+            response_body=response.text
+        )
+
+    async def get(self, endpoint: str, **kwargs) -> AsyncAPIResponse:
+        """Send GET request."""
+        return await self._send_request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs) -> AsyncAPIResponse:
+        """Send POST request."""
+        return await self._send_request("POST", endpoint, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> AsyncAPIResponse:
+        """Send DELETE request."""
+        return await self._send_request("DELETE", endpoint, **kwargs)
+
+    # -------------------------------------------------------------------------
+    # Focus Server endpoints (same contracts as FocusServerAPI)
+    # -------------------------------------------------------------------------
+
+    async def configure_streaming_job(self, payload: ConfigureRequest) -> ConfigureResponse:
+        """
+        Configure a streaming job (POST /configure).
+
+        Raises:
+            APIError: If API call fails
+            ValidationError: If payload validation fails
+        """
+        try:
+            if not isinstance(payload, ConfigureRequest):
+                raise ValidationError("Payload must be a ConfigureRequest instance")
+
+            response = await self.post("/configure", json=payload.model_dump())
+            return ConfigureResponse.model_validate_json(response.content)
+
+        except Exception as e:
+            self.logger.error(f"Failed to configure streaming job: {e}")
+            if isinstance(e, (APIError, ValidationError)):
+                raise
+            raise APIError(f"Failed to configure streaming job: {e}") from e
+
+    async def get_channels(self) -> ChannelRange:
+        """Get available channel range (GET /channels)."""
+        try:
+            response = await self.get("/channels")
+            return ChannelRange.model_validate_json(response.content)
+
+        except Exception as e:
+            self.logger.error(f"Failed to get channel range: {e}")
+            if isinstance(e, APIError):
+                raise
+            raise APIError(f"Failed to get channel range: {e}") from e
+
+    async def get_live_metadata(self) -> LiveMetadata:
+        """Get live metadata information (GET /live_metadata)."""
+        try:
+            response = await self.get("/live_metadata")
+            return LiveMetadata.model_validate_json(response.content)
+
+        except Exception as e:
+            self.logger.error(f"Failed to get live metadata: {e}")
+            if isinstance(e, APIError):
+                raise
+            raise APIError(f"Failed to get live metadata: {e}") from e
+
+    async def get_job_metadata(self, job_id: str) -> ConfigureResponse:
+        """
+        Get job metadata by job ID (GET /metadata/{job_id}).
+
+        Raises:
+            APIError: If API call fails or the server reports an invalid job_id
+            ValidationError: If job_id is invalid
+        """
+        if not job_id or not isinstance(job_id, str):
+            raise ValidationError("Job ID must be a non-empty string")
+
+        try:
+            response = await self.get(f"/metadata/{job_id}")
+            response_data = response.json()
+
+            if isinstance(response_data, dict) and 'error' in response_data:
+                error_msg = response_data.get('error', 'Unknown error')
+                self.logger.warning(f"Job {job_id} metadata returned error: {error_msg}")
+                raise APIError(f"Invalid job_id: {error_msg}")
+
+            return ConfigureResponse(**response_data)
+
+        except APIError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to get job metadata for job ID {job_id}: {e}")
+            raise APIError(f"Failed to get job metadata: {e}") from e
+
+    async def get_recordings_in_time_range(
+        self,
+        payload: RecordingsInTimeRangeRequest
+    ) -> RecordingsInTimeRangeResponse:
+        """
+        Get recordings available in a time range (POST /recordings_in_time_range).
+
+        Raises:
+            APIError: If API call fails
+            ValidationError: If payload validation fails
+        """
+        try:
+            if not isinstance(payload, RecordingsInTimeRangeRequest):
+                raise ValidationError("Payload must be a RecordingsInTimeRangeRequest instance")
+
+            response = await self.post("/recordings_in_time_range", json=payload.model_dump())
+            return RecordingsInTimeRangeResponse(root=response.json())
+
+        except Exception as e:
+            self.logger.error(f"Failed to get recordings in time range: {e}")
+            if isinstance(e, (APIError, ValidationError)):
+                raise
+            raise APIError(f"Failed to get recordings in time range: {e}") from e
+
+    async def get_health_status(self) -> bool:
+        """True if GET /ack returns 200."""
+        try:
+            response = await self.get("/ack")
+            return response.status_code == 200
+
+        except Exception as e:
+            self.logger.error(f"Failed to get health status: {e}")
+            if isinstance(e, APIError):
+                raise
+            raise APIError(f"Failed to get health status: {e}") from e
+
+    async def get_job_status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get job status by job ID (from GET /metadata/{job_id}).
+
+        Returns:
+            Dict with 'status', 'job_id' and stream fields, or
+            {'status': 'not_found', ...} if the job does not exist
+
+        Raises:
+            APIError: If API call fails (other than not found)
+            ValidationError: If job_id is invalid
+        """
+        if not job_id or not isinstance(job_id, str):
+            raise ValidationError("Job ID must be a non-empty string")
+
+        try:
+            metadata = await self.get_job_metadata(job_id)
+            return {
+                'status': metadata.status or '',
+                'job_id': metadata.job_id or job_id,
+                'stream_port': metadata.stream_port,
+                'stream_url': metadata.stream_url,
+                'view_type': metadata.view_type,
+            }
+
+        except APIError as e:
+            error_str = str(e).lower()
+            if '404' in error_str or 'not found' in error_str or 'invalid job_id' in error_str:
+                self.logger.warning(f"Job {job_id} not found (404/Invalid job_id) - may have been deleted or never existed")
+                return {
+                    'status': 'not_found',
+                    'job_id': job_id,
+                    'error': 'Job not found'
+                }
+            self.logger.error(f"Failed to get job status for job ID {job_id}: {e}")
+            raise
+
+    async def cancel_job(self, job_id: str) -> bool:
+        """
+        Cancel a job by job ID (DELETE /job/{job_id}).
+
+        Returns:
+            True if cancelled, False if not found (404) or not cancelled
+
+        Raises:
+            APIError: If API call fails (except 404)
+            ValidationError: If job_id is invalid
+        """
+        if not job_id or not isinstance(job_id, str):
+            raise ValidationError("Job ID must be a non-empty string")
+
+        try:
+            response = await self._send_request("DELETE", f"/job/{job_id}", allowed_statuses=(404,))
+
+            if response.status_code == 200:
+                self.logger.info(f"Job {job_id} cancelled successfully")
+                return True
+            if response.status_code == 404:
+                self.logger.debug(f"Job {job_id} not found (may be completed or cancellation not supported)")
+            else:
+                self.logger.warning(f"Job {job_id} cancellation returned status {response.status_code}")
+            return False
+
+        except APIError as e:
+            self.logger.error(f"Failed to cancel job {job_id}: {e}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to cancel job {job_id}: {e}")
+            raise APIError(f"Failed to cancel job: {e}") from e
+
+    async def validate_connection(self) -> bool:
+        """True if GET /channels succeeds."""
+        try:
+            await self.get_channels()
+            return True
+        except Exception as e:
+            self.logger.error(f"Focus Server connection validation failed: {e}")
+            return False
+
+    async def get_api_info(self) -> Dict[str, Any]:
+        """Get API information and version (GET /info)."""
+        try:
+            response = await self.get("/info")
+            return response.json()
+
+        except Exception as e:
+            self.logger.error(f"Failed to get API information: {e}")
+            if isinstance(e, APIError):
+                raise
+            raise APIError(f"Failed to get API information: {e}") from e
+
+    async def config_task(self, task_id: str, payload: ConfigTaskRequest) -> ConfigTaskResponse:
+        """
+        Configure and start a baby analyzer task (POST /config/{task_id}).
+
+        Raises:
+            APIError: If API call fails
+            ValidationError: If task_id or payload is invalid
+        """
+        if not task_id or not isinstance(task_id, str):
+            raise ValidationError("task_id must be a non-empty string")
+
+        try:
+            if not isinstance(payload, ConfigTaskRequest):
+                raise ValidationError("Payload must be a ConfigTaskRequest instance")
+
+            response = await self.post(f"/config/{task_id}", json=payload.model_dump())
+            return ConfigTaskResponse.model_validate_json(response.content)
+
+        except Exception as e:
+            self.logger.error(f"Failed to configure task {task_id}: {e}")
+            if isinstance(e, (APIError, ValidationError)):
+                raise
+            raise APIError(f"Failed to configure task: {e}") from e
+
+    async def get_sensors(self) -> SensorsListResponse:
+        """Get the list of available sensors (GET /sensors)."""
+        try:
+            response = await self.get("/sensors")
+            return SensorsListResponse.model_validate_json(response.content)
+
+        except Exception as e:
+            self.logger.error(f"Failed to get sensors list: {e}")
+            if isinstance(e, APIError):
+                raise
+            raise APIError(f"Failed to get sensors list: {e}") from e
+
+    async def get_live_metadata_flat(self) -> LiveMetadataFlat:
+        """Retrieve current fiber metadata from live stream (GET /live_metadata)."""
+        try:
+            response = await self.get("/live_metadata")
+            return LiveMetadataFlat.model_validate_json(response.content)
+
+        except Exception as e:
+            self.logger.error(f"Failed to get live metadata: {e}")
+            if isinstance(e, APIError):
+                raise
+            raise APIError(f"Failed to get live metadata: {e}") from e
+
+    async def get_waterfall(self, task_id: str, row_count: int) -> WaterfallGetResponse:
+        """
+        Retrieve processed waterfall data (GET /waterfall/{task_id}/{row_count}).
+
+        Returns:
+            WaterfallGetResponse: 200 no data yet, 201 data, 208 baby analyzer
+            exited, 400 invalid row_count, 404 consumer not found
+
+        Raises:
+            APIError: If API call fails
+            ValidationError: If task_id or row_count is invalid
+        """
+        if not task_id or not isinstance(task_id, str):
+            raise ValidationError("task_id must be a non-empty string")
+
+        if not isinstance(row_count, int) or row_count <= 0:
+            raise ValidationError("row_count must be a positive integer")
+
+        try:
+            response = await self._send_request(
+                "GET", f"/waterfall/{task_id}/{row_count}", allowed_statuses=(400, 404)
+            )
+            status_code = response.status_code
+
+            if status_code == 200:
+                return WaterfallGetResponse(status_code=200, data=None, message="No data available yet")
+            if status_code == 201:
+                return WaterfallGetResponse(
+                    status_code=201, data=response.json(), message="Data retrieved successfully"
+                )
+            if status_code == 208:
+                return WaterfallGetResponse(status_code=208, data=None, message="Baby analyzer has exited")
+            if status_code == 400:
+                return WaterfallGetResponse(status_code=400, data=None, message="Invalid row_count")
+            if status_code == 404:
+                return WaterfallGetResponse(
+                    status_code=404, data=None, message="Consumer not found for task_id"
+                )
+            raise APIError(f"Unexpected status code: {status_code}")
+
+        except Exception as e:
+            self.logger.error(f"Failed to get waterfall data for task {task_id}: {e}")
+            if isinstance(e, (APIError, ValidationError)):
+                raise
+            raise APIError(f"Failed to get waterfall data: {e}") from e
+
+    async def get_waterfall_columns(self, task_id: str, row_count: int) -> WaterfallColumnsResponse:
+        """
+        Fast-path get_waterfall: body decoded into NumPy columns, Pydantic
+        validation only on every ``api_client.waterfall.validate_every``-th call.
+
+        Raises:
+            APIError: If API call fails or the body cannot be decoded
+            ValidationError: If task_id or row_count is invalid
+        """
+        if not task_id or not isinstance(task_id, str):
+            raise ValidationError("task_id must be a non-empty string")
+
+        if not isinstance(row_count, int) or row_count <= 0:
+            raise ValidationError("row_count must be a positive integer")
+
+        self._waterfall_fast_calls += 1
+        validate = (
+            self.waterfall_validate_every > 0
+            and self._waterfall_fast_calls % self.waterfall_validate_every == 0
+        )
+
+        try:
+            response = await self._send_request(
+                "GET", f"/waterfall/{task_id}/{row_count}", allowed_statuses=(400, 404)
+            )
+            return build_columns_response(response.status_code, response.content, validate=validate)
+
+        except Exception as e:
+            self.logger.error(f"Failed to get waterfall data for task {task_id}: {e}")
+            if isinstance(e, (APIError, ValidationError)):
+                raise
+            raise APIError(f"Failed to get waterfall data: {e}") from e
+
+    async def get_task_metadata(self, task_id: str) -> TaskMetadataGetResponse:
+        """
+        Get metadata for a task's recording (GET /metadata/{task_id}).
+
+        Returns:
+            TaskMetadataGetResponse: 200 consumer not running, 201 metadata,
+            404 invalid task_id
+
+        Raises:
+            APIError: If API call fails
+            ValidationError: If task_id is invalid
+        """
+        if not task_id or not isinstance(task_id, str):
+            raise ValidationError("task_id must be a non-empty string")
+
+        try:
+            response = await self._send_request("GET", f"/metadata/{task_id}", allowed_statuses=(404,))
+            status_code = response.status_code
+
+            if status_code == 200:
+                return TaskMetadataGetResponse(status_code=200, metadata=None)
+            if status_code == 201:
+                return TaskMetadataGetResponse(
+                    status_code=201,
+                    metadata=LiveMetadataFlat.model_validate_json(response.content)
+                )
+            if status_code == 404:
+                return TaskMetadataGetResponse(status_code=404, metadata=None)
+            raise APIError(f"Unexpected status code: {status_code}")
+
+        except Exception as e:
+            self.logger.error(f"Failed to get task metadata for {task_id}: {e}")
+            if isinstance(e, (APIError, ValidationError)):
+                raise
+            raise APIError(f"Failed to get task metadata: {e}") from e
@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional
 
 from src.core.api_client import BaseAPIClient
 from src.core.exceptions import APIError, ValidationError
+from src.apis.waterfall_decoder import WaterfallColumnsResponse, build_columns_response
 from src.models.focus_server_models import (
     ConfigureRequest, ConfigureResponse, ChannelRange, LiveMetadata,
     RecordingsInTimeRangeRequest, RecordingsInTimeRangeResponse,
@@ -43,10 +44,19 @@ class FocusServerAPI(BaseAPIClient):
         if not base_url:
             raise ValidationError("Focus Server base URL not configured")
         
-        super().__init__(base_url, timeout, max_retries, verify_ssl)
+        super().__init__(
+            base_url, timeout, max_retries, verify_ssl,
+            log_mode=config_manager.get("api_client.logging.mode", self.LOG_MODE_VERBOSE),
+            log_sample_every=config_manager.get("api_client.logging.sample_every", 100),
+            slow_request_ms=config_manager.get("api_client.logging.slow_request_ms", 1000.0)
+        )
         self.config_manager = config_manager
         self.logger = logging.getLogger(__name__)
         
+        # Fast-path waterfall responses: full Pydantic validation on every Nth (0 = never)
+        self.waterfall_validate_every = config_manager.get("api_client.waterfall.validate_every", 0)
+        self._waterfall_fast_calls = 0
+        
         self.logger.info(f"Focus Server API client initialized for {base_url} (SSL verify: {verify_ssl})")
     
     def configure_streaming_job(self, payload: ConfigureRequest) -> ConfigureResponse:
@@ -635,6 +645,58 @@ class FocusServerAPI(BaseAPIClient):
                 raise
             raise APIError(f"Failed to get waterfall data: {e}") from e
     
+    def get_waterfall_columns(self, task_id: str, row_count: int) -> WaterfallColumnsResponse:
+        """
+        Fast-path variant of get_waterfall for bulk data.
+        
+        GET /waterfall/{task_id}/{row_count}
+        
+        The body is parsed with orjson straight into NumPy columns
+        (timestamps, sensor ids, intensity matrix) instead of nested Pydantic
+        models. Full Pydantic validation runs on every
+        ``api_client.waterfall.validate_every``-th response (0 = never).
+        
+        Args:
+            task_id: Task identifier
+            row_count: Number of rows requested (must be > 0)
+            
+        Returns:
+            WaterfallColumnsResponse (columns set for 201 only); same status
+            codes and messages as get_waterfall
+            
+        Raises:
+            APIError: If API call fails or the body cannot be decoded
+            ValidationError: If task_id or row_count is invalid
+        """
+        if not task_id or not isinstance(task_id, str):
+            raise ValidationError("task_id must be a non-empty string")
+        
+        if not isinstance(row_count, int) or row_count <= 0:
+            raise ValidationError("row_count must be a positive integer")
+        
+        self._waterfall_fast_calls += 1
+        validate = (
+            self.waterfall_validate_every > 0
+            and self._waterfall_fast_calls % self.waterfall_validate_every == 0
+        )
+        
+        try:
+            try:
+                response = self.get(f"/waterfall/{task_id}/{row_count}")
+            except APIError as e:
+                # 400 (invalid row_count) / 404 (consumer not found) are documented results
+                if e.status_code in (400, 404):
+                    return build_columns_response(e.status_code, b"")
+                raise
+            
+            return build_columns_response(response.status_code, response.content, validate=validate)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get waterfall data for task {task_id}: {e}")
+            if isinstance(e, (APIError, ValidationError)):
+                raise
+            raise APIError(f"Failed to get waterfall data: {e}") from e
+    
     def get_task_metadata(self, task_id: str) -> TaskMetadataGetResponse:
         """
         Get metadata for a specific task's recording.
@@ -32,20 +32,35 @@ Usage:
     client.disconnect()
     ```
 
+For many concurrent live jobs, use the asyncio variant instead of one
+thread per stream:
+    ```python
+    from src.apis.grpc_client import AsyncStreamMultiplexer
+    
+    mux = AsyncStreamMultiplexer(connection_timeout=30)
+    mux.start()
+    handle = mux.add_stream(job_id, stream_url, stream_port)
+    ...
+    mux.shutdown()
+    ```
+
 Author: QA Automation Architect
 Date: 2025-11-29
 """
 
+import asyncio
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Generator, Any, Dict
+from typing import Optional, Generator, AsyncGenerator, Any, Dict, List
 
 import grpc
 
 # Import the ACTUAL production proto (pandadatastream)
 from src.models.proto_generated import pandadatastream_pb2, pandadatastream_pb2_grpc
+from src.apis.grpc_stream_stats import StreamStatsAccumulator
 
 # Alias for backwards compatibility (legacy proto)
 try:
@@ -56,6 +71,31 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Channel Configuration
+# =============================================================================
+
+GRPC_CHANNEL_OPTIONS = (
+    ('grpc.max_receive_message_length', 50 * 1024 * 1024),  # 50MB
+    ('grpc.max_send_message_length', 50 * 1024 * 1024),
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', True),
+)
+
+
+def _clean_stream_url(stream_url: str) -> str:
+    """Strip scheme prefix and trailing slashes from a stream URL."""
+    clean_url = stream_url
+    if clean_url.startswith('http://'):
+        clean_url = clean_url.replace('http://', '')
+    elif clean_url.startswith('https://'):
+        clean_url = clean_url.replace('https://', '')
+    
+    # Remove trailing slashes
+    return clean_url.rstrip('/')
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -71,6 +111,7 @@ class StreamMetrics:
     min_amplitude: Optional[float] = None
     max_amplitude: Optional[float] = None
     errors: int = 0
+    payload_stats: Optional[StreamStatsAccumulator] = None
     
     @property
     def duration_seconds(self) -> float:
@@ -89,9 +130,36 @@ class StreamMetrics:
             return self.frames_received / duration
         return 0.0
     
+    def record_frame(self, frame: Any) -> None:
+        """
+        Update counters and amplitude range from a received DataStream frame.
+        
+        Args:
+            frame: pandadatastream DataStream message
+        """
+        self.frames_received += 1
+        self.total_rows += frame.data_shape_y  # Number of rows
+        
+        # Track amplitude range (using pandadatastream field names)
+        if frame.global_minimum is not None:
+            if self.min_amplitude is None:
+                self.min_amplitude = frame.global_minimum
+            else:
+                self.min_amplitude = min(self.min_amplitude, frame.global_minimum)
+        
+        if frame.global_maximum is not None:
+            if self.max_amplitude is None:
+                self.max_amplitude = frame.global_maximum
+            else:
+                self.max_amplitude = max(self.max_amplitude, frame.global_maximum)
+        
+        # Decoded payload statistics (only when enabled)
+        if self.payload_stats is not None:
+            self.payload_stats.update_frame(frame)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
+        result = {
             "frames_received": self.frames_received,
             "total_rows": self.total_rows,
             "total_bytes": self.total_bytes,
@@ -101,6 +169,9 @@ class StreamMetrics:
             "frames_per_second": self.frames_per_second,
             "errors": self.errors
         }
+        if self.payload_stats is not None:
+            result["payload_stats"] = self.payload_stats.summary()
+        return result
 
 
 # =============================================================================
@@ -136,7 +207,8 @@ class GrpcStreamClient:
         connection_timeout: int = 30,
         stream_timeout: int = 60,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        collect_payload_stats: bool = False
     ):
         """
         Initialize gRPC Stream Client.
@@ -147,12 +219,16 @@ class GrpcStreamClient:
             stream_timeout: Timeout for stream operations (seconds)
             max_retries: Maximum retries for transient failures
             retry_delay: Delay between retries (seconds)
+            collect_payload_stats: Decode main_data of every frame into
+                                   StreamMetrics.payload_stats (mean/variance,
+                                   NaN/Inf, per-channel energy, quantiles)
         """
         self.config_manager = config_manager
         self.connection_timeout = connection_timeout
         self.stream_timeout = stream_timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.collect_payload_stats = collect_payload_stats
         
         # Connection state
         self._channel: Optional[grpc.Channel] = None
@@ -162,7 +238,7 @@ class GrpcStreamClient:
         self._stream_port: Optional[int] = None
         
         # Metrics
-        self._metrics = StreamMetrics()
+        self._metrics = self._new_metrics()
         
         self.logger = logging.getLogger(__name__)
         self.logger.debug("GrpcStreamClient initialized")
@@ -177,6 +253,12 @@ class GrpcStreamClient:
         """Get current metrics."""
         return self._metrics
     
+    def _new_metrics(self) -> StreamMetrics:
+        """Create fresh metrics (with a payload accumulator if enabled)."""
+        return StreamMetrics(
+            payload_stats=StreamStatsAccumulator() if self.collect_payload_stats else None
+        )
+    
     def connect(
         self,
         stream_url: str,
@@ -201,28 +283,13 @@ class GrpcStreamClient:
             self.logger.warning("Already connected, disconnecting first...")
             self.disconnect()
         
-        # Clean URL (remove http:// or https:// if present)
-        clean_url = stream_url
-        if clean_url.startswith('http://'):
-            clean_url = clean_url.replace('http://', '')
-        elif clean_url.startswith('https://'):
-            clean_url = clean_url.replace('https://', '')
-        
-        # Remove trailing slashes
-        clean_url = clean_url.rstrip('/')
-        
+        clean_url = _clean_stream_url(stream_url)
         target = f"{clean_url}:{stream_port}"
         self.logger.info(f"Connecting to gRPC server at {target}...")
         
         try:
             # Create channel options
-            options = [
-                ('grpc.max_receive_message_length', 50 * 1024 * 1024),  # 50MB
-                ('grpc.max_send_message_length', 50 * 1024 * 1024),
-                ('grpc.keepalive_time_ms', 30000),
-                ('grpc.keepalive_timeout_ms', 10000),
-                ('grpc.keepalive_permit_without_calls', True),
-            ]
+            options = list(GRPC_CHANNEL_OPTIONS)
             
             # Create channel
             if use_tls:
@@ -292,7 +359,8 @@ class GrpcStreamClient:
         stream_id: int = 0,
         max_frames: Optional[int] = None,
         job_id: Optional[str] = None,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        reset_metrics: bool = True
     ) -> Generator[pandadatastream_pb2.DataStream, None, None]:
         """
         Stream spectrogram data from gRPC server.
@@ -304,6 +372,8 @@ class GrpcStreamClient:
             max_frames: Maximum number of frames to receive (None = unlimited)
             job_id: Optional job ID (not used in pandadatastream, kept for compatibility)
             timeout: Timeout per frame (seconds), defaults to stream_timeout
+            reset_metrics: Start a fresh StreamMetrics (False keeps accumulating
+                           across calls, e.g. during a long soak)
         
         Yields:
             DataStream: Protobuf message containing:
@@ -337,8 +407,9 @@ class GrpcStreamClient:
         )
         
         # Reset metrics
-        self._metrics = StreamMetrics()
-        self._metrics.start_time = time.time()
+        if reset_metrics or self._metrics.start_time is None:
+            self._metrics = self._new_metrics()
+            self._metrics.start_time = time.time()
         
         # Create stream request using PRODUCTION pandadatastream proto
         # Note: pandadatastream uses stream_id, not job_id
@@ -357,28 +428,9 @@ class GrpcStreamClient:
             
             for frame in stream:
                 frames_received += 1
-                self._metrics.frames_received = frames_received
                 
                 # Update metrics - pandadatastream uses different field names
-                data_points = frame.data_shape_x * frame.data_shape_y
-                self._metrics.total_rows += frame.data_shape_y  # Number of rows
-                
-                # Track amplitude range (using pandadatastream field names)
-                if frame.global_minimum is not None:
-                    if self._metrics.min_amplitude is None:
-                        self._metrics.min_amplitude = frame.global_minimum
-                    else:
-                        self._metrics.min_amplitude = min(
-                            self._metrics.min_amplitude, frame.global_minimum
-                        )
-                
-                if frame.global_maximum is not None:
-                    if self._metrics.max_amplitude is None:
-                        self._metrics.max_amplitude = frame.global_maximum
-                    else:
-                        self._metrics.max_amplitude = max(
-                            self._metrics.max_amplitude, frame.global_maximum
-                        )
+                self._metrics.record_frame(frame)
                 
                 self.logger.debug(
                     f"Frame {frames_received}: shape={frame.data_shape_x}x{frame.data_shape_y}, "
@@ -510,6 +562,780 @@ class GrpcStreamClient:
         return f"GrpcStreamClient(status={status})"
 
 
+# =============================================================================
+# AsyncGrpcStreamClient (grpc.aio)
+# =============================================================================
+
+class AsyncGrpcStreamClient:
+    """
+    Asyncio gRPC client for Focus Server streaming (built on ``grpc.aio``).
+    
+    Same connection/stream semantics as GrpcStreamClient, but every stream is
+    a coroutine instead of an OS thread, so a single event loop can hold
+    hundreds of concurrent StreamData calls.
+    
+    Usage:
+        ```python
+        async with AsyncGrpcStreamClient() as client:
+            await client.connect("10.10.100.100", 30123)
+            async for frame in client.stream_data(stream_id=0, max_frames=10):
+                print(f"Data shape: {frame.data_shape_x}x{frame.data_shape_y}")
+        ```
+    """
+    
+    def __init__(
+        self,
+        config_manager: Optional[Any] = None,
+        connection_timeout: int = 30,
+        stream_timeout: int = 60,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        collect_payload_stats: bool = False
+    ):
+        """
+        Initialize async gRPC Stream Client.
+        
+        Args:
+            config_manager: Optional configuration manager instance
+            connection_timeout: Timeout for connection (seconds)
+            stream_timeout: Timeout waiting for each frame (seconds)
+            max_retries: Maximum retries for transient failures
+            retry_delay: Delay between retries (seconds)
+            collect_payload_stats: Decode main_data of every frame into
+                                   StreamMetrics.payload_stats (mean/variance,
+                                   NaN/Inf, per-channel energy, quantiles)
+        """
+        self.config_manager = config_manager
+        self.connection_timeout = connection_timeout
+        self.stream_timeout = stream_timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.collect_payload_stats = collect_payload_stats
+        
+        # Connection state
+        self._channel: Optional[grpc.aio.Channel] = None
+        self._stub: Optional[pandadatastream_pb2_grpc.DataStreamServiceStub] = None
+        self._call: Optional[Any] = None
+        self._connected: bool = False
+        self._stream_url: Optional[str] = None
+        self._stream_port: Optional[int] = None
+        
+        # Metrics
+        self._metrics = self._new_metrics()
+        
+        self.logger = logging.getLogger(__name__)
+    
+    @property
+    def is_connected(self) -> bool:
+        """Check if client is connected."""
+        return self._connected
+    
+    @property
+    def metrics(self) -> StreamMetrics:
+        """Get current metrics."""
+        return self._metrics
+    
+    def _new_metrics(self) -> StreamMetrics:
+        """Create fresh metrics (with a payload accumulator if enabled)."""
+        return StreamMetrics(
+            payload_stats=StreamStatsAccumulator() if self.collect_payload_stats else None
+        )
+    
+    async def connect(
+        self,
+        stream_url: str,
+        stream_port: int,
+        use_tls: bool = False
+    ) -> bool:
+        """
+        Connect to gRPC server.
+        
+        Args:
+            stream_url: gRPC server URL/IP
+            stream_port: gRPC server port (NodePort)
+            use_tls: Whether to use TLS (default: False for internal network)
+        
+        Returns:
+            True if connected successfully
+        
+        Raises:
+            ConnectionError: If connection fails
+        """
+        if self._connected:
+            self.logger.warning("Already connected, disconnecting first...")
+            await self.disconnect()
+        
+        clean_url = _clean_stream_url(stream_url)
+        target = f"{clean_url}:{stream_port}"
+        self.logger.debug(f"Connecting to gRPC server at {target} (async)...")
+        
+        try:
+            options = list(GRPC_CHANNEL_OPTIONS)
+            
+            if use_tls:
+                credentials = grpc.ssl_channel_credentials()
+                self._channel = grpc.aio.secure_channel(target, credentials, options=options)
+            else:
+                self._channel = grpc.aio.insecure_channel(target, options=options)
+            
+            try:
+                await asyncio.wait_for(
+                    self._channel.channel_ready(),
+                    timeout=self.connection_timeout
+                )
+            except asyncio.TimeoutError:
+                raise ConnectionError(
+                    f"Connection timeout after {self.connection_timeout}s to {target}"
+                )
+            
+            self._stub = pandadatastream_pb2_grpc.DataStreamServiceStub(self._channel)
+            
+            self._connected = True
+            self._stream_url = clean_url
+            self._stream_port = stream_port
+            
+            self.logger.debug(f"Connected to gRPC server at {target} (async)")
+            return True
+            
+        except grpc.RpcError as e:
+            await self._cleanup()
+            raise ConnectionError(f"gRPC connection error: {e.code()}: {e.details()}") from e
+        except ConnectionError:
+            await self._cleanup()
+            raise
+        except Exception as e:
+            await self._cleanup()
+            raise ConnectionError(f"Connection failed: {e}") from e
+    
+    async def disconnect(self) -> None:
+        """Cancel any in-flight stream and close the channel."""
+        if not self._connected and self._channel is None:
+            return
+        
+        await self._cleanup()
+        self.logger.debug("Disconnected from gRPC server (async)")
+    
+    async def _cleanup(self) -> None:
+        """Internal cleanup method."""
+        self._connected = False
+        self._stub = None
+        self.cancel_stream()
+        
+        if self._channel:
+            try:
+                await self._channel.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing channel: {e}")
+            self._channel = None
+    
+    def cancel_stream(self) -> None:
+        """Cancel the in-flight StreamData call (if any)."""
+        if self._call is not None and not self._call.done():
+            self._call.cancel()
+        self._call = None
+    
+    async def stream_data(
+        self,
+        stream_id: int = 0,
+        max_frames: Optional[int] = None,
+        job_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        reset_metrics: bool = True
+    ) -> AsyncGenerator[pandadatastream_pb2.DataStream, None]:
+        """
+        Stream spectrogram data from gRPC server.
+        
+        Unlike GrpcStreamClient.stream_data, the timeout applies to each frame
+        rather than to the whole call, so a live stream can stay open for as
+        long as frames keep arriving.
+        
+        Args:
+            stream_id: Stream ID for stream separation (default: 0)
+            max_frames: Maximum number of frames to receive (None = unlimited)
+            job_id: Optional job ID (not used in pandadatastream, kept for compatibility)
+            timeout: Timeout per frame (seconds), defaults to stream_timeout
+            reset_metrics: Start a fresh StreamMetrics (False keeps accumulating
+                           across calls, e.g. after a reconnect)
+        
+        Yields:
+            DataStream: Protobuf message (see GrpcStreamClient.stream_data)
+        
+        Raises:
+            ConnectionError: If not connected or server unavailable
+            TimeoutError: If no frame arrives within the timeout
+            RuntimeError: If stream error occurs
+        """
+        if not self._connected or not self._stub:
+            raise ConnectionError("Not connected to gRPC server. Call connect() first.")
+        
+        effective_timeout = timeout or self.stream_timeout
+        
+        if reset_metrics or self._metrics.start_time is None:
+            self._metrics = self._new_metrics()
+            self._metrics.start_time = time.time()
+        
+        request = pandadatastream_pb2.StreamDataRequest(stream_id=stream_id)
+        call = self._stub.StreamData(request)
+        self._call = call
+        frames_received = 0
+        
+        try:
+            while True:
+                try:
+                    frame = await asyncio.wait_for(call.read(), timeout=effective_timeout)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(
+                        f"No frame within {effective_timeout}s "
+                        f"(received {frames_received} frames)"
+                    )
+                
+                if frame is grpc.aio.EOF:
+                    break
+                
+                frames_received += 1
+                self._metrics.record_frame(frame)
+                
+                yield frame
+                
+                if max_frames and frames_received >= max_frames:
+                    break
+        
+        except grpc.RpcError as e:
+            self._metrics.errors += 1
+            
+            if e.code() == grpc.StatusCode.CANCELLED:
+                self.logger.debug(f"Stream cancelled after {frames_received} frames")
+            elif e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                raise TimeoutError(
+                    f"Stream deadline exceeded (received {frames_received} frames)"
+                ) from e
+            elif e.code() == grpc.StatusCode.UNAVAILABLE:
+                raise ConnectionError(f"gRPC server unavailable: {e.details()}") from e
+            else:
+                raise RuntimeError(f"Stream error: {e.code()}: {e.details()}") from e
+        
+        except TimeoutError:
+            self._metrics.errors += 1
+            raise
+        
+        finally:
+            if not call.done():
+                call.cancel()
+            if self._call is call:
+                self._call = None
+            self._metrics.end_time = time.time()
+    
+    async def check_health(self) -> bool:
+        """
+        Check gRPC server health (channel readiness, see GrpcStreamClient.check_health).
+        
+        Returns:
+            True if the channel becomes ready within 5 seconds
+        """
+        if not self._connected or not self._channel:
+            return False
+        
+        try:
+            await asyncio.wait_for(self._channel.channel_ready(), timeout=5.0)
+            return True
+        except Exception:
+            return False
+    
+    async def collect_frames(
+        self,
+        stream_id: int = 0,
+        timeout_seconds: int = 60,
+        max_frames: int = 100,
+        job_id: Optional[str] = None
+    ) -> list:
+        """
+        Convenience method to collect frames into a list.
+        
+        Args:
+            stream_id: Stream ID
+            timeout_seconds: Maximum total time to wait
+            max_frames: Maximum frames to collect
+            job_id: Optional job ID
+        
+        Returns:
+            List of DataStream frames
+        """
+        frames = []
+        
+        async def _collect():
+            async for frame in self.stream_data(
+                stream_id=stream_id,
+                max_frames=max_frames,
+                job_id=job_id,
+                timeout=timeout_seconds
+            ):
+                frames.append(frame)
+        
+        try:
+            await asyncio.wait_for(_collect(), timeout=timeout_seconds)
+        except (TimeoutError, asyncio.TimeoutError):
+            self.logger.warning(f"Stream timeout after {len(frames)} frames")
+        
+        return frames
+    
+    async def __aenter__(self) -> 'AsyncGrpcStreamClient':
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.disconnect()
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        status = "connected" if self._connected else "disconnected"
+        if self._connected:
+            return (
+                f"AsyncGrpcStreamClient(status={status}, "
+                f"target={self._stream_url}:{self._stream_port}, "
+                f"metrics={self._metrics.to_dict()})"
+            )
+        return f"AsyncGrpcStreamClient(status={status})"
+
+
+# =============================================================================
+# AsyncStreamMultiplexer
+# =============================================================================
+
+class AsyncStreamHandle:
+    """
+    One continuously-consumed stream owned by an AsyncStreamMultiplexer.
+    
+    Exposes the same read-only surface the load testers use on their thread
+    based job handles (frames_received, error, is_alive) plus the per-stream
+    StreamMetrics.
+    """
+    
+    def __init__(
+        self,
+        job_id: str,
+        stream_url: str,
+        stream_port: int,
+        client: AsyncGrpcStreamClient,
+        multiplexer: 'AsyncStreamMultiplexer',
+        stream_id: int = 0
+    ):
+        self.job_id = job_id
+        self.stream_url = stream_url
+        self.stream_port = stream_port
+        self.stream_id = stream_id
+        self.client = client
+        self.created_at = datetime.now()
+        self.error: Optional[str] = None
+        self.stream_restarts = 0
+        self._multiplexer = multiplexer
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+    
+    @property
+    def metrics(self) -> StreamMetrics:
+        """Per-stream metrics (accumulated across stream restarts)."""
+        return self.client.metrics
+    
+    @property
+    def frames_received(self) -> int:
+        """Total frames received on this stream."""
+        return self.client.metrics.frames_received
+    
+    @property
+    def is_alive(self) -> bool:
+        """True while the stream pump task is running."""
+        return self._task is not None and not self._task.done()
+    
+    def stop(self, timeout: float = 5.0) -> bool:
+        """
+        Stop this stream and close its channel (safe to call from any thread).
+        
+        Returns:
+            True if the stream was stopped within the timeout
+        """
+        return self._multiplexer.remove_stream(self.job_id, timeout=timeout)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "job_id": self.job_id,
+            "target": f"{self.stream_url}:{self.stream_port}",
+            "alive": self.is_alive,
+            "stream_restarts": self.stream_restarts,
+            "error": self.error,
+            "metrics": self.metrics.to_dict(),
+        }
+
+
+class AsyncStreamMultiplexer:
+    """
+    Holds many concurrent StreamData calls on a single asyncio event loop.
+    
+    Each stream is an AsyncGrpcStreamClient plus a pump task that consumes
+    frames until stopped, re-opening the call after errors (the same behavior
+    as the thread-per-job LiveJobHandle). The multiplexer can run inside an
+    existing event loop (``await open_stream(...)``) or own a background loop
+    thread so synchronous testers can use it (``start()`` + ``add_stream(...)``).
+    
+    Usage:
+        ```python
+        mux = AsyncStreamMultiplexer(connection_timeout=30)
+        mux.start()
+        handle = mux.add_stream(job_id, stream_url, stream_port)
+        ...
+        print(handle.frames_received, handle.metrics.frames_per_second)
+        mux.shutdown()
+        ```
+    """
+    
+    def __init__(
+        self,
+        config_manager: Optional[Any] = None,
+        connection_timeout: int = 30,
+        frame_timeout: int = 30,
+        max_connect_retries: int = 3,
+        connect_retry_delay: float = 2.0,
+        reconnect_delay: float = 1.0,
+        max_concurrent_connects: int = 50,
+        use_tls: bool = False,
+        collect_payload_stats: bool = False
+    ):
+        """
+        Initialize the multiplexer.
+        
+        Args:
+            config_manager: Optional configuration manager instance
+            connection_timeout: Timeout for each channel connect (seconds)
+            frame_timeout: Max wait for a single frame before restarting the call (seconds)
+            max_connect_retries: Connect attempts per stream (exponential backoff)
+            connect_retry_delay: Base delay between connect attempts (seconds)
+            reconnect_delay: Pause before re-opening a stream after an error (seconds)
+            max_concurrent_connects: Limit on simultaneous channel handshakes
+            use_tls: Whether to use TLS for the channels
+            collect_payload_stats: Accumulate decoded payload statistics per stream
+        """
+        self.config_manager = config_manager
+        self.connection_timeout = connection_timeout
+        self.frame_timeout = frame_timeout
+        self.max_connect_retries = max_connect_retries
+        self.connect_retry_delay = connect_retry_delay
+        self.reconnect_delay = reconnect_delay
+        self.max_concurrent_connects = max_concurrent_connects
+        self.use_tls = use_tls
+        self.collect_payload_stats = collect_payload_stats
+        
+        self._handles: Dict[str, AsyncStreamHandle] = {}
+        self._connect_semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        
+        self.logger = logging.getLogger(__name__)
+    
+    # -------------------------------------------------------------------------
+    # Introspection
+    # -------------------------------------------------------------------------
+    
+    @property
+    def handles(self) -> List[AsyncStreamHandle]:
+        """Snapshot of all stream handles."""
+        return list(self._handles.values())
+    
+    @property
+    def active_count(self) -> int:
+        """Number of streams whose pump task is running."""
+        return sum(1 for h in self.handles if h.is_alive)
+    
+    @property
+    def total_frames(self) -> int:
+        """Frames received across all streams."""
+        return sum(h.frames_received for h in self.handles)
+    
+    def get_handle(self, job_id: str) -> Optional[AsyncStreamHandle]:
+        """Get the handle for a job (None if unknown)."""
+        return self._handles.get(job_id)
+    
+    def metrics_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stream metrics keyed by job_id."""
+        return {h.job_id: h.to_dict() for h in self.handles}
+    
+    # -------------------------------------------------------------------------
+    # Coroutine API (call from the multiplexer's event loop)
+    # -------------------------------------------------------------------------
+    
+    async def open_stream(
+        self,
+        job_id: str,
+        stream_url: str,
+        stream_port: int,
+        stream_id: int = 0
+    ) -> AsyncStreamHandle:
+        """
+        Connect to a job's gRPC server and start consuming its stream.
+        
+        Args:
+            job_id: Job identifier (used as the handle key)
+            stream_url: gRPC server URL/IP
+            stream_port: gRPC server port
+            stream_id: Stream ID for stream separation
+        
+        Returns:
+            AsyncStreamHandle for the running stream
+        
+        Raises:
+            ConnectionError: If all connect attempts fail
+        """
+        if self._connect_semaphore is None:
+            self._connect_semaphore = asyncio.Semaphore(self.max_concurrent_connects)
+        
+        existing = self._handles.get(job_id)
+        if existing and existing.is_alive:
+            return existing
+        
+        client = AsyncGrpcStreamClient(
+            config_manager=self.config_manager,
+            connection_timeout=self.connection_timeout,
+            stream_timeout=self.frame_timeout,
+            collect_payload_stats=self.collect_payload_stats
+        )
+        
+        last_error = None
+        for attempt in range(self.max_connect_retries):
+            try:
+                async with self._connect_semaphore:
+                    await client.connect(stream_url, stream_port, use_tls=self.use_tls)
+                break
+            except ConnectionError as e:
+                last_error = e
+                self.logger.debug(
+                    f"Job {job_id}: async connect attempt {attempt + 1}/"
+                    f"{self.max_connect_retries} failed: {e}"
+                )
+                if attempt < self.max_connect_retries - 1:
+                    await asyncio.sleep(self.connect_retry_delay * (2 ** attempt))
+        else:
+            raise ConnectionError(
+                f"gRPC connect failed after {self.max_connect_retries} attempts: {last_error}"
+            )
+        
+        handle = AsyncStreamHandle(
+            job_id=job_id,
+            stream_url=stream_url,
+            stream_port=stream_port,
+            client=client,
+            multiplexer=self,
+            stream_id=stream_id
+        )
+        handle._task = asyncio.get_running_loop().create_task(
+            self._pump(handle), name=f"stream-{job_id}"
+        )
+        self._handles[job_id] = handle
+        return handle
+    
+    async def _pump(self, handle: AsyncStreamHandle) -> None:
+        """Consume frames for one stream until it is stopped."""
+        first_call = True
+        reconnect = False
+        
+        while not handle._stopping:
+            if reconnect:
+                reconnect = not await self._reconnect(handle)
+            
+            try:
+                async for _ in handle.client.stream_data(
+                    stream_id=handle.stream_id,
+                    timeout=self.frame_timeout,
+                    reset_metrics=first_call
+                ):
+                    if handle._stopping:
+                        break
+                first_call = False
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                first_call = False
+                reconnect = True
+                handle.error = str(e)
+                self.logger.debug(f"Job {handle.job_id}: Stream error: {e}")
+            
+            if handle._stopping:
+                break
+            
+            # Stream ended or failed - re-open after a short pause
+            handle.stream_restarts += 1
+            await asyncio.sleep(self.reconnect_delay)
+        
+        self.logger.debug(
+            f"Job {handle.job_id}: Stream pump ended ({handle.frames_received} frames)"
+        )
+    
+    async def _reconnect(self, handle: AsyncStreamHandle) -> bool:
+        """
+        Replace a stream's channel after an error.
+        
+        The old channel may be broken (server restart, dropped connection), so
+        retrying the call on it can fail forever; a fresh channel is connected
+        instead. Metrics are kept.
+        
+        Returns:
+            True if the new channel is connected
+        """
+        await handle.client.disconnect()
+        try:
+            async with self._connect_semaphore:
+                await handle.client.connect(
+                    handle.stream_url, handle.stream_port, use_tls=self.use_tls
+                )
+            return True
+        except ConnectionError as e:
+            handle.error = str(e)
+            self.logger.debug(f"Job {handle.job_id}: Reconnect failed: {e}")
+            return False
+    
+    async def close_stream(self, job_id: str) -> bool:
+        """
+        Stop a stream and close its channel.
+        
+        Returns:
+            True if the job was known and has been stopped
+        """
+        handle = self._handles.pop(job_id, None)
+        if handle is None:
+            return False
+        
+        handle._stopping = True
+        if handle._task is not None and not handle._task.done():
+            handle._task.cancel()
+            try:
+                await handle._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        
+        await handle.client.disconnect()
+        return True
+    
+    async def close_all(self) -> int:
+        """
+        Stop every stream concurrently.
+        
+        Returns:
+            Number of streams closed
+        """
+        results = await asyncio.gather(
+            *(self.close_stream(job_id) for job_id in list(self._handles)),
+            return_exceptions=True
+        )
+        return sum(1 for r in results if r is True)
+    
+    # -------------------------------------------------------------------------
+    # Thread bridge (for synchronous testers)
+    # -------------------------------------------------------------------------
+    
+    def start(self) -> None:
+        """Start a dedicated event loop thread for the synchronous API."""
+        if self._loop_thread and self._loop_thread.is_alive():
+            return
+        
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        
+        def _run_loop():
+            asyncio.set_event_loop(self._loop)
+            self._loop.call_soon(ready.set)
+            self._loop.run_forever()
+        
+        self._loop_thread = threading.Thread(
+            target=_run_loop,
+            name="grpc-stream-mux",
+            daemon=True
+        )
+        self._loop_thread.start()
+        ready.wait()
+        self.logger.debug("AsyncStreamMultiplexer event loop started")
+    
+    def _run_sync(self, coro, timeout: Optional[float]):
+        """Run a coroutine on the multiplexer loop and wait for its result."""
+        if self._loop is None or not self._loop.is_running():
+            coro.close()
+            raise RuntimeError("AsyncStreamMultiplexer is not started. Call start() first.")
+        
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result(timeout=timeout)
+    
+    def add_stream(
+        self,
+        job_id: str,
+        stream_url: str,
+        stream_port: int,
+        stream_id: int = 0,
+        timeout: Optional[float] = None
+    ) -> AsyncStreamHandle:
+        """
+        Thread-safe wrapper around open_stream().
+        
+        Blocks until the channel is connected and the stream pump is running.
+        
+        Raises:
+            ConnectionError: If all connect attempts fail
+        """
+        return self._run_sync(
+            self.open_stream(job_id, stream_url, stream_port, stream_id=stream_id),
+            timeout=timeout
+        )
+    
+    def remove_stream(self, job_id: str, timeout: float = 5.0) -> bool:
+        """Thread-safe wrapper around close_stream()."""
+        if self._loop is not None and self._loop_thread is threading.current_thread():
+            raise RuntimeError("remove_stream() called from the event loop; use close_stream()")
+        
+        if self._loop is None:
+            return False
+        
+        try:
+            return self._run_sync(self.close_stream(job_id), timeout=timeout)
+        except Exception as e:
+            self.logger.warning(f"Error stopping stream {job_id}: {e}")
+            return False
+    
+    def shutdown(self, timeout: float = 30.0) -> int:
+        """
+        Close all streams and stop the background event loop.
+        
+        Returns:
+            Number of streams closed
+        """
+        if self._loop is None:
+            return 0
+        
+        closed = 0
+        if self._loop.is_running():
+            try:
+                closed = self._run_sync(self.close_all(), timeout=timeout)
+            except Exception as e:
+                self.logger.warning(f"Error closing streams: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        
+        if self._loop_thread:
+            self._loop_thread.join(timeout=5)
+            if self._loop_thread.is_alive():
+                # Closing a loop that is still running raises; a later
+                # shutdown() closes it once the thread has exited
+                self.logger.warning("Event loop thread did not stop; loop left open")
+                return closed
+        self._loop.close()
+        self._loop = None
+        self._loop_thread = None
+        return closed
+    
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"AsyncStreamMultiplexer(streams={len(self._handles)}, "
+            f"active={self.active_count}, frames={self.total_frames})"
+        )
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
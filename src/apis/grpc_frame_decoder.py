@@ -0,0 +1,323 @@
+"""
+gRPC Frame Decoder for pandadatastream
+======================================
+
+Decodes the ``main_data`` payload of pandadatastream ``DataStream`` frames
+into NumPy arrays.
+
+``main_data`` is a ``repeated bytes`` field whose shape is described by
+``data_shape_x`` (samples per row), ``data_shape_y`` (rows) and the optional
+``data_shape_z`` (treated as 1 when unset). The server may send the payload as
+a single blob or split into several chunks (e.g. one per row); both layouts
+are supported.
+
+Decoding uses ``np.frombuffer`` directly over the protobuf ``bytes`` objects:
+for single-chunk frames the returned array is a read-only view with no copy.
+Multi-chunk frames are copied once into a contiguous array, or straight into a
+preallocated FrameRingBuffer when batching.
+
+Usage:
+    ```python
+    from src.apis.grpc_frame_decoder import decode_frame, FrameRingBuffer
+
+    for frame in client.stream_data(stream_id=0, max_frames=100):
+        data = decode_frame(frame)           # (rows, x) or (z, rows, x)
+        assert np.isfinite(data).all()
+
+    ring = FrameRingBuffer(capacity_rows=10_000, row_width=frame.data_shape_x)
+    for frame in client.stream_data(stream_id=0):
+        ring.append(frame)
+    latest = ring.latest(500)                # last 500 rows, oldest first
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Focus Server spectrogram payloads are float32 samples (little endian)
+DEFAULT_PAYLOAD_DTYPE = np.dtype('<f4')
+
+
+class FrameDecodeError(ValueError):
+    """Raised when a frame's main_data does not match its declared shape."""
+
+
+# =============================================================================
+# Frame Decoding
+# =============================================================================
+
+def frame_shape(frame: Any) -> Tuple[int, ...]:
+    """
+    Get the array shape declared by a DataStream frame.
+
+    Args:
+        frame: pandadatastream DataStream message
+
+    Returns:
+        (rows, x) when data_shape_z is unset or 1, otherwise (z, rows, x)
+    """
+    z = frame.data_shape_z if frame.HasField('data_shape_z') else 1
+    if z > 1:
+        return (z, frame.data_shape_y, frame.data_shape_x)
+    return (frame.data_shape_y, frame.data_shape_x)
+
+
+def decode_frame(
+    frame: Any,
+    dtype: Any = DEFAULT_PAYLOAD_DTYPE,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Decode a DataStream frame's main_data into a NumPy array.
+
+    Args:
+        frame: pandadatastream DataStream message
+        dtype: Sample dtype of the payload (default: little-endian float32)
+        out: Optional preallocated array of the frame's shape to decode into
+
+    Returns:
+        Array shaped by frame_shape(). Without ``out``, single-chunk payloads
+        are returned as a read-only zero-copy view over the protobuf bytes.
+
+    Raises:
+        FrameDecodeError: If the payload size does not match the declared shape
+    """
+    dtype = np.dtype(dtype)
+    shape = frame_shape(frame)
+    expected_items = int(np.prod(shape))
+    chunks = frame.main_data
+
+    if len(chunks) == 1:
+        flat = np.frombuffer(chunks[0], dtype=dtype)
+        if flat.size != expected_items:
+            raise FrameDecodeError(
+                f"main_data has {flat.size} samples, expected {expected_items} for shape {shape}"
+            )
+        if out is None:
+            return flat.reshape(shape)
+        np.copyto(out.reshape(-1), flat)
+        return out
+
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    flat_out = out.reshape(-1)
+
+    offset = 0
+    for chunk in chunks:
+        part = np.frombuffer(chunk, dtype=dtype)
+        end = offset + part.size
+        if end > expected_items:
+            raise FrameDecodeError(
+                f"main_data exceeds {expected_items} samples for shape {shape}"
+            )
+        flat_out[offset:end] = part
+        offset = end
+
+    if offset != expected_items:
+        raise FrameDecodeError(
+            f"main_data has {offset} samples, expected {expected_items} for shape {shape}"
+        )
+    return out
+
+
+def frame_timestamps(frame: Any) -> np.ndarray:
+    """Get the per-row timestamps (ms since epoch) of a frame as int64 array."""
+    return np.fromiter(frame.timestamp_in_milis, dtype=np.int64, count=len(frame.timestamp_in_milis))
+
+
+@dataclass
+class DecodedFrame:
+    """A DataStream frame with its payload decoded to NumPy."""
+    data: np.ndarray
+    timestamps_ms: np.ndarray
+    start_channel: int
+    end_channel: int
+    global_minimum: float
+    global_maximum: float
+
+    @classmethod
+    def from_frame(cls, frame: Any, dtype: Any = DEFAULT_PAYLOAD_DTYPE) -> 'DecodedFrame':
+        """Decode a pandadatastream DataStream message."""
+        return cls(
+            data=decode_frame(frame, dtype=dtype),
+            timestamps_ms=frame_timestamps(frame),
+            start_channel=frame.start_channel,
+            end_channel=frame.end_channel,
+            global_minimum=frame.global_minimum,
+            global_maximum=frame.global_maximum,
+        )
+
+    @property
+    def rows(self) -> int:
+        """Number of rows in this frame."""
+        return self.data.shape[-2]
+
+
+# =============================================================================
+# FrameRingBuffer
+# =============================================================================
+
+class FrameRingBuffer:
+    """
+    Preallocated ring buffer of decoded rows for batching many frames.
+
+    Rows from each appended frame are decoded straight into one fixed
+    (capacity_rows, row_width) array, with row timestamps kept alongside, so
+    steady-state streaming allocates nothing per frame. When full, the oldest
+    rows are overwritten.
+    """
+
+    def __init__(
+        self,
+        capacity_rows: int,
+        row_width: int,
+        dtype: Any = DEFAULT_PAYLOAD_DTYPE
+    ):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity_rows: Number of rows retained
+            row_width: Samples per row (frame data_shape_x)
+            dtype: Payload sample dtype
+        """
+        if capacity_rows <= 0 or row_width <= 0:
+            raise ValueError("capacity_rows and row_width must be positive")
+
+        self.capacity_rows = capacity_rows
+        self.row_width = row_width
+        self.dtype = np.dtype(dtype)
+
+        self._data = np.zeros((capacity_rows, row_width), dtype=self.dtype)
+        self._timestamps = np.zeros(capacity_rows, dtype=np.int64)
+        self._head = 0          # Next row to write
+        self._size = 0          # Valid rows
+        self.frames_appended = 0
+        self.rows_appended = 0
+
+    def __len__(self) -> int:
+        """Number of valid rows currently buffered."""
+        return self._size
+
+    @property
+    def is_full(self) -> bool:
+        """True once the buffer has wrapped at least once."""
+        return self._size == self.capacity_rows
+
+    def append(self, frame: Any) -> int:
+        """
+        Decode a frame's rows into the buffer.
+
+        Args:
+            frame: pandadatastream DataStream message (data_shape_z must be 1)
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            FrameDecodeError: If the frame's row width or payload size mismatch
+        """
+        shape = frame_shape(frame)
+        if len(shape) != 2 or shape[1] != self.row_width:
+            raise FrameDecodeError(
+                f"Frame shape {shape} does not match ring row width {self.row_width}"
+            )
+
+        rows = shape[0]
+        if rows > self.capacity_rows:
+            # Only the newest capacity_rows rows survive anyway
+            decoded = decode_frame(frame, dtype=self.dtype)[-self.capacity_rows:]
+            timestamps = frame_timestamps(frame)[-self.capacity_rows:]
+            self._write_rows(decoded, timestamps)
+        elif self._head + rows <= self.capacity_rows:
+            # Contiguous slot - decode in place
+            decode_frame(frame, dtype=self.dtype, out=self._data[self._head:self._head + rows])
+            self._write_timestamps(frame, self._head, rows)
+            self._advance(rows)
+        else:
+            self._write_rows(decode_frame(frame, dtype=self.dtype), frame_timestamps(frame))
+
+        self.frames_appended += 1
+        self.rows_appended += rows
+        return rows
+
+    def extend(self, frames: Iterable[Any]) -> int:
+        """
+        Append many frames.
+
+        Returns:
+            Total rows written
+        """
+        return sum(self.append(frame) for frame in frames)
+
+    def _write_timestamps(self, frame: Any, start: int, rows: int) -> None:
+        """Copy a frame's row timestamps into the slot [start, start+rows)."""
+        ts = frame.timestamp_in_milis
+        if len(ts) == rows:
+            self._timestamps[start:start + rows] = ts
+        else:
+            self._timestamps[start:start + rows] = 0
+
+    def _write_rows(self, rows_data: np.ndarray, timestamps: np.ndarray) -> None:
+        """Write rows with wrap-around."""
+        rows = rows_data.shape[0]
+        if timestamps.size != rows:
+            timestamps = np.zeros(rows, dtype=np.int64)
+
+        first = min(rows, self.capacity_rows - self._head)
+        self._data[self._head:self._head + first] = rows_data[:first]
+        self._timestamps[self._head:self._head + first] = timestamps[:first]
+
+        rest = rows - first
+        if rest:
+            self._data[:rest] = rows_data[first:]
+            self._timestamps[:rest] = timestamps[first:]
+        self._advance(rows)
+
+    def _advance(self, rows: int) -> None:
+        self._head = (self._head + rows) % self.capacity_rows
+        self._size = min(self.capacity_rows, self._size + rows)
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Get the newest rows, oldest first.
+
+        Returns a view when the rows are contiguous in the ring, otherwise a copy.
+
+        Args:
+            n: Number of rows (default: all buffered rows)
+        """
+        n = self._size if n is None else min(n, self._size)
+        start = (self._head - n) % self.capacity_rows
+        if start + n <= self.capacity_rows:
+            return self._data[start:start + n]
+        return np.concatenate((self._data[start:], self._data[:self._head]))
+
+    def latest_timestamps(self, n: Optional[int] = None) -> np.ndarray:
+        """Get the timestamps of the newest rows, oldest first."""
+        n = self._size if n is None else min(n, self._size)
+        start = (self._head - n) % self.capacity_rows
+        if start + n <= self.capacity_rows:
+            return self._timestamps[start:start + n]
+        return np.concatenate((self._timestamps[start:], self._timestamps[:self._head]))
+
+    def clear(self) -> None:
+        """Drop all buffered rows (keeps the allocation)."""
+        self._head = 0
+        self._size = 0
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"FrameRingBuffer(rows={self._size}/{self.capacity_rows}, "
+            f"width={self.row_width}, dtype={self.dtype})"
+        )
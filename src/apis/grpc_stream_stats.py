@@ -0,0 +1,352 @@
+"""
+gRPC Stream Payload Statistics
+==============================
+
+Vectorized per-frame statistics over decoded pandadatastream payloads.
+
+StreamStatsAccumulator is fed the decoded ``main_data`` array of every frame
+and keeps, without storing any frames:
+    - Running mean/variance of all finite samples (Welford, merged per frame
+      with Chan's parallel update)
+    - NaN / Inf sample counts
+    - Per-channel (start_channel..end_channel) sample count, energy, mean,
+      min and max
+    - A streaming quantile sketch of sample amplitudes
+    - Amplitude drift of the recent per-frame mean vs. an initial baseline
+
+Each update is a handful of NumPy reductions over the frame, so it keeps up
+with the stream at line rate during long soaks.
+
+Usage:
+    ```python
+    from src.apis.grpc_stream_stats import StreamStatsAccumulator
+
+    stats = StreamStatsAccumulator()
+    for frame in client.stream_data(stream_id=0):
+        stats.update_frame(frame)
+
+    print(stats.summary())
+    print(stats.dead_channels())
+    print(stats.amplitude_drift())
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import logging
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.apis.grpc_frame_decoder import DEFAULT_PAYLOAD_DTYPE, FrameDecodeError, decode_frame
+from src.utils.quantile_sketch import QuantileSketch
+
+logger = logging.getLogger(__name__)
+
+
+class StreamStatsAccumulator:
+    """
+    Vectorized running statistics of a stream's decoded payload.
+
+    Channel layout: the frame's channel count (end_channel - start_channel + 1)
+    is matched against the last array axis first, then the row axis; frames
+    where neither matches still feed the global statistics and are counted in
+    ``channel_layout_mismatches``.
+    """
+
+    def __init__(
+        self,
+        dtype: Any = DEFAULT_PAYLOAD_DTYPE,
+        sketch_accuracy: float = 0.01,
+        baseline_frames: int = 100,
+        drift_alpha: float = 0.01
+    ):
+        """
+        Initialize the accumulator.
+
+        Args:
+            dtype: Payload sample dtype
+            sketch_accuracy: Relative accuracy of the amplitude quantile sketch
+            baseline_frames: Frames used to establish the drift baseline
+            drift_alpha: EWMA weight of each new frame mean for drift tracking
+        """
+        self.dtype = np.dtype(dtype)
+        self.baseline_frames = baseline_frames
+        self.drift_alpha = drift_alpha
+
+        # Global Welford state (finite samples only)
+        self.frames = 0
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.nan_count = 0
+        self.inf_count = 0
+        self.decode_errors = 0
+        self.channel_layout_mismatches = 0
+
+        # Per-channel state, indexed by absolute channel number
+        self._ch_frames = np.zeros(0, dtype=np.int64)
+        self._ch_count = np.zeros(0, dtype=np.int64)
+        self._ch_sum = np.zeros(0, dtype=np.float64)
+        self._ch_energy = np.zeros(0, dtype=np.float64)
+        self._ch_min = np.zeros(0, dtype=np.float64)
+        self._ch_max = np.zeros(0, dtype=np.float64)
+
+        # Amplitude distribution
+        self.sketch = QuantileSketch(relative_accuracy=sketch_accuracy)
+
+        # Drift tracking (per-frame means)
+        self._baseline_count = 0
+        self._baseline_mean = 0.0
+        self._baseline_m2 = 0.0
+        self._recent_mean: Optional[float] = None
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def update_frame(self, frame: Any) -> bool:
+        """
+        Decode a DataStream frame and update all statistics.
+
+        Returns:
+            True if the frame was decoded and accumulated
+        """
+        try:
+            data = decode_frame(frame, dtype=self.dtype)
+        except FrameDecodeError as e:
+            self.decode_errors += 1
+            logger.debug(f"Skipping frame payload: {e}")
+            return False
+
+        self.update(data, frame.start_channel, frame.end_channel)
+        return True
+
+    def update(
+        self,
+        data: np.ndarray,
+        start_channel: Optional[int] = None,
+        end_channel: Optional[int] = None
+    ) -> None:
+        """
+        Update statistics with one decoded frame.
+
+        Args:
+            data: Decoded payload, (rows, x) or (z, rows, x)
+            start_channel: First channel in the frame (inclusive)
+            end_channel: Last channel in the frame (inclusive)
+        """
+        self.frames += 1
+        if data.size == 0:
+            return
+
+        values = data.astype(np.float64, copy=False)
+        finite = np.isfinite(values)
+        n_finite = int(finite.sum())
+        if n_finite != values.size:
+            nan = int(np.isnan(values).sum())
+            self.nan_count += nan
+            self.inf_count += values.size - n_finite - nan
+            finite_values = values[finite]
+        else:
+            finite_values = values.ravel()
+
+        if start_channel is not None and end_channel is not None:
+            self._update_channels(values, finite, start_channel, end_channel)
+
+        if n_finite == 0:
+            return
+
+        # Chan's parallel merge of this frame into the running Welford state
+        frame_mean = float(finite_values.mean())
+        frame_m2 = float(np.square(finite_values - frame_mean).sum())
+        total = self.count + n_finite
+        delta = frame_mean - self.mean
+        self.mean += delta * n_finite / total
+        self._m2 += frame_m2 + delta * delta * self.count * n_finite / total
+        self.count = total
+
+        self.sketch.add_many(finite_values)
+        self._update_drift(frame_mean)
+
+    def _update_drift(self, frame_mean: float) -> None:
+        if self._baseline_count < self.baseline_frames:
+            self._baseline_count += 1
+            delta = frame_mean - self._baseline_mean
+            self._baseline_mean += delta / self._baseline_count
+            self._baseline_m2 += delta * (frame_mean - self._baseline_mean)
+            self._recent_mean = self._baseline_mean
+        else:
+            self._recent_mean += self.drift_alpha * (frame_mean - self._recent_mean)
+
+    def _update_channels(
+        self,
+        values: np.ndarray,
+        finite: np.ndarray,
+        start_channel: int,
+        end_channel: int
+    ) -> None:
+        n_channels = end_channel - start_channel + 1
+        if n_channels <= 0:
+            self.channel_layout_mismatches += 1
+            return
+
+        if values.shape[-1] == n_channels:
+            per_channel = values.reshape(-1, n_channels)
+            mask = finite.reshape(-1, n_channels)
+        elif values.ndim >= 2 and values.shape[-2] == n_channels:
+            per_channel = np.moveaxis(values, -2, -1).reshape(-1, n_channels)
+            mask = np.moveaxis(finite, -2, -1).reshape(-1, n_channels)
+        else:
+            self.channel_layout_mismatches += 1
+            return
+
+        self._ensure_channels(end_channel + 1)
+        sl = slice(start_channel, end_channel + 1)
+
+        if mask.all():
+            clean = per_channel
+            counts = np.full(n_channels, per_channel.shape[0], dtype=np.int64)
+            ch_min = clean.min(axis=0)
+            ch_max = clean.max(axis=0)
+        else:
+            clean = np.where(mask, per_channel, 0.0)
+            counts = mask.sum(axis=0)
+            ch_min = np.where(mask, per_channel, np.inf).min(axis=0)
+            ch_max = np.where(mask, per_channel, -np.inf).max(axis=0)
+
+        self._ch_frames[sl] += 1
+        self._ch_count[sl] += counts
+        self._ch_sum[sl] += clean.sum(axis=0)
+        self._ch_energy[sl] += np.einsum('ij,ij->j', clean, clean)
+        np.minimum(self._ch_min[sl], ch_min, out=self._ch_min[sl])
+        np.maximum(self._ch_max[sl], ch_max, out=self._ch_max[sl])
+
+    def _ensure_channels(self, size: int) -> None:
+        current = self._ch_count.size
+        if size <= current:
+            return
+        extra = size - current
+        self._ch_frames = np.concatenate((self._ch_frames, np.zeros(extra, dtype=np.int64)))
+        self._ch_count = np.concatenate((self._ch_count, np.zeros(extra, dtype=np.int64)))
+        self._ch_sum = np.concatenate((self._ch_sum, np.zeros(extra)))
+        self._ch_energy = np.concatenate((self._ch_energy, np.zeros(extra)))
+        self._ch_min = np.concatenate((self._ch_min, np.full(extra, np.inf)))
+        self._ch_max = np.concatenate((self._ch_max, np.full(extra, -np.inf)))
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of all finite samples."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of all finite samples."""
+        return math.sqrt(self.variance)
+
+    @property
+    def channels(self) -> np.ndarray:
+        """Channel numbers that received at least one sample."""
+        return np.nonzero(self._ch_count)[0]
+
+    def channel_energy(self) -> Dict[int, float]:
+        """Mean energy (mean of squares) per channel."""
+        seen = self.channels
+        energy = self._ch_energy[seen] / self._ch_count[seen]
+        return dict(zip(seen.tolist(), energy.tolist()))
+
+    def channel_means(self) -> Dict[int, float]:
+        """Mean amplitude per channel."""
+        seen = self.channels
+        means = self._ch_sum[seen] / self._ch_count[seen]
+        return dict(zip(seen.tolist(), means.tolist()))
+
+    def dead_channels(
+        self,
+        min_energy: float = 1e-12,
+        min_range: float = 0.0,
+        expected_channels: Optional[range] = None
+    ) -> List[int]:
+        """
+        Find channels that look dead.
+
+        A channel is dead if it received frames but no finite sample (all
+        NaN/Inf), its mean energy is at or below min_energy, its amplitude
+        range (max - min) is at or below min_range (flat line, only judged
+        once the channel has at least 2 samples), or it is in
+        expected_channels but never received a frame.
+
+        Args:
+            min_energy: Mean-square threshold for a silent channel
+            min_range: Max-min threshold for a stuck channel
+            expected_channels: Channel numbers that should be present
+
+        Returns:
+            Sorted list of dead channel numbers
+        """
+        received = np.nonzero(self._ch_frames)[0]
+        counts = self._ch_count[received]
+        has_samples = counts > 0
+        energy = np.divide(
+            self._ch_energy[received], counts, out=np.zeros(received.size), where=has_samples
+        )
+        # A single sample has no range, so it cannot show a flat line
+        flat = (counts >= 2) & (self._ch_max[received] - self._ch_min[received] <= min_range)
+        dead = set(received[~has_samples | (energy <= min_energy) | flat].tolist())
+
+        if expected_channels is not None:
+            seen_set = set(received.tolist())
+            dead.update(ch for ch in expected_channels if ch not in seen_set)
+
+        return sorted(dead)
+
+    def amplitude_drift(self) -> Optional[float]:
+        """
+        Drift of the recent per-frame mean vs. the baseline, in baseline stds.
+
+        Returns:
+            Signed drift (None until the baseline is complete)
+        """
+        if self._baseline_count < self.baseline_frames or self._recent_mean is None:
+            return None
+
+        baseline_std = math.sqrt(self._baseline_m2 / (self._baseline_count - 1)) \
+            if self._baseline_count > 1 else 0.0
+        delta = self._recent_mean - self._baseline_mean
+        if baseline_std == 0.0:
+            return 0.0 if delta == 0.0 else math.copysign(math.inf, delta)
+        return delta / baseline_std
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact JSON-compatible summary."""
+        p50, p95, p99 = self.sketch.quantiles((0.5, 0.95, 0.99))
+        return {
+            "frames": self.frames,
+            "samples": self.count,
+            "mean": self.mean if self.count else None,
+            "std": self.std if self.count else None,
+            "min": self.sketch.min,
+            "max": self.sketch.max,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "nan_count": self.nan_count,
+            "inf_count": self.inf_count,
+            "decode_errors": self.decode_errors,
+            "channels_seen": int(self.channels.size),
+            "dead_channels": self.dead_channels(),
+            "amplitude_drift": self.amplitude_drift(),
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"StreamStatsAccumulator(frames={self.frames}, samples={self.count}, "
+            f"mean={self.mean:.4g}, std={self.std:.4g})"
+        )
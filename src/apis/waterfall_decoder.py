@@ -0,0 +1,269 @@
+"""
+Waterfall Decoder - Fast-Path Waterfall Parsing
+===============================================
+
+Parses GET /waterfall/{task_id}/{row_count} JSON bodies straight into
+columnar NumPy arrays, skipping the nested WaterfallDataBlock /
+WaterfallRowData / WaterfallSensorData Pydantic models.
+
+For large row_count the Pydantic path dominates client CPU: every row runs
+a field validator and every intensity becomes a Python float inside a
+model. The fast path instead:
+
+- parses the body with orjson (stdlib json if orjson is not installed)
+- builds one intensity array of shape (rows, sensors, bins) plus
+  per-row timestamps, one sensor id vector and per-block amplitude ranges
+- checks timestamps with vectorized comparisons instead of per-row
+  validators
+
+Full Pydantic validation is still available through validate_waterfall(),
+which the API clients run on a sample of responses
+(``api_client.waterfall.validate_every``).
+
+Usage:
+    ```python
+    response = focus_server_api.get_waterfall_columns(task_id, row_count=500)
+    if response.status_code == 201:
+        cols = response.columns
+        cols.intensity.shape          # (rows, sensors, bins)
+        cols.end_timestamps           # int64 epoch millis per row
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, List, Optional, Union
+
+import numpy as np
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from src.core.exceptions import APIError
+from src.models.focus_server_models import WaterfallDataBlock
+
+logger = logging.getLogger(__name__)
+
+
+# Intensities are compared against amplitudes, float32 keeps 7 digits at half the memory
+DEFAULT_INTENSITY_DTYPE = np.dtype(np.float32)
+
+# Message per GET /waterfall status code (same texts as FocusServerAPI.get_waterfall)
+WATERFALL_STATUS_MESSAGES = {
+    200: "No data available yet",
+    201: "Data retrieved successfully",
+    208: "Baby analyzer has exited",
+    400: "Invalid row_count",
+    404: "Consumer not found for task_id",
+}
+
+_BLOCKS_ADAPTER = TypeAdapter(List[WaterfallDataBlock])
+
+
+class WaterfallDecodeError(ValueError):
+    """Raised when a waterfall body cannot be decoded into columns."""
+
+
+@dataclass
+class WaterfallColumns:
+    """Waterfall rows of one response as columnar NumPy arrays."""
+    start_timestamps: np.ndarray
+    end_timestamps: np.ndarray
+    sensor_ids: np.ndarray
+    intensity: np.ndarray
+    canvas_ids: List[str]
+    block_index: np.ndarray
+    block_max_amp: np.ndarray
+    block_min_amp: np.ndarray
+
+    @property
+    def num_rows(self) -> int:
+        """Number of rows across all blocks."""
+        return self.intensity.shape[0]
+
+    @property
+    def num_sensors(self) -> int:
+        """Sensors per row."""
+        return self.intensity.shape[1]
+
+    @property
+    def num_bins(self) -> int:
+        """Intensity values per sensor."""
+        return self.intensity.shape[2]
+
+
+@dataclass
+class WaterfallColumnsResponse:
+    """GET /waterfall result with columnar data (fast path of WaterfallGetResponse)."""
+    status_code: int
+    message: Optional[str] = None
+    columns: Optional[WaterfallColumns] = None
+    validated: bool = False
+
+
+# =============================================================================
+# Decoding
+# =============================================================================
+
+def _loads(raw: Union[bytes, str]) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def empty_columns(dtype: Any = DEFAULT_INTENSITY_DTYPE) -> WaterfallColumns:
+    """Columns with zero rows."""
+    return WaterfallColumns(
+        start_timestamps=np.empty(0, dtype=np.int64),
+        end_timestamps=np.empty(0, dtype=np.int64),
+        sensor_ids=np.empty(0, dtype=np.int64),
+        intensity=np.empty((0, 0, 0), dtype=dtype),
+        canvas_ids=[],
+        block_index=np.empty(0, dtype=np.int64),
+        block_max_amp=np.empty(0, dtype=np.float64),
+        block_min_amp=np.empty(0, dtype=np.float64),
+    )
+
+
+def decode_waterfall(
+    raw: Union[bytes, str],
+    dtype: Any = DEFAULT_INTENSITY_DTYPE,
+    check_timestamps: bool = True
+) -> WaterfallColumns:
+    """
+    Decode a GET /waterfall 201 body into columnar arrays.
+
+    Args:
+        raw: Response body (list of {"rows", "current_max_amp", "current_min_amp"})
+        dtype: Intensity dtype
+        check_timestamps: Verify timestamps are >= 0 and end > start (vectorized)
+
+    Returns:
+        WaterfallColumns
+
+    Raises:
+        WaterfallDecodeError: Malformed body, rows with differing sensor
+                              ids/bin counts, or invalid timestamps
+    """
+    try:
+        blocks = _loads(raw)
+    except ValueError as e:
+        raise WaterfallDecodeError(f"Waterfall body is not valid JSON: {e}") from e
+
+    if not isinstance(blocks, list):
+        raise WaterfallDecodeError("Waterfall body must be a list of data blocks")
+
+    try:
+        rows = [row for block in blocks for row in block["rows"]]
+        if not rows:
+            return empty_columns(dtype)
+
+        n_rows = len(rows)
+        start = np.fromiter((row["startTimestamp"] for row in rows), dtype=np.int64, count=n_rows)
+        end = np.fromiter((row["endTimestamp"] for row in rows), dtype=np.int64, count=n_rows)
+
+        sensor_ids = np.asarray(
+            [[sensor["id"] for sensor in row["sensors"]] for row in rows], dtype=np.int64
+        )
+        intensity = np.asarray(
+            [[sensor["intensity"] for sensor in row["sensors"]] for row in rows], dtype=dtype
+        )
+
+        block_sizes = [len(block["rows"]) for block in blocks]
+        block_max_amp = np.fromiter(
+            (block["current_max_amp"] for block in blocks), dtype=np.float64, count=len(blocks)
+        )
+        block_min_amp = np.fromiter(
+            (block["current_min_amp"] for block in blocks), dtype=np.float64, count=len(blocks)
+        )
+        canvas_ids = [row["canvasId"] for row in rows]
+    except (KeyError, TypeError) as e:
+        raise WaterfallDecodeError(f"Malformed waterfall body: missing or invalid {e}") from e
+    except ValueError as e:
+        # np.asarray on ragged sensors/intensity lists
+        raise WaterfallDecodeError(f"Waterfall rows are not rectangular: {e}") from e
+
+    if intensity.ndim == 2 and intensity.shape[1] == 0:
+        intensity = intensity.reshape(n_rows, 0, 0)  # rows without sensors
+    if sensor_ids.ndim != 2 or intensity.ndim != 3:
+        raise WaterfallDecodeError(
+            f"Waterfall rows are not rectangular: sensor ids {sensor_ids.shape}, "
+            f"intensity {intensity.shape}"
+        )
+    if sensor_ids.size and not (sensor_ids == sensor_ids[0]).all():
+        raise WaterfallDecodeError("Waterfall rows have different sensor ids")
+
+    if check_timestamps:
+        if (start < 0).any() or (end < 0).any():
+            raise WaterfallDecodeError("Waterfall timestamps must be >= 0")
+        bad = np.flatnonzero((start > 0) & (end <= start))
+        if bad.size:
+            raise WaterfallDecodeError(
+                f"endTimestamp must be > startTimestamp ({bad.size} rows, first at row {bad[0]})"
+            )
+
+    return WaterfallColumns(
+        start_timestamps=start,
+        end_timestamps=end,
+        sensor_ids=sensor_ids[0],
+        intensity=intensity,
+        canvas_ids=canvas_ids,
+        block_index=np.repeat(np.arange(len(blocks), dtype=np.int64), block_sizes),
+        block_max_amp=block_max_amp,
+        block_min_amp=block_min_amp,
+    )
+
+
+def validate_waterfall(raw: Union[bytes, str]) -> List[WaterfallDataBlock]:
+    """
+    Full Pydantic validation of a waterfall body (the slow path).
+
+    Raises:
+        pydantic.ValidationError: If any block, row or sensor is invalid
+    """
+    return _BLOCKS_ADAPTER.validate_json(raw)
+
+
+def build_columns_response(
+    status_code: int,
+    content: Union[bytes, str],
+    validate: bool = False,
+    dtype: Any = DEFAULT_INTENSITY_DTYPE
+) -> WaterfallColumnsResponse:
+    """
+    Build a WaterfallColumnsResponse from a GET /waterfall status and body.
+
+    Args:
+        status_code: HTTP status code
+        content: Response body (only decoded for 201)
+        validate: Also run full Pydantic validation on the body
+        dtype: Intensity dtype
+
+    Raises:
+        APIError: If the status code is not a documented waterfall status
+        WaterfallDecodeError: If a 201 body cannot be decoded
+        pydantic.ValidationError: If validate is set and the body is invalid
+    """
+    if status_code not in WATERFALL_STATUS_MESSAGES:
+        raise APIError(f"Unexpected status code: {status_code}")
+
+    columns = None
+    if status_code == 201:
+        columns = decode_waterfall(content, dtype=dtype)
+        if validate:
+            validate_waterfall(content)
+
+    return WaterfallColumnsResponse(
+        status_code=status_code,
+        message=WATERFALL_STATUS_MESSAGES[status_code],
+        columns=columns,
+        validated=validate and status_code == 201,
+    )
@@ -0,0 +1,452 @@
+"""
+Waterfall Poll Scheduler
+========================
+
+Central, adaptive scheduler for polling GET /waterfall/{task_id}/{row_count}
+across many concurrent tasks from one event loop.
+
+Instead of one loop with a fixed sleep per task, every active task_id is
+kept in a single time-ordered heap. After each poll the task's next poll
+time and row_count are derived from its own history:
+
+- 201 (data): the row arrival rate is updated (EWMA). The next poll is
+  timed so that about ``target_rows_per_poll`` rows are waiting, and
+  row_count is sized to fetch them in one request. If the response was
+  full (rows == row_count) more rows are queued on the server, so the task
+  is polled again immediately with a doubled row_count (burst catch-up).
+- 200 (no data yet): the interval backs off exponentially, so idle tasks
+  stop burning requests.
+- 208 (baby analyzer exited): the task is finished and never polled again.
+- 404 / errors: backed off and dropped after too many in a row.
+
+Received rows are timed against their ``endTimestamp`` so end-to-end row
+latency is available as an HDR histogram.
+
+Usage:
+    ```python
+    from src.apis.async_focus_server_api import AsyncFocusServerAPI
+    from src.apis.waterfall_scheduler import WaterfallPollScheduler
+
+    async with AsyncFocusServerAPI(config_manager) as api:
+        scheduler = WaterfallPollScheduler(api, on_rows=handle_rows)
+        for task_id in task_ids:
+            scheduler.add_task(task_id)
+        await scheduler.run()
+        print(scheduler.stats())
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Reasons a task stops being polled
+FINISH_EXITED = "exited"
+FINISH_NOT_FOUND = "not_found"
+FINISH_INVALID_ROW_COUNT = "invalid_row_count"
+FINISH_ERRORS = "errors"
+FINISH_REMOVED = "removed"
+
+
+@dataclass
+class TaskPollState:
+    """Polling history and schedule of one waterfall task."""
+
+    task_id: str
+    row_count: int
+    interval: float
+    added_at: float
+    next_poll_at: float = 0.0
+    rows_per_second: float = 0.0
+    last_data_at: Optional[float] = None
+    polls: int = 0
+    rows_received: int = 0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+    consecutive_empty: int = 0
+    consecutive_not_found: int = 0
+    consecutive_errors: int = 0
+    callback_errors: int = 0
+    last_error: Optional[str] = None
+    finish_reason: Optional[str] = None
+    generation: int = 0
+
+    @property
+    def finished(self) -> bool:
+        """True once the task is no longer polled."""
+        return self.finish_reason is not None
+
+    @property
+    def empty_polls(self) -> int:
+        """Polls answered with 200 (no data available yet)."""
+        return self.status_counts.get(200, 0)
+
+
+class WaterfallPollScheduler:
+    """
+    Adaptive poll scheduler for many waterfall tasks.
+
+    Works with AsyncFocusServerAPI (awaited on the loop) or the sync
+    FocusServerAPI (each call runs in a worker thread).
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        on_rows: Optional[Callable[[str, Any], Any]] = None,
+        on_finished: Optional[Callable[[TaskPollState], Any]] = None,
+        initial_interval_seconds: float = 0.5,
+        min_interval_seconds: float = 0.05,
+        max_interval_seconds: float = 5.0,
+        empty_backoff: float = 1.5,
+        target_rows_per_poll: int = 50,
+        initial_row_count: int = 100,
+        max_row_count: int = 1000,
+        rate_smoothing: float = 0.3,
+        max_concurrent_polls: int = 50,
+        max_consecutive_not_found: int = 10,
+        max_consecutive_errors: int = 5,
+        fast_path: bool = False
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            api: AsyncFocusServerAPI or FocusServerAPI
+            on_rows: Called with (task_id, response) for every 201 response
+                     (may be a coroutine function; runs on the loop, keep it cheap).
+                     Exceptions it raises are logged and counted; the task
+                     keeps being polled.
+            on_finished: Called with the TaskPollState when a task stops
+            initial_interval_seconds: Delay before a new task's first poll
+            min_interval_seconds: Shortest delay between polls of one task
+            max_interval_seconds: Longest delay between polls of one task
+            empty_backoff: Interval multiplier after a 200 (no data) response
+            target_rows_per_poll: Rows each poll should ideally pick up
+            initial_row_count: row_count of a task's first poll
+            max_row_count: Upper bound for batched row_count
+            rate_smoothing: EWMA weight of the newest row rate observation
+            max_concurrent_polls: Max waterfall requests in flight
+            max_consecutive_not_found: 404s in a row before a task is dropped
+            max_consecutive_errors: Failed requests in a row before a task is dropped
+            fast_path: Poll with get_waterfall_columns (NumPy columns, sampled
+                       Pydantic validation); on_rows then receives a
+                       WaterfallColumnsResponse
+        """
+        self.api = api
+        self.on_rows = on_rows
+        self.on_finished = on_finished
+        self.initial_interval = initial_interval_seconds
+        self.min_interval = min_interval_seconds
+        self.max_interval = max_interval_seconds
+        self.empty_backoff = empty_backoff
+        self.target_rows_per_poll = target_rows_per_poll
+        self.initial_row_count = initial_row_count
+        self.max_row_count = max_row_count
+        self.rate_smoothing = rate_smoothing
+        self.max_concurrent_polls = max_concurrent_polls
+        self.max_consecutive_not_found = max_consecutive_not_found
+        self.max_consecutive_errors = max_consecutive_errors
+
+        self.fast_path = fast_path
+
+        self._fetch = api.get_waterfall_columns if fast_path else api.get_waterfall
+        self._fetch_is_async = inspect.iscoroutinefunction(self._fetch)
+        self._tasks: Dict[str, TaskPollState] = {}
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+        self.row_latency = LatencyHistogram()
+
+    # -------------------------------------------------------------------------
+    # Task registry
+    # -------------------------------------------------------------------------
+
+    @property
+    def tasks(self) -> Dict[str, TaskPollState]:
+        """All tasks ever added, by task_id."""
+        return self._tasks
+
+    @property
+    def active_task_count(self) -> int:
+        """Tasks still being polled."""
+        return sum(1 for state in self._tasks.values() if not state.finished)
+
+    def add_task(self, task_id: str, row_count: Optional[int] = None) -> TaskPollState:
+        """
+        Start polling a task (no-op if it is already active).
+
+        Args:
+            task_id: Waterfall task identifier
+            row_count: row_count of the first poll (default: initial_row_count)
+        """
+        state = self._tasks.get(task_id)
+        if state is not None and not state.finished:
+            return state
+
+        now = time.monotonic()
+        state = TaskPollState(
+            task_id=task_id,
+            row_count=min(row_count or self.initial_row_count, self.max_row_count),
+            interval=self.initial_interval,
+            added_at=now,
+        )
+        self._tasks[task_id] = state
+        self._schedule(state, now + self.initial_interval)
+        return state
+
+    def remove_task(self, task_id: str) -> None:
+        """Stop polling a task."""
+        state = self._tasks.get(task_id)
+        if state is not None and not state.finished:
+            self._finish(state, FINISH_REMOVED)
+
+    def stop(self) -> None:
+        """Make run() return after the polls in flight complete."""
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _schedule(self, state: TaskPollState, at: float) -> None:
+        state.generation += 1
+        state.next_poll_at = at
+        heapq.heappush(self._heap, (at, next(self._sequence), state.task_id, state.generation))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _finish(self, state: TaskPollState, reason: str) -> None:
+        state.finish_reason = reason
+        state.generation += 1  # invalidates any queued heap entry
+        logger.debug(
+            f"Waterfall task {state.task_id} finished ({reason}) after {state.polls} polls, "
+            f"{state.rows_received} rows"
+        )
+        if self.on_finished is not None:
+            self.on_finished(state)
+
+    # -------------------------------------------------------------------------
+    # Scheduling loop
+    # -------------------------------------------------------------------------
+
+    async def run(self, duration_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Poll until every task finished, stop() is called or the duration elapses.
+
+        Args:
+            duration_seconds: Optional wall-clock limit
+
+        Returns:
+            stats()
+        """
+        self._running = True
+        self._wakeup = asyncio.Event()
+        slots = asyncio.Semaphore(self.max_concurrent_polls)
+        in_flight = set()
+        deadline = time.monotonic() + duration_seconds if duration_seconds else None
+
+        def _on_poll_done(poll_task: asyncio.Task) -> None:
+            in_flight.discard(poll_task)
+            slots.release()
+            self._wakeup.set()
+
+        try:
+            while self._running:
+                if not self._heap and not in_flight:
+                    break
+
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    break
+
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, task_id, generation = heapq.heappop(self._heap)
+                    state = self._tasks.get(task_id)
+                    if state is None or state.finished or state.generation != generation:
+                        continue
+                    await slots.acquire()
+                    poll_task = asyncio.create_task(self._poll(state))
+                    in_flight.add(poll_task)
+                    poll_task.add_done_callback(_on_poll_done)
+
+                timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+                if timeout is not None:
+                    timeout = max(timeout, 0.0)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._running = False
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            self._wakeup = None
+
+        return self.stats()
+
+    def run_sync(self, duration_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """run() from synchronous code."""
+        return asyncio.run(self.run(duration_seconds))
+
+    async def _get_waterfall(self, task_id: str, row_count: int):
+        if self._fetch_is_async:
+            return await self._fetch(task_id, row_count)
+        return await asyncio.to_thread(self._fetch, task_id, row_count)
+
+    async def _poll(self, state: TaskPollState) -> None:
+        """Poll one task once and schedule its next poll."""
+        requested = state.row_count
+        state.polls += 1
+
+        try:
+            response = await self._get_waterfall(state.task_id, requested)
+        except Exception as e:
+            state.consecutive_errors += 1
+            state.last_error = str(e)
+            logger.debug(f"Waterfall poll failed for {state.task_id}: {e}")
+            if state.consecutive_errors >= self.max_consecutive_errors:
+                self._finish(state, FINISH_ERRORS)
+                return
+            self._backoff(state)
+            return
+
+        if state.finished:
+            return  # removed while the request was in flight
+
+        status = response.status_code
+        state.status_counts[status] = state.status_counts.get(status, 0) + 1
+        state.consecutive_errors = 0
+
+        if status == 201:
+            await self._on_data(state, response, requested)
+        elif status == 200:
+            state.consecutive_empty += 1
+            state.consecutive_not_found = 0
+            state.rows_per_second *= (1 - self.rate_smoothing)
+            self._backoff(state)
+        elif status == 208:
+            self._finish(state, FINISH_EXITED)
+        elif status == 404:
+            # Consumer may not be running yet right after config_task
+            state.consecutive_not_found += 1
+            if state.consecutive_not_found >= self.max_consecutive_not_found:
+                self._finish(state, FINISH_NOT_FOUND)
+            else:
+                self._backoff(state)
+        else:
+            self._finish(state, FINISH_INVALID_ROW_COUNT)
+
+    async def _on_data(self, state: TaskPollState, response: Any, requested: int) -> None:
+        now = time.monotonic()
+        rows = self._count_rows(response)
+
+        state.consecutive_empty = 0
+        state.consecutive_not_found = 0
+        state.rows_received += rows
+
+        since = now - (state.last_data_at if state.last_data_at is not None else state.added_at)
+        if since > 0:
+            observed = rows / since
+            state.rows_per_second = (
+                observed if state.rows_per_second == 0
+                else self.rate_smoothing * observed + (1 - self.rate_smoothing) * state.rows_per_second
+            )
+        state.last_data_at = now
+
+        if self.on_rows is not None:
+            try:
+                result = self.on_rows(state.task_id, response)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                state.callback_errors += 1
+                state.last_error = f"on_rows failed: {e}"
+                logger.error(f"on_rows callback failed for waterfall task {state.task_id}: {e}")
+
+        if rows >= requested:
+            # Full batch: rows are queued on the server, catch up right away
+            state.row_count = min(self.max_row_count, requested * 2)
+            state.interval = self.min_interval
+            self._schedule(state, now)
+            return
+
+        if state.rows_per_second > 0:
+            interval = self.target_rows_per_poll / state.rows_per_second
+        else:
+            interval = state.interval
+        state.interval = min(self.max_interval, max(self.min_interval, interval))
+        # Ask for twice the expected rows so a small burst still fits one request
+        expected = state.rows_per_second * state.interval
+        state.row_count = min(self.max_row_count, max(1, math.ceil(expected * 2), rows))
+        self._schedule(state, now + state.interval)
+
+    def _backoff(self, state: TaskPollState) -> None:
+        state.interval = min(self.max_interval, max(self.min_interval, state.interval * self.empty_backoff))
+        self._schedule(state, time.monotonic() + state.interval)
+
+    def _count_rows(self, response: Any) -> int:
+        """Count rows and record their end-to-end latency (now - endTimestamp)."""
+        now_ms = time.time() * 1000
+
+        columns = getattr(response, "columns", None)
+        if columns is not None:
+            self.row_latency.record_many((now_ms - columns.end_timestamps).tolist())
+            return columns.num_rows
+
+        rows = 0
+        for block in response.data or []:
+            for row in block.rows:
+                rows += 1
+                self.row_latency.record(now_ms - row.endTimestamp)
+        return rows
+
+    # -------------------------------------------------------------------------
+    # Results
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregate polling statistics across all tasks."""
+        status_counts: Dict[int, int] = {}
+        finish_reasons: Dict[str, int] = {}
+        polls = rows = errors = callback_errors = 0
+        for state in self._tasks.values():
+            polls += state.polls
+            rows += state.rows_received
+            for status, count in state.status_counts.items():
+                status_counts[status] = status_counts.get(status, 0) + count
+            if state.finished:
+                finish_reasons[state.finish_reason] = finish_reasons.get(state.finish_reason, 0) + 1
+            errors += state.polls - sum(state.status_counts.values())
+            callback_errors += state.callback_errors
+
+        return {
+            "tasks": len(self._tasks),
+            "active_tasks": self.active_task_count,
+            "polls": polls,
+            "rows_received": rows,
+            "empty_polls": status_counts.get(200, 0),
+            "empty_poll_ratio": status_counts.get(200, 0) / polls if polls else 0.0,
+            "rows_per_poll": rows / polls if polls else 0.0,
+            "failed_polls": errors,
+            "callback_errors": callback_errors,
+            "status_counts": status_counts,
+            "finish_reasons": finish_reasons,
+            "row_latency_ms": self.row_latency.summary(),
+        }
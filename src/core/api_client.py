@@ -5,10 +5,15 @@ Base API Client
 Base API client for the Focus Server automation framework.
 """
 
+import atexit
 import requests
 import time
 import logging
+import logging.handlers
+import itertools
 import json
+import queue
+import threading
 from typing import Dict, Any, Optional, Union
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
@@ -17,7 +22,152 @@ from src.core.exceptions import APIError, NetworkError, TimeoutError
 from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
 
 
-class BaseAPIClient:
+# =============================================================================
+# Background request logging (compact mode)
+# =============================================================================
+
+REQUEST_LOGGER_NAME = "api_client.requests"
+
+_request_log_lock = threading.Lock()
+_request_log_listener: Optional[logging.handlers.QueueListener] = None
+_request_log_atexit_registered = False
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _RootForwardingHandler(logging.Handler):
+    """Hands records to whatever handlers the root logger has at emit time."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger().handle(record)
+
+
+def get_request_logger() -> logging.Logger:
+    """
+    Logger for compact request records, written by a background thread.
+    
+    Records are put on an in-memory queue by the calling thread and emitted
+    through the root logger's handlers by a QueueListener, so file/console
+    I/O never happens on the request path. Queued records are flushed at
+    interpreter exit.
+    """
+    global _request_log_listener, _request_log_atexit_registered
+    
+    request_logger = logging.getLogger(REQUEST_LOGGER_NAME)
+    with _request_log_lock:
+        if _request_log_listener is None:
+            log_queue: queue.Queue = queue.Queue(-1)
+            request_logger.addHandler(_DeferredQueueHandler(log_queue))
+            request_logger.propagate = False
+            _request_log_listener = logging.handlers.QueueListener(
+                log_queue, _RootForwardingHandler()
+            )
+            _request_log_listener.start()
+            if not _request_log_atexit_registered:
+                atexit.register(flush_request_logger)
+                _request_log_atexit_registered = True
+    return request_logger
+
+
+def flush_request_logger() -> None:
+    """Stop the background writer after draining queued records."""
+    global _request_log_listener
+    
+    with _request_log_lock:
+        if _request_log_listener is not None:
+            _request_log_listener.stop()
+            _request_log_listener = None
+            request_logger = logging.getLogger(REQUEST_LOGGER_NAME)
+            for handler in list(request_logger.handlers):
+                if isinstance(handler, _DeferredQueueHandler):
+                    request_logger.removeHandler(handler)
+            request_logger.propagate = True
+
+
+class RequestLoggingMixin:
+    """
+    Request logging mode switch and compact timing records.
+    
+    Shared by the sync and async API clients.
+    """
+    
+    LOG_MODE_VERBOSE = "verbose"
+    LOG_MODE_COMPACT = "compact"
+    
+    def set_request_logging(
+        self,
+        log_mode: str,
+        log_sample_every: Optional[int] = None,
+        slow_request_ms: Optional[float] = None
+    ) -> None:
+        """
+        Switch request logging mode.
+        
+        Verbose mode logs full request/response bodies at INFO, which costs
+        more than the calls themselves under load; load testers use compact
+        mode, which logs sampled and slow requests from a background thread.
+        
+        Args:
+            log_mode: "verbose" or "compact"
+            log_sample_every: Compact mode - log one of every N requests (0 = none)
+            slow_request_ms: Compact mode - always log requests slower than this
+        
+        Raises:
+            ValueError: If log_mode is unknown
+        """
+        if log_mode not in (self.LOG_MODE_VERBOSE, self.LOG_MODE_COMPACT):
+            raise ValueError(f"Unknown log_mode: {log_mode}")
+        
+        self.log_mode = log_mode
+        if log_sample_every is not None:
+            self.log_sample_every = log_sample_every
+        if slow_request_ms is not None:
+            self.slow_request_ms = slow_request_ms
+        self._request_logger = get_request_logger() if log_mode == self.LOG_MODE_COMPACT else None
+    
+    def _log_request_record(
+        self,
+        method: str,
+        url: str,
+        status_code: Optional[int],
+        start_time: float,
+        request_number: int,
+        error: Optional[str] = None
+    ) -> None:
+        """Queue a compact timing record if the request is sampled, slow or failed."""
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        failed = error is not None or (status_code is not None and status_code >= 400)
+        slow = elapsed_ms >= self.slow_request_ms
+        sampled = self.log_sample_every > 0 and request_number % self.log_sample_every == 0
+        
+        if not (failed or slow or sampled):
+            return
+        
+        level = logging.WARNING if failed or slow else logging.INFO
+        self._request_logger.log(
+            level,
+            "%s %s -> %s (%.1fms)",
+            method, url, status_code if status_code is not None else error, elapsed_ms,
+            extra={
+                "api_request": {
+                    "method": method,
+                    "url": url,
+                    "status": status_code,
+                    "elapsed_ms": round(elapsed_ms, 2),
+                    "request_number": request_number,
+                    "error": error,
+                    "slow": slow,
+                }
+            }
+        )
+
+
+class BaseAPIClient(RequestLoggingMixin):
     """
     Base API client with common functionality for all API clients.
     
@@ -27,9 +177,23 @@ class BaseAPIClient:
     - Error handling
     - Logging
     - Response validation
+    
+    Request logging modes:
+    - "verbose" (default): pretty-printed request/response bodies at INFO
+    - "compact": no body logging; one timing record per sampled, slow or
+      failed request, written by a background thread (see get_request_logger)
     """
     
-    def __init__(self, base_url: str, timeout: int = 60, max_retries: int = 3, verify_ssl: bool = False):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 60,
+        max_retries: int = 3,
+        verify_ssl: bool = False,
+        log_mode: str = RequestLoggingMixin.LOG_MODE_VERBOSE,
+        log_sample_every: int = 100,
+        slow_request_ms: float = 1000.0
+    ):
         """
         Initialize the base API client.
         
@@ -38,12 +202,18 @@ class BaseAPIClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             verify_ssl: Whether to verify SSL certificates (default: False for self-signed certs)
+            log_mode: Request logging mode ("verbose" or "compact")
+            log_sample_every: Compact mode - log one of every N requests (0 = none)
+            slow_request_ms: Compact mode - always log requests slower than this
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
         self.verify_ssl = verify_ssl
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._request_counter = itertools.count(1)
+        self._request_logger: Optional[logging.Logger] = None
+        self.set_request_logging(log_mode, log_sample_every, slow_request_ms)
         
         # Suppress SSL warnings if verification is disabled
         if not self.verify_ssl:
@@ -142,6 +312,9 @@ class BaseAPIClient:
         # Set SSL verification
         kwargs.setdefault('verify', self.verify_ssl)
         
+        if self._request_logger is not None:
+            return self._send_request_compact(method, url, **kwargs)
+        
         # Log detailed request information
         self.logger.info(f"{'='*80}")
         self.logger.info(f">> {method} {url}")
@@ -255,6 +428,55 @@ class BaseAPIClient:
             self.logger.error(f"{'='*80}")
             raise APIError(f"Request failed: {e}") from e
     
+    def _send_request_compact(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        _send_request for compact logging mode.
+        
+        Same error handling, but bodies are never parsed or serialized for
+        logging; only a timing record is queued for sampled, slow or failed
+        requests.
+        """
+        request_number = next(self._request_counter)
+        start_time = time.perf_counter()
+        
+        try:
+            response = self.circuit_breaker.call(
+                self.session.request,
+                method, url, **kwargs
+            )
+        except requests.exceptions.Timeout as e:
+            self._log_request_record(method, url, None, start_time, request_number, "timeout")
+            raise TimeoutError(f"Request timed out after {self.timeout} seconds", self.timeout) from e
+        except CircuitBreakerOpenError as e:
+            self._log_request_record(method, url, None, start_time, request_number, "circuit_open")
+            raise NetworkError(f"Circuit breaker is open - server appears down: {e}") from e
+        except requests.exceptions.ConnectionError as e:
+            self._log_request_record(method, url, None, start_time, request_number, "connection_error")
+            raise NetworkError(f"Connection failed: {e}") from e
+        except requests.exceptions.RequestException as e:
+            self._log_request_record(method, url, None, start_time, request_number, "request_error")
+            raise APIError(f"Request failed: {e}") from e
+        
+        self._log_request_record(method, url, response.status_code, start_time, request_number)
+        
+        if response.status_code >= 400:
+            if response.status_code == 503:
+                try:
+                    error_data = response.json()
+                    error_message = str(error_data.get('error', '') or error_data.get('message', '')).lower()
+                    if 'waiting for fiber' in error_message or 'waiting_for_fiber' in error_message:
+                        raise APIError(
+                            message="System is waiting for fiber - cannot configure",
+                            status_code=503,
+                            response_body=error_data
+                        )
+                except (ValueError, KeyError, AttributeError, json.JSONDecodeError):
+                    pass
+            
+            self._handle_http_error(response, url)
+        
+        return response
+    
     def _handle_http_error(self, response: requests.Response, url: str):
         """
         Handle HTTP error responses.
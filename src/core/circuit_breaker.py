@@ -87,6 +87,48 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is open
             Exception: Original exception if function fails
         """
+        self._before_call()
+        
+        # Execute function
+        try:
+            result = func(*args, **kwargs)
+            self._on_success()
+            return result
+        except self.expected_exception as e:
+            self._on_failure()
+            raise
+    
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await a coroutine function with circuit breaker protection.
+        
+        Same state machine as call(); intended for clients running on an
+        asyncio event loop (state is only touched from the loop thread).
+        
+        Args:
+            func: Coroutine function to await
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+            
+        Returns:
+            Awaited function result
+            
+        Raises:
+            CircuitBreakerOpenError: If circuit is open
+            Exception: Original exception if function fails
+        """
+        self._before_call()
+        
+        try:
+            result = await func(*args, **kwargs)
+            self._on_success()
+            return result
+        except self.expected_exception as e:
+            self._on_failure()
+            raise
+    
+    def _before_call(self):
+        """Move OPEN -> HALF_OPEN once the timeout expired, otherwise reject."""
         # Check if circuit should transition from OPEN to HALF_OPEN
         if self.state == "OPEN":
             if self.last_failure_time and (time.time() - self.last_failure_time) > self.timeout:
@@ -102,15 +144,6 @@ class CircuitBreaker:
                     f"Will retry after {remaining_time:.0f}s. "
                     f"Failure count: {self.failure_count}/{self.failure_threshold}"
                 )
-        
-        # Execute function
-        try:
-            result = func(*args, **kwargs)
-            self._on_success()
-            return result
-        except self.expected_exception as e:
-            self._on_failure()
-            raise
     
     def _on_success(self):
         """Handle successful call."""
@@ -0,0 +1,346 @@
+"""
+Cluster Snapshot
+================
+
+Process-wide, TTL-cached snapshot of the pods, jobs and deployments of a
+namespace, shared by fixtures and monitors.
+
+Load-test fixtures, job verification and the pod log monitor each used to
+list pods / jobs on their own schedule for the same namespace. A
+ClusterSnapshotService refreshes all three lists in one pass - in a
+background thread while it is being read - and hands out immutable
+snapshots with name-prefix and job-id indexes, so N monitors cost one
+refresh per TTL instead of N polls.
+
+Usage:
+    ```python
+    snapshots = get_cluster_snapshot_service(kubernetes_manager)
+    snapshot = snapshots.get()
+    running = snapshot.pods_with_prefix("grpc-job-", phase="Running")
+    pods = snapshot.pods_for_job("1234-5")
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import bisect
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.core.exceptions import InfrastructureError
+
+
+# Job (and pod) name prefix of Focus Server gRPC jobs: grpc-job-<job id>
+GRPC_JOB_PREFIX = "grpc-job-"
+
+# Pod labels naming the Job that owns the pod
+JOB_NAME_LABELS = ("batch.kubernetes.io/job-name", "job-name")
+
+# Snapshot lists refreshed together: kind -> ClusterSnapshot attribute
+SNAPSHOT_KINDS = {"pod": "pods", "job": "jobs", "deployment": "deployments"}
+
+DEFAULT_TTL_SECONDS = 5.0
+
+# The background refresher pauses after this long without readers
+DEFAULT_IDLE_SECONDS = 60.0
+
+
+def _name(obj: Dict[str, Any]) -> str:
+    return obj.get("metadata", {}).get("name") or ""
+
+
+def _phase(obj: Dict[str, Any]) -> Optional[str]:
+    return obj.get("status", {}).get("phase")
+
+
+class _PrefixIndex:
+    """Objects sorted by name for prefix lookups."""
+
+    def __init__(self, objects: Iterable[Dict[str, Any]]):
+        entries = sorted((_name(obj), index, obj) for index, obj in enumerate(objects))
+        self._names = [name for name, _, _ in entries]
+        self._objects = [obj for _, _, obj in entries]
+
+    def with_prefix(self, prefix: str) -> List[Dict[str, Any]]:
+        start = bisect.bisect_left(self._names, prefix)
+        end = start
+        while end < len(self._names) and self._names[end].startswith(prefix):
+            end += 1
+        return self._objects[start:end]
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ClusterSnapshot:
+    """
+    Consistent view of a namespace at one refresh. Objects are in API JSON
+    form (as returned by `kubectl get -o json`); treat them as read-only.
+    """
+    namespace: str
+    taken_at: float  # Epoch seconds at the start of the refresh
+    pods: List[Dict[str, Any]] = field(default_factory=list)
+    jobs: List[Dict[str, Any]] = field(default_factory=list)
+    deployments: List[Dict[str, Any]] = field(default_factory=list)
+    resource_versions: Dict[str, str] = field(default_factory=dict)
+
+    _pod_index: _PrefixIndex = field(init=False, repr=False, compare=False)
+    _job_index: _PrefixIndex = field(init=False, repr=False, compare=False)
+    _pods_by_job_name: Dict[str, List[Dict[str, Any]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        pods_by_job_name: Dict[str, List[Dict[str, Any]]] = {}
+        for pod in self.pods:
+            labels = pod.get("metadata", {}).get("labels") or {}
+            job_name = next((labels[key] for key in JOB_NAME_LABELS if key in labels), None)
+            if job_name:
+                pods_by_job_name.setdefault(job_name, []).append(pod)
+
+        object.__setattr__(self, "_pod_index", _PrefixIndex(self.pods))
+        object.__setattr__(self, "_job_index", _PrefixIndex(self.jobs))
+        object.__setattr__(self, "_pods_by_job_name", pods_by_job_name)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.taken_at
+
+    def pods_with_prefix(self, prefix: str, phase: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Pods whose name starts with prefix (e.g. `grpc-job-`), sorted by name."""
+        pods = self._pod_index.with_prefix(prefix)
+        if phase is not None:
+            pods = [pod for pod in pods if _phase(pod) == phase]
+        return pods
+
+    def jobs_with_prefix(self, prefix: str) -> List[Dict[str, Any]]:
+        """Jobs whose name starts with prefix, sorted by name."""
+        return self._job_index.with_prefix(prefix)
+
+    def active_pods(self) -> List[Dict[str, Any]]:
+        """Pods that have not terminated (the set `get_pods()` returns over SSH)."""
+        return [pod for pod in self.pods if _phase(pod) not in ("Succeeded", "Failed")]
+
+    def job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The Kubernetes Job grpc-job-<job_id>, if present."""
+        name = f"{GRPC_JOB_PREFIX}{job_id}"
+        return next((job for job in self._job_index.with_prefix(name) if _name(job) == name), None)
+
+    def pods_for_job(self, job_id: str) -> List[Dict[str, Any]]:
+        """
+        Pods of the Job grpc-job-<job_id>: by the job-name label, or by the
+        `grpc-job-<job_id>-<suffix>` pod name for unlabelled pods.
+        """
+        name = f"{GRPC_JOB_PREFIX}{job_id}"
+        labelled = self._pods_by_job_name.get(name)
+        if labelled:
+            return list(labelled)
+        return self._pod_index.with_prefix(f"{name}-")
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+class ClusterSnapshotService:
+    """
+    Keeps the current ClusterSnapshot of a namespace fresh.
+
+    get() returns the current snapshot and refreshes it only when it is older
+    than the TTL (or the caller's max_age). Concurrent refresh requests are
+    coalesced into one. While get() is being called, a background thread
+    refreshes every TTL, so readers rarely wait for the cluster.
+    """
+
+    def __init__(
+        self,
+        kubernetes_manager: Any,
+        namespace: Optional[str] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        background: bool = True
+    ):
+        """
+        Args:
+            kubernetes_manager: KubernetesManager used for the list calls
+            namespace: Kubernetes namespace (default: configured namespace)
+            ttl_seconds: Maximum snapshot age served by get()
+            idle_seconds: Background refreshing pauses after this long without get()
+            background: Refresh in a background thread while being read
+        """
+        self.kubernetes_manager = kubernetes_manager
+        self.namespace = namespace or kubernetes_manager.k8s_config.get("namespace", "panda")
+        self.ttl_seconds = ttl_seconds
+        self.idle_seconds = idle_seconds
+        self.background = background
+        self.logger = logging.getLogger(__name__)
+
+        self._snapshot: Optional[ClusterSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._last_read = 0.0
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.refreshes = 0
+        self.failed_refreshes = 0
+        self.reads = 0
+
+    def get(self, max_age: Optional[float] = None, timeout: Optional[float] = None) -> ClusterSnapshot:
+        """
+        Current snapshot, refreshed first if older than max_age (default: TTL).
+
+        max_age=0 returns a snapshot taken after this call started (use it
+        after creating an object that must appear). timeout bounds each list
+        call of a refresh made for this read (default: the
+        KubernetesManager.list_objects_json default).
+
+        Raises:
+            InfrastructureError: If there is no snapshot and listing fails
+        """
+        requested_at = time.time()
+        max_age = self.ttl_seconds if max_age is None else max_age
+        self.reads += 1
+        self._touch()
+
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.taken_at >= requested_at - max_age:
+            return snapshot
+
+        with self._refresh_lock:
+            # Another reader may have refreshed while we waited
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.taken_at >= requested_at - max_age:
+                return snapshot
+            try:
+                return self._refresh_locked(timeout)
+            except Exception as e:
+                if snapshot is None:
+                    raise InfrastructureError(f"Cluster snapshot of '{self.namespace}' unavailable: {e}") from e
+                self.logger.warning(f"Cluster snapshot refresh failed, serving {snapshot.age_seconds:.1f}s old data: {e}")
+                return snapshot
+
+    def refresh(self) -> ClusterSnapshot:
+        """List pods, jobs and deployments now and publish a new snapshot."""
+        with self._refresh_lock:
+            return self._refresh_locked()
+
+    def stop(self):
+        """Stop the background refresher."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "namespace": self.namespace,
+            "reads": self.reads,
+            "refreshes": self.refreshes,
+            "failed_refreshes": self.failed_refreshes,
+            "age_seconds": snapshot.age_seconds if snapshot else None,
+        }
+
+    def _refresh_locked(self, timeout: Optional[float] = None) -> ClusterSnapshot:
+        taken_at = time.time()
+        lists: Dict[str, List[Dict[str, Any]]] = {}
+        resource_versions: Dict[str, str] = {}
+        list_kwargs = {} if timeout is None else {"timeout": timeout}
+        try:
+            for kind, attribute in SNAPSHOT_KINDS.items():
+                lists[attribute], resource_versions[kind] = self.kubernetes_manager.list_objects_json(
+                    kind, self.namespace, **list_kwargs
+                )
+        except Exception:
+            self.failed_refreshes += 1
+            raise
+
+        snapshot = ClusterSnapshot(
+            namespace=self.namespace, taken_at=taken_at, resource_versions=resource_versions, **lists
+        )
+        self._snapshot = snapshot
+        self.refreshes += 1
+        self.logger.debug(
+            f"Cluster snapshot of '{self.namespace}': {len(snapshot.pods)} pods, "
+            f"{len(snapshot.jobs)} jobs, {len(snapshot.deployments)} deployments "
+            f"in {time.time() - taken_at:.2f}s"
+        )
+        return snapshot
+
+    # --- Background refresher ---
+
+    def _touch(self):
+        with self._condition:
+            self._last_read = time.monotonic()
+            if self.background and not self._stopped and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"cluster-snapshot-{self.namespace}", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                # Sleep one TTL; while nobody reads, sleep until the next get()
+                self._condition.wait(self.ttl_seconds)
+                while not self._stopped and time.monotonic() - self._last_read > self.idle_seconds:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.age_seconds < self.ttl_seconds * 0.5:
+                continue  # A reader refreshed recently
+            try:
+                self.refresh()
+            except Exception as e:
+                self.logger.debug(f"Background cluster snapshot refresh failed: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registry
+# ---------------------------------------------------------------------------
+
+_services_lock = threading.Lock()
+_services: Dict[str, ClusterSnapshotService] = {}
+
+
+def get_cluster_snapshot_service(
+    kubernetes_manager: Any,
+    namespace: Optional[str] = None,
+    ttl_seconds: Optional[float] = None
+) -> ClusterSnapshotService:
+    """
+    The process-wide ClusterSnapshotService of a namespace.
+
+    Created on first use with this kubernetes_manager; later callers share it
+    whatever manager they pass. The TTL defaults to
+    kubernetes.snapshot_ttl_seconds.
+    """
+    k8s_config = kubernetes_manager.k8s_config
+    namespace = namespace or k8s_config.get("namespace", "panda")
+    with _services_lock:
+        service = _services.get(namespace)
+        if service is None:
+            if ttl_seconds is None:
+                ttl_seconds = float(k8s_config.get("snapshot_ttl_seconds", DEFAULT_TTL_SECONDS))
+            service = ClusterSnapshotService(kubernetes_manager, namespace, ttl_seconds=ttl_seconds)
+            _services[namespace] = service
+        return service
+
+
+def shutdown_cluster_snapshot_services():
+    """Stop and forget all shared snapshot services."""
+    with _services_lock:
+        services = list(_services.values())
+        _services.clear()
+    for service in services:
+        service.stop()
@@ -0,0 +1,183 @@
+"""
+Kubectl List Stream
+===================
+
+Incremental parser for Kubernetes list documents (`kubectl get <kind> -o json`,
+`kubectl get --raw <list path>`, list responses of the API server).
+
+A list of hundreds of grpc-job pods is tens of MB of JSON. Reading it whole and
+then calling json.loads holds the text and the decoded objects at the same time.
+KubectlListParser takes the document in chunks as they arrive and decodes
+one element of `items` at a time, so callers can filter items on the fly with
+memory bounded by the largest item (plus the items they keep). The list
+`metadata` (resourceVersion, continue token) is decoded too.
+
+Usage:
+    ```python
+    parser = KubectlListParser()
+    chunks = ssh_manager.stream_stdout("kubectl get pods -o json")
+    running = [
+        pod for pod in iter_list_items(chunks, parser)
+        if pod["metadata"]["name"].startswith("grpc-job-")
+    ]
+    resource_version = parser.metadata.get("resourceVersion")
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+# Bytes that change the parser state outside / inside JSON strings. JSON
+# syntax is ASCII, and UTF-8 never puts ASCII bytes inside multi-byte
+# characters, so the document is scanned as bytes.
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_OPENERS = (ord("{"), ord("["))
+_OBJECT_OPEN = ord("{")
+_ARRAY_OPEN = ord("[")
+
+# Depth (after opening) of the `items` array elements and of `metadata`
+_ITEM_DEPTH = 3
+_METADATA_DEPTH = 2
+
+
+class KubectlListParser:
+    """
+    Push parser for one list document: feed() chunks, get complete items back.
+
+    Only the bytes of the item being read (and of a top-level key split
+    across chunks) are buffered. Items must be JSON objects, as in every
+    Kubernetes list.
+    """
+
+    def __init__(self):
+        self.metadata: Dict[str, Any] = {}
+        self.items_seen = 0
+        self.bytes_read = 0
+
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._in_items = False
+        self._last_key = b""
+        self._key_start: Optional[int] = None
+        self._capture_start: Optional[int] = None
+        self._capture_depth = 0
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        """
+        Parse the next chunk of the document.
+
+        Returns:
+            Items completed by this chunk, in document order
+
+        Raises:
+            ValueError: If an item or the metadata is not valid JSON
+        """
+        self.bytes_read += len(data)
+        buffer = self._buffer
+        buffer += data
+        pos = self._pos
+        items = []
+
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if buffer[match.start()] == _BACKSLASH:
+                    if match.start() + 1 >= len(buffer):
+                        pos = match.start()  # Escaped character is in the next chunk
+                        break
+                    pos = match.start() + 2
+                    continue
+                pos = match.end()
+                self._in_string = False
+                if self._key_start is not None:
+                    self._last_key = bytes(buffer[self._key_start:pos - 1])
+                    self._key_start = None
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            char = buffer[match.start()]
+            pos = match.end()
+
+            if char == _QUOTE:
+                self._in_string = True
+                if self._depth == 1:
+                    # Top-level key (or string value; only keys precede a container)
+                    self._key_start = pos
+            elif char in _OPENERS:
+                self._depth += 1
+                if self._depth == 2 and char == _ARRAY_OPEN and self._last_key == b"items":
+                    self._in_items = True
+                elif (
+                    (self._depth == _METADATA_DEPTH and char == _OBJECT_OPEN and self._last_key == b"metadata")
+                    or (self._depth == _ITEM_DEPTH and self._in_items)
+                ):
+                    self._capture_start = match.start()
+                    self._capture_depth = self._depth
+            else:
+                if self._capture_start is not None and self._depth == self._capture_depth:
+                    value = json.loads(bytes(buffer[self._capture_start:pos]))
+                    self._capture_start = None
+                    if self._in_items:
+                        items.append(value)
+                        self.items_seen += 1
+                    else:
+                        self.metadata = value
+                elif self._depth == 2 and self._in_items:
+                    self._in_items = False
+                self._depth -= 1
+
+        # Drop the bytes nothing refers to any more
+        keep = min(
+            offset for offset in (pos, self._capture_start, self._key_start) if offset is not None
+        )
+        if keep:
+            del buffer[:keep]
+            pos -= keep
+            if self._capture_start is not None:
+                self._capture_start -= keep
+            if self._key_start is not None:
+                self._key_start -= keep
+        self._pos = pos
+        return items
+
+    def close(self):
+        """
+        Check that the document ended.
+
+        Raises:
+            ValueError: If the document is truncated
+        """
+        if self._depth or self._in_string:
+            raise ValueError(f"Truncated list document after {self.bytes_read} bytes")
+
+
+def iter_list_items(chunks: Iterable[bytes], parser: Optional[KubectlListParser] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the items of a list document read from chunks.
+
+    Pass a parser to read its metadata once the items are exhausted.
+
+    Raises:
+        ValueError: If the document is invalid or truncated
+    """
+    parser = parser or KubectlListParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
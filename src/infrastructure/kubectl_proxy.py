@@ -0,0 +1,181 @@
+"""
+Kubectl Proxy
+=============
+
+Long-lived `kubectl proxy` on the SSH host, reached through a local port
+forward over the existing SSH transport.
+
+In SSH fallback mode every KubernetesManager read used to start a fresh
+`kubectl` process on a new exec channel (kubeconfig load, API discovery,
+process exit). KubectlProxy starts `kubectl proxy --port=0` once and serves
+reads as plain REST calls on a keep-alive HTTP session: each pooled
+connection is a direct-tcpip channel on the same transport, so concurrent
+get_pods / get_jobs / get_endpoints calls run in parallel over one warm
+connection.
+
+Usage:
+    ```python
+    proxy = KubectlProxy(ssh_manager)
+    proxy.start()
+    pods = proxy.get_json("/api/v1/namespaces/panda/pods", params={"labelSelector": "app=mongodb"})
+    proxy.close()
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+
+from src.core.exceptions import InfrastructureError
+
+
+# `kubectl proxy --port=0` announces the port it picked
+READY_PATTERN = r"Starting to serve on [\d.]+:(\d+)"
+
+
+class KubectlProxy:
+    """REST access to the Kubernetes API through a remote `kubectl proxy`."""
+
+    def __init__(self, ssh_manager: Any, startup_timeout: float = 15.0, pool_size: int = 8):
+        """
+        Args:
+            ssh_manager: Connected SSHManager
+            startup_timeout: Seconds to wait for `kubectl proxy` to start serving
+            pool_size: Concurrent HTTP connections (SSH channels) kept open
+        """
+        self.ssh_manager = ssh_manager
+        self.startup_timeout = startup_timeout
+        self.pool_size = pool_size
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._channel = None
+        self._forward = None
+        self._session: Optional[requests.Session] = None
+        self.base_url: Optional[str] = None
+        self.requests = 0
+
+    def start(self):
+        """
+        Start the remote proxy and the local forward (no-op if running).
+
+        Raises:
+            InfrastructureError: If the proxy cannot be started
+        """
+        with self._lock:
+            if self.is_alive:
+                return
+            self._close_locked()
+
+            channel, match = self.ssh_manager.start_background_command(
+                "kubectl proxy --port=0", READY_PATTERN, timeout=self.startup_timeout
+            )
+            try:
+                forward = self.ssh_manager.forward_local_port("127.0.0.1", int(match.group(1)))
+            except Exception:
+                channel.close()
+                raise
+
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size))
+            self._channel, self._forward, self._session = channel, forward, session
+            self.base_url = f"http://127.0.0.1:{forward.local_port}"
+            self.logger.info(f"kubectl proxy running on remote port {match.group(1)}, local {self.base_url}")
+
+    @property
+    def is_alive(self) -> bool:
+        """True while the remote proxy runs and the forward is up."""
+        return (
+            self._channel is not None
+            and not self._channel.closed
+            and not self._channel.exit_status_ready()
+            and self._forward is not None
+            and self._forward.active
+        )
+
+    def get_json(self, path: str, params: Optional[Dict[str, str]] = None, timeout: float = 30) -> Optional[Dict[str, Any]]:
+        """
+        GET an API path (e.g. /api/v1/namespaces/panda/pods).
+
+        Returns:
+            Decoded JSON, or None if the object does not exist (404)
+
+        Raises:
+            InfrastructureError: If the proxy is down or the request fails
+        """
+        session = self._session
+        if session is None or not self.is_alive:
+            raise InfrastructureError("kubectl proxy is not running")
+
+        try:
+            response = session.get(f"{self.base_url}{path}", params=params, timeout=timeout)
+        except RequestException as e:
+            raise InfrastructureError(f"kubectl proxy request failed: {e}") from e
+
+        self.requests += 1
+        if response.status_code == 404:
+            return None
+        if not response.ok:
+            raise InfrastructureError(
+                f"kubectl proxy GET {path} failed: HTTP {response.status_code} {response.text[:200]}"
+            )
+        return response.json()
+
+    def iter_content(
+        self,
+        path: str,
+        params: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+        chunk_size: int = 65536
+    ) -> Iterator[bytes]:
+        """
+        GET an API path and yield the response body in chunks as it arrives.
+
+        For large lists (see kubectl_list_stream); the body is never held
+        whole. Closing the generator releases the connection.
+
+        Raises:
+            InfrastructureError: If the proxy is down or the request fails
+                (including 404)
+        """
+        session = self._session
+        if session is None or not self.is_alive:
+            raise InfrastructureError("kubectl proxy is not running")
+
+        try:
+            response = session.get(f"{self.base_url}{path}", params=params, timeout=timeout, stream=True)
+        except RequestException as e:
+            raise InfrastructureError(f"kubectl proxy request failed: {e}") from e
+
+        self.requests += 1
+        with response:
+            if not response.ok:
+                raise InfrastructureError(
+                    f"kubectl proxy GET {path} failed: HTTP {response.status_code} {response.text[:200]}"
+                )
+            try:
+                yield from response.iter_content(chunk_size)
+            except RequestException as e:
+                raise InfrastructureError(f"kubectl proxy read of {path} failed: {e}") from e
+
+    def close(self):
+        """Stop the local forward and hang up the remote proxy."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self):
+        if self._session is not None:
+            self._session.close()
+        if self._forward is not None:
+            self._forward.close()
+        if self._channel is not None:
+            self._channel.close()
+        self._channel = self._forward = self._session = None
+        self.base_url = None
@@ -3,21 +3,93 @@ Kubernetes Manager
 ==================
 
 Kubernetes infrastructure manager for cluster operations and monitoring.
+
+Waits (pod ready / deleted, deployment and StatefulSet scale) are
+watch-driven: one list for the current state, then a watch from its
+resourceVersion - the Kubernetes watch API, or in SSH fallback mode a single
+streaming `kubectl get --raw ...?watch=1` channel - so they return on the
+event that satisfies the condition, with sub-second timestamps recorded in
+`last_wait`.
 """
 
 import logging
 import time
 import json
 import platform
-from typing import List, Dict, Any, Optional
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
 
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
 from src.core.exceptions import InfrastructureError
+from src.infrastructure.kubectl_list_stream import KubectlListParser, iter_list_items
+from src.infrastructure.kubectl_proxy import KubectlProxy
 from config.config_manager import ConfigManager
 
 
+# REST collection paths of the kinds that can be listed as JSON and waited on
+WATCH_API_PATHS = {
+    "pod": "/api/v1/namespaces/{namespace}/pods",
+    "job": "/apis/batch/v1/namespaces/{namespace}/jobs",
+    "deployment": "/apis/apps/v1/namespaces/{namespace}/deployments",
+    "statefulset": "/apis/apps/v1/namespaces/{namespace}/statefulsets",
+}
+
+# Seconds before retrying a kubectl proxy that failed to start
+KUBECTL_PROXY_RETRY_SECONDS = 60
+
+# Read size when streaming list responses
+LIST_CHUNK_BYTES = 65536
+
+# Filter over the items of a streamed list (True = keep)
+ItemPredicate = Callable[[Dict[str, Any]], bool]
+
+# Predicate over the object as JSON (None while it does not exist):
+# True = condition met, False = give up, None = keep waiting
+WaitPredicate = Callable[[Optional[Dict[str, Any]]], Optional[bool]]
+
+
+@dataclass
+class WaitResult:
+    """Outcome of a watch-driven wait (epoch timestamps, sub-second)."""
+    description: str
+    condition_met: bool
+    started_at: float
+    finished_at: float
+    events: int = 0  # Watch events evaluated
+    last_object: Optional[Dict[str, Any]] = None
+    
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds from the start of the wait until the condition resolved."""
+        return self.finished_at - self.started_at
+
+
+def _ready_replicas(obj: Optional[Dict[str, Any]]) -> Optional[int]:
+    if obj is None:
+        return None
+    return (obj.get("status") or {}).get("readyReplicas") or 0
+
+
+def _pod_ready_verdict(pod: Optional[Dict[str, Any]]) -> Optional[bool]:
+    """True when Running and Ready, False on Failed/Unknown, else keep waiting."""
+    if pod is None:
+        return None
+    status = pod.get("status") or {}
+    phase = status.get("phase", "Unknown")
+    if phase == "Running" and any(
+        c.get("type") == "Ready" and c.get("status") == "True" for c in status.get("conditions") or []
+    ):
+        return True
+    if phase in ("Failed", "Unknown"):
+        return False
+    return None
+
+
 class KubernetesManager:
     """
     Kubernetes infrastructure manager for testing and operations.
@@ -53,6 +125,15 @@ class KubernetesManager:
         self.ssh_manager: Optional[Any] = None  # Lazy import to avoid circular dependencies
         self.use_ssh_fallback = False
         
+        # Persistent `kubectl proxy` serving SSH-mode reads (started on first use)
+        self._kubectl_proxy: Optional[KubectlProxy] = None
+        self._kubectl_proxy_lock = threading.Lock()
+        self._kubectl_proxy_retry_at = 0.0
+        
+        # Watch-driven waits (most recent last)
+        self.last_wait: Optional[WaitResult] = None
+        self.wait_history: Deque[WaitResult] = deque(maxlen=100)
+        
         self._load_k8s_config()
         self.logger.info("Kubernetes manager initialized")
     
@@ -182,6 +263,203 @@ class KubernetesManager:
         
         return result
     
+    def _execute_kubectl_many_via_ssh(self, commands: List[str], timeout: int = 30) -> List[Dict[str, Any]]:
+        """
+        Execute kubectl commands in parallel over the SSH channel pool.
+        
+        Args:
+            commands: kubectl commands to execute
+            timeout: Timeout per command in seconds
+            
+        Returns:
+            Command results (see SSHManager.execute_many), in order
+        """
+        if not self.ssh_manager:
+            if not self._init_ssh_fallback():
+                raise InfrastructureError("SSH manager not available for kubectl execution")
+        
+        if not self.ssh_manager.connected:
+            if not self.ssh_manager.connect():
+                raise InfrastructureError("Failed to connect via SSH for kubectl execution")
+        
+        namespace = self.k8s_config.get("namespace", "panda")
+        full_commands = [f"kubectl -n {namespace} {command}" for command in commands]
+        self.logger.debug(f"Executing {len(full_commands)} kubectl commands via SSH")
+        return self.ssh_manager.execute_many(full_commands, timeout=timeout)
+    
+    def _stream_kubectl_via_ssh(self, command: str, timeout: float) -> Iterator[str]:
+        """
+        Stream the stdout lines of a long-running kubectl command over one SSH channel.
+        
+        Args:
+            command: kubectl command to execute (e.g. a watch)
+            timeout: Maximum streaming time in seconds
+        """
+        if not self.ssh_manager:
+            if not self._init_ssh_fallback():
+                raise InfrastructureError("SSH manager not available for kubectl execution")
+        
+        if not self.ssh_manager.connected:
+            if not self.ssh_manager.connect():
+                raise InfrastructureError("Failed to connect via SSH for kubectl execution")
+        
+        namespace = self.k8s_config.get("namespace", "panda")
+        full_command = f"kubectl -n {namespace} {command}"
+        self.logger.debug(f"Streaming kubectl via SSH: {full_command}")
+        return self.ssh_manager.stream_lines(full_command, timeout=timeout)
+    
+    def _stream_kubectl_stdout_via_ssh(self, command: str, timeout: float) -> Iterator[bytes]:
+        """
+        Stream the raw stdout of a kubectl command (e.g. a large list) over one SSH channel.
+        
+        Args:
+            command: kubectl command to execute
+            timeout: Timeout in seconds
+        """
+        if not self.ssh_manager:
+            if not self._init_ssh_fallback():
+                raise InfrastructureError("SSH manager not available for kubectl execution")
+        
+        if not self.ssh_manager.connected:
+            if not self.ssh_manager.connect():
+                raise InfrastructureError("Failed to connect via SSH for kubectl execution")
+        
+        namespace = self.k8s_config.get("namespace", "panda")
+        full_command = f"kubectl -n {namespace} {command}"
+        self.logger.debug(f"Streaming kubectl output via SSH: {full_command}")
+        return self.ssh_manager.stream_stdout(full_command, timeout=timeout, chunk_size=LIST_CHUNK_BYTES)
+    
+    def _get_kubectl_proxy(self) -> Optional[KubectlProxy]:
+        """
+        The persistent kubectl proxy, started on first use.
+        
+        Returns None if disabled (kubernetes.use_kubectl_proxy: false) or if it
+        cannot be started; a failed start is retried after
+        KUBECTL_PROXY_RETRY_SECONDS.
+        """
+        if not self.k8s_config.get("use_kubectl_proxy", True):
+            return None
+        
+        with self._kubectl_proxy_lock:
+            if self._kubectl_proxy is not None and self._kubectl_proxy.is_alive:
+                return self._kubectl_proxy
+            if time.monotonic() < self._kubectl_proxy_retry_at:
+                return None
+            
+            try:
+                if not self.ssh_manager and not self._init_ssh_fallback():
+                    raise InfrastructureError("SSH manager not available for kubectl proxy")
+                if not self.ssh_manager.connected and not self.ssh_manager.connect():
+                    raise InfrastructureError("Failed to connect via SSH for kubectl proxy")
+                
+                if self._kubectl_proxy is None:
+                    self._kubectl_proxy = KubectlProxy(self.ssh_manager)
+                self._kubectl_proxy.start()
+                return self._kubectl_proxy
+            except Exception as e:
+                self.logger.warning(f"kubectl proxy unavailable, using kubectl exec: {e}")
+                self._kubectl_proxy_retry_at = time.monotonic() + KUBECTL_PROXY_RETRY_SECONDS
+                return None
+    
+    def _kubectl_get_json(
+        self,
+        path: str,
+        command: str,
+        description: str,
+        params: Optional[Dict[str, str]] = None,
+        timeout: int = 30
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read an API object or list as JSON in SSH mode.
+        
+        Served by the persistent kubectl proxy when it is up (one warm
+        connection, concurrent callers run in parallel); otherwise, or if the
+        request fails, by running the equivalent kubectl command.
+        
+        Args:
+            path: API path (e.g. /api/v1/namespaces/panda/endpoints)
+            command: Equivalent kubectl command with `-o json`
+            description: What is read, for error messages
+            params: Query parameters of the API request
+            timeout: Timeout in seconds
+        
+        Returns:
+            Decoded JSON, or None if the object does not exist
+        """
+        proxy = self._get_kubectl_proxy()
+        if proxy is not None:
+            try:
+                return proxy.get_json(path, params=params, timeout=timeout)
+            except (InfrastructureError, ValueError) as e:
+                self.logger.warning(f"kubectl proxy read of {description} failed, using kubectl exec: {e}")
+        
+        result = self._execute_kubectl_via_ssh(command, timeout=timeout)
+        if not result["success"]:
+            if "NotFound" in result.get("stderr", ""):
+                return None
+            raise InfrastructureError(f"Failed to get {description} via SSH: {result['stderr']}")
+        
+        try:
+            return json.loads(result["stdout"])
+        except json.JSONDecodeError as e:
+            raise InfrastructureError(f"Failed to parse kubectl output as JSON: {e}") from e
+    
+    def _kubectl_list_json(
+        self,
+        path: str,
+        command: str,
+        description: str,
+        params: Optional[Dict[str, str]] = None,
+        timeout: int = 30,
+        predicate: Optional[ItemPredicate] = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Read a list in SSH mode, decoding it item by item as it arrives.
+        
+        Like _kubectl_get_json (kubectl proxy first, kubectl exec as
+        fallback), but the raw JSON is never held whole.
+        
+        Returns:
+            (items accepted by predicate, list resourceVersion); ([], "") if
+            the resource does not exist
+        """
+        proxy = self._get_kubectl_proxy()
+        if proxy is not None:
+            try:
+                return self._collect_list_items(
+                    proxy.iter_content(path, params=params, timeout=timeout, chunk_size=LIST_CHUNK_BYTES), predicate
+                )
+            except (InfrastructureError, ValueError) as e:
+                self.logger.warning(f"kubectl proxy read of {description} failed, using kubectl exec: {e}")
+        
+        try:
+            return self._collect_list_items(self._stream_kubectl_stdout_via_ssh(command, timeout), predicate)
+        except InfrastructureError as e:
+            if "NotFound" in str(e):
+                return [], ""
+            raise InfrastructureError(f"Failed to get {description} via SSH: {e}") from e
+        except ValueError as e:
+            raise InfrastructureError(f"Failed to parse kubectl output as JSON: {e}") from e
+    
+    @staticmethod
+    def _collect_list_items(
+        chunks: Iterator[bytes],
+        predicate: Optional[ItemPredicate]
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Decode a streamed list document, keeping the items accepted by predicate."""
+        parser = KubectlListParser()
+        items = [item for item in iter_list_items(chunks, parser) if predicate is None or predicate(item)]
+        return items, parser.metadata.get("resourceVersion", "")
+    
+    def close(self):
+        """Stop the kubectl proxy (if running) and disconnect SSH."""
+        with self._kubectl_proxy_lock:
+            if self._kubectl_proxy is not None:
+                self._kubectl_proxy.close()
+                self._kubectl_proxy = None
+        if self.ssh_manager:
+            self.ssh_manager.disconnect()
+    
     def _ensure_k8s_available(self):
         """Ensure Kubernetes is available (either direct API or SSH fallback)."""
         if self.use_ssh_fallback:
@@ -267,6 +545,24 @@ class KubernetesManager:
         if not namespace:
             namespace = self.k8s_config.get("namespace", "panda")
         
+        proxy = self._get_kubectl_proxy()
+        if proxy is not None:
+            params = {"fieldSelector": "status.phase!=Succeeded,status.phase!=Failed"}
+            if label_selector:
+                params["labelSelector"] = label_selector
+            try:
+                # Same namespace as the kubectl command below
+                kubectl_namespace = self.k8s_config.get("namespace", "panda")
+                chunks = proxy.iter_content(
+                    f"/api/v1/namespaces/{kubectl_namespace}/pods", params=params, chunk_size=LIST_CHUNK_BYTES
+                )
+                items, _ = self._collect_list_items(chunks, None)
+                pod_list = [self._pod_info_from_json(item) for item in items]
+                self.logger.debug(f"Retrieved {len(pod_list)} pods from namespace '{namespace}' via kubectl proxy")
+                return pod_list
+            except (InfrastructureError, ValueError) as e:
+                self.logger.warning(f"kubectl proxy read of pods failed, using kubectl exec: {e}")
+        
         # Use lightweight custom-columns format instead of full JSON for better performance
         # This is MUCH faster than -o json, especially with many pods
         cmd = (
@@ -383,39 +679,30 @@ class KubernetesManager:
         if not namespace:
             namespace = self.k8s_config.get("namespace", "default")
         
-        # Build kubectl command
-        cmd = f"get deployments -o json"
-        
-        result = self._execute_kubectl_via_ssh(cmd, timeout=30)
-        
-        if not result["success"]:
-            raise InfrastructureError(f"Failed to get deployments via SSH: {result['stderr']}")
+        # Same namespace as `kubectl get` (the configured one)
+        kubectl_namespace = self.k8s_config.get("namespace", "panda")
+        deployments_data = self._kubectl_get_json(
+            f"/apis/apps/v1/namespaces/{kubectl_namespace}/deployments", "get deployments -o json", "deployments"
+        ) or {}
+        deployment_list = []
         
-        # Parse JSON output
-        try:
-            deployments_data = json.loads(result["stdout"])
-            deployment_list = []
-            
-            for deployment_item in deployments_data.get("items", []):
-                metadata = deployment_item.get("metadata", {})
-                spec = deployment_item.get("spec", {})
-                status = deployment_item.get("status", {})
-                
-                deployment_info = {
-                    "name": metadata.get("name"),
-                    "namespace": metadata.get("namespace"),
-                    "replicas": spec.get("replicas", 0),
-                    "ready_replicas": status.get("readyReplicas", 0),
-                    "available_replicas": status.get("availableReplicas", 0),
-                    "labels": metadata.get("labels", {})
-                }
-                deployment_list.append(deployment_info)
-            
-            self.logger.debug(f"Retrieved {len(deployment_list)} deployments from namespace '{namespace}' via SSH")
-            return deployment_list
+        for deployment_item in deployments_data.get("items", []):
+            metadata = deployment_item.get("metadata", {})
+            spec = deployment_item.get("spec", {})
+            status = deployment_item.get("status", {})
             
-        except json.JSONDecodeError as e:
-            raise InfrastructureError(f"Failed to parse kubectl output as JSON: {e}")
+            deployment_info = {
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
+                "replicas": spec.get("replicas", 0),
+                "ready_replicas": status.get("readyReplicas", 0),
+                "available_replicas": status.get("availableReplicas", 0),
+                "labels": metadata.get("labels", {})
+            }
+            deployment_list.append(deployment_info)
+        
+        self.logger.debug(f"Retrieved {len(deployment_list)} deployments from namespace '{namespace}' via SSH")
+        return deployment_list
     
     def get_jobs(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -469,43 +756,34 @@ class KubernetesManager:
         if not namespace:
             namespace = self.k8s_config.get("namespace", "default")
         
-        # Build kubectl command
-        cmd = f"get jobs -o json"
-        
-        result = self._execute_kubectl_via_ssh(cmd, timeout=30)
-        
-        if not result["success"]:
-            raise InfrastructureError(f"Failed to get jobs via SSH: {result['stderr']}")
+        # Same namespace as `kubectl get` (the configured one)
+        kubectl_namespace = self.k8s_config.get("namespace", "panda")
+        job_items, _ = self._kubectl_list_json(
+            f"/apis/batch/v1/namespaces/{kubectl_namespace}/jobs", "get jobs -o json", "jobs"
+        )
+        job_list = []
         
-        # Parse JSON output
-        try:
-            jobs_data = json.loads(result["stdout"])
-            job_list = []
+        for job_item in job_items:
+            metadata = job_item.get("metadata", {})
+            spec = job_item.get("spec", {})
+            status = job_item.get("status", {})
             
-            for job_item in jobs_data.get("items", []):
-                metadata = job_item.get("metadata", {})
-                spec = job_item.get("spec", {})
-                status = job_item.get("status", {})
-                
-                conditions = status.get("conditions", [])
-                status_type = conditions[0].get("type", "Unknown") if conditions else "Unknown"
-                
-                job_info = {
-                    "name": metadata.get("name"),
-                    "namespace": metadata.get("namespace"),
-                    "status": status_type,
-                    "completions": spec.get("completions", 1),
-                    "succeeded": status.get("succeeded", 0),
-                    "failed": status.get("failed", 0),
-                    "labels": metadata.get("labels", {})
-                }
-                job_list.append(job_info)
-            
-            self.logger.debug(f"Retrieved {len(job_list)} jobs from namespace '{namespace}' via SSH")
-            return job_list
+            conditions = status.get("conditions", [])
+            status_type = conditions[0].get("type", "Unknown") if conditions else "Unknown"
             
-        except json.JSONDecodeError as e:
-            raise InfrastructureError(f"Failed to parse kubectl output as JSON: {e}") from e
+            job_info = {
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
+                "status": status_type,
+                "completions": spec.get("completions", 1),
+                "succeeded": status.get("succeeded", 0),
+                "failed": status.get("failed", 0),
+                "labels": metadata.get("labels", {})
+            }
+            job_list.append(job_info)
+        
+        self.logger.debug(f"Retrieved {len(job_list)} jobs from namespace '{namespace}' via SSH")
+        return job_list
     
     def get_pod_logs(self, pod_name: str, namespace: Optional[str] = None, 
                     container: Optional[str] = None, tail_lines: int = 100) -> str:
@@ -689,6 +967,31 @@ class KubernetesManager:
             self.logger.error(f"Failed to delete job '{job_name}': {e}")
             return False
     
+    def delete_jobs(self, job_names: List[str], namespace: Optional[str] = None) -> Dict[str, bool]:
+        """
+        Delete several jobs; over SSH the deletions run in parallel.
+        
+        Args:
+            job_names: Names of the jobs to delete
+            namespace: Kubernetes namespace (defaults to configured namespace)
+            
+        Returns:
+            Job name -> True if deletion was successful
+        """
+        self._ensure_k8s_available()
+        
+        if not self.use_ssh_fallback:
+            return {job_name: self.delete_job(job_name, namespace) for job_name in job_names}
+        
+        self.logger.info(f"Deleting {len(job_names)} jobs via SSH...")
+        results = self._execute_kubectl_many_via_ssh([f"delete job {job_name}" for job_name in job_names])
+        deleted = {job_name: result["success"] for job_name, result in zip(job_names, results)}
+        for job_name, result in zip(job_names, results):
+            if not result["success"]:
+                self.logger.debug(f"Failed to delete job '{job_name}' via SSH: {result['stderr']}")
+        self.logger.info(f"Deleted {sum(deleted.values())}/{len(job_names)} jobs via SSH")
+        return deleted
+    
     def _delete_job_via_ssh(self, job_name: str, namespace: str) -> bool:
         """Delete job via SSH kubectl command."""
         try:
@@ -761,52 +1064,16 @@ class KubernetesManager:
             namespace: Kubernetes namespace
             timeout: Timeout in seconds
         """
-        self.logger.debug(f"Waiting for deployment '{deployment_name}' to reach {expected_replicas} replicas...")
-        
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                if self.use_ssh_fallback:
-                    # Use kubectl via SSH to check deployment status
-                    cmd = f"get deployment {deployment_name} -o json"
-                    result = self._execute_kubectl_via_ssh(cmd, timeout=10)
-                    
-                    if result["success"]:
-                        deployment_data = json.loads(result["stdout"])
-                        status = deployment_data.get("status", {})
-                        ready_replicas = status.get("readyReplicas", 0)
-                        
-                        if ready_replicas == expected_replicas:
-                            self.logger.debug(f"Deployment '{deployment_name}' reached {expected_replicas} replicas")
-                            return
-                        
-                        self.logger.debug(f"Deployment '{deployment_name}' has {ready_replicas} ready replicas, waiting...")
-                    else:
-                        self.logger.warning(f"Failed to get deployment status via SSH: {result['stderr']}")
-                else:
-                    deployment = self.k8s_apps_v1.read_namespaced_deployment(
-                        name=deployment_name,
-                        namespace=namespace
-                    )
-                    
-                    ready_replicas = deployment.status.ready_replicas or 0
-                    
-                    if ready_replicas == expected_replicas:
-                        self.logger.debug(f"Deployment '{deployment_name}' reached {expected_replicas} replicas")
-                        return
-                    
-                    self.logger.debug(f"Deployment '{deployment_name}' has {ready_replicas} ready replicas, waiting...")
-                
-            except ApiException as e:
-                self.logger.warning(f"K8s API error while waiting for deployment scale: {e}")
-            except Exception as e:
-                self.logger.warning(f"Error while waiting for deployment scale: {e}")
-            
-            time.sleep(5)
-        
-        raise InfrastructureError(
-            f"Deployment '{deployment_name}' did not reach {expected_replicas} replicas within {timeout} seconds"
+        result = self.wait_for_object(
+            "deployment", deployment_name, namespace,
+            lambda deployment: _ready_replicas(deployment) == expected_replicas or None,
+            timeout=timeout,
+            description=f"deployment '{deployment_name}' at {expected_replicas} ready replicas"
         )
+        if not result.condition_met:
+            raise InfrastructureError(
+                f"Deployment '{deployment_name}' did not reach {expected_replicas} replicas within {timeout} seconds"
+            )
     
     def _wait_for_pod_deletion(self, pod_name: str, namespace: str, timeout: int = 120):
         """
@@ -817,39 +1084,209 @@ class KubernetesManager:
             namespace: Kubernetes namespace
             timeout: Timeout in seconds
         """
-        self.logger.debug(f"Waiting for pod '{pod_name}' to be deleted...")
+        result = self.wait_for_object(
+            "pod", pod_name, namespace,
+            lambda pod: True if pod is None else None,
+            timeout=timeout,
+            description=f"pod '{pod_name}' deleted"
+        )
+        if not result.condition_met:
+            raise InfrastructureError(f"Pod '{pod_name}' was not deleted within {timeout} seconds")
+    
+    # -------------------------------------------------------------------------
+    # Watch-driven waits
+    # -------------------------------------------------------------------------
+    
+    def wait_for_object(
+        self,
+        kind: str,
+        name: str,
+        namespace: str,
+        predicate: WaitPredicate,
+        timeout: float = 120,
+        description: str = ""
+    ) -> WaitResult:
+        """
+        Wait until predicate resolves for one object, driven by watch events.
+        
+        Lists the object once, then watches it from the list's resourceVersion,
+        re-listing if the watch ends early or the version expires (410).
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        Args:
+            kind: "pod", "deployment" or "statefulset"
+            name: Object name
+            namespace: Kubernetes namespace
+            predicate: Called with the object as JSON (None while absent);
+                True = met, False = give up, None = keep waiting
+            timeout: Timeout in seconds
+            description: Condition description for logs
+            
+        Returns:
+            WaitResult (also kept as last_wait / in wait_history)
+        """
+        self._ensure_k8s_available()
+        if kind not in WATCH_API_PATHS:
+            raise ValueError(f"Cannot wait on kind '{kind}'")
+        
+        description = description or f"{kind} '{name}'"
+        self.logger.debug(f"Waiting for {description} (timeout: {timeout}s)...")
+        started_at = time.time()
+        deadline = time.monotonic() + timeout
+        events = 0
+        obj = None
+        verdict = None
+        
+        while verdict is None and time.monotonic() < deadline:
             try:
-                if self.use_ssh_fallback:
-                    # Use kubectl via SSH to check if pod exists
-                    cmd = f"get pod {pod_name}"
-                    result = self._execute_kubectl_via_ssh(cmd, timeout=10)
-                    
-                    if not result["success"]:
-                        # Pod doesn't exist anymore (deleted)
-                        self.logger.debug(f"Pod '{pod_name}' deleted successfully")
-                        return
-                    
-                    self.logger.debug(f"Pod '{pod_name}' still exists, waiting...")
-                else:
-                    self.k8s_core_v1.read_namespaced_pod(
-                        name=pod_name,
-                        namespace=namespace
-                    )
-                    self.logger.debug(f"Pod '{pod_name}' still exists, waiting...")
+                obj, resource_version = self._list_watched_object(kind, name, namespace)
+                verdict = predicate(obj)
+                if verdict is not None:
+                    break
                 
-            except ApiException as e:
-                if e.status == 404:  # Pod not found, meaning it's deleted
-                    self.logger.debug(f"Pod '{pod_name}' deleted successfully")
-                    return
-                else:
-                    raise InfrastructureError(f"K8s API error while waiting for pod deletion: {e}") from e
+                remaining = deadline - time.monotonic()
+                for event_type, event_obj in self._watch_object_events(
+                    kind, name, namespace, resource_version, remaining
+                ):
+                    if event_type == "ERROR":
+                        self.logger.debug(f"Watch error while waiting for {description}, re-listing: {event_obj}")
+                        break
+                    if event_type == "BOOKMARK":
+                        continue
+                    events += 1
+                    obj = None if event_type == "DELETED" else event_obj
+                    verdict = predicate(obj)
+                    if verdict is not None or time.monotonic() >= deadline:
+                        break
+                    
+            except Exception as e:
+                self.logger.warning(f"Error while waiting for {description}: {e}")
+                time.sleep(min(1.0, max(0.0, deadline - time.monotonic())))
+        
+        result = WaitResult(
+            description=description,
+            condition_met=verdict is True,
+            started_at=started_at,
+            finished_at=time.time(),
+            events=events,
+            last_object=obj
+        )
+        self.last_wait = result
+        self.wait_history.append(result)
+        
+        if result.condition_met:
+            self.logger.debug(f"{description} after {result.elapsed_seconds:.3f}s ({events} watch events)")
+        elif verdict is False:
+            self.logger.warning(f"Gave up waiting for {description} after {result.elapsed_seconds:.3f}s")
+        else:
+            self.logger.warning(f"Timed out waiting for {description} after {timeout}s")
+        return result
+    
+    def list_objects_json(
+        self,
+        kind: str,
+        namespace: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        timeout: int = 30,
+        predicate: Optional[ItemPredicate] = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        List objects of a kind in API JSON form.
+        
+        In SSH mode the response is decoded item by item as it arrives, so a
+        list of hundreds of pods is never held as raw JSON and decoded
+        objects at once; with a predicate, only the matching items are kept.
+        
+        Args:
+            kind: One of WATCH_API_PATHS (pod, job, deployment, statefulset)
+            namespace: Kubernetes namespace (default: configured namespace)
+            field_selector: Optional field selector
+            timeout: Timeout in seconds
+            predicate: Keep only the items for which it returns True
+                (e.g. `lambda pod: pod["metadata"]["name"].startswith("grpc-job-")`)
             
-            time.sleep(5)
+        Returns:
+            (items, list resourceVersion)
+        """
+        self._ensure_k8s_available()
+        if kind not in WATCH_API_PATHS:
+            raise ValueError(f"Unsupported kind '{kind}', expected one of {sorted(WATCH_API_PATHS)}")
+        if not namespace:
+            namespace = self.k8s_config.get("namespace", "panda")
+        
+        if self.use_ssh_fallback:
+            path = WATCH_API_PATHS[kind].format(namespace=namespace)
+            params = {"fieldSelector": field_selector} if field_selector else None
+            query = f"?fieldSelector={quote(field_selector)}" if field_selector else ""
+            return self._kubectl_list_json(
+                path, f"get --raw '{path}{query}'", f"{kind} list",
+                params=params, timeout=timeout, predicate=predicate
+            )
+        
+        kwargs = {"field_selector": field_selector} if field_selector else {}
+        listing = self._watch_list_function(kind)(namespace, **kwargs)
+        api_client = self.k8s_core_v1.api_client
+        items = [api_client.sanitize_for_serialization(item) for item in listing.items]
+        if predicate is not None:
+            items = [item for item in items if predicate(item)]
+        return items, listing.metadata.resource_version
+    
+    def _list_watched_object(self, kind: str, name: str, namespace: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Current object as JSON (None if absent) and the list resourceVersion."""
+        items, resource_version = self.list_objects_json(
+            kind, namespace, field_selector=f"metadata.name={name}", timeout=10
+        )
+        return (items[0] if items else None), resource_version
+    
+    def _watch_object_events(
+        self,
+        kind: str,
+        name: str,
+        namespace: str,
+        resource_version: str,
+        timeout: float
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Yield (event type, object JSON) for one object until the watch ends."""
+        field_selector = f"metadata.name={name}"
+        timeout_seconds = max(1, int(timeout + 0.999))
         
-        raise InfrastructureError(f"Pod '{pod_name}' was not deleted within {timeout} seconds")
+        if self.use_ssh_fallback:
+            path = WATCH_API_PATHS[kind].format(namespace=namespace)
+            query = (
+                f"watch=1&allowWatchBookmarks=true&fieldSelector={quote(field_selector)}"
+                f"&resourceVersion={quote(resource_version)}&timeoutSeconds={timeout_seconds}"
+            )
+            for line in self._stream_kubectl_via_ssh(f"get --raw '{path}?{query}'", timeout=timeout + 5):
+                if line.strip():
+                    event = json.loads(line)
+                    yield event.get("type", ""), event.get("object")
+            return
+        
+        watcher = watch.Watch()
+        try:
+            for event in watcher.stream(
+                self._watch_list_function(kind),
+                namespace,
+                field_selector=field_selector,
+                resource_version=resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=timeout_seconds
+            ):
+                yield event["type"], event.get("raw_object")
+        except ApiException as e:
+            if e.status != 410:
+                raise
+            yield "ERROR", {"code": 410, "message": str(e)}
+        finally:
+            watcher.stop()
+    
+    def _watch_list_function(self, kind: str) -> Callable:
+        if kind == "pod":
+            return self.k8s_core_v1.list_namespaced_pod
+        if kind == "deployment":
+            return self.k8s_apps_v1.list_namespaced_deployment
+        if kind == "job":
+            return self.k8s_batch_v1.list_namespaced_job
+        return self.k8s_apps_v1.list_namespaced_stateful_set
     
     def get_cluster_info(self) -> Dict[str, Any]:
         """
@@ -1107,42 +1544,41 @@ class KubernetesManager:
     
     def _get_pod_by_name_via_ssh(self, pod_name: str, namespace: str) -> Optional[Dict[str, Any]]:
         """Get pod by name via SSH kubectl command."""
-        cmd = f"get pod {pod_name} -n {namespace} -o json"
-        result = self._execute_kubectl_via_ssh(cmd, timeout=30)
-        
-        if not result["success"]:
-            if "NotFound" in result.get("stderr", ""):
-                return None
-            raise InfrastructureError(f"Failed to get pod via SSH: {result['stderr']}")
+        pod_data = self._kubectl_get_json(
+            f"/api/v1/namespaces/{namespace}/pods/{quote(pod_name)}",
+            f"get pod {pod_name} -n {namespace} -o json",
+            "pod"
+        )
+        if pod_data is None:
+            return None
         
-        try:
-            pod_data = json.loads(result["stdout"])
-            metadata = pod_data.get("metadata", {})
-            spec = pod_data.get("spec", {})
-            status = pod_data.get("status", {})
-            conditions = status.get("conditions", [])
-            
-            ready_condition = next((c for c in conditions if c.get("type") == "Ready"), None)
-            ready = "True" if ready_condition and ready_condition.get("status") == "True" else "False"
-            
-            container_statuses = status.get("containerStatuses", [])
-            restart_count = container_statuses[0].get("restartCount", 0) if container_statuses else 0
-            
-            pod_info = {
-                "name": metadata.get("name"),
-                "namespace": metadata.get("namespace"),
-                "status": status.get("phase", "Unknown"),
-                "ready": ready,
-                "restart_count": restart_count,
-                "node_name": spec.get("nodeName"),
-                "labels": metadata.get("labels", {}),
-                "creation_timestamp": metadata.get("creationTimestamp")
-            }
-            
-            return pod_info
-            
-        except json.JSONDecodeError as e:
-            raise InfrastructureError(f"Failed to parse kubectl output as JSON: {e}") from e
+        pod_info = self._pod_info_from_json(pod_data)
+        pod_info["creation_timestamp"] = pod_data.get("metadata", {}).get("creationTimestamp")
+        return pod_info
+    
+    @staticmethod
+    def _pod_info_from_json(pod_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Pod summary dict from a pod in API JSON form."""
+        metadata = pod_data.get("metadata", {})
+        spec = pod_data.get("spec", {})
+        status = pod_data.get("status", {})
+        conditions = status.get("conditions", [])
+        
+        ready_condition = next((c for c in conditions if c.get("type") == "Ready"), None)
+        ready = "True" if ready_condition and ready_condition.get("status") == "True" else "False"
+        
+        container_statuses = status.get("containerStatuses", [])
+        restart_count = container_statuses[0].get("restartCount", 0) if container_statuses else 0
+        
+        return {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "status": status.get("phase", "Unknown"),
+            "ready": ready,
+            "restart_count": restart_count,
+            "node_name": spec.get("nodeName"),
+            "labels": metadata.get("labels", {})
+        }
     
     def get_pod_status(self, pod_name: str, namespace: Optional[str] = None) -> str:
         """
@@ -1164,6 +1600,9 @@ class KubernetesManager:
         """
         Wait for pod to become ready.
         
+        Returns on the watch event that makes the pod ready; the timing is
+        kept in last_wait.
+        
         Args:
             pod_name: Name of the pod
             namespace: Kubernetes namespace (defaults to configured namespace)
@@ -1175,28 +1614,18 @@ class KubernetesManager:
         if not namespace:
             namespace = self.k8s_config.get("namespace", "default")
         
-        self.logger.debug(f"Waiting for pod '{pod_name}' to be ready (timeout: {timeout}s)...")
-        
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            pod_info = self.get_pod_by_name(pod_name, namespace)
-            
-            if pod_info:
-                status = pod_info.get("status", "Unknown")
-                ready = pod_info.get("ready", "False")
-                
-                if status == "Running" and ready == "True":
-                    self.logger.debug(f"Pod '{pod_name}' is ready")
-                    return True
-                
-                if status in ["Failed", "Unknown"]:
-                    self.logger.warning(f"Pod '{pod_name}' entered unexpected state: {status}")
-                    return False
-            
-            time.sleep(2)
-        
-        self.logger.warning(f"Pod '{pod_name}' did not become ready within {timeout} seconds")
-        return False
+        result = self.wait_for_object(
+            "pod", pod_name, namespace, _pod_ready_verdict,
+            timeout=timeout, description=f"pod '{pod_name}' ready"
+        )
+        if result.condition_met:
+            self.logger.debug(f"Pod '{pod_name}' is ready")
+        elif result.last_object is not None and _pod_ready_verdict(result.last_object) is False:
+            phase = (result.last_object.get("status") or {}).get("phase", "Unknown")
+            self.logger.warning(f"Pod '{pod_name}' entered unexpected state: {phase}")
+        else:
+            self.logger.warning(f"Pod '{pod_name}' did not become ready within {timeout} seconds")
+        return result.condition_met
     
     def restart_pod(self, pod_name: str, namespace: Optional[str] = None) -> bool:
         """
@@ -1292,52 +1721,16 @@ class KubernetesManager:
             namespace: Kubernetes namespace
             timeout: Timeout in seconds
         """
-        self.logger.debug(f"Waiting for StatefulSet '{statefulset_name}' to reach {expected_replicas} replicas...")
-        
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                if self.use_ssh_fallback:
-                    # Use kubectl via SSH to check StatefulSet status
-                    cmd = f"get statefulset {statefulset_name} -o json"
-                    result = self._execute_kubectl_via_ssh(cmd, timeout=10)
-                    
-                    if result["success"]:
-                        statefulset_data = json.loads(result["stdout"])
-                        status = statefulset_data.get("status", {})
-                        ready_replicas = status.get("readyReplicas", 0) or 0
-                        
-                        if ready_replicas == expected_replicas:
-                            self.logger.debug(f"StatefulSet '{statefulset_name}' reached {expected_replicas} replicas")
-                            return
-                        
-                        self.logger.debug(f"StatefulSet '{statefulset_name}' has {ready_replicas} ready replicas, waiting...")
-                    else:
-                        self.logger.warning(f"Failed to get StatefulSet status via SSH: {result['stderr']}")
-                else:
-                    statefulset = self.k8s_apps_v1.read_namespaced_stateful_set(
-                        name=statefulset_name,
-                        namespace=namespace
-                    )
-                    
-                    ready_replicas = statefulset.status.ready_replicas or 0
-                    
-                    if ready_replicas == expected_replicas:
-                        self.logger.debug(f"StatefulSet '{statefulset_name}' reached {expected_replicas} replicas")
-                        return
-                    
-                    self.logger.debug(f"StatefulSet '{statefulset_name}' has {ready_replicas} ready replicas, waiting...")
-                
-            except ApiException as e:
-                self.logger.warning(f"K8s API error while waiting for StatefulSet scale: {e}")
-            except Exception as e:
-                self.logger.warning(f"Error while waiting for StatefulSet scale: {e}")
-            
-            time.sleep(5)
-        
-        raise InfrastructureError(
-            f"StatefulSet '{statefulset_name}' did not reach {expected_replicas} replicas within {timeout} seconds"
+        result = self.wait_for_object(
+            "statefulset", statefulset_name, namespace,
+            lambda statefulset: _ready_replicas(statefulset) == expected_replicas or None,
+            timeout=timeout,
+            description=f"StatefulSet '{statefulset_name}' at {expected_replicas} ready replicas"
         )
+        if not result.condition_met:
+            raise InfrastructureError(
+                f"StatefulSet '{statefulset_name}' did not reach {expected_replicas} replicas within {timeout} seconds"
+            )
     
     def get_ingress(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -1403,49 +1796,44 @@ class KubernetesManager:
     
     def _get_ingress_via_ssh(self, namespace: str) -> List[Dict[str, Any]]:
         """Get Ingress resources via SSH kubectl command."""
-        cmd = f"get ingress -n {namespace} -o json"
-        result = self._execute_kubectl_via_ssh(cmd, timeout=30)
-        
-        if not result["success"]:
-            raise InfrastructureError(f"Failed to get Ingress via SSH: {result['stderr']}")
-        
-        try:
-            ingress_data = json.loads(result["stdout"])
-            ingress_list = []
-            
-            for item in ingress_data.get("items", []):
-                metadata = item.get("metadata", {})
-                spec = item.get("spec", {})
-                
-                rules = []
-                for rule in spec.get("rules", []):
-                    paths = []
-                    http = rule.get("http", {})
-                    for path in http.get("paths", []):
-                        backend = path.get("backend", {})
-                        service = backend.get("service", {})
-                        paths.append({
-                            "path": path.get("path"),
-                            "path_type": path.get("pathType"),
-                            "service_name": service.get("name"),
-                            "service_port": service.get("port", {}).get("number")
-                        })
-                    rules.append({
-                        "host": rule.get("host"),
-                        "paths": paths
+        ingress_data = self._kubectl_get_json(
+            f"/apis/networking.k8s.io/v1/namespaces/{namespace}/ingresses",
+            f"get ingress -n {namespace} -o json",
+            "Ingress"
+        ) or {}
+        ingress_list = []
+        
+        for item in ingress_data.get("items", []):
+            metadata = item.get("metadata", {})
+            spec = item.get("spec", {})
+            
+            rules = []
+            for rule in spec.get("rules", []):
+                paths = []
+                http = rule.get("http", {})
+                for path in http.get("paths", []):
+                    backend = path.get("backend", {})
+                    service = backend.get("service", {})
+                    paths.append({
+                        "path": path.get("path"),
+                        "path_type": path.get("pathType"),
+                        "service_name": service.get("name"),
+                        "service_port": service.get("port", {}).get("number")
                     })
-                
-                ingress_info = {
-                    "name": metadata.get("name"),
-                    "namespace": metadata.get("namespace"),
-                    "rules": rules,
-                    "labels": metadata.get("labels", {})
-                }
-                ingress_list.append(ingress_info)
+                rules.append({
+                    "host": rule.get("host"),
+                    "paths": paths
+                })
             
-            return ingress_list
-        except json.JSONDecodeError as e:
-            raise InfrastructureError(f"Failed to parse Ingress JSON: {e}") from e
+            ingress_info = {
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
+                "rules": rules,
+                "labels": metadata.get("labels", {})
+            }
+            ingress_list.append(ingress_info)
+        
+        return ingress_list
     
     def get_services(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -1503,42 +1891,35 @@ class KubernetesManager:
     
     def _get_services_via_ssh(self, namespace: str) -> List[Dict[str, Any]]:
         """Get Services via SSH kubectl command."""
-        cmd = f"get svc -n {namespace} -o json"
-        result = self._execute_kubectl_via_ssh(cmd, timeout=30)
-        
-        if not result["success"]:
-            raise InfrastructureError(f"Failed to get Services via SSH: {result['stderr']}")
+        svc_data = self._kubectl_get_json(
+            f"/api/v1/namespaces/{namespace}/services", f"get svc -n {namespace} -o json", "Services"
+        ) or {}
+        service_list = []
+        
+        for item in svc_data.get("items", []):
+            metadata = item.get("metadata", {})
+            spec = item.get("spec", {})
+            
+            ports = []
+            for port in spec.get("ports", []):
+                ports.append({
+                    "name": port.get("name"),
+                    "port": port.get("port"),
+                    "target_port": port.get("targetPort"),
+                    "protocol": port.get("protocol", "TCP")
+                })
+            
+            service_info = {
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
+                "type": spec.get("type", "ClusterIP"),
+                "cluster_ip": spec.get("clusterIP"),
+                "ports": ports,
+                "labels": metadata.get("labels", {})
+            }
+            service_list.append(service_info)
         
-        try:
-            svc_data = json.loads(result["stdout"])
-            service_list = []
-            
-            for item in svc_data.get("items", []):
-                metadata = item.get("metadata", {})
-                spec = item.get("spec", {})
-                
-                ports = []
-                for port in spec.get("ports", []):
-                    ports.append({
-                        "name": port.get("name"),
-                        "port": port.get("port"),
-                        "target_port": port.get("targetPort"),
-                        "protocol": port.get("protocol", "TCP")
-                    })
-                
-                service_info = {
-                    "name": metadata.get("name"),
-                    "namespace": metadata.get("namespace"),
-                    "type": spec.get("type", "ClusterIP"),
-                    "cluster_ip": spec.get("clusterIP"),
-                    "ports": ports,
-                    "labels": metadata.get("labels", {})
-                }
-                service_list.append(service_info)
-            
-            return service_list
-        except json.JSONDecodeError as e:
-            raise InfrastructureError(f"Failed to parse Services JSON: {e}") from e
+        return service_list
     
     def get_endpoints(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -1612,56 +1993,49 @@ class KubernetesManager:
     
     def _get_endpoints_via_ssh(self, namespace: str) -> List[Dict[str, Any]]:
         """Get Endpoints via SSH kubectl command."""
-        cmd = f"get endpoints -n {namespace} -o json"
-        result = self._execute_kubectl_via_ssh(cmd, timeout=30)
-        
-        if not result["success"]:
-            raise InfrastructureError(f"Failed to get Endpoints via SSH: {result['stderr']}")
-        
-        try:
-            ep_data = json.loads(result["stdout"])
-            endpoint_list = []
-            
-            for item in ep_data.get("items", []):
-                metadata = item.get("metadata", {})
-                subsets_data = item.get("subsets", [])
+        ep_data = self._kubectl_get_json(
+            f"/api/v1/namespaces/{namespace}/endpoints", f"get endpoints -n {namespace} -o json", "Endpoints"
+        ) or {}
+        endpoint_list = []
+        
+        for item in ep_data.get("items", []):
+            metadata = item.get("metadata", {})
+            subsets_data = item.get("subsets", [])
+            
+            subsets = []
+            for subset in subsets_data:
+                addresses = []
+                for addr in subset.get("addresses", []):
+                    target_ref = addr.get("targetRef", {})
+                    addresses.append({
+                        "ip": addr.get("ip"),
+                        "hostname": addr.get("hostname"),
+                        "target_ref": {
+                            "kind": target_ref.get("kind"),
+                            "name": target_ref.get("name"),
+                            "namespace": target_ref.get("namespace")
+                        } if target_ref else None
+                    })
                 
-                subsets = []
-                for subset in subsets_data:
-                    addresses = []
-                    for addr in subset.get("addresses", []):
-                        target_ref = addr.get("targetRef", {})
-                        addresses.append({
-                            "ip": addr.get("ip"),
-                            "hostname": addr.get("hostname"),
-                            "target_ref": {
-                                "kind": target_ref.get("kind"),
-                                "name": target_ref.get("name"),
-                                "namespace": target_ref.get("namespace")
-                            } if target_ref else None
-                        })
-                    
-                    ports = []
-                    for port in subset.get("ports", []):
-                        ports.append({
-                            "name": port.get("name"),
-                            "port": port.get("port"),
-                            "protocol": port.get("protocol", "TCP")
-                        })
-                    
-                    subsets.append({
-                        "addresses": addresses,
-                        "ports": ports
+                ports = []
+                for port in subset.get("ports", []):
+                    ports.append({
+                        "name": port.get("name"),
+                        "port": port.get("port"),
+                        "protocol": port.get("protocol", "TCP")
                     })
                 
-                endpoint_info = {
-                    "name": metadata.get("name"),
-                    "namespace": metadata.get("namespace"),
-                    "subsets": subsets,
-                    "labels": metadata.get("labels", {})
-                }
-                endpoint_list.append(endpoint_info)
+                subsets.append({
+                    "addresses": addresses,
+                    "ports": ports
+                })
             
-            return endpoint_list
-        except json.JSONDecodeError as e:
-            raise InfrastructureError(f"Failed to parse Endpoints JSON: {e}") from e
+            endpoint_info = {
+                "name": metadata.get("name"),
+                "namespace": metadata.get("namespace"),
+                "subsets": subsets,
+                "labels": metadata.get("labels", {})
+            }
+            endpoint_list.append(endpoint_info)
+        
+        return endpoint_list
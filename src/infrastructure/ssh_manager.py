@@ -5,13 +5,18 @@ SSH Manager
 SSH infrastructure manager for remote operations and node access.
 """
 
+import asyncio
 import logging
 import time
 import os
+import re
+import select
 import sys
 import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Tuple
 
 import paramiko
 from paramiko import SSHClient, AutoAddPolicy
@@ -20,6 +25,89 @@ from src.core.exceptions import InfrastructureError, NetworkError
 from config.config_manager import ConfigManager
 
 
+# Concurrent command channels on the SSH connection (sshd MaxSessions defaults
+# to 10; the rest is left for streams, kubectl proxy and port forwards)
+DEFAULT_MAX_CHANNELS = 8
+
+# Retries of a channel open the server refused (MaxSessions reached)
+CHANNEL_OPEN_RETRIES = 3
+
+
+class LocalPortForward:
+    """
+    Local TCP listener on 127.0.0.1 tunnelling every accepted connection to
+    remote_host:remote_port through its own direct-tcpip channel of one SSH
+    transport (the equivalent of `ssh -L`).
+    """
+    
+    def __init__(self, transport: paramiko.Transport, remote_host: str, remote_port: int, local_port: int = 0):
+        self.transport = transport
+        self.remote_host = remote_host
+        self.remote_port = remote_port
+        self.logger = logging.getLogger(__name__)
+        
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", local_port))
+        self._server.listen(64)
+        self.local_port = self._server.getsockname()[1]
+        
+        self._closed = threading.Event()
+        self._accept_thread = threading.Thread(
+            target=self._accept_loop, name=f"ssh-forward-{self.local_port}", daemon=True
+        )
+        self._accept_thread.start()
+    
+    @property
+    def active(self) -> bool:
+        """True while listening and the SSH transport is up."""
+        return not self._closed.is_set() and self.transport.is_active()
+    
+    def close(self):
+        """Stop listening; open tunnels end with their connections."""
+        self._closed.set()
+        try:
+            self._server.close()
+        except OSError:
+            pass
+    
+    def _accept_loop(self):
+        while not self._closed.is_set():
+            try:
+                client, address = self._server.accept()
+            except OSError:
+                break
+            try:
+                channel = self.transport.open_channel(
+                    "direct-tcpip", (self.remote_host, self.remote_port), address
+                )
+            except Exception as e:
+                self.logger.warning(f"Port forward to {self.remote_host}:{self.remote_port} failed: {e}")
+                client.close()
+                continue
+            threading.Thread(target=self._pump, args=(client, channel), daemon=True).start()
+    
+    def _pump(self, client: socket.socket, channel: Any):
+        try:
+            while not self._closed.is_set():
+                readable, _, _ = select.select([client, channel], [], [], 1.0)
+                if client in readable:
+                    data = client.recv(65536)
+                    if not data:
+                        break
+                    channel.sendall(data)
+                if channel in readable:
+                    data = channel.recv(65536)
+                    if not data:
+                        break
+                    client.sendall(data)
+        except (OSError, EOFError, paramiko.SSHException):
+            pass
+        finally:
+            channel.close()
+            client.close()
+
+
 class SSHManager:
     """
     SSH infrastructure manager for remote operations.
@@ -86,6 +174,13 @@ class SSHManager:
         self.connected = False
         self.use_jump_host = False
         
+        # Command channel pool: all commands share the one authenticated
+        # transport (and jump-host hop); at most max_channels run at once
+        self.max_channels = int(self.ssh_config.get("max_channels", DEFAULT_MAX_CHANNELS))
+        self._channel_slots = threading.BoundedSemaphore(self.max_channels)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
         self.logger.info("SSH manager initialized")
     
     def connect(self) -> bool:
@@ -335,6 +430,11 @@ class SSHManager:
     
     def disconnect(self):
         """Disconnect from SSH server."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+        
         if self.ssh_client and self.connected:
             self.ssh_client.close()
             self.ssh_client = None
@@ -365,11 +465,31 @@ class SSHManager:
         if not self.connected:
             raise InfrastructureError("SSH not connected")
         
+        # Wait for a free channel slot (counts against the command timeout)
+        if not self._channel_slots.acquire(timeout=timeout):
+            raise InfrastructureError(
+                f"No free SSH channel within {timeout}s ({self.max_channels} in use): {command}"
+            )
+        try:
+            return self._execute_on_channel(command, timeout)
+        finally:
+            self._channel_slots.release()
+    
+    def _execute_on_channel(self, command: str, timeout: int) -> Dict[str, Any]:
+        """Run one command on a new session channel of the shared transport."""
         try:
             self.logger.debug(f"Executing command: {command} (timeout: {timeout}s)")
             
-            # Execute command
-            stdin, stdout, stderr = self.ssh_client.exec_command(command, timeout=timeout)
+            # Execute command (the server may refuse a channel while other
+            # clients hold sessions: back off and retry)
+            for attempt in range(CHANNEL_OPEN_RETRIES + 1):
+                try:
+                    stdin, stdout, stderr = self.ssh_client.exec_command(command, timeout=timeout)
+                    break
+                except paramiko.ChannelException as e:
+                    if attempt == CHANNEL_OPEN_RETRIES:
+                        raise InfrastructureError(f"SSH channel refused: {e}") from e
+                    time.sleep(0.1 * 2 ** attempt)
             
             # Set timeout on channel to prevent hanging
             stdout.channel.settimeout(timeout)
@@ -407,6 +527,8 @@ class SSHManager:
             
             return result
             
+        except InfrastructureError:
+            raise
         except socket.timeout:
             raise InfrastructureError(f"Command timed out after {timeout} seconds: {command}") from None
         except paramiko.SSHException as e:
@@ -414,6 +536,265 @@ class SSHManager:
         except Exception as e:
             raise InfrastructureError(f"Unexpected error during command execution: {e}") from e
     
+    def submit_command(self, command: str, timeout: int = 60) -> "Future[Dict[str, Any]]":
+        """
+        Run execute_command in the channel pool without waiting for it.
+        
+        Returns:
+            Future resolving to the execute_command result (or raising its
+            InfrastructureError)
+        """
+        if not self.connected:
+            raise InfrastructureError("SSH not connected")
+        
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_channels, thread_name_prefix="ssh-channel"
+                )
+            return self._executor.submit(self.execute_command, command, timeout)
+    
+    def execute_many(self, commands: Sequence[str], timeout: int = 60) -> List[Dict[str, Any]]:
+        """
+        Execute commands in parallel over the one SSH connection.
+        
+        At most max_channels run at once. A command that cannot be executed
+        (timeout, channel error) does not affect the others: its result has
+        success False, exit_code None and the error as stderr.
+        
+        Args:
+            commands: Commands to execute
+            timeout: Timeout per command in seconds
+            
+        Returns:
+            execute_command results, in the order of commands
+        """
+        futures = [self.submit_command(command, timeout) for command in commands]
+        results = []
+        for command, future in zip(commands, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                self.logger.warning(f"Command failed: {command}: {e}")
+                results.append({
+                    "command": command,
+                    "exit_code": None,
+                    "stdout": "",
+                    "stderr": str(e),
+                    "success": False
+                })
+        return results
+    
+    async def execute_command_async(self, command: str, timeout: int = 60) -> Dict[str, Any]:
+        """Awaitable execute_command running in the channel pool."""
+        return await asyncio.wrap_future(self.submit_command(command, timeout))
+    
+    def stream_lines(self, command: str, timeout: float = 60) -> Iterator[str]:
+        """
+        Execute a command and yield its stdout line by line as it arrives.
+        
+        Meant for long-running commands such as kubectl watches: the stream
+        ends at EOF or after `timeout` seconds, and closing the generator
+        (e.g. breaking out of the loop) closes the channel. The command holds
+        one of the max_channels slots until then.
+        
+        Args:
+            command: Command to execute
+            timeout: Maximum streaming time in seconds
+            
+        Yields:
+            Decoded stdout lines without line terminators
+            
+        Raises:
+            InfrastructureError: If no channel slot frees up within `timeout`
+                or the channel cannot be opened
+        """
+        deadline = time.monotonic() + timeout
+        if not self._channel_slots.acquire(timeout=timeout):
+            raise InfrastructureError(
+                f"No free SSH channel within {timeout}s ({self.max_channels} in use): {command}"
+            )
+        try:
+            channel = self._open_exec_channel(command)
+            self.logger.debug(f"Streaming command: {command} (timeout: {timeout}s)")
+            buffer = b""
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.logger.debug(f"Stream reached its {timeout}s limit: {command}")
+                        return
+                    channel.settimeout(min(remaining, 1.0))
+                    try:
+                        data = channel.recv(65536)
+                    except socket.timeout:
+                        continue
+                    if not data:
+                        break
+                    buffer += data
+                    *lines, buffer = buffer.split(b"\n")
+                    for line in lines:
+                        yield line.decode("utf-8", errors="replace").rstrip("\r")
+                if buffer:
+                    yield buffer.decode("utf-8", errors="replace").rstrip("\r")
+            finally:
+                channel.close()
+        finally:
+            self._channel_slots.release()
+    
+    def stream_stdout(self, command: str, timeout: float = 60, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Execute a command and yield its raw stdout in chunks as they arrive.
+        
+        Unlike execute_command, the output is never held in memory as a
+        whole; pair it with kubectl_list_stream.iter_list_items to decode
+        large `kubectl get -o json` lists item by item. The command holds
+        one of the max_channels slots until the stream ends or is closed.
+        
+        Args:
+            command: Command to execute
+            timeout: Command timeout in seconds
+            chunk_size: Maximum bytes per chunk
+            
+        Yields:
+            stdout bytes
+            
+        Raises:
+            InfrastructureError: If the command cannot be executed, times
+                out or exits non-zero (the message includes its stderr)
+        """
+        if not self._channel_slots.acquire(timeout=timeout):
+            raise InfrastructureError(
+                f"No free SSH channel within {timeout}s ({self.max_channels} in use): {command}"
+            )
+        try:
+            channel = self._open_exec_channel(command)
+            self.logger.debug(f"Streaming stdout of: {command} (timeout: {timeout}s)")
+            deadline = time.monotonic() + timeout
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise InfrastructureError(f"Command timed out after {timeout} seconds: {command}")
+                    channel.settimeout(min(remaining, 1.0))
+                    try:
+                        data = channel.recv(chunk_size)
+                    except socket.timeout:
+                        continue
+                    if not data:
+                        break
+                    yield data
+                
+                exit_code = channel.recv_exit_status()
+                if exit_code != 0:
+                    stderr = b""
+                    while channel.recv_stderr_ready():
+                        stderr += channel.recv_stderr(65536)
+                    raise InfrastructureError(
+                        f"Command failed with exit code {exit_code}: {command}: "
+                        f"{stderr.decode('utf-8', errors='replace').strip()}"
+                    )
+            finally:
+                channel.close()
+        finally:
+            self._channel_slots.release()
+    
+    def _open_exec_channel(self, command: str) -> Any:
+        """Open a session channel on the shared transport and start command on it."""
+        if not self.connected:
+            raise InfrastructureError("SSH not connected")
+        
+        try:
+            # Same back-off as _execute_on_channel when the server refuses
+            # the channel (MaxSessions reached by other clients)
+            for attempt in range(CHANNEL_OPEN_RETRIES + 1):
+                try:
+                    channel = self.ssh_client.get_transport().open_session()
+                    break
+                except paramiko.ChannelException as e:
+                    if attempt == CHANNEL_OPEN_RETRIES:
+                        raise InfrastructureError(f"SSH channel refused: {e}") from e
+                    time.sleep(0.1 * 2 ** attempt)
+            channel.exec_command(command)
+        except paramiko.SSHException as e:
+            raise InfrastructureError(f"SSH command execution failed: {e}") from e
+        return channel
+    
+    def start_background_command(
+        self,
+        command: str,
+        ready_pattern: str,
+        timeout: float = 15
+    ) -> Tuple[paramiko.Channel, "re.Match"]:
+        """
+        Start a long-running command on its own channel and wait until its
+        output matches ready_pattern.
+        
+        The command runs on a pseudo-terminal, so closing the returned channel
+        (or losing the connection) hangs it up.
+        
+        Args:
+            command: Command to execute (e.g. `kubectl proxy --port=0`)
+            ready_pattern: Regex that the output matches once the command is ready
+            timeout: Startup timeout in seconds
+            
+        Returns:
+            (open channel, ready_pattern match)
+            
+        Raises:
+            InfrastructureError: If not connected, or the command exits or
+                does not become ready in time
+        """
+        if not self.connected:
+            raise InfrastructureError("SSH not connected")
+        
+        try:
+            channel = self.ssh_client.get_transport().open_session()
+            channel.get_pty()
+            channel.exec_command(command)
+        except paramiko.SSHException as e:
+            raise InfrastructureError(f"SSH command execution failed: {e}") from e
+        
+        pattern = re.compile(ready_pattern)
+        deadline = time.monotonic() + timeout
+        output = ""
+        while True:
+            match = pattern.search(output)
+            if match:
+                self.logger.debug(f"Background command ready: {command}")
+                return channel, match
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            channel.settimeout(min(remaining, 1.0))
+            try:
+                data = channel.recv(4096)
+            except socket.timeout:
+                continue
+            if not data:
+                break
+            output += data.decode("utf-8", errors="replace")
+        
+        channel.close()
+        raise InfrastructureError(f"Command did not become ready within {timeout}s: {command}: {output[-500:]}")
+    
+    def forward_local_port(self, remote_host: str, remote_port: int, local_port: int = 0) -> LocalPortForward:
+        """
+        Forward a local port to remote_host:remote_port over the SSH connection.
+        
+        Args:
+            remote_host: Host as seen from the SSH server (e.g. 127.0.0.1)
+            remote_port: Port on remote_host
+            local_port: Local port (0 picks a free one)
+            
+        Returns:
+            LocalPortForward; close() it when done
+        """
+        if not self.connected:
+            raise InfrastructureError("SSH not connected")
+        return LocalPortForward(self.ssh_client.get_transport(), remote_host, remote_port, local_port)
+    
     def execute_sudo_command(self, command: str, timeout: int = 60) -> Dict[str, Any]:
         """
         Execute a sudo command on the remote server.
@@ -15,6 +15,8 @@ try:
 except ImportError:
     FLASK_AVAILABLE = False
 
+from src.sentinel.api.run_query import RunQuery, etag_matches
+from src.sentinel.core.run_event_bus import anomaly_summary, run_summary
 from src.sentinel.main.sentinel_service import SentinelService
 from config.config_manager import ConfigManager
 
@@ -85,25 +87,20 @@ class SentinelAPI:
         })
     
     def list_runs(self):
-        """List runs with optional filters."""
-        pipeline = request.args.get("pipeline")
-        environment = request.args.get("environment")
-        status = request.args.get("status")
-        limit = int(request.args.get("limit", 100))
-        offset = int(request.args.get("offset", 0))
+        """List runs with optional filters (keyset cursor, field projection, ETag)."""
+        try:
+            query = RunQuery.from_args(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         
-        runs = self.sentinel_service.query_runs(
-            pipeline=pipeline,
-            environment=environment,
-            status=status,
-            limit=limit,
-            offset=offset
-        )
+        # Version is read before the query: a concurrent write can only make
+        # the tag stale (one extra full response), never hide new data
+        etag = query.etag(self.sentinel_service.history_version())
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return "", 304, headers
         
-        return jsonify({
-            "runs": runs,
-            "count": len(runs)
-        })
+        return jsonify(query.execute(self.sentinel_service)), 200, headers
     
     def get_run(self, run_id: str):
         """Get a specific run."""
@@ -111,23 +108,7 @@ class SentinelAPI:
         if not context:
             return jsonify({"error": "Run not found"}), 404
         
-        # Convert to dict
-        run_data = {
-            "run_id": context.run_id,
-            "pipeline": context.pipeline,
-            "environment": context.environment,
-            "branch": context.branch,
-            "commit": context.commit,
-            "status": context.status.value,
-            "start_time": context.start_time.isoformat() if context.start_time else None,
-            "end_time": context.end_time.isoformat() if context.end_time else None,
-            "duration_seconds": context.duration_seconds(),
-            "total_tests": context.total_tests(),
-            "passed_tests": context.passed_tests(),
-            "failed_tests": context.failed_tests(),
-            "anomalies_count": len(context.anomalies),
-            "suites": list(context.suites.keys())
-        }
+        run_data = run_summary(context)
         
         return jsonify(run_data)
     
@@ -137,18 +118,7 @@ class SentinelAPI:
         if not context:
             return jsonify({"error": "Run not found"}), 404
         
-        anomalies = [
-            {
-                "anomaly_id": a.anomaly_id,
-                "severity": a.severity.value,
-                "category": a.category.value,
-                "title": a.title,
-                "description": a.description,
-                "timestamp": a.timestamp.isoformat(),
-                "affected_component": a.affected_component
-            }
-            for a in context.anomalies
-        ]
+        anomalies = [anomaly_summary(a) for a in context.anomalies]
         
         return jsonify({
             "run_id": run_id,
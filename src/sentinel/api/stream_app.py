@@ -0,0 +1,309 @@
+"""
+Sentinel Async API
+==================
+
+aiohttp server mode of the Sentinel API: the REST endpoints of SentinelAPI
+plus live run feeds pushed from SentinelService callbacks through its
+RunEventBus.
+
+Streams:
+- GET /api/runs/{run_id}/events  Server-sent events for one run; starts with
+  a `snapshot` of the run, ends after the run reaches a final status (right
+  after the snapshot if it already has one)
+- GET /api/events                Server-sent events of all runs
+                                 (?run_id=..., ?types=test,anomaly)
+- GET /api/runs/{run_id}/ws      The same feed over a WebSocket (JSON messages)
+
+SSE events carry `id: <seq>`; a client reconnecting with Last-Event-ID gets
+the events it missed (while still in the bus replay ring) instead of a new
+snapshot. Each subscriber has its own bounded queue, so N watchers cost one
+fan-out per event rather than N polling loops rebuilding the run dict.
+
+Usage:
+    ```python
+    api = SentinelStreamAPI(sentinel_service)
+    api.run(host="0.0.0.0", port=5000)
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+try:
+    from aiohttp import WSMsgType, web
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+from src.sentinel.api.run_query import RunQuery, etag_matches
+from src.sentinel.core.models import RunStatus
+from src.sentinel.core.run_event_bus import RunEvent, Subscription, anomaly_summary, run_summary
+from src.sentinel.main.sentinel_service import SentinelService
+
+
+FINAL_RUN_STATUSES = {
+    RunStatus.COMPLETED.value, RunStatus.FAILED.value, RunStatus.CANCELLED.value
+}
+
+
+def _is_run_end(event: RunEvent) -> bool:
+    return event.event_type == "run" and event.data.get("status") in FINAL_RUN_STATUSES
+
+
+def _is_finished(context) -> bool:
+    return context is not None and context.status.value in FINAL_RUN_STATUSES
+
+
+class SentinelStreamAPI:
+    """
+    Async REST + streaming API for Automation Run Sentinel.
+
+    Provides endpoints for:
+    - Run queries and statistics
+    - Webhook ingestion
+    - Health checks
+    - Live run feeds (SSE / WebSocket)
+    """
+
+    def __init__(self, sentinel_service: SentinelService, heartbeat_seconds: float = 15.0):
+        """
+        Initialize API.
+
+        Args:
+            sentinel_service: SentinelService instance
+            heartbeat_seconds: Idle interval between SSE keep-alives / WebSocket pings
+        """
+        self.sentinel_service = sentinel_service
+        self.event_bus = sentinel_service.event_bus
+        self.heartbeat_seconds = heartbeat_seconds
+        self.logger = logging.getLogger(__name__)
+
+        if AIOHTTP_AVAILABLE:
+            self.app = web.Application()
+            self._register_routes()
+        else:
+            self.logger.warning("aiohttp not available, async API will not be functional")
+            self.app = None
+
+    def _register_routes(self):
+        """Register API routes."""
+        router = self.app.router
+
+        # Health check
+        router.add_get("/health", self.health)
+        router.add_get("/ready", self.ready)
+
+        # Run endpoints
+        router.add_get("/api/runs", self.list_runs)
+        router.add_get("/api/runs/{run_id}", self.get_run)
+        router.add_get("/api/runs/{run_id}/anomalies", self.get_run_anomalies)
+
+        # Live feeds
+        router.add_get("/api/events", self.stream_events)
+        router.add_get("/api/runs/{run_id}/events", self.stream_events)
+        router.add_get("/api/runs/{run_id}/ws", self.run_websocket)
+
+        # Webhook endpoints
+        router.add_post("/api/webhooks/{source:github|jenkins|generic}", self.webhook)
+
+        # Statistics
+        router.add_get("/api/stats", self.get_stats)
+
+    # -------------------------------------------------------------------------
+    # REST
+    # -------------------------------------------------------------------------
+
+    async def health(self, request):
+        """Health check endpoint."""
+        return web.json_response({
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "service": "automation-run-sentinel"
+        })
+
+    async def ready(self, request):
+        """Readiness check endpoint."""
+        return web.json_response({
+            "status": "ready",
+            "timestamp": datetime.now().isoformat()
+        })
+
+    async def list_runs(self, request):
+        """List runs with optional filters (database read runs off the loop, 304 on ETag match)."""
+        try:
+            query = RunQuery.from_args(request.query)
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        etag = query.etag(self.sentinel_service.history_version())
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return web.Response(status=304, headers=headers)
+
+        body = await asyncio.get_running_loop().run_in_executor(
+            None, query.execute, self.sentinel_service
+        )
+        return web.json_response(body, headers=headers, dumps=self._dumps)
+
+    async def get_run(self, request):
+        """Get a specific run."""
+        context = self.sentinel_service.get_run(request.match_info["run_id"])
+        if not context:
+            return web.json_response({"error": "Run not found"}, status=404)
+        return web.json_response(run_summary(context))
+
+    async def get_run_anomalies(self, request):
+        """Get anomalies for a run."""
+        run_id = request.match_info["run_id"]
+        context = self.sentinel_service.get_run(run_id)
+        if not context:
+            return web.json_response({"error": "Run not found"}, status=404)
+
+        anomalies = [anomaly_summary(a) for a in context.anomalies]
+        return web.json_response({"run_id": run_id, "anomalies": anomalies, "count": len(anomalies)})
+
+    async def webhook(self, request):
+        """Handle GitHub Actions / Jenkins / generic webhooks."""
+        source = request.match_info["source"]
+        try:
+            webhook_data = await request.json()
+            context = await asyncio.get_running_loop().run_in_executor(
+                None, self.sentinel_service.detect_run_from_webhook, webhook_data
+            )
+            if context:
+                return web.json_response({"status": "detected", "run_id": context.run_id})
+            return web.json_response({
+                "status": "not_detected",
+                "message": "Run not detected from webhook data"
+            })
+
+        except Exception as e:
+            self.logger.error(f"Error processing {source} webhook: {e}", exc_info=True)
+            return web.json_response({"error": str(e)}, status=500)
+
+    async def get_stats(self, request):
+        """Get service statistics."""
+        return web.json_response({
+            "active_runs": len(self.sentinel_service.get_active_runs()),
+            "event_stream": self.event_bus.stats(),
+            "timestamp": datetime.now().isoformat()
+        })
+
+    # -------------------------------------------------------------------------
+    # Live feeds
+    # -------------------------------------------------------------------------
+
+    def _subscribe(self, request, run_id: Optional[str]) -> Subscription:
+        types = request.query.get("types")
+        last_event_id = request.headers.get("Last-Event-ID") or request.query.get("last_event_id")
+        return self.event_bus.subscribe(
+            run_id=run_id,
+            event_types=types.split(",") if types else None,
+            last_seq=int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+        )
+
+    async def _next_events(self, subscription: Subscription) -> List[RunEvent]:
+        """Wait for the next event, then take everything else already queued."""
+        event = await subscription.get(timeout=self.heartbeat_seconds)
+        return [event] + subscription.drain() if event else []
+
+    async def stream_events(self, request):
+        """Server-sent events feed of one run or all runs."""
+        run_id = request.match_info.get("run_id") or request.query.get("run_id")
+        per_run = "run_id" in request.match_info
+        context = self.sentinel_service.get_run(run_id) if run_id else None
+        if per_run and context is None:
+            return web.json_response({"error": "Run not found"}, status=404)
+
+        subscription = self._subscribe(request, run_id)
+        response = web.StreamResponse(headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        })
+        try:
+            await response.prepare(request)
+            if context is not None and not request.headers.get("Last-Event-ID"):
+                await response.write(f"event: snapshot\ndata: {self._dumps(run_summary(context))}\n\n".encode())
+
+            if per_run and _is_finished(context):
+                # Nothing more is published for a finished run: send what was replayed and end
+                replayed = subscription.drain()
+                if replayed:
+                    await response.write(self._sse(replayed))
+                return response
+
+            while True:
+                events = await self._next_events(subscription)
+                if not events:
+                    await response.write(b": keep-alive\n\n")
+                    continue
+                await response.write(self._sse(events))
+                if per_run and any(_is_run_end(event) for event in events):
+                    break
+        except (ConnectionResetError, asyncio.CancelledError):
+            self.logger.debug(f"Event stream subscriber for {run_id or 'all runs'} disconnected")
+            raise
+        finally:
+            self.event_bus.unsubscribe(subscription)
+
+        return response
+
+    async def run_websocket(self, request):
+        """WebSocket feed of one run (snapshot message, then one message per event)."""
+        run_id = request.match_info["run_id"]
+        context = self.sentinel_service.get_run(run_id)
+        if context is None:
+            return web.json_response({"error": "Run not found"}, status=404)
+
+        ws = web.WebSocketResponse(heartbeat=self.heartbeat_seconds)
+        await ws.prepare(request)
+        subscription = self._subscribe(request, run_id)
+        # Reading is what processes the client's close / ping frames
+        reader = asyncio.ensure_future(self._read_until_closed(ws))
+        try:
+            await ws.send_str(self._dumps({"type": "snapshot", "run_id": run_id, "data": run_summary(context)}))
+            while not _is_finished(context) and not ws.closed and not reader.done():
+                events = await self._next_events(subscription)
+                for event in events:
+                    await ws.send_str(event.payload)
+                if any(_is_run_end(event) for event in events):
+                    break
+        except ConnectionResetError:
+            self.logger.debug(f"WebSocket subscriber for {run_id} disconnected")
+        finally:
+            self.event_bus.unsubscribe(subscription)
+            reader.cancel()
+            await ws.close()
+
+        return ws
+
+    @staticmethod
+    async def _read_until_closed(ws):
+        async for message in ws:
+            if message.type == WSMsgType.ERROR:
+                break
+
+    @staticmethod
+    def _sse(events: List[RunEvent]) -> bytes:
+        return "".join(
+            f"id: {event.seq}\nevent: {event.event_type}\ndata: {event.payload}\n\n"
+            for event in events
+        ).encode()
+
+    @staticmethod
+    def _dumps(data) -> str:
+        return json.dumps(data, default=str)
+
+    def run(self, host: str = "0.0.0.0", port: int = 5000):
+        """Run the API server (blocks until interrupted)."""
+        if not self.app:
+            raise RuntimeError("aiohttp not available, cannot run async API server")
+
+        web.run_app(self.app, host=host, port=port, print=None)
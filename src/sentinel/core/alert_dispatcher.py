@@ -3,13 +3,24 @@ Alert Dispatcher
 ================
 
 Delivers alerts to configured channels (Slack, email, webhooks).
+
+Delivery is asynchronous: dispatch_anomaly() only checks the cooldown and
+hands the anomaly to one worker thread per channel, so a slow SMTP server or
+webhook never stalls SentinelService callbacks. Each worker has a bounded
+queue (oldest alerts dropped when full), retries failed sends with
+exponential backoff, and coalesces anomalies of the same run, category and
+component: the first is sent at once, the ones following it within
+`coalesce_window_seconds` go out as one digest when the window closes.
 """
 
 import logging
 import json
+import threading
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Dict, List, Optional, Callable
-from dataclasses import asdict
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from dataclasses import asdict, dataclass, field
 
 import requests
 from requests.exceptions import RequestException
@@ -17,6 +28,226 @@ from requests.exceptions import RequestException
 from src.sentinel.core.models import Anomaly, AnomalySeverity, RunContext
 
 
+SEVERITY_ORDER = {
+    AnomalySeverity.INFO: 1,
+    AnomalySeverity.WARNING: 2,
+    AnomalySeverity.CRITICAL: 3
+}
+
+# Defaults of the `alert_delivery` config section
+DEFAULT_DELIVERY = {
+    "async": True,                  # False sends inline from dispatch_anomaly()
+    "queue_size": 1000,             # Alerts buffered per channel
+    "coalesce_window_seconds": 60,  # 0 disables digests
+    "max_retries": 3,
+    "retry_backoff_seconds": 2.0,   # Doubled per attempt
+    "max_backoff_seconds": 60.0,
+    "cooldown_max_entries": 10000,
+}
+
+# Anomalies listed in a digest description
+DIGEST_MAX_LINES = 20
+
+
+def digest_anomaly(anomalies: List[Anomaly]) -> Anomaly:
+    """Summarize anomalies coalesced within one window as a single anomaly."""
+    first = anomalies[0]
+    component = first.affected_component
+    lines = [f"- [{a.severity.value}] {a.title}" for a in anomalies[:DIGEST_MAX_LINES]]
+    if len(anomalies) > DIGEST_MAX_LINES:
+        lines.append(f"- ... and {len(anomalies) - DIGEST_MAX_LINES} more")
+    
+    return Anomaly(
+        run_id=first.run_id,
+        severity=max((a.severity for a in anomalies), key=lambda s: SEVERITY_ORDER.get(s, 0)),
+        category=first.category,
+        title=f"{len(anomalies)} more {first.category.value} anomalies" + (f" on {component}" if component else ""),
+        description="\n".join(lines),
+        affected_component=component,
+        metadata={
+            "digest": True,
+            "count": len(anomalies),
+            "anomaly_ids": [a.anomaly_id for a in anomalies],
+        },
+        root_cause_hints=list(dict.fromkeys(h for a in anomalies for h in a.root_cause_hints))[:10]
+    )
+
+
+class _CooldownMap:
+    """Alert key -> time first alerted, evicted after the TTL and capped in size."""
+    
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, float]" = OrderedDict()  # Insertion (= time) order
+        self._lock = threading.Lock()
+    
+    def acquire(self, key: str) -> bool:
+        """Record key and return True, or False if it is still in cooldown."""
+        now = time.monotonic()
+        with self._lock:
+            while self._entries:
+                oldest_key, alerted = next(iter(self._entries.items()))
+                if now - alerted < self.ttl_seconds:
+                    break
+                del self._entries[oldest_key]
+            
+            if key in self._entries:
+                return False
+            self._entries[key] = now
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class _AlertGroup:
+    """Anomalies coalesced for one (run, category, component) window."""
+    context: RunContext
+    opened: float
+    anomalies: List[Anomaly] = field(default_factory=list)
+
+
+class _ChannelWorker:
+    """Background delivery for one channel: bounded queue, coalescing and retries."""
+    
+    def __init__(self, name: str, send: Callable[[Anomaly, RunContext], None], settings: Dict[str, Any]):
+        self.name = name
+        self._send = send
+        self.window = settings["coalesce_window_seconds"]
+        self.max_retries = settings["max_retries"]
+        self.backoff = settings["retry_backoff_seconds"]
+        self.max_backoff = settings["max_backoff_seconds"]
+        self.logger = logging.getLogger(__name__)
+        
+        self._queue: Deque[Tuple[Anomaly, RunContext]] = deque(maxlen=settings["queue_size"])
+        self._cond = threading.Condition()
+        self._groups: "OrderedDict[tuple, _AlertGroup]" = OrderedDict()  # Worker thread only
+        self._busy = False
+        self._flush_requested = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"queued": 0, "sent": 0, "failed": 0, "retries": 0, "dropped": 0, "coalesced": 0}
+    
+    def submit(self, anomaly: Anomaly, context: RunContext):
+        """Queue an alert (drops the oldest queued one when full)."""
+        with self._cond:
+            if len(self._queue) == self._queue.maxlen:
+                self.stats["dropped"] += 1
+            self._queue.append((anomaly, context))
+            self.stats["queued"] += 1
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(
+                    target=self._run, name=f"sentinel-alerts-{self.name}", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send everything queued, including open digests; True if done in time."""
+        with self._cond:
+            if self._thread is None:
+                return True
+            self._flush_requested = True
+            self._cond.notify()
+            return self._cond.wait_for(
+                lambda: not (self._queue or self._busy or self._flush_requested), timeout
+            )
+    
+    def stop(self, timeout: Optional[float] = None):
+        """Send what is queued (without backoff waits) and stop the thread."""
+        with self._cond:
+            thread = self._thread
+            self._stopping = True
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+            with self._cond:
+                # A worker still sending after the timeout stays registered
+                # (so submit() does not start a second one); it clears
+                # itself when it exits
+                if self._thread is thread and not thread.is_alive():
+                    self._thread = None
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while not (self._queue or self._stopping or self._flush_requested):
+                    wait = self._next_due()
+                    if wait is not None and wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                items = list(self._queue)
+                self._queue.clear()
+                force = self._stopping or self._flush_requested
+                stopping = self._stopping
+                self._busy = True
+            
+            for anomaly, context in items:
+                self._accept(anomaly, context)
+            self._send_due(force)
+            
+            with self._cond:
+                self._busy = False
+                if force and not self._queue:
+                    self._flush_requested = False
+                self._cond.notify_all()
+                if stopping and not self._queue:
+                    if self._thread is threading.current_thread():
+                        self._thread = None
+                    return
+    
+    def _next_due(self) -> Optional[float]:
+        if not self._groups:
+            return None
+        return min(group.opened for group in self._groups.values()) + self.window - time.monotonic()
+    
+    def _accept(self, anomaly: Anomaly, context: RunContext):
+        if self.window <= 0:
+            self._deliver(anomaly, context)
+            return
+        
+        key = (context.run_id, anomaly.category.value, anomaly.affected_component)
+        group = self._groups.get(key)
+        if group is None:
+            # Leading edge: the first alert of a burst is never delayed
+            self._groups[key] = _AlertGroup(context, time.monotonic())
+            self._deliver(anomaly, context)
+        else:
+            group.anomalies.append(anomaly)
+            self.stats["coalesced"] += 1
+    
+    def _send_due(self, force: bool):
+        now = time.monotonic()
+        for key, group in list(self._groups.items()):
+            if force or now - group.opened >= self.window:
+                del self._groups[key]
+                if group.anomalies:
+                    self._deliver(digest_anomaly(group.anomalies), group.context)
+    
+    def _deliver(self, anomaly: Anomaly, context: RunContext):
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._send(anomaly, context)
+                self.stats["sent"] += 1
+                return
+            except Exception as e:
+                if attempt == self.max_retries or self._stopping:
+                    break
+                delay = min(self.backoff * 2 ** attempt, self.max_backoff)
+                self.stats["retries"] += 1
+                self.logger.warning(f"{self.name} alert failed ({e}), retrying in {delay:.1f}s")
+                with self._cond:
+                    self._cond.wait_for(lambda: self._stopping, delay)
+        
+        self.stats["failed"] += 1
+        self.logger.error(f"Giving up on {self.name} alert for anomaly {anomaly.anomaly_id}")
+
+
 class AlertDispatcher:
     """
     Dispatches alerts to configured channels.
@@ -26,6 +257,7 @@ class AlertDispatcher:
     - Email (SMTP)
     - Generic webhooks
     - Multiple channels with severity filtering
+    - Per-channel background delivery with retries and digests
     """
     
     def __init__(self, config: Optional[Dict] = None):
@@ -37,21 +269,33 @@ class AlertDispatcher:
         """
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
+        self.delivery = {**DEFAULT_DELIVERY, **self.config.get("alert_delivery", {})}
         
         # Load alert channels from config
         self.channels = self._load_channels()
         
         # Alert history (to prevent spam)
-        self._recent_alerts: Dict[str, datetime] = {}
         self._alert_cooldown_seconds = self.config.get("alert_cooldown_seconds", 300)
+        self._cooldowns = _CooldownMap(self._alert_cooldown_seconds, self.delivery["cooldown_max_entries"])
+        
+        self._workers: Dict[str, _ChannelWorker] = {}
+        if self.delivery["async"]:
+            for channel in self.channels:
+                if channel["enabled"]:
+                    self._workers[channel["name"]] = _ChannelWorker(
+                        channel["name"],
+                        lambda anomaly, context, channel=channel: self._send_alert(anomaly, context, channel),
+                        self.delivery
+                    )
     
     def _load_channels(self) -> List[Dict]:
         """Load alert channels from configuration."""
         channels = []
         
         config_channels = self.config.get("channels", [])
-        for channel_config in config_channels:
+        for index, channel_config in enumerate(config_channels):
             channel = {
+                "name": channel_config.get("name") or f"{channel_config.get('type')}-{index}",
                 "type": channel_config.get("type"),  # slack, email, webhook
                 "webhook_url": channel_config.get("webhook_url"),
                 "email_to": channel_config.get("to", []),
@@ -66,20 +310,21 @@ class AlertDispatcher:
         """
         Dispatch an anomaly alert to appropriate channels.
         
+        Returns once the alert is queued; channel workers do the sending.
+        
         Args:
             anomaly: Anomaly to alert about
             context: RunContext
         """
         # Check cooldown
         alert_key = f"{anomaly.anomaly_id}:{anomaly.severity.value}"
-        if self._is_in_cooldown(alert_key):
+        if not self._cooldowns.acquire(alert_key):
             self.logger.debug(f"Alert {alert_key} is in cooldown, skipping")
             return
         
         # Mark as alerted
         anomaly.alerted = True
         anomaly.alert_timestamp = datetime.now()
-        self._recent_alerts[alert_key] = datetime.now()
         
         # Dispatch to each channel
         for channel in self.channels:
@@ -90,37 +335,50 @@ class AlertDispatcher:
             if not self._meets_severity_threshold(anomaly.severity, channel["severity_min"]):
                 continue
             
+            worker = self._workers.get(channel["name"])
+            if worker is not None:
+                worker.submit(anomaly, context)
+                continue
+            
             try:
-                if channel["type"] == "slack":
-                    self._send_slack_alert(anomaly, context, channel)
-                elif channel["type"] == "email":
-                    self._send_email_alert(anomaly, context, channel)
-                elif channel["type"] == "webhook":
-                    self._send_webhook_alert(anomaly, context, channel)
+                self._send_alert(anomaly, context, channel)
             except Exception as e:
                 self.logger.error(f"Error sending alert to {channel['type']}: {e}", exc_info=True)
     
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send all queued alerts and open digests now.
+        
+        Returns:
+            True if every channel finished within timeout
+        """
+        return all([worker.flush(timeout) for worker in self._workers.values()])
+    
+    def stop(self, timeout: Optional[float] = 10.0):
+        """Deliver queued alerts and open digests, then stop the channel workers."""
+        for worker in self._workers.values():
+            worker.stop(timeout)
+    
+    def get_delivery_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-channel delivery counters (queued, sent, failed, retries, dropped, coalesced)."""
+        return {name: dict(worker.stats) for name, worker in self._workers.items()}
+    
+    def _send_alert(self, anomaly: Anomaly, context: RunContext, channel: Dict):
+        """Send one alert (or digest) to a channel; raises on delivery failure."""
+        if channel["type"] == "slack":
+            self._send_slack_alert(anomaly, context, channel)
+        elif channel["type"] == "email":
+            self._send_email_alert(anomaly, context, channel)
+        elif channel["type"] == "webhook":
+            self._send_webhook_alert(anomaly, context, channel)
+    
     def _meets_severity_threshold(
         self,
         severity: AnomalySeverity,
         min_severity: AnomalySeverity
     ) -> bool:
         """Check if severity meets channel threshold."""
-        severity_order = {
-            AnomalySeverity.INFO: 1,
-            AnomalySeverity.WARNING: 2,
-            AnomalySeverity.CRITICAL: 3
-        }
-        return severity_order.get(severity, 0) >= severity_order.get(min_severity, 0)
-    
-    def _is_in_cooldown(self, alert_key: str) -> bool:
-        """Check if alert is in cooldown period."""
-        if alert_key not in self._recent_alerts:
-            return False
-        
-        last_alert = self._recent_alerts[alert_key]
-        elapsed = (datetime.now() - last_alert).total_seconds()
-        return elapsed < self._alert_cooldown_seconds
+        return SEVERITY_ORDER.get(severity, 0) >= SEVERITY_ORDER.get(min_severity, 0)
     
     def _send_slack_alert(self, anomaly: Anomaly, context: RunContext, channel: Dict):
         """Send alert to Slack webhook."""
@@ -66,7 +66,8 @@ class AnomalyEngine:
             "test_failure_rate_threshold": 0.5,  # 50%
             "test_stuck_threshold_minutes": 30,
             "error_rate_spike_threshold": 0.2,  # 20% increase
-            "test_duration_deviation_threshold": 0.5,  # 50% increase
+            "test_duration_deviation_threshold": 0.5,  # 50% above baseline p95
+            "baseline_min_runs": 5,  # History needed before duration rules fire
         }
         
         config_thresholds = self.config.get("anomaly_thresholds", {})
@@ -311,7 +312,7 @@ class AnomalyEngine:
         
         # Check failure rate
         if context.total_tests() > 0:
-            failure_rate = context.failed_tests() / context.total_tests()
+            failure_rate = context.failure_rate()
             if failure_rate > self.thresholds["test_failure_rate_threshold"]:
                 anomaly = Anomaly(
                     run_id=context.run_id,
@@ -342,6 +343,92 @@ class AnomalyEngine:
         
         return anomalies[0] if anomalies else None
     
+    def detect_duration_regression(
+        self,
+        context: RunContext,
+        baseline: Dict,
+        test_baselines: Optional[Dict[str, Dict]] = None
+    ) -> List[Anomaly]:
+        """
+        Detect run and test durations regressing past their baseline p95.
+        
+        A duration regresses when it exceeds p95 * (1 + test_duration_deviation_threshold).
+        Baselines with fewer than baseline_min_runs runs are ignored. All
+        regressed tests are reported in one anomaly.
+        
+        Args:
+            context: Finished RunContext
+            baseline: RunHistoryStore.get_baseline() result
+            test_baselines: RunHistoryStore.get_test_baselines() result
+            
+        Returns:
+            Detected anomalies
+        """
+        anomalies = []
+        factor = 1 + self.thresholds["test_duration_deviation_threshold"]
+        min_runs = self.thresholds["baseline_min_runs"]
+        
+        duration = context.duration_seconds()
+        p95 = baseline.get("duration_p95")
+        if duration and p95 and baseline.get("run_count", 0) >= min_runs and duration > p95 * factor:
+            anomalies.append(Anomaly(
+                run_id=context.run_id,
+                timestamp=datetime.now(),
+                severity=AnomalySeverity.WARNING,
+                category=AnomalyCategory.TEST,
+                title=f"Run duration regression: {duration:.0f}s vs p95 {p95:.0f}s",
+                description=(
+                    f"Run took {duration:.0f}s, {duration / p95:.1f}x the baseline p95 "
+                    f"of {p95:.0f}s over {baseline['run_count']} runs"
+                ),
+                metadata={"duration": duration, "baseline_p95": p95, "baseline_runs": baseline["run_count"]},
+                root_cause_hints=[
+                    "Compare slowest tests with the previous runs",
+                    "Check cluster resource pressure",
+                    "Review recent changes to test setup"
+                ]
+            ))
+        
+        regressed = []
+        for test_id, test_baseline in (test_baselines or {}).items():
+            test = context.tests.get(test_id)
+            test_p95 = test_baseline.get("duration_p95")
+            if test is None or not test_p95 or test_baseline.get("run_count", 0) < min_runs:
+                continue
+            test_duration = test.duration_seconds
+            if isinstance(test_duration, (int, float)) and test_duration > test_p95 * factor:
+                regressed.append((test_duration / test_p95, test_id, test_duration, test_p95))
+        
+        if regressed:
+            regressed.sort(reverse=True)
+            worst = [
+                {"test_id": test_id, "duration": test_duration, "baseline_p95": test_p95}
+                for _, test_id, test_duration, test_p95 in regressed[:10]
+            ]
+            anomalies.append(Anomaly(
+                run_id=context.run_id,
+                timestamp=datetime.now(),
+                severity=AnomalySeverity.WARNING,
+                category=AnomalyCategory.TEST,
+                title=f"{len(regressed)} test(s) slower than baseline p95",
+                description=(
+                    f"{len(regressed)} test(s) exceeded their baseline p95 duration by more than "
+                    f"{self.thresholds['test_duration_deviation_threshold']:.0%}; slowest: "
+                    f"{worst[0]['test_id']} ({worst[0]['duration']:.1f}s vs {worst[0]['baseline_p95']:.1f}s)"
+                ),
+                affected_test=worst[0]["test_id"],
+                metadata={"regressed_count": len(regressed), "worst": worst},
+                root_cause_hints=[
+                    "Check the slowest tests for new waits or retries",
+                    "Check backing services for latency"
+                ]
+            ))
+        
+        for anomaly in anomalies:
+            self._notify_anomaly(anomaly, context)
+        
+        return anomalies
+    
     def detect_structure_violation(
         self,
         violation: StructureViolation,
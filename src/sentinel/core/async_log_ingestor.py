@@ -0,0 +1,502 @@
+"""
+Async Log Ingestor
+==================
+
+Follows many pod logs on one asyncio event loop.
+
+LogStreamer used to start one daemon thread per pod, each blocking on a
+kubernetes Watch over read_namespaced_pod_log. Those threads could not be
+stopped and load runs with dozens of grpc-job-* pods leaked them.
+AsyncLogIngestor instead runs a single event loop thread; every followed pod
+is a pair of tasks on that loop:
+
+- a reader, which streams ``GET /api/v1/namespaces/{ns}/pods/{pod}/log``
+  (follow=true, timestamps=true) and reconnects with exponential backoff,
+  resuming from the last seen timestamp (``sinceTime``) without repeating
+  lines it already delivered
+- a dispatcher, which hands lines from a bounded per-pod buffer to the
+  line callback
+
+When a buffer is full the overflow policy decides what happens:
+
+- ``block``: the reader waits, which pushes back on the API server
+  connection (no lines lost)
+- ``drop_newest`` / ``drop_oldest``: lines are dropped and counted
+- ``sample``: above ``sample_watermark`` only every ``sample_every``-th
+  line is buffered; when full, new lines are dropped
+
+unfollow()/stop() cancel the tasks and close the HTTP streams.
+
+Usage:
+    ```python
+    ingestor = AsyncLogIngestor(KubernetesPodLogSource(), buffer_lines=5000)
+    ingestor.start()
+    ingestor.follow("run-1:grpc-job-0:panda", "grpc-job-0", "panda", on_line)
+    ...
+    ingestor.stop()
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import logging
+import ssl
+import threading
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_SAMPLE = "sample"
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST, OVERFLOW_SAMPLE)
+
+STATE_CONNECTING = "connecting"
+STATE_STREAMING = "streaming"
+STATE_BACKOFF = "backoff"
+STATE_FINISHED = "finished"
+
+_END = object()  # End-of-stream marker in a stream buffer
+
+
+class PodLogGone(Exception):
+    """The pod (or its log) no longer exists; the stream will not reconnect."""
+
+
+# =============================================================================
+# Log Source
+# =============================================================================
+
+class KubernetesPodLogSource:
+    """
+    Streams pod logs from the Kubernetes API with aiohttp.
+
+    Credentials come from the kubernetes client configuration, so call
+    kubernetes.config.load_kube_config()/load_incluster_config() first.
+    """
+
+    def __init__(self, configuration=None, connect_timeout_seconds: float = 10.0):
+        """
+        Args:
+            configuration: kubernetes.client.Configuration (default: the
+                           loaded default configuration)
+            connect_timeout_seconds: Connect timeout per request
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for KubernetesPodLogSource")
+        if configuration is None:
+            from kubernetes import client
+            configuration = client.Configuration.get_default_copy()
+        self.configuration = configuration
+        self.connect_timeout_seconds = connect_timeout_seconds
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _ssl(self):
+        cfg = self.configuration
+        if not cfg.verify_ssl:
+            return False
+        context = ssl.create_default_context(cafile=cfg.ssl_ca_cert)
+        if cfg.cert_file:
+            context.load_cert_chain(cfg.cert_file, cfg.key_file)
+        return context
+
+    def _headers(self) -> Dict[str, str]:
+        cfg = self.configuration
+        if cfg.refresh_api_key_hook is not None:
+            cfg.refresh_api_key_hook(cfg)
+        token = cfg.get_api_key_with_prefix("authorization")
+        return {"Authorization": token} if token else {}
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=self._ssl()),
+                timeout=aiohttp.ClientTimeout(total=None, connect=self.connect_timeout_seconds),
+            )
+        return self._session
+
+    def _pod_url(self, pod_name: str, namespace: str) -> str:
+        return f"{self.configuration.host}/api/v1/namespaces/{namespace}/pods/{pod_name}"
+
+    async def stream(
+        self,
+        pod_name: str,
+        namespace: str,
+        since_time: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Yield "<RFC3339 timestamp> <text>" log lines until the stream ends.
+
+        Raises:
+            PodLogGone: If the pod does not exist (404)
+            aiohttp.ClientError: On other HTTP or connection errors
+        """
+        params = {"follow": "true", "timestamps": "true"}
+        if since_time:
+            params["sinceTime"] = since_time
+        async with self._get_session().get(
+            f"{self._pod_url(pod_name, namespace)}/log",
+            params=params,
+            headers=self._headers(),
+            proxy=self.configuration.proxy,
+        ) as response:
+            if response.status == 404:
+                raise PodLogGone(f"Pod {namespace}/{pod_name} not found")
+            response.raise_for_status()
+
+            # Split on newlines ourselves: StreamReader line iteration fails on
+            # lines longer than its buffer limit
+            pending = b""
+            async for chunk in response.content.iter_any():
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    yield line.decode("utf-8", errors="replace").rstrip("\r")
+            if pending:
+                yield pending.decode("utf-8", errors="replace").rstrip("\r")
+
+    async def is_finished(self, pod_name: str, namespace: str) -> bool:
+        """True if the pod is gone or has terminated (no more log lines)."""
+        async with self._get_session().get(
+            self._pod_url(pod_name, namespace),
+            headers=self._headers(),
+            proxy=self.configuration.proxy,
+        ) as response:
+            if response.status == 404:
+                return True
+            response.raise_for_status()
+            pod = await response.json()
+        return pod.get("status", {}).get("phase") in ("Succeeded", "Failed")
+
+    async def close(self):
+        """Close the HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+# =============================================================================
+# Ingestor
+# =============================================================================
+
+@dataclass
+class PodLogStream:
+    """State of one followed pod log."""
+    stream_id: str
+    pod_name: str
+    namespace: str
+    on_line: Callable[[str], None]
+    queue: asyncio.Queue = field(repr=False)
+    state: str = STATE_CONNECTING
+    lines_received: int = 0
+    lines_dispatched: int = 0
+    lines_dropped: int = 0
+    duplicates_skipped: int = 0
+    reconnects: int = 0
+    errors: int = 0
+    last_timestamp: Optional[str] = None
+    lines_at_last_timestamp: int = 0
+    tasks: List[asyncio.Task] = field(default_factory=list, repr=False)
+
+    # Resume bookkeeping: lines at last_timestamp still to skip after reconnect
+    _resume_skip: int = field(default=0, repr=False)
+    _resuming: bool = field(default=False, repr=False)
+    _sample_counter: int = field(default=0, repr=False)
+
+    def to_dict(self) -> Dict:
+        return {
+            "pod_name": self.pod_name,
+            "namespace": self.namespace,
+            "state": self.state,
+            "buffered": self.queue.qsize(),
+            "lines_received": self.lines_received,
+            "lines_dispatched": self.lines_dispatched,
+            "lines_dropped": self.lines_dropped,
+            "duplicates_skipped": self.duplicates_skipped,
+            "reconnects": self.reconnects,
+            "errors": self.errors,
+            "last_timestamp": self.last_timestamp,
+        }
+
+
+class AsyncLogIngestor:
+    """
+    Multiplexes followed pod logs on one event loop thread.
+
+    follow()/unfollow()/stop() are thread-safe; line callbacks run on the
+    ingestor's loop thread.
+    """
+
+    def __init__(
+        self,
+        source,
+        buffer_lines: int = 10_000,
+        overflow_policy: str = OVERFLOW_BLOCK,
+        sample_every: int = 10,
+        sample_watermark: float = 0.8,
+        reconnect_delay_seconds: float = 1.0,
+        max_reconnect_delay_seconds: float = 30.0,
+        on_finished: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Args:
+            source: Log source with async stream(pod, namespace, since_time)
+                    and is_finished(pod, namespace); e.g. KubernetesPodLogSource
+            buffer_lines: Max buffered lines per pod
+            overflow_policy: block, drop_newest, drop_oldest or sample
+            sample_every: Keep every Nth line above the sample watermark (sample policy)
+            sample_watermark: Buffer fill ratio where sampling starts (sample policy)
+            reconnect_delay_seconds: First reconnect delay (doubles per failure)
+            max_reconnect_delay_seconds: Reconnect delay cap
+            on_finished: Called with the stream_id when a pod's log has ended
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}, got {overflow_policy!r}")
+        if buffer_lines < 1:
+            raise ValueError("buffer_lines must be >= 1")
+
+        self.source = source
+        self.buffer_lines = buffer_lines
+        self.overflow_policy = overflow_policy
+        self.sample_every = max(1, sample_every)
+        self.sample_watermark = sample_watermark
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self.max_reconnect_delay_seconds = max_reconnect_delay_seconds
+        self.on_finished = on_finished
+
+        self.streams: Dict[str, PodLogStream] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Thread-safe API
+    # -------------------------------------------------------------------------
+
+    def start(self):
+        """Start the event loop thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._run_loop, name="sentinel-log-ingestor", daemon=True
+            )
+            self._thread.start()
+        logger.info("Async log ingestor started")
+
+    def stop(self, timeout: float = 10.0):
+        """Cancel all streams, close the source and stop the loop thread."""
+        with self._lock:
+            thread, loop = self._thread, self._loop
+            self._thread = None
+        if thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Log ingestor shutdown did not complete cleanly: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        logger.info("Async log ingestor stopped")
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def follow(self, stream_id: str, pod_name: str, namespace: str, on_line: Callable[[str], None]) -> bool:
+        """
+        Start following a pod log.
+
+        Returns:
+            False if stream_id is already followed, True otherwise
+        """
+        return self._call(self._follow(stream_id, pod_name, namespace, on_line))
+
+    def unfollow(self, stream_id: str) -> bool:
+        """
+        Stop following a pod log; buffered lines are discarded.
+
+        Returns:
+            False if stream_id was not followed, True otherwise
+        """
+        return self._call(self._unfollow(stream_id))
+
+    def stream_ids(self) -> List[str]:
+        """IDs of followed streams."""
+        return list(self.streams)
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-stream counters."""
+        return {stream_id: stream.to_dict() for stream_id, stream in list(self.streams.items())}
+
+    def _call(self, coro):
+        if self._thread is None:
+            self.start()
+        if threading.current_thread() is self._thread:
+            # Called from a line callback: cannot block on our own loop
+            self._loop.create_task(coro)
+            return True
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    # -------------------------------------------------------------------------
+    # Loop-side coroutines
+    # -------------------------------------------------------------------------
+
+    async def _follow(self, stream_id: str, pod_name: str, namespace: str, on_line) -> bool:
+        if stream_id in self.streams:
+            return False
+        stream = PodLogStream(
+            stream_id=stream_id,
+            pod_name=pod_name,
+            namespace=namespace,
+            on_line=on_line,
+            queue=asyncio.Queue(maxsize=self.buffer_lines),
+        )
+        self.streams[stream_id] = stream
+        stream.tasks = [
+            asyncio.create_task(self._read(stream), name=f"log-read-{pod_name}"),
+            asyncio.create_task(self._dispatch(stream), name=f"log-dispatch-{pod_name}"),
+        ]
+        logger.info(f"Following logs of {namespace}/{pod_name} ({stream_id})")
+        return True
+
+    async def _unfollow(self, stream_id: str) -> bool:
+        stream = self.streams.pop(stream_id, None)
+        if stream is None:
+            return False
+        for task in stream.tasks:
+            task.cancel()
+        await asyncio.gather(*stream.tasks, return_exceptions=True)
+        stream.state = STATE_FINISHED
+        logger.info(f"Stopped following logs: {stream_id}")
+        return True
+
+    async def _shutdown(self):
+        for stream_id in list(self.streams):
+            await self._unfollow(stream_id)
+        close = getattr(self.source, "close", None)
+        if close is not None:
+            await close()
+
+    async def _read(self, stream: PodLogStream):
+        delay = self.reconnect_delay_seconds
+        try:
+            while True:
+                stream.state = STATE_CONNECTING
+                try:
+                    async for raw in self.source.stream(
+                        stream.pod_name, stream.namespace, stream.last_timestamp
+                    ):
+                        stream.state = STATE_STREAMING
+                        delay = self.reconnect_delay_seconds
+                        line = self._accept(stream, raw)
+                        if line is not None:
+                            await self._enqueue(stream, line)
+                    # Follow streams end when the container stops (or the
+                    # connection is recycled); only reconnect if it may go on
+                    if await self.source.is_finished(stream.pod_name, stream.namespace):
+                        break
+                except PodLogGone as e:
+                    logger.debug(str(e))
+                    break
+                except Exception as e:
+                    stream.errors += 1
+                    logger.warning(f"Log stream {stream.stream_id} failed: {e}")
+
+                stream.state = STATE_BACKOFF
+                stream.reconnects += 1
+                stream._resuming = stream.last_timestamp is not None
+                stream._resume_skip = stream.lines_at_last_timestamp
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay_seconds)
+        finally:
+            stream.state = STATE_FINISHED
+        await stream.queue.put(_END)
+
+    def _accept(self, stream: PodLogStream, raw: str) -> Optional[str]:
+        """Strip the timestamp prefix; skip lines already delivered before a reconnect."""
+        timestamp, sep, text = raw.partition(" ")
+        if not sep or not timestamp[:4].isdigit():
+            stream.lines_received += 1
+            return raw
+
+        if stream._resuming:
+            # sinceTime has second precision: the server repeats earlier lines
+            if timestamp < stream.last_timestamp or (
+                timestamp == stream.last_timestamp and stream._resume_skip > 0
+            ):
+                if timestamp == stream.last_timestamp:
+                    stream._resume_skip -= 1
+                stream.duplicates_skipped += 1
+                return None
+            stream._resuming = False
+
+        if timestamp == stream.last_timestamp:
+            stream.lines_at_last_timestamp += 1
+        else:
+            stream.last_timestamp = timestamp
+            stream.lines_at_last_timestamp = 1
+        stream.lines_received += 1
+        return text
+
+    async def _enqueue(self, stream: PodLogStream, line: str):
+        queue = stream.queue
+        policy = self.overflow_policy
+        if policy == OVERFLOW_BLOCK:
+            await queue.put(line)
+            return
+
+        if policy == OVERFLOW_SAMPLE and queue.qsize() >= self.sample_watermark * self.buffer_lines:
+            stream._sample_counter += 1
+            if stream._sample_counter % self.sample_every:
+                stream.lines_dropped += 1
+                return
+
+        if queue.full():
+            stream.lines_dropped += 1
+            if policy != OVERFLOW_DROP_OLDEST:
+                return
+            queue.get_nowait()
+        queue.put_nowait(line)
+
+    async def _dispatch(self, stream: PodLogStream):
+        while True:
+            line = await stream.queue.get()
+            if line is _END:
+                break
+            try:
+                stream.on_line(line)
+            except Exception as e:
+                logger.error(f"Error in log line callback for {stream.stream_id}: {e}", exc_info=True)
+            stream.lines_dispatched += 1
+            if stream.lines_dispatched % 1000 == 0:
+                # Let readers of other pods run during long backlogs
+                await asyncio.sleep(0)
+
+        if self.streams.get(stream.stream_id) is stream:
+            del self.streams[stream.stream_id]
+            logger.info(f"Log stream finished: {stream.stream_id}")
+            if self.on_finished is not None:
+                try:
+                    self.on_finished(stream.stream_id)
+                except Exception as e:
+                    logger.error(f"Error in log stream finished callback: {e}", exc_info=True)
@@ -0,0 +1,236 @@
+"""
+Baseline Rollups
+================
+
+Incrementally maintained statistics behind run and test baselines.
+
+RunHistoryStore folds every finished run into one rollup row per
+(pipeline, environment, day) and one per (pipeline, environment, test_id,
+day). Each numeric metric is a MetricRollup: count, mean and M2 (Welford /
+Chan, so variance merges exactly) plus a mergeable QuantileSketch for
+percentiles. A baseline over N days merges at most N rows instead of
+aggregating every run in the window.
+
+Usage:
+    ```python
+    duration = MetricRollup()
+    duration.add(812.0)
+    duration.merge(MetricRollup.from_json(row["duration"]))
+    duration.quantile(0.95), duration.stddev
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import json
+import math
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional
+
+from src.utils.quantile_sketch import QuantileSketch
+
+
+# Relative accuracy of duration / failure-rate percentiles
+SKETCH_ACCURACY = 0.02
+
+# Run statuses folded into baselines (cancelled / stuck runs would skew them)
+BASELINE_RUN_STATUSES = ("completed", "failed")
+
+# Test statuses counted as executed, and the subset counted as failures
+EXECUTED_TEST_STATUSES = ("passed", "failed", "error")
+FAILED_TEST_STATUSES = ("failed", "error")
+
+
+def rollup_day(value: Optional[datetime]) -> str:
+    """Rollup bucket (ISO date) for a run start time."""
+    return (value.date() if value else date.today()).isoformat()
+
+
+@dataclass
+class MetricRollup:
+    """Count / mean / variance and a quantile sketch of one metric."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0  # Sum of squared deviations from the mean
+    sketch: QuantileSketch = field(default_factory=lambda: QuantileSketch(SKETCH_ACCURACY))
+
+    def add(self, value: Optional[float]):
+        """Record one value (None / NaN are ignored)."""
+        if value is None or value != value:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.sketch.add(value)
+
+    def merge(self, other: 'MetricRollup'):
+        """Merge another rollup (Chan et al. parallel variance)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.sketch.merge(other.sketch)
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Sample variance (None below two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Sample standard deviation (None below two values)."""
+        variance = self.variance
+        return math.sqrt(max(variance, 0.0)) if variance is not None else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated q-quantile (None if empty)."""
+        return self.sketch.quantile(q)
+
+    def summary(self, prefix: str) -> Dict[str, Optional[float]]:
+        """Flat {prefix_mean, prefix_stddev, prefix_p50, prefix_p95, prefix_p99}."""
+        p50, p95, p99 = self.sketch.quantiles((0.5, 0.95, 0.99))
+        return {
+            f"{prefix}_mean": self.mean if self.count else None,
+            f"{prefix}_stddev": self.stddev,
+            f"{prefix}_p50": p50,
+            f"{prefix}_p95": p95,
+            f"{prefix}_p99": p99,
+        }
+
+    def to_json(self) -> str:
+        """Serialize for a TEXT column."""
+        return json.dumps({
+            "count": self.count, "mean": self.mean, "m2": self.m2, "sketch": self.sketch.to_dict()
+        })
+
+    @classmethod
+    def from_json(cls, data: Optional[str]) -> 'MetricRollup':
+        """Rebuild from to_json() output (empty rollup for NULL)."""
+        if not data:
+            return cls()
+        values = json.loads(data)
+        return cls(
+            count=values["count"],
+            mean=values["mean"],
+            m2=values["m2"],
+            sketch=QuantileSketch.from_dict(values["sketch"]),
+        )
+
+
+@dataclass
+class RunRollup:
+    """Rollup of the runs of one (pipeline, environment, day)."""
+    run_count: int = 0
+    total_tests_sum: int = 0
+    passed_tests_sum: int = 0
+    failed_tests_sum: int = 0
+    duration: MetricRollup = field(default_factory=MetricRollup)
+    failure_rate: MetricRollup = field(default_factory=MetricRollup)
+
+    def add_run(self, duration: Optional[float], total: int, passed: int, failed: int):
+        """Fold in one finished run."""
+        self.run_count += 1
+        self.total_tests_sum += total
+        self.passed_tests_sum += passed
+        self.failed_tests_sum += failed
+        self.duration.add(duration)
+        if total:
+            self.failure_rate.add(failed / total)
+
+    def merge(self, other: 'RunRollup'):
+        """Merge another day's rollup (baseline windows)."""
+        self.run_count += other.run_count
+        self.total_tests_sum += other.total_tests_sum
+        self.passed_tests_sum += other.passed_tests_sum
+        self.failed_tests_sum += other.failed_tests_sum
+        self.duration.merge(other.duration)
+        self.failure_rate.merge(other.failure_rate)
+
+    def to_row(self, pipeline: str, environment: str, day: str) -> tuple:
+        """Row in run_rollups column order."""
+        return (
+            pipeline, environment, day, self.run_count,
+            self.total_tests_sum, self.passed_tests_sum, self.failed_tests_sum,
+            self.duration.to_json(), self.failure_rate.to_json(),
+        )
+
+    @classmethod
+    def from_row(cls, row: Any) -> 'RunRollup':
+        """Rebuild from the value columns (run_count onwards) of a run_rollups row."""
+        return cls(
+            run_count=row[0],
+            total_tests_sum=row[1],
+            passed_tests_sum=row[2],
+            failed_tests_sum=row[3],
+            duration=MetricRollup.from_json(row[4]),
+            failure_rate=MetricRollup.from_json(row[5]),
+        )
+
+    def baseline(self) -> Dict[str, Any]:
+        """Baseline dictionary (means keep their historical names)."""
+        runs = self.run_count
+        return {
+            "avg_duration": self.duration.mean if self.duration.count else None,
+            "avg_total_tests": self.total_tests_sum / runs if runs else None,
+            "avg_passed_tests": self.passed_tests_sum / runs if runs else None,
+            "avg_failed_tests": self.failed_tests_sum / runs if runs else None,
+            "run_count": runs,
+            **self.duration.summary("duration"),
+            **self.failure_rate.summary("failure_rate"),
+        }
+
+
+@dataclass
+class TestRollup:
+    """Rollup of one test_id's executions in one (pipeline, environment, day)."""
+    run_count: int = 0
+    failed_count: int = 0
+    duration: MetricRollup = field(default_factory=MetricRollup)
+
+    def add_result(self, status: str, duration: Optional[float]):
+        """Fold in one execution (non-executed statuses are ignored)."""
+        if status not in EXECUTED_TEST_STATUSES:
+            return
+        self.run_count += 1
+        if status in FAILED_TEST_STATUSES:
+            self.failed_count += 1
+        self.duration.add(duration)
+
+    def merge(self, other: 'TestRollup'):
+        """Merge another day's rollup."""
+        self.run_count += other.run_count
+        self.failed_count += other.failed_count
+        self.duration.merge(other.duration)
+
+    def to_row(self, pipeline: str, environment: str, test_id: str, day: str) -> tuple:
+        """Row in test_rollups column order."""
+        return (
+            pipeline, environment, test_id, day,
+            self.run_count, self.failed_count, self.duration.to_json(),
+        )
+
+    @classmethod
+    def from_row(cls, row: Any) -> 'TestRollup':
+        """Rebuild from the value columns (run_count onwards) of a test_rollups row."""
+        return cls(run_count=row[0], failed_count=row[1], duration=MetricRollup.from_json(row[2]))
+
+    def baseline(self) -> Dict[str, Any]:
+        """Baseline dictionary for one test."""
+        return {
+            "run_count": self.run_count,
+            "failure_rate": self.failed_count / self.run_count if self.run_count else None,
+            **self.duration.summary("duration"),
+        }
+
+
+def merge_rollups(rollups: Iterable[Any], empty: Any) -> Any:
+    """Merge day rollups into `empty` and return it."""
+    for rollup in rollups:
+        empty.merge(rollup)
+    return empty
@@ -0,0 +1,283 @@
+"""
+Informer Cache
+==============
+
+Shared, indexed in-memory view of Kubernetes objects, kept current by one
+list+watch loop per (resource kind, namespace), in the style of client-go
+informers.
+
+Each ResourceInformer:
+- lists once to fill the cache and learn the collection resourceVersion
+- watches from that resourceVersion; every event updates the cache before
+  the event callback runs
+- on reconnect resumes the watch from the last seen resourceVersion
+  (bookmarks keep it fresh on quiet namespaces) instead of re-listing
+- on 410 Gone (resourceVersion compacted away) re-lists and emits only
+  the differences (ADDED/MODIFIED/DELETED) against the cache
+
+InformerCache indexes objects by label and by owner reference, so lookups
+such as "pods owned by Job X" or "pod with run-id=Y" are dict lookups.
+
+Usage:
+    ```python
+    cache = InformerCache()
+    informer = ResourceInformer(cache, "pod", "panda", core_v1.list_namespaced_pod,
+                                on_event=handle_pod_event)
+    threading.Thread(target=informer.run, args=(stop_event,), daemon=True).start()
+    cache.by_owner("pod", "Job", "grpc-job-1", namespace="panda")
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+
+logger = logging.getLogger(__name__)
+
+HTTP_GONE = 410
+
+ObjectKey = Tuple[str, str]  # (namespace, name)
+
+
+class InformerCache:
+    """Thread-safe store of Kubernetes objects per kind, indexed by label and owner."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._objects: Dict[str, Dict[ObjectKey, Any]] = defaultdict(dict)
+        self._label_index: Dict[Tuple[str, str, str], Set[ObjectKey]] = defaultdict(set)
+        self._owner_index: Dict[Tuple[str, str, str], Set[ObjectKey]] = defaultdict(set)
+        self._synced: Set[Tuple[str, str]] = set()
+
+    # -------------------------------------------------------------------------
+    # Writes (called by informers)
+    # -------------------------------------------------------------------------
+
+    def upsert(self, kind: str, obj: Any):
+        """Add or replace an object."""
+        key = (obj.metadata.namespace, obj.metadata.name)
+        with self._lock:
+            previous = self._objects[kind].get(key)
+            if previous is not None:
+                self._unindex(kind, key, previous)
+            self._objects[kind][key] = obj
+            self._index(kind, key, obj)
+
+    def delete(self, kind: str, obj: Any):
+        """Remove an object (no-op if unknown)."""
+        key = (obj.metadata.namespace, obj.metadata.name)
+        with self._lock:
+            previous = self._objects[kind].pop(key, None)
+            if previous is not None:
+                self._unindex(kind, key, previous)
+
+    def replace(self, kind: str, namespace: str, objs: List[Any]) -> List[Tuple[str, Any]]:
+        """
+        Replace all objects of kind in namespace with a fresh list.
+
+        Returns:
+            (event_type, obj) for every difference: ADDED, MODIFIED (changed
+            resourceVersion) and DELETED
+        """
+        events = []
+        with self._lock:
+            current = {
+                key: obj for key, obj in self._objects[kind].items() if key[0] == namespace
+            }
+            for obj in objs:
+                key = (namespace, obj.metadata.name)
+                previous = current.pop(key, None)
+                if previous is None:
+                    events.append(("ADDED", obj))
+                elif previous.metadata.resource_version != obj.metadata.resource_version:
+                    events.append(("MODIFIED", obj))
+                else:
+                    continue
+                self.upsert(kind, obj)
+            for obj in current.values():
+                self.delete(kind, obj)
+                events.append(("DELETED", obj))
+            self._synced.add((kind, namespace))
+        return events
+
+    def _index(self, kind: str, key: ObjectKey, obj: Any):
+        for label, value in (obj.metadata.labels or {}).items():
+            self._label_index[(kind, label, value)].add(key)
+        for owner in obj.metadata.owner_references or []:
+            self._owner_index[(kind, owner.kind, owner.name)].add(key)
+
+    def _unindex(self, kind: str, key: ObjectKey, obj: Any):
+        for label, value in (obj.metadata.labels or {}).items():
+            index_key = (kind, label, value)
+            self._label_index[index_key].discard(key)
+            if not self._label_index[index_key]:
+                del self._label_index[index_key]
+        for owner in obj.metadata.owner_references or []:
+            index_key = (kind, owner.kind, owner.name)
+            self._owner_index[index_key].discard(key)
+            if not self._owner_index[index_key]:
+                del self._owner_index[index_key]
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def has_synced(self, kind: str, namespace: str) -> bool:
+        """True once the first list of kind in namespace is in the cache."""
+        return (kind, namespace) in self._synced
+
+    def get(self, kind: str, namespace: str, name: str) -> Optional[Any]:
+        """Object by namespace/name, or None."""
+        return self._objects[kind].get((namespace, name))
+
+    def list(self, kind: str, namespace: Optional[str] = None) -> List[Any]:
+        """All objects of kind, optionally in one namespace."""
+        with self._lock:
+            return [
+                obj for key, obj in self._objects[kind].items()
+                if namespace is None or key[0] == namespace
+            ]
+
+    def by_label(self, kind: str, label: str, value: str, namespace: Optional[str] = None) -> List[Any]:
+        """Objects of kind with label=value."""
+        return self._lookup(kind, self._label_index.get((kind, label, value), ()), namespace)
+
+    def by_owner(self, kind: str, owner_kind: str, owner_name: str, namespace: Optional[str] = None) -> List[Any]:
+        """Objects of kind with an owner reference to owner_kind/owner_name."""
+        return self._lookup(kind, self._owner_index.get((kind, owner_kind, owner_name), ()), namespace)
+
+    def _lookup(self, kind: str, keys, namespace: Optional[str]) -> List[Any]:
+        with self._lock:
+            objects = self._objects[kind]
+            return [
+                objects[key] for key in list(keys)
+                if (namespace is None or key[0] == namespace) and key in objects
+            ]
+
+
+class ResourceInformer:
+    """
+    List+watch loop for one resource kind in one namespace.
+
+    run() blocks until stop_event is set; run it in its own thread.
+    """
+
+    def __init__(
+        self,
+        cache: InformerCache,
+        kind: str,
+        namespace: str,
+        list_func: Callable,
+        label_selector: Optional[str] = None,
+        on_event: Optional[Callable[[str, Any, str], None]] = None,
+        watch_timeout_seconds: int = 300,
+        backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 30.0
+    ):
+        """
+        Args:
+            cache: Shared InformerCache
+            kind: Cache kind name ("pod", "job", ...)
+            namespace: Namespace to watch
+            list_func: Namespaced list function (e.g. CoreV1Api.list_namespaced_pod)
+            label_selector: Optional label selector
+            on_event: Called with (obj, event_type, namespace) after the cache is updated
+            watch_timeout_seconds: Server-side timeout of one watch request
+            backoff_seconds: First retry delay after an error (doubles per error)
+            max_backoff_seconds: Retry delay cap
+        """
+        self.cache = cache
+        self.kind = kind
+        self.namespace = namespace
+        self.list_func = list_func
+        self.label_selector = label_selector
+        self.on_event = on_event
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        self.resource_version: Optional[str] = None
+        self.relists = 0
+        self.resumes = 0
+        self._watch: Optional[watch.Watch] = None
+
+    def run(self, stop_event: threading.Event):
+        """List, then watch and resume until stop_event is set."""
+        backoff = self.backoff_seconds
+        while not stop_event.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                else:
+                    self.resumes += 1
+                self._watch_once(stop_event)
+                backoff = self.backoff_seconds
+                continue
+            except ApiException as e:
+                if e.status == HTTP_GONE:
+                    logger.info(
+                        f"{self.kind} watch in {self.namespace} expired "
+                        f"(resourceVersion {self.resource_version}), re-listing"
+                    )
+                    self.resource_version = None
+                    continue
+                if e.status != 404:  # Namespace not found is OK
+                    logger.error(f"Error watching {self.kind}s in {self.namespace}: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error watching {self.kind}s in {self.namespace}: {e}", exc_info=True)
+
+            stop_event.wait(backoff)
+            backoff = min(backoff * 2, self.max_backoff_seconds)
+
+    def stop(self):
+        """Ask the current watch request to end after its next event."""
+        if self._watch is not None:
+            self._watch.stop()
+
+    def _relist(self):
+        result = self.list_func(namespace=self.namespace, label_selector=self.label_selector)
+        events = self.cache.replace(self.kind, self.namespace, result.items)
+        self.resource_version = result.metadata.resource_version
+        self.relists += 1
+        for event_type, obj in events:
+            self._emit(obj, event_type)
+
+    def _watch_once(self, stop_event: threading.Event):
+        self._watch = watch.Watch()
+        for event in self._watch.stream(
+            self.list_func,
+            namespace=self.namespace,
+            label_selector=self.label_selector,
+            resource_version=self.resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=self.watch_timeout_seconds
+        ):
+            if stop_event.is_set():
+                self._watch.stop()
+                break
+
+            obj = event["object"]
+            event_type = event["type"]
+            if event_type == "DELETED":
+                self.cache.delete(self.kind, obj)
+            elif event_type != "BOOKMARK":
+                self.cache.upsert(self.kind, obj)
+            self.resource_version = obj.metadata.resource_version
+            if event_type != "BOOKMARK":
+                self._emit(obj, event_type)
+
+    def _emit(self, obj: Any, event_type: str):
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(obj, event_type, self.namespace)
+        except Exception as e:
+            logger.error(f"Error in {self.kind} informer callback: {e}", exc_info=True)
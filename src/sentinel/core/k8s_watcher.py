@@ -4,6 +4,9 @@ Kubernetes Watcher
 
 Continuously monitors Kubernetes resources (pods, jobs, services) in real time
 and reports health events to the anomaly engine.
+
+Pods and jobs are watched concurrently, one informer per namespace and
+resource (see informer_cache.py), into a shared indexed cache.
 """
 
 import logging
@@ -12,9 +15,10 @@ from datetime import datetime
 from typing import Dict, List, Optional, Callable, Set
 from queue import Queue, Empty
 
-from kubernetes import client, config, watch
+from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
+from src.sentinel.core.informer_cache import InformerCache, ResourceInformer
 from src.sentinel.core.models import (
     RunContext,
     PodHealthEvent,
@@ -40,7 +44,8 @@ class K8sWatcher:
         self,
         config_manager: ConfigManager,
         namespaces: Optional[List[str]] = None,
-        label_selectors: Optional[Dict[str, str]] = None
+        label_selectors: Optional[Dict[str, str]] = None,
+        watch_timeout_seconds: int = 300
     ):
         """
         Initialize Kubernetes watcher.
@@ -49,10 +54,13 @@ class K8sWatcher:
             config_manager: ConfigManager instance
             namespaces: List of namespaces to watch (default: all)
             label_selectors: Label selectors for filtering resources
+            watch_timeout_seconds: Server-side timeout of one watch request
+                                   (the watch then resumes from its resourceVersion)
         """
         self.config_manager = config_manager
         self.namespaces = namespaces or ["default", "panda"]
         self.label_selectors = label_selectors or {}
+        self.watch_timeout_seconds = watch_timeout_seconds
         self.logger = logging.getLogger(__name__)
         
         # Kubernetes clients
@@ -66,8 +74,14 @@ class K8sWatcher:
         
         # Tracking
         self._watching = False
+        self._stop_event = threading.Event()
         self._watch_threads: List[threading.Thread] = []
         self._run_contexts: Dict[str, RunContext] = {}
+        self._runs_by_job: Dict[str, RunContext] = {}
+        
+        # Shared pod/job cache, filled by one informer per namespace and kind
+        self.cache = InformerCache()
+        self._informers: List[ResourceInformer] = []
         
         # Callbacks
         self.on_pod_event_callbacks: List[Callable[[PodHealthEvent, RunContext], None]] = []
@@ -105,12 +119,16 @@ class K8sWatcher:
             context: RunContext to monitor
         """
         self._run_contexts[context.run_id] = context
+        if context.k8s_job_name:
+            self._runs_by_job[context.k8s_job_name] = context
         self.logger.info(f"Registered run for K8s monitoring: {context.run_id}")
     
     def unregister_run(self, run_id: str):
         """Unregister a run from monitoring."""
         if run_id in self._run_contexts:
-            del self._run_contexts[run_id]
+            context = self._run_contexts.pop(run_id)
+            if self._runs_by_job.get(context.k8s_job_name) is context:
+                del self._runs_by_job[context.k8s_job_name]
             self.logger.info(f"Unregistered run from K8s monitoring: {run_id}")
     
     def register_pod_event_callback(
@@ -128,7 +146,7 @@ class K8sWatcher:
         self.on_job_event_callbacks.append(callback)
     
     def start_watching(self):
-        """Start watching Kubernetes resources."""
+        """Start one informer thread per namespace for pods and for jobs."""
         if self._watching:
             self.logger.warning("K8sWatcher is already watching")
             return
@@ -138,167 +156,54 @@ class K8sWatcher:
             return
         
         self._watching = True
+        # A fresh event per start: threads left over from a stop_watching()
+        # that timed out keep their (set) event and still exit
+        self._stop_event = threading.Event()
+        label_selector = self._build_label_selector()
         
-        # Start pod watcher thread
-        pod_thread = threading.Thread(
-            target=self._watch_pods,
-            daemon=True,
-            name="k8s-pod-watcher"
-        )
-        pod_thread.start()
-        self._watch_threads.append(pod_thread)
+        self._informers = []
+        for namespace in self.namespaces:
+            self._informers.append(ResourceInformer(
+                self.cache, "pod", namespace, self.core_v1.list_namespaced_pod,
+                label_selector=label_selector,
+                on_event=lambda pod, event_type, ns: self._process_pod_event(pod, event_type, ns),
+                watch_timeout_seconds=self.watch_timeout_seconds
+            ))
+            self._informers.append(ResourceInformer(
+                self.cache, "job", namespace, self.batch_v1.list_namespaced_job,
+                label_selector=label_selector,
+                on_event=lambda job, event_type, ns: self._process_job_event(job, event_type, ns),
+                watch_timeout_seconds=self.watch_timeout_seconds
+            ))
         
-        # Start job watcher thread
-        job_thread = threading.Thread(
-            target=self._watch_jobs,
-            daemon=True,
-            name="k8s-job-watcher"
-        )
-        job_thread.start()
-        self._watch_threads.append(job_thread)
+        for informer in self._informers:
+            thread = threading.Thread(
+                target=informer.run,
+                args=(self._stop_event,),
+                daemon=True,
+                name=f"k8s-{informer.kind}-watcher-{informer.namespace}"
+            )
+            thread.start()
+            self._watch_threads.append(thread)
         
-        self.logger.info("K8sWatcher started watching")
+        self.logger.info(f"K8sWatcher started watching ({len(self._informers)} informers)")
     
-    def stop_watching(self):
+    def stop_watching(self, timeout: float = 2.0):
         """Stop watching Kubernetes resources."""
         self._watching = False
+        self._stop_event.set()
+        for informer in self._informers:
+            informer.stop()
+        # Threads blocked in a quiet watch exit at its next event or timeout
+        for thread in self._watch_threads:
+            thread.join(timeout / max(len(self._watch_threads), 1))
+        self._watch_threads = [thread for thread in self._watch_threads if thread.is_alive()]
         self.logger.info("K8sWatcher stopped watching")
     
-    def _watch_pods(self):
-        """Watch pods in configured namespaces."""
-        while self._watching:
-            try:
-                for namespace in self.namespaces:
-                    if not self._watching:
-                        break
-                    
-                    try:
-                        # Build label selector string
-                        label_selector = self._build_label_selector()
-                        
-                        # Watch pods
-                        w = watch.Watch()
-                        for event in w.stream(
-                            self.core_v1.list_namespaced_pod,
-                            namespace=namespace,
-                            label_selector=label_selector,
-                            timeout_seconds=30
-                        ):
-                            if not self._watching:
-                                break
-                            
-                            pod = event['object']
-                            event_type = event['type']
-                            
-                            # Process pod event
-                            self._process_pod_event(pod, event_type, namespace)
-                    
-                    except ApiException as e:
-                        if e.status != 404:  # Namespace not found is OK
-                            self.logger.error(f"Error watching pods in {namespace}: {e}")
-                        continue
-                    
-                    except Exception as e:
-                        self.logger.error(f"Unexpected error watching pods: {e}", exc_info=True)
-                        continue
-            
-            except Exception as e:
-                self.logger.error(f"Fatal error in pod watcher: {e}", exc_info=True)
-                if self._watching:
-                    import time
-                    time.sleep(5)  # Back off before retrying
-    
-    def _watch_jobs(self):
-        """Watch jobs in configured namespaces."""
-        while self._watching:
-            try:
-                for namespace in self.namespaces:
-                    if not self._watching:
-                        break
-                    
-                    try:
-                        # Build label selector string
-                        label_selector = self._build_label_selector()
-                        
-                        # Watch jobs
-                        w = watch.Watch()
-                        for event in w.stream(
-                            self.batch_v1.list_namespaced_job,
-                            namespace=namespace,
-                            label_selector=label_selector,
-                            timeout_seconds=30
-                        ):
-                            if not self._watching:
-                                break
-                            
-                            job = event['object']
-                            event_type = event['type']
-                            
-                            # Process job event
-                            self._process_job_event(job, event_type, namespace)
-                    
-                    except ApiException as e:
-                        if e.status != 404:
-                            self.logger.error(f"Error watching jobs in {namespace}: {e}")
-                        continue
-                    
-                    except Exception as e:
-                        self.logger.error(f"Unexpected error watching jobs: {e}", exc_info=True)
-                        continue
-            
-            except Exception as e:
-                self.logger.error(f"Fatal error in job watcher: {e}", exc_info=True)
-                if self._watching:
-                    import time
-                    time.sleep(5)
-    
     def _process_pod_event(self, pod, event_type: str, namespace: str):
         """Process a pod event and create PodHealthEvent."""
         try:
-            # Extract pod information
-            pod_name = pod.metadata.name
-            phase = pod.status.phase
-            
-            # Get container statuses
-            container_statuses = []
-            if pod.status.container_statuses:
-                for cs in pod.status.container_statuses:
-                    container_statuses.append({
-                        "name": cs.name,
-                        "ready": cs.ready,
-                        "restart_count": cs.restart_count,
-                        "state": str(cs.state) if cs.state else None,
-                        "last_state": str(cs.last_state) if cs.last_state else None,
-                    })
-            
-            # Calculate total restarts
-            total_restarts = sum(
-                cs.restart_count for cs in pod.status.container_statuses or []
-            )
-            
-            # Extract reason and message
-            reason = None
-            message = None
-            if pod.status.container_statuses:
-                for cs in pod.status.container_statuses:
-                    if cs.state and cs.state.waiting:
-                        reason = cs.state.waiting.reason
-                        message = cs.state.waiting.message
-                    elif cs.state and cs.state.terminated:
-                        reason = cs.state.terminated.reason
-                        message = cs.state.terminated.message
-            
-            # Create pod health event
-            pod_event = PodHealthEvent(
-                pod_name=pod_name,
-                namespace=namespace,
-                phase=phase,
-                container_statuses=container_statuses,
-                restarts=total_restarts,
-                reason=reason,
-                message=message,
-                timestamp=datetime.now()
-            )
+            pod_event = self._build_pod_health_event(pod, namespace)
             
             # Find associated run context
             run_context = self._find_run_context_for_pod(pod)
@@ -313,6 +218,53 @@ class K8sWatcher:
         except Exception as e:
             self.logger.error(f"Error processing pod event: {e}", exc_info=True)
     
+    def _build_pod_health_event(self, pod, namespace: str) -> PodHealthEvent:
+        """Create a PodHealthEvent from a V1Pod."""
+        # Extract pod information
+        pod_name = pod.metadata.name
+        phase = pod.status.phase
+        
+        # Get container statuses
+        container_statuses = []
+        if pod.status.container_statuses:
+            for cs in pod.status.container_statuses:
+                container_statuses.append({
+                    "name": cs.name,
+                    "ready": cs.ready,
+                    "restart_count": cs.restart_count,
+                    "state": str(cs.state) if cs.state else None,
+                    "last_state": str(cs.last_state) if cs.last_state else None,
+                })
+        
+        # Calculate total restarts
+        total_restarts = sum(
+            cs.restart_count for cs in pod.status.container_statuses or []
+        )
+        
+        # Extract reason and message
+        reason = None
+        message = None
+        if pod.status.container_statuses:
+            for cs in pod.status.container_statuses:
+                if cs.state and cs.state.waiting:
+                    reason = cs.state.waiting.reason
+                    message = cs.state.waiting.message
+                elif cs.state and cs.state.terminated:
+                    reason = cs.state.terminated.reason
+                    message = cs.state.terminated.message
+        
+        # Create pod health event
+        return PodHealthEvent(
+            pod_name=pod_name,
+            namespace=namespace,
+            phase=phase,
+            container_statuses=container_statuses,
+            restarts=total_restarts,
+            reason=reason,
+            message=message,
+            timestamp=datetime.now()
+        )
+    
     def _process_job_event(self, job, event_type: str, namespace: str):
         """Process a job event and create JobStatusEvent."""
         try:
@@ -344,7 +296,6 @@ class K8sWatcher:
     
     def _find_run_context_for_pod(self, pod) -> Optional[RunContext]:
         """Find RunContext associated with a pod."""
-        pod_name = pod.metadata.name
         labels = pod.metadata.labels or {}
         annotations = pod.metadata.annotations or {}
         
@@ -353,26 +304,19 @@ class K8sWatcher:
         if run_id:
             return self._run_contexts.get(run_id)
         
-        # Try to match by job name
-        owner_refs = pod.metadata.owner_references or []
-        for owner in owner_refs:
-            if owner.kind == "Job":
-                job_name = owner.name
-                # Find run context with matching job name
-                for context in self._run_contexts.values():
-                    if context.k8s_job_name == job_name:
-                        return context
+        # Try to match by owning job
+        for owner in pod.metadata.owner_references or []:
+            if owner.kind == "Job" and owner.name in self._runs_by_job:
+                return self._runs_by_job[owner.name]
         
         return None
     
     def _find_run_context_for_job(self, job) -> Optional[RunContext]:
         """Find RunContext associated with a job."""
-        job_name = job.metadata.name
-        
         # Try to match by job name
-        for context in self._run_contexts.values():
-            if context.k8s_job_name == job_name:
-                return context
+        context = self._runs_by_job.get(job.metadata.name)
+        if context:
+            return context
         
         # Try to match by run-id label/annotation
         labels = job.metadata.labels or {}
@@ -395,6 +339,9 @@ class K8sWatcher:
         """
         Get current health status of a specific pod.
         
+        Served from the informer cache; only reads the pod from the API when
+        the namespace has not been synced (watcher not started).
+        
         Args:
             pod_name: Pod name
             namespace: Namespace
@@ -402,18 +349,21 @@ class K8sWatcher:
         Returns:
             PodHealthEvent if found, None otherwise
         """
+        if self.cache.has_synced("pod", namespace):
+            pod = self.cache.get("pod", namespace, pod_name)
+            return self._build_pod_health_event(pod, namespace) if pod else None
+        
         if not self.core_v1:
             return None
         
         try:
             pod = self.core_v1.read_namespaced_pod(pod_name, namespace)
-            self._process_pod_event(pod, "MODIFIED", namespace)
-            # Event will be created by _process_pod_event
-            return None  # Return value not used, event goes to callbacks
+            return self._build_pod_health_event(pod, namespace)
         except ApiException as e:
-            self.logger.error(f"Error reading pod {pod_name}: {e}")
+            if e.status != 404:
+                self.logger.error(f"Error reading pod {pod_name}: {e}")
             return None
-
-
-
-
+    
+    def get_pods_for_job(self, job_name: str, namespace: Optional[str] = None) -> List:
+        """Cached pods owned by a Job (empty until the namespace is synced)."""
+        return self.cache.by_owner("pod", "Job", job_name, namespace=namespace)
@@ -4,18 +4,20 @@ Log Streamer
 
 Streams and parses logs from Kubernetes pods/jobs, extracting test events
 and error signatures.
+
+All followed pod logs share one AsyncLogIngestor event loop; tune it with
+the ``log_ingestion`` config section.
 """
 
 import logging
 import re
-import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Callable, Pattern
-from queue import Queue
 
 from kubernetes import client
-from kubernetes.client.rest import ApiException
 
+from src.sentinel.core.async_log_ingestor import AsyncLogIngestor, KubernetesPodLogSource
+from src.sentinel.core.pattern_set import PatternSet
 from src.sentinel.core.models import (
     RunContext,
     TestEvent,
@@ -59,11 +61,11 @@ class LogStreamer:
         # Log patterns
         self.test_patterns = self._load_test_patterns()
         self.error_patterns = self._load_error_patterns()
+        self._build_pattern_sets()
         
-        # Active streams
-        self._active_streams: Dict[str, threading.Thread] = {}
-        self._stream_queues: Dict[str, Queue] = {}
-        self._streaming = False
+        # Pod log streams, multiplexed on one event loop (created on first use)
+        self.ingestion_config = self.config.get("log_ingestion", {})
+        self._ingestor: Optional[AsyncLogIngestor] = None
         
         # Callbacks
         self.on_test_event_callbacks: List[Callable[[TestEvent, RunContext], None]] = []
@@ -171,6 +173,15 @@ class LogStreamer:
         
         return patterns
     
+    def _build_pattern_sets(self):
+        """
+        Build the single-pass prefilters over test_patterns/error_patterns.
+        
+        Call again after changing test_patterns or error_patterns.
+        """
+        self._test_pattern_set = PatternSet(self.test_patterns.items())
+        self._error_pattern_set = PatternSet((pattern, pattern) for pattern in self.error_patterns)
+    
     def register_run(self, context: RunContext):
         """Register a run context for log streaming."""
         self._run_contexts[context.run_id] = context
@@ -187,7 +198,7 @@ class LogStreamer:
             del self._run_contexts[run_id]
             # Stop streams associated with this run
             streams_to_stop = [
-                stream_id for stream_id in self._active_streams.keys()
+                stream_id for stream_id in self.active_stream_ids()
                 if stream_id.startswith(f"{run_id}:")
             ]
             for stream_id in streams_to_stop:
@@ -207,6 +218,22 @@ class LogStreamer:
         """Register callback for error detection."""
         self.on_error_callbacks.append(callback)
     
+    def _get_ingestor(self) -> AsyncLogIngestor:
+        """Create and start the shared log ingestor on first use."""
+        if self._ingestor is None:
+            cfg = self.ingestion_config
+            self._ingestor = AsyncLogIngestor(
+                KubernetesPodLogSource(),
+                buffer_lines=cfg.get("buffer_lines", 10_000),
+                overflow_policy=cfg.get("overflow_policy", "block"),
+                sample_every=cfg.get("sample_every", 10),
+                sample_watermark=cfg.get("sample_watermark", 0.8),
+                reconnect_delay_seconds=cfg.get("reconnect_delay_seconds", 1.0),
+                max_reconnect_delay_seconds=cfg.get("max_reconnect_delay_seconds", 30.0),
+            )
+        self._ingestor.start()
+        return self._ingestor
+    
     def start_streaming(self, pod_name: str, namespace: str, run_id: str):
         """
         Start streaming logs from a pod.
@@ -220,69 +247,41 @@ class LogStreamer:
             self.logger.warning("K8s client not initialized, cannot stream logs")
             return
         
-        stream_id = f"{run_id}:{pod_name}:{namespace}"
-        if stream_id in self._active_streams:
-            self.logger.debug(f"Already streaming logs from {stream_id}")
+        context = self._run_contexts.get(run_id)
+        if not context:
+            self.logger.warning(f"Run context not found: {run_id}")
             return
         
-        # Create queue for log lines
-        log_queue = Queue()
-        self._stream_queues[stream_id] = log_queue
-        
-        # Start streaming thread
-        stream_thread = threading.Thread(
-            target=self._stream_pod_logs,
-            args=(pod_name, namespace, run_id, log_queue),
-            daemon=True,
-            name=f"log-stream-{pod_name}"
+        stream_id = f"{run_id}:{pod_name}:{namespace}"
+        started = self._get_ingestor().follow(
+            stream_id,
+            pod_name,
+            namespace,
+            lambda log_line: self._process_log_line(log_line, pod_name, context)
         )
-        stream_thread.start()
-        self._active_streams[stream_id] = stream_thread
+        if not started:
+            self.logger.debug(f"Already streaming logs from {stream_id}")
+            return
         
         self.logger.info(f"Started streaming logs from {pod_name} in {namespace}")
     
     def stop_streaming(self, stream_id: str):
         """Stop streaming logs from a pod."""
-        if stream_id in self._active_streams:
-            # Thread will stop when queue is closed or pod is deleted
-            del self._active_streams[stream_id]
-            if stream_id in self._stream_queues:
-                del self._stream_queues[stream_id]
+        if self._ingestor is not None and self._ingestor.unfollow(stream_id):
             self.logger.info(f"Stopped streaming logs: {stream_id}")
     
-    def _stream_pod_logs(self, pod_name: str, namespace: str, run_id: str, log_queue: Queue):
-        """Stream logs from a pod and process them."""
-        try:
-            # Get run context
-            context = self._run_contexts.get(run_id)
-            if not context:
-                self.logger.warning(f"Run context not found: {run_id}")
-                return
-            
-            # Stream logs
-            w = client.Watch()
-            for event in w.stream(
-                self.core_v1.read_namespaced_pod_log,
-                name=pod_name,
-                namespace=namespace,
-                follow=True,
-                _preload_content=False
-            ):
-                if event['type'] == 'ERROR':
-                    break
-                
-                log_line = event['object']
-                if log_line:
-                    # Process log line
-                    self._process_log_line(log_line, pod_name, context)
-        
-        except ApiException as e:
-            if e.status == 404:
-                self.logger.debug(f"Pod {pod_name} not found (may have been deleted)")
-            else:
-                self.logger.error(f"Error streaming logs from {pod_name}: {e}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error streaming logs: {e}", exc_info=True)
+    def stop(self):
+        """Stop all log streams and the ingestion event loop."""
+        if self._ingestor is not None:
+            self._ingestor.stop()
+    
+    def active_stream_ids(self) -> List[str]:
+        """IDs ("run_id:pod:namespace") of the pod logs being followed."""
+        return self._ingestor.stream_ids() if self._ingestor is not None else []
+    
+    def get_stream_stats(self) -> Dict[str, Dict]:
+        """Per-stream ingestion counters (lines, drops, reconnects, buffer depth)."""
+        return self._ingestor.stats() if self._ingestor is not None else {}
     
     def _process_log_line(self, log_line: str, source: str, context: RunContext):
         """
@@ -294,30 +293,26 @@ class LogStreamer:
             context: RunContext
         """
         try:
-            # Check for test events
-            for event_type, pattern in self.test_patterns.items():
-                match = pattern.search(log_line)
-                if match:
-                    test_event = self._create_test_event(event_type, match, log_line, source)
-                    if test_event:
-                        # Notify callbacks
-                        for callback in self.on_test_event_callbacks:
-                            try:
-                                callback(test_event, context)
-                            except Exception as e:
-                                self.logger.error(f"Error in test event callback: {e}", exc_info=True)
-                        break
-            
-            # Check for errors
-            for error_pattern in self.error_patterns:
-                if error_pattern.search(log_line):
-                    # Notify error callbacks
-                    for callback in self.on_error_callbacks:
+            # Check for test events (first matching pattern wins)
+            for event_type, match in self._test_pattern_set.iter_matches(log_line):
+                test_event = self._create_test_event(event_type, match, log_line, source)
+                if test_event:
+                    # Notify callbacks
+                    for callback in self.on_test_event_callbacks:
                         try:
-                            callback(log_line, context)
+                            callback(test_event, context)
                         except Exception as e:
-                            self.logger.error(f"Error in error callback: {e}", exc_info=True)
+                            self.logger.error(f"Error in test event callback: {e}", exc_info=True)
                     break
+            
+            # Check for errors
+            if self._error_pattern_set.search_any(log_line):
+                # Notify error callbacks
+                for callback in self.on_error_callbacks:
+                    try:
+                        callback(log_line, context)
+                    except Exception as e:
+                        self.logger.error(f"Error in error callback: {e}", exc_info=True)
         
         except Exception as e:
             self.logger.error(f"Error processing log line: {e}", exc_info=True)
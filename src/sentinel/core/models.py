@@ -87,6 +87,20 @@ class RunContext:
     # Infrastructure snapshots
     infra_snapshots: List['InfraSnapshot'] = field(default_factory=list)
     
+    # Status counters per run and per suite name, kept in step with `tests` by
+    # add_test()/set_test_status() so readers never scan all tests
+    _status_counts: Dict[TestStatus, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _suite_status_counts: Dict[str, Dict[TestStatus, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    # Tests changed since the history store last took them (incremental saves)
+    _dirty_test_ids: Set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    
     def duration_seconds(self) -> Optional[float]:
         """Calculate run duration in seconds."""
         if self.start_time and self.end_time:
@@ -99,17 +113,140 @@ class RunContext:
         """Check if run is currently active."""
         return self.status == RunStatus.RUNNING
     
+    # -------------------------------------------------------------------------
+    # Test and suite bookkeeping
+    # -------------------------------------------------------------------------
+    
+    def add_suite(self, suite: 'SuiteRun'):
+        """Register a suite; its counters pick up tests already added for it."""
+        self.suites[suite.suite_name] = suite
+        if suite.suite_name in self._suite_status_counts:
+            suite.test_ids = [
+                test_id for test_id, test in self.tests.items()
+                if test.suite_name == suite.suite_name
+            ]
+            self._sync_suite_counters(suite.suite_name)
+    
+    def add_test(self, test: 'TestCaseRun'):
+        """
+        Add a test case and count its current status.
+        
+        Re-adding an existing test_id replaces it (its old status is uncounted).
+        """
+        previous = self.tests.get(test.test_id)
+        if previous is not None:
+            self._count(previous.suite_name, previous.status, -1)
+        else:
+            suite = self.suites.get(test.suite_name)
+            if suite is not None:
+                suite.test_ids.append(test.test_id)
+        
+        self.tests[test.test_id] = test
+        self._dirty_test_ids.add(test.test_id)
+        self._count(test.suite_name, test.status, 1)
+        self._sync_suite_counters(test.suite_name)
+    
+    def set_test_status(self, test_id: str, status: TestStatus):
+        """
+        Move a test to a new status, updating run and suite counters.
+        
+        Status changes must go through here (not `test.status = ...`) for the
+        counters to stay correct.
+        """
+        test = self.tests[test_id]
+        if test.status == status:
+            return
+        self._count(test.suite_name, test.status, -1)
+        self._count(test.suite_name, status, 1)
+        test.status = status
+        self._dirty_test_ids.add(test_id)
+        self._sync_suite_counters(test.suite_name)
+    
+    def mark_test_dirty(self, test_id: str):
+        """Flag a test whose fields (times, errors) changed outside add_test()/set_test_status()."""
+        self._dirty_test_ids.add(test_id)
+    
+    def take_dirty_tests(self) -> List[str]:
+        """Return the test IDs changed since the previous call and reset the set."""
+        dirty, self._dirty_test_ids = self._dirty_test_ids, set()
+        return list(dirty)
+    
+    def _count(self, suite_name: str, status: TestStatus, delta: int):
+        self._status_counts[status] = self._status_counts.get(status, 0) + delta
+        suite_counts = self._suite_status_counts.setdefault(suite_name, {})
+        suite_counts[status] = suite_counts.get(status, 0) + delta
+    
+    def _sync_suite_counters(self, suite_name: str):
+        suite = self.suites.get(suite_name)
+        if suite is None:
+            return
+        counts = self._suite_status_counts.get(suite_name, {})
+        suite.total_tests = sum(counts.values())
+        suite.passed_tests = counts.get(TestStatus.PASSED, 0)
+        suite.failed_tests = counts.get(TestStatus.FAILED, 0)
+        suite.skipped_tests = counts.get(TestStatus.SKIPPED, 0)
+    
+    def _counters(self) -> Dict[TestStatus, int]:
+        # Tests inserted into `tests` directly bypass add_test(); recount once
+        if sum(self._status_counts.values()) != len(self.tests):
+            self._rebuild_counters()
+        return self._status_counts
+    
+    def _rebuild_counters(self):
+        self._status_counts = {}
+        self._suite_status_counts = {}
+        for test in self.tests.values():
+            self._count(test.suite_name, test.status, 1)
+        for suite_name in self.suites:
+            self._sync_suite_counters(suite_name)
+    
+    # -------------------------------------------------------------------------
+    # Counters (O(1))
+    # -------------------------------------------------------------------------
+    
     def total_tests(self) -> int:
         """Get total number of tests in this run."""
         return len(self.tests)
     
+    def status_count(self, status: TestStatus) -> int:
+        """Get number of tests currently in the given status."""
+        return self._counters().get(status, 0)
+    
     def passed_tests(self) -> int:
         """Get number of passed tests."""
-        return sum(1 for t in self.tests.values() if t.status == TestStatus.PASSED)
+        return self.status_count(TestStatus.PASSED)
     
     def failed_tests(self) -> int:
         """Get number of failed tests."""
-        return sum(1 for t in self.tests.values() if t.status == TestStatus.FAILED)
+        return self.status_count(TestStatus.FAILED)
+    
+    def skipped_tests(self) -> int:
+        """Get number of skipped tests."""
+        return self.status_count(TestStatus.SKIPPED)
+    
+    def failure_rate(self) -> float:
+        """Get failed tests / total tests (0.0 for a run without tests)."""
+        total = self.total_tests()
+        return self.failed_tests() / total if total else 0.0
+    
+    def suite_breakdown(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get per-suite test counts.
+        
+        Returns:
+            {suite_name: {"total": n, "<status>": n, ...}} with a key for
+            every TestStatus
+        """
+        self._counters()
+        breakdown = {}
+        for suite_name, counts in self._suite_status_counts.items():
+            total = sum(counts.values())
+            if not total and suite_name not in self.suites:
+                continue
+            entry = {"total": total}
+            entry.update({status.value: counts.get(status, 0) for status in TestStatus})
+            breakdown[suite_name] = entry
+        return breakdown
 
 
 @dataclass
@@ -0,0 +1,198 @@
+"""
+Pattern Set
+===========
+
+Single-pass prefilter for matching a log line against many regexes.
+
+LogStreamer and RunDetector test every pod log line against dozens of
+patterns, and almost all lines (plain INFO/DEBUG output) match none of them.
+PatternSet extracts from each regex the literal strings a match must
+contain, e.g. ``\\b(?:error|ERROR)\\b.*`` -> {"error"}. Each line is lowered
+once and checked for the (deduplicated) literals of all patterns with
+substring search, which is far cheaper than a regex alternation. Lines
+without any of them are rejected; for the remaining candidates only the
+patterns whose literals occur in the line run their full regex. Non-ASCII
+lines go through one case-insensitive alternation of the literals instead,
+since str.lower() and regex case folding differ outside ASCII.
+
+Patterns without a required literal (e.g. ``\\w+=\\d+``) cannot be gated and
+always run, in their original order relative to the gated ones.
+
+Usage:
+    ```python
+    pattern_set = PatternSet(test_patterns.items())
+    for event_type, match in pattern_set.iter_matches(log_line):
+        ...
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import re
+from typing import FrozenSet, Generic, Iterable, Iterator, List, Optional, Pattern, Tuple, TypeVar
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+K = TypeVar("K")
+
+# Literals shorter than this are too common to reject anything
+MIN_LITERAL_LENGTH = 2
+
+_REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT}
+if hasattr(sre_parse, "POSSESSIVE_REPEAT"):
+    _REPEATS.add(sre_parse.POSSESSIVE_REPEAT)
+_ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", None)
+
+
+# =============================================================================
+# Required literal extraction
+# =============================================================================
+
+def _best(options: List[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    """Most selective any-of set: longest shortest literal, then fewest literals."""
+    if not options:
+        return None
+    return max(options, key=lambda s: (min(len(lit) for lit in s), -len(s)))
+
+
+def _sequence_literals(items) -> Optional[FrozenSet[str]]:
+    """Any-of literal set that every match of a parsed sequence contains."""
+    options: List[FrozenSet[str]] = []
+    run: List[str] = []
+
+    def flush():
+        if len(run) >= MIN_LITERAL_LENGTH:
+            options.append(frozenset(["".join(run)]))
+        run.clear()
+
+    for op, av in items:
+        if op is sre_parse.LITERAL and av < 128:
+            run.append(chr(av).lower())
+            continue
+        flush()
+        if op is sre_parse.SUBPATTERN:
+            required = _sequence_literals(av[-1])
+        elif op is _ATOMIC_GROUP:
+            required = _sequence_literals(av)
+        elif op is sre_parse.BRANCH:
+            branches = [_sequence_literals(branch) for branch in av[1]]
+            required = None if None in branches else frozenset().union(*branches)
+        elif op in _REPEATS and av[0] >= 1:
+            required = _sequence_literals(av[2])
+        else:
+            required = None
+        if required:
+            options.append(required)
+    flush()
+
+    return _best(options)
+
+
+def required_literals(pattern: Pattern) -> Optional[FrozenSet[str]]:
+    """
+    Lowercase literals of which every match of pattern contains at least one.
+
+    Returns:
+        Frozenset of literals, or None if the pattern has no usable literal
+        (e.g. it can match without any fixed text, or is a bytes pattern)
+    """
+    if not isinstance(pattern.pattern, str):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+    return _sequence_literals(list(parsed))
+
+
+# =============================================================================
+# Pattern Set
+# =============================================================================
+
+class PatternSet(Generic[K]):
+    """
+    Ordered (key, compiled regex) pairs behind a single literal prefilter.
+
+    iter_matches()/first_match() give the same results, in the same order, as
+    calling pattern.search(line) on every pattern in turn.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[K, Pattern]]):
+        """
+        Args:
+            patterns: (key, compiled regex) pairs in match priority order
+        """
+        self.patterns: List[Tuple[K, Pattern]] = list(patterns)
+        self._literals: List[Optional[Tuple[str, ...]]] = []
+        all_literals = set()
+        for _, pattern in self.patterns:
+            literals = required_literals(pattern)
+            self._literals.append(tuple(sorted(literals)) if literals else None)
+            all_literals.update(literals or ())
+
+        # Lines can only be rejected outright if every pattern is gated
+        self._ungated = any(literals is None for literals in self._literals)
+        # A literal containing another one adds nothing to the "any literal" gate
+        self._gate_literals = tuple(
+            lit for lit in sorted(all_literals)
+            if not any(other != lit and other in lit for other in all_literals)
+        )
+        self._gate: Optional[Pattern] = None
+        if all_literals:
+            alternation = "|".join(
+                re.escape(lit) for lit in sorted(all_literals, key=len, reverse=True)
+            )
+            self._gate = re.compile(alternation, re.IGNORECASE)
+
+        self.lines_checked = 0
+        self.lines_rejected = 0
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, line: str) -> Iterator[Tuple[K, "re.Match"]]:
+        """Yield (key, match) for every pattern that matches line, in order."""
+        self.lines_checked += 1
+        # Unicode case folding (e.g. KELVIN SIGN ~ "k") only agrees with
+        # str.lower() on ASCII; other lines use the regex gate and skip the
+        # per-pattern literal check
+        lowered = None
+        if line.isascii():
+            lowered = line.lower()
+            gate_hit = any(lit in lowered for lit in self._gate_literals)
+        else:
+            gate_hit = self._gate is not None and self._gate.search(line) is not None
+        if not gate_hit and not self._ungated:
+            self.lines_rejected += 1
+            return
+
+        for (key, pattern), literals in zip(self.patterns, self._literals):
+            if literals is not None:
+                if not gate_hit:
+                    continue
+                if lowered is not None and not any(lit in lowered for lit in literals):
+                    continue
+            match = pattern.search(line)
+            if match:
+                yield key, match
+
+    def first_match(self, line: str) -> Optional[Tuple[K, "re.Match"]]:
+        """(key, match) of the first matching pattern, or None."""
+        return next(self.iter_matches(line), None)
+
+    def search_any(self, line: str) -> bool:
+        """True if any pattern matches line."""
+        return self.first_match(line) is not None
+
+    def stats(self) -> dict:
+        """Prefilter counters."""
+        return {
+            "patterns": len(self.patterns),
+            "gated_patterns": sum(1 for literals in self._literals if literals is not None),
+            "lines_checked": self.lines_checked,
+            "lines_rejected": self.lines_rejected,
+        }
@@ -16,6 +16,7 @@ from dataclasses import dataclass
 
 from src.sentinel.core.models import RunContext, RunStatus
 from src.sentinel.core.run_context import RunContextManager
+from src.sentinel.core.pattern_set import PatternSet
 
 
 @dataclass
@@ -55,6 +56,7 @@ class RunDetector:
         
         # Detection rules from config
         self.log_rules: List[RunDetectionRule] = self._load_log_rules()
+        self._build_rule_set()
         
         # Callbacks for run start/end events
         self.on_run_start_callbacks: List[Callable[[RunContext], None]] = []
@@ -93,6 +95,20 @@ class RunDetector:
         
         return rules
     
+    def _build_rule_set(self):
+        """
+        Compile log_rules into a single-pass prefilter.
+        
+        Call again after changing log_rules. Invalid patterns are skipped.
+        """
+        compiled = []
+        for rule in self.log_rules:
+            try:
+                compiled.append((rule, re.compile(rule.pattern, re.IGNORECASE)))
+            except re.error as e:
+                self.logger.warning(f"Invalid run detection pattern {rule.pattern!r}: {e}")
+        self._rule_set = PatternSet(compiled)
+    
     def register_run_start_callback(self, callback: Callable[[RunContext], None]):
         """Register a callback for run start events."""
         self.on_run_start_callbacks.append(callback)
@@ -245,34 +261,34 @@ class RunDetector:
             Created RunContext if detected, None otherwise
         """
         try:
-            for rule in self.log_rules:
-                match = re.search(rule.pattern, log_line, re.IGNORECASE)
-                if match:
-                    # Extract values from match groups
-                    pipeline = self._extract_value(match, rule.pipeline_extractor) or "unknown"
-                    environment = self._extract_value(match, rule.environment_extractor) or "unknown"
-                    run_id = self._extract_value(match, rule.run_id_extractor)
-                    
-                    if not run_id:
-                        # Generate run ID if not found
-                        run_id = f"log-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-                    
-                    # Check if we already detected this run
-                    if run_id in self._detected_runs:
-                        return self._detected_runs[run_id]
-                    
-                    context = self.context_manager.create_context(
-                        run_id=str(run_id),
-                        pipeline=pipeline,
-                        environment=environment,
-                        branch="",
-                        commit="",
-                        triggered_by=source,
-                    )
-                    
-                    self._detected_runs[run_id] = context
-                    self._notify_run_start(context)
-                    return context
+            first = self._rule_set.first_match(log_line)
+            if first:
+                rule, match = first
+                # Extract values from match groups
+                pipeline = self._extract_value(match, rule.pipeline_extractor) or "unknown"
+                environment = self._extract_value(match, rule.environment_extractor) or "unknown"
+                run_id = self._extract_value(match, rule.run_id_extractor)
+                
+                if not run_id:
+                    # Generate run ID if not found
+                    run_id = f"log-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+                
+                # Check if we already detected this run
+                if run_id in self._detected_runs:
+                    return self._detected_runs[run_id]
+                
+                context = self.context_manager.create_context(
+                    run_id=str(run_id),
+                    pipeline=pipeline,
+                    environment=environment,
+                    branch="",
+                    commit="",
+                    triggered_by=source,
+                )
+                
+                self._detected_runs[run_id] = context
+                self._notify_run_start(context)
+                return context
         
         except Exception as e:
             self.logger.error(f"Error detecting run from log: {e}", exc_info=True)
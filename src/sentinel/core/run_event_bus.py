@@ -0,0 +1,249 @@
+"""
+Run Event Bus
+=============
+
+Fan-out of live run deltas (run, test, pod, job and anomaly events) from
+SentinelService callbacks to streaming API subscribers.
+
+publish() is thread-safe and cheap: the event is numbered, serialized once,
+kept in a small replay ring and handed to each subscriber event loop with a
+single call_soon_threadsafe(); the fan-out to that loop's subscribers then
+runs on the loop. Every subscriber has its own bounded asyncio queue - a slow
+client loses its oldest events (counted in `dropped`, visible to the client
+as a gap in `seq`) and never blocks the publisher or other clients.
+
+Subscribers reconnecting with the last seq they saw get the missed events
+from the replay ring (as long as they are still in it) before live ones.
+
+Usage:
+    ```python
+    bus = RunEventBus()
+    bus.publish("run-1", "test", {"test_id": "api:test_a", "status": "passed"})
+
+    # On an asyncio loop
+    subscription = bus.subscribe(run_id="run-1")
+    event = await subscription.get(timeout=15)
+    bus.unsubscribe(subscription)
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.sentinel.core.models import Anomaly, RunContext
+
+
+logger = logging.getLogger(__name__)
+
+EVENT_TYPES = ("run", "test", "pod", "job", "anomaly")
+
+
+@dataclass
+class RunEvent:
+    """One live delta of a run."""
+    seq: int
+    run_id: str
+    event_type: str
+    data: Dict[str, Any]
+    timestamp: datetime = field(default_factory=datetime.now)
+    payload: str = field(default="", repr=False, compare=False)  # JSON, built once
+
+    def __post_init__(self):
+        if not self.payload:
+            self.payload = json.dumps({
+                "seq": self.seq,
+                "run_id": self.run_id,
+                "type": self.event_type,
+                "timestamp": self.timestamp.isoformat(),
+                "data": self.data,
+            }, default=str)
+
+
+def run_summary(context: RunContext) -> Dict[str, Any]:
+    """Run fields and counters served by the API and sent as stream snapshots."""
+    return {
+        "run_id": context.run_id,
+        "pipeline": context.pipeline,
+        "environment": context.environment,
+        "branch": context.branch,
+        "commit": context.commit,
+        "status": context.status.value,
+        "start_time": context.start_time.isoformat() if context.start_time else None,
+        "end_time": context.end_time.isoformat() if context.end_time else None,
+        "duration_seconds": context.duration_seconds(),
+        "total_tests": context.total_tests(),
+        "passed_tests": context.passed_tests(),
+        "failed_tests": context.failed_tests(),
+        "skipped_tests": context.skipped_tests(),
+        "failure_rate": context.failure_rate(),
+        "anomalies_count": len(context.anomalies),
+        "suites": list(context.suites.keys()),
+        "suite_breakdown": context.suite_breakdown()
+    }
+
+
+def anomaly_summary(anomaly: Anomaly) -> Dict[str, Any]:
+    """Anomaly fields served by the API and sent as stream deltas."""
+    return {
+        "anomaly_id": anomaly.anomaly_id,
+        "severity": anomaly.severity.value,
+        "category": anomaly.category.value,
+        "title": anomaly.title,
+        "description": anomaly.description,
+        "timestamp": anomaly.timestamp.isoformat(),
+        "affected_component": anomaly.affected_component
+    }
+
+
+class Subscription:
+    """A subscriber's filter and bounded queue (owned by one event loop)."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        run_id: Optional[str],
+        event_types: Optional[Set[str]],
+        max_queue: int,
+        last_seq: int
+    ):
+        self.loop = loop
+        self.run_id = run_id
+        self.event_types = event_types
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.last_seq = last_seq
+        self.dropped = 0
+
+    def matches(self, event: RunEvent) -> bool:
+        """True if the event passes this subscriber's run/type filter."""
+        return (
+            (self.run_id is None or event.run_id == self.run_id)
+            and (self.event_types is None or event.event_type in self.event_types)
+        )
+
+    def offer(self, event: RunEvent):
+        """Queue an event, dropping the oldest one when full (loop thread only)."""
+        if event.seq <= self.last_seq:
+            return  # Already delivered by replay
+        self.last_seq = event.seq
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[RunEvent]:
+        """Next event, or None if timeout expires first."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def drain(self) -> List[RunEvent]:
+        """All queued events without waiting."""
+        events = []
+        while not self.queue.empty():
+            events.append(self.queue.get_nowait())
+        return events
+
+
+class RunEventBus:
+    """Thread-safe publisher with per-subscriber bounded queues."""
+
+    def __init__(self, max_queue: int = 1000, replay_size: int = 1000):
+        """
+        Args:
+            max_queue: Events buffered per subscriber before the oldest are dropped
+            replay_size: Recent events kept for reconnecting subscribers
+        """
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._replay: deque = deque(maxlen=replay_size)
+        self._subscribers: Dict[asyncio.AbstractEventLoop, List[Subscription]] = {}
+        self.published = 0
+
+    def publish(self, run_id: str, event_type: str, data: Dict[str, Any]) -> RunEvent:
+        """Publish a delta to every matching subscriber (any thread)."""
+        with self._lock:
+            self._seq += 1
+            event = RunEvent(self._seq, run_id, event_type, data)
+            self._replay.append(event)
+            self.published += 1
+            # Scheduled under the lock: callbacks of one loop run in FIFO
+            # order, so every loop fans events out in seq order (offer()
+            # drops anything at or below the last seq it has seen)
+            for loop in list(self._subscribers):
+                try:
+                    loop.call_soon_threadsafe(self._fan_out, loop, event)
+                except RuntimeError:
+                    logger.debug("Dropping subscribers of a closed event loop")
+                    self._subscribers.pop(loop, None)
+        return event
+
+    def _fan_out(self, loop: asyncio.AbstractEventLoop, event: RunEvent):
+        for subscription in list(self._subscribers.get(loop, ())):
+            if subscription.matches(event):
+                subscription.offer(event)
+
+    def subscribe(
+        self,
+        run_id: Optional[str] = None,
+        event_types: Optional[Iterable[str]] = None,
+        last_seq: Optional[int] = None
+    ) -> Subscription:
+        """
+        Subscribe from the running event loop.
+
+        Args:
+            run_id: Only events of this run (None: all runs)
+            event_types: Only these event types (None: all)
+            last_seq: Replay buffered events after this seq first
+
+        Returns:
+            Subscription; call unsubscribe() when done
+        """
+        loop = asyncio.get_running_loop()
+        types = set(event_types) if event_types else None
+        with self._lock:
+            subscription = Subscription(loop, run_id, types, self.max_queue, self._seq)
+            if last_seq is not None:
+                subscription.last_seq = last_seq
+                for event in self._replay:
+                    if subscription.matches(event):
+                        subscription.offer(event)
+                subscription.last_seq = max(subscription.last_seq, self._seq)
+            self._subscribers.setdefault(loop, []).append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscription (no-op if already removed)."""
+        with self._lock:
+            subscriptions = self._subscribers.get(subscription.loop, [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+            if not subscriptions:
+                self._subscribers.pop(subscription.loop, None)
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the latest published event."""
+        return self._seq
+
+    def stats(self) -> Dict[str, int]:
+        """Get publisher and subscriber counters."""
+        with self._lock:
+            subscriptions = [s for subs in self._subscribers.values() for s in subs]
+            return {
+                "published": self.published,
+                "last_seq": self._seq,
+                "subscribers": len(subscriptions),
+                "dropped": sum(s.dropped for s in subscriptions),
+            }
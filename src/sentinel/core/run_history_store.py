@@ -3,14 +3,44 @@ Run History Store
 =================
 
 Persists and queries historical data about runs, tests, anomalies, and infrastructure context.
+
+Writes are write-behind: save_run()/save_progress() only queue the run and
+return. A dedicated writer thread takes everything queued since its last
+pass (several saves of one run coalesce into one) and writes it in a single
+transaction of batched upserts - executemany on SQLite (WAL journal),
+execute_values on PostgreSQL. After a run's first write, only the tests
+changed since the previous flush (RunContext.take_dirty_tests()) and new
+anomalies are written again.
+
+Baselines are materialized: each finished run is folded (once) into daily
+rollups per (pipeline, environment) and per test_id, holding counts,
+mean/variance and quantile sketches (see baseline_rollups), so
+get_baseline() merges at most one row per day of the window.
 """
 
+import base64
+import heapq
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import asdict
 import json
 
+try:
+    from psycopg2.extras import execute_values
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+from src.sentinel.core.baseline_rollups import (
+    BASELINE_RUN_STATUSES,
+    RunRollup,
+    TestRollup,
+    merge_rollups,
+    rollup_day,
+)
 from src.sentinel.core.models import (
     RunContext,
     SuiteRun,
@@ -20,12 +50,93 @@ from src.sentinel.core.models import (
 )
 
 
+# Upserted tables in write order: table -> (primary key columns, columns)
+UPSERT_TABLES: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "runs": (("run_id",), (
+        "run_id", "pipeline", "environment", "branch", "commit_hash", "triggered_by",
+        "start_time", "end_time", "status", "duration_seconds",
+        "total_tests", "passed_tests", "failed_tests", "skipped_tests", "metadata",
+    )),
+    "suites": (("suite_id",), (
+        "suite_id", "run_id", "suite_name", "start_time", "end_time",
+        "duration_seconds", "total_tests", "passed_tests", "failed_tests", "skipped_tests",
+    )),
+    "tests": (("test_id",), (
+        "test_id", "run_id", "suite_name", "test_name", "status",
+        "start_time", "end_time", "duration_seconds", "tags", "xray_id", "error_message",
+    )),
+    "anomalies": (("anomaly_id",), (
+        "anomaly_id", "run_id", "timestamp", "severity", "category",
+        "title", "description", "affected_component", "metadata",
+    )),
+    "run_rollups": (("pipeline", "environment", "day"), (
+        "pipeline", "environment", "day", "run_count",
+        "total_tests_sum", "passed_tests_sum", "failed_tests_sum", "duration", "failure_rate",
+    )),
+    "test_rollups": (("pipeline", "environment", "test_id", "day"), (
+        "pipeline", "environment", "test_id", "day", "run_count", "failed_count", "duration",
+    )),
+    "rolled_up_runs": (("run_id",), ("run_id", "day")),
+}
+
+
+def _upsert_sql(table: str, values_clause: str) -> str:
+    """INSERT ... ON CONFLICT DO UPDATE (valid on SQLite >= 3.24 and PostgreSQL)."""
+    keys, columns = UPSERT_TABLES[table]
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column not in keys)
+    conflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES {values_clause} "
+        f"ON CONFLICT ({', '.join(keys)}) {conflict}"
+    )
+
+
+# Columns of the runs table that queries can project
+RUN_FIELDS: Tuple[str, ...] = UPSERT_TABLES["runs"][1] + ("created_at",)
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _sort_key(start_time: Any, run_id: str) -> tuple:
+    """Python twin of ORDER BY start_time DESC NULLS LAST, run_id DESC (used with max-first)."""
+    if isinstance(start_time, datetime):
+        start_time = start_time.isoformat()
+    return (start_time is not None, start_time or "", run_id)
+
+
+def encode_cursor(run: Dict[str, Any]) -> str:
+    """Opaque keyset cursor pointing just after `run` in (start_time, run_id) order."""
+    start_time = run.get("start_time")
+    if isinstance(start_time, datetime):
+        start_time = start_time.isoformat()
+    raw = json.dumps([start_time, run["run_id"]])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[str], str]:
+    """
+    Decode a cursor made by encode_cursor().
+    
+    Raises:
+        ValueError: Malformed cursor
+    """
+    try:
+        start_time, run_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(run_id, str) or not (start_time is None or isinstance(start_time, str)):
+        raise ValueError("Invalid cursor")
+    return start_time, run_id
+
+
 class RunHistoryStore:
     """
     Stores and retrieves historical run data.
     
     Supports:
-    - Persisting run metadata
+    - Persisting run metadata (write-behind, incremental for live runs)
     - Querying runs by filters
     - Generating baselines and trends
     - Aggregating statistics
@@ -41,9 +152,29 @@ class RunHistoryStore:
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
         
+        write_behind = self.config.get("database", {}).get("write_behind", {})
+        self.write_behind_enabled = write_behind.get("enabled", True)
+        self.batch_size = write_behind.get("batch_size", 1000)  # execute_values page size
+        
         # Database connection (will be initialized based on config)
         self.db_connection = None
+        self.dialect = "sqlite"
+        self._db_lock = threading.RLock()
         self._init_database()
+        
+        # Write-behind queue: run_id -> (context, final); the writer thread
+        # swaps the whole dict out, so repeated saves of a run coalesce
+        self._pending: Dict[str, Tuple[RunContext, bool]] = {}
+        self._pending_cond = threading.Condition()
+        self._writing = False
+        self._stopping = False
+        self._writer_thread: Optional[threading.Thread] = None
+        
+        # run_id -> anomalies already written; a run is listed once all of it
+        # has been written, after which only dirty tests are rewritten
+        self._written_runs: Dict[str, int] = {}
+        self._stats = {"batches": 0, "runs_written": 0, "tests_written": 0, "errors": 0}
+        self._data_version = 0
     
     def _init_database(self):
         """Initialize database connection."""
@@ -71,7 +202,10 @@ class RunHistoryStore:
                 user=db_config.get("user", "sentinel"),
                 password=db_config.get("password", "")
             )
+            # Reads run in autocommit; writes open an explicit transaction
+            # (see _transaction) so a batch is committed or rolled back whole
             self.db_connection.autocommit = True
+            self.dialect = "postgresql"
             self.logger.info("PostgreSQL connection established")
             self._create_tables()
         
@@ -93,6 +227,14 @@ class RunHistoryStore:
             
             self.db_connection = sqlite3.connect(db_path, check_same_thread=False)
             self.db_connection.row_factory = sqlite3.Row
+            self.dialect = "sqlite"
+            
+            # WAL lets readers run while the writer thread commits; NORMAL
+            # only syncs at checkpoints (a crash can lose the last commits,
+            # never corrupt the file)
+            sqlite_config = db_config.get("sqlite", {})
+            self.db_connection.execute(f"PRAGMA journal_mode={sqlite_config.get('journal_mode', 'WAL')}")
+            self.db_connection.execute(f"PRAGMA synchronous={sqlite_config.get('synchronous', 'NORMAL')}")
             self.logger.info(f"SQLite connection established: {db_path}")
             self._create_tables()
         
@@ -201,12 +343,62 @@ class RunHistoryStore:
                 )
             """)
             
+            # Baseline rollups (one row per day; metric columns hold
+            # baseline_rollups.MetricRollup JSON)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS run_rollups (
+                    pipeline TEXT NOT NULL,
+                    environment TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    run_count INTEGER,
+                    total_tests_sum INTEGER,
+                    passed_tests_sum INTEGER,
+                    failed_tests_sum INTEGER,
+                    duration TEXT,
+                    failure_rate TEXT,
+                    PRIMARY KEY (pipeline, environment, day)
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS test_rollups (
+                    pipeline TEXT NOT NULL,
+                    environment TEXT NOT NULL,
+                    test_id TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    run_count INTEGER,
+                    failed_count INTEGER,
+                    duration TEXT,
+                    PRIMARY KEY (pipeline, environment, test_id, day)
+                )
+            """)
+            
+            # Runs already folded into the rollups (keeps re-saves idempotent)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS rolled_up_runs (
+                    run_id TEXT PRIMARY KEY,
+                    day TEXT
+                )
+            """)
+            
             # Create indexes
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_runs_pipeline ON runs(pipeline)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_runs_environment ON runs(environment)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_runs_start_time ON runs(start_time)")
+            # Keyset pagination: equality filters, then (start_time, run_id) order
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_runs_page ON runs(start_time, run_id)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_pipeline_env_page "
+                "ON runs(pipeline, environment, start_time, run_id)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_status_page ON runs(status, start_time, run_id)"
+            )
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_tests_run_id ON tests(run_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_anomalies_run_id ON anomalies(run_id)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_test_rollups_day ON test_rollups(pipeline, environment, day)"
+            )
             
             self.db_connection.commit()
             self.logger.info("Database tables created successfully")
@@ -214,117 +406,407 @@ class RunHistoryStore:
         except Exception as e:
             self.logger.error(f"Error creating tables: {e}", exc_info=True)
     
+    # -------------------------------------------------------------------------
+    # Writes (write-behind)
+    # -------------------------------------------------------------------------
+    
     def save_run(self, context: RunContext):
         """
-        Save a run context to the database.
+        Save a finished run.
+        
+        With write-behind enabled this only queues the run; use flush() to
+        wait until it is in the database.
         
         Args:
             context: RunContext to save
         """
+        self._submit(context, final=True)
+    
+    def save_progress(self, context: RunContext):
+        """
+        Queue a snapshot of a live run.
+        
+        Cheap enough to call every few seconds on big runs: only tests changed
+        since the previous flush are written.
+        
+        Args:
+            context: RunContext of an active run
+        """
+        self._submit(context, final=False)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued save has been written.
+        
+        Returns:
+            False if the timeout expired first
+        """
+        with self._pending_cond:
+            return self._pending_cond.wait_for(
+                lambda: not self._pending and not self._writing, timeout
+            )
+    
+    def stop(self, timeout: float = 10.0):
+        """Write pending saves and stop the writer thread (restarted by the next save)."""
+        with self._pending_cond:
+            self._stopping = True
+            self._pending_cond.notify_all()
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout)
+            self._writer_thread = None
+    
+    def get_write_stats(self) -> Dict[str, int]:
+        """Get writer counters (batches, runs/tests written, errors, pending runs)."""
+        with self._pending_cond:
+            return {**self._stats, "pending_runs": len(self._pending)}
+    
+    def _submit(self, context: RunContext, final: bool):
         if not self.db_connection:
-            # In-memory storage
-            self._memory_store[context.run_id] = asdict(context)
+            # In-memory storage keeps finished runs only
+            if final:
+                self._memory_store[context.run_id] = asdict(context)
+                self._data_version += 1
             return
         
+        if not self.write_behind_enabled:
+            self._write_batch({context.run_id: (context, final)})
+            return
+        
+        with self._pending_cond:
+            queued = self._pending.get(context.run_id)
+            self._pending[context.run_id] = (context, final or (queued is not None and queued[1]))
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._stopping = False
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="sentinel-history-writer", daemon=True
+                )
+                self._writer_thread.start()
+            self._pending_cond.notify_all()
+    
+    def _writer_loop(self):
+        """Drain the queue until stop() is called and nothing is pending."""
+        while True:
+            with self._pending_cond:
+                while not self._pending and not self._stopping:
+                    self._pending_cond.wait()
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, {}
+                self._writing = True
+            
+            try:
+                self._write_batch(batch)
+            finally:
+                with self._pending_cond:
+                    self._writing = False
+                    self._pending_cond.notify_all()
+    
+    def _write_batch(self, batch: Dict[str, Tuple[RunContext, bool]]):
+        """Write queued runs in one transaction of batched upserts."""
+        with self._db_lock:
+            rows: Dict[str, Dict[Any, tuple]] = {table: {} for table in UPSERT_TABLES}
+            anomaly_counts = {}
+            
+            for run_id, (context, final) in batch.items():
+                dirty = context.take_dirty_tests()
+                if run_id in self._written_runs:
+                    tests = [context.tests[test_id] for test_id in dirty if test_id in context.tests]
+                    anomalies = context.anomalies[self._written_runs[run_id]:]
+                else:
+                    tests = list(context.tests.values())
+                    anomalies = list(context.anomalies)
+                anomaly_counts[run_id] = self._written_runs.get(run_id, 0) + len(anomalies)
+                
+                rows["runs"][run_id] = self._run_row(context)
+                for suite_name, suite in list(context.suites.items()):
+                    rows["suites"][f"{run_id}:{suite_name}"] = self._suite_row(context, suite)
+                for test in tests:
+                    rows["tests"][test.test_id] = self._test_row(context, test)
+                for anomaly in anomalies:
+                    rows["anomalies"][anomaly.anomaly_id] = self._anomaly_row(context, anomaly)
+            
+            try:
+                with self._transaction() as cursor:
+                    self._fold_into_rollups(
+                        cursor, [context for context, final in batch.values() if final], rows
+                    )
+                    self._execute_upserts(cursor, rows)
+            except Exception as e:
+                self.logger.error(f"Error saving runs {list(batch)}: {e}", exc_info=True)
+                for run_id in batch:
+                    # The next save of these runs rewrites them in full
+                    self._written_runs.pop(run_id, None)
+                self._stats["errors"] += 1
+                return
+            
+            for run_id, (context, final) in batch.items():
+                if final:
+                    self._written_runs.pop(run_id, None)
+                    self.logger.info(f"Saved run {run_id} to history")
+                else:
+                    self._written_runs[run_id] = anomaly_counts[run_id]
+            self._data_version += 1
+            self._stats["batches"] += 1
+            self._stats["runs_written"] += len(batch)
+            self._stats["tests_written"] += len(rows["tests"])
+    
+    @contextmanager
+    def _transaction(self):
+        """
+        Run the block in one transaction and yield its cursor.
+        
+        Committed when the block succeeds, rolled back when it raises. The
+        PostgreSQL connection leaves autocommit for the duration; SQLite
+        takes the write lock up front so reads in the block are consistent
+        with the writes.
+        """
+        connection = self.db_connection
+        if self.dialect == "postgresql":
+            connection.autocommit = False
         try:
-            cursor = self.db_connection.cursor()
+            cursor = connection.cursor()
+            if self.dialect == "sqlite":
+                cursor.execute("BEGIN IMMEDIATE")
+            yield cursor
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            if self.dialect == "postgresql":
+                connection.autocommit = True
+    
+    def _execute_upserts(self, cursor, rows: Dict[str, Dict[Any, tuple]]):
+        """Upsert the rows of every table on the cursor (the caller commits)."""
+        for table, table_rows in rows.items():
+            if not table_rows:
+                continue
+            values = list(table_rows.values())
+            if self.dialect == "postgresql":
+                execute_values(cursor, _upsert_sql(table, "%s"), values, page_size=self.batch_size)
+            else:
+                placeholders = ", ".join("?" * len(UPSERT_TABLES[table][1]))
+                cursor.executemany(_upsert_sql(table, f"({placeholders})"), values)
+    
+    @staticmethod
+    def _run_row(context: RunContext) -> tuple:
+        return (
+            context.run_id,
+            context.pipeline,
+            context.environment,
+            context.branch,
+            context.commit if hasattr(context, 'commit') else None,
+            context.triggered_by,
+            _iso(context.start_time),
+            _iso(context.end_time),
+            context.status.value,
+            context.duration_seconds(),
+            context.total_tests(),
+            context.passed_tests(),
+            context.failed_tests(),
+            context.skipped_tests(),
+            json.dumps({
+                "ci_run_id": context.ci_run_id,
+                "ci_workflow_id": context.ci_workflow_id,
+                "k8s_job_name": context.k8s_job_name,
+                "k8s_namespace": context.k8s_namespace,
+            })
+        )
+    
+    @staticmethod
+    def _suite_row(context: RunContext, suite: SuiteRun) -> tuple:
+        return (
+            f"{context.run_id}:{suite.suite_name}",
+            context.run_id,
+            suite.suite_name,
+            _iso(suite.start_time),
+            _iso(suite.end_time),
+            suite.duration_seconds(),
+            suite.total_tests,
+            suite.passed_tests,
+            suite.failed_tests,
+            suite.skipped_tests
+        )
+    
+    @staticmethod
+    def _test_duration(test: TestCaseRun) -> Optional[float]:
+        # The duration_seconds field shadows the method of the same name, so
+        # on instances it is either a stored number or the bare function
+        duration = test.duration_seconds
+        if isinstance(duration, (int, float)):
+            return duration
+        if test.start_time and test.end_time:
+            return (test.end_time - test.start_time).total_seconds()
+        return None
+    
+    @classmethod
+    def _test_row(cls, context: RunContext, test: TestCaseRun) -> tuple:
+        return (
+            test.test_id,
+            context.run_id,
+            test.suite_name,
+            test.test_name,
+            test.status.value,
+            _iso(test.start_time),
+            _iso(test.end_time),
+            cls._test_duration(test),
+            json.dumps(sorted(test.tags)),
+            test.xray_id,
+            test.error_message
+        )
+    
+    @staticmethod
+    def _anomaly_row(context: RunContext, anomaly: Anomaly) -> tuple:
+        return (
+            anomaly.anomaly_id,
+            context.run_id,
+            anomaly.timestamp.isoformat(),
+            anomaly.severity.value,
+            anomaly.category.value,
+            anomaly.title,
+            anomaly.description,
+            anomaly.affected_component,
+            json.dumps(anomaly.metadata)
+        )
+    
+    # -------------------------------------------------------------------------
+    # Baseline rollups
+    # -------------------------------------------------------------------------
+    
+    def _sql(self, query: str) -> str:
+        """Adapt '?' placeholders to the connection's paramstyle."""
+        return query.replace("?", "%s") if self.dialect == "postgresql" else query
+    
+    def _fold_into_rollups(self, cursor, contexts: List[RunContext], rows: Dict[str, Dict[Any, tuple]]):
+        """
+        Fold finished runs into the day rollups.
+        
+        Runs already listed in rolled_up_runs are skipped, so saving a run
+        twice does not count it twice. Reads go through the cursor of the
+        batch's transaction; the updated rollup rows and rolled_up_runs
+        markers are added to `rows` and upserted in that same transaction.
+        """
+        run_rollups: Dict[tuple, RunRollup] = {}
+        test_rollups: Dict[tuple, TestRollup] = {}
+        
+        for context in contexts:
+            if context.status.value not in BASELINE_RUN_STATUSES:
+                continue
+            cursor.execute(self._sql("SELECT 1 FROM rolled_up_runs WHERE run_id = ?"), (context.run_id,))
+            if cursor.fetchone() or context.run_id in rows["rolled_up_runs"]:
+                continue
             
-            # Save run
-            cursor.execute("""
-                INSERT OR REPLACE INTO runs (
-                    run_id, pipeline, environment, branch, commit_hash, triggered_by,
-                    start_time, end_time, status, duration_seconds,
-                    total_tests, passed_tests, failed_tests, skipped_tests, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                context.run_id,
-                context.pipeline,
-                context.environment,
-                context.branch,
-                context.commit if hasattr(context, 'commit') else None,
-                context.triggered_by,
-                context.start_time.isoformat() if context.start_time else None,
-                context.end_time.isoformat() if context.end_time else None,
-                context.status.value,
+            scope = (context.pipeline, context.environment, rollup_day(context.start_time))
+            if scope not in run_rollups:
+                self._load_rollups(cursor, scope, run_rollups, test_rollups)
+            self._add_to_rollups(
+                scope,
                 context.duration_seconds(),
                 context.total_tests(),
                 context.passed_tests(),
                 context.failed_tests(),
-                sum(1 for t in context.tests.values() if t.status.value == "skipped"),
-                json.dumps({
-                    "ci_run_id": context.ci_run_id,
-                    "ci_workflow_id": context.ci_workflow_id,
-                    "k8s_job_name": context.k8s_job_name,
-                    "k8s_namespace": context.k8s_namespace,
-                })
-            ))
-            
-            # Save suites
-            for suite_name, suite in context.suites.items():
-                suite_id = f"{context.run_id}:{suite_name}"
-                cursor.execute("""
-                    INSERT OR REPLACE INTO suites (
-                        suite_id, run_id, suite_name, start_time, end_time,
-                        duration_seconds, total_tests, passed_tests, failed_tests, skipped_tests
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    suite_id,
-                    context.run_id,
-                    suite.suite_name,
-                    suite.start_time.isoformat() if suite.start_time else None,
-                    suite.end_time.isoformat() if suite.end_time else None,
-                    suite.duration_seconds(),
-                    suite.total_tests,
-                    suite.passed_tests,
-                    suite.failed_tests,
-                    suite.skipped_tests
-                ))
+                [(test.test_id, test.status.value, self._test_duration(test))
+                 for test in list(context.tests.values())],
+                run_rollups,
+                test_rollups
+            )
+            rows["rolled_up_runs"][context.run_id] = (context.run_id, scope[2])
+        
+        for key, rollup in run_rollups.items():
+            rows["run_rollups"][key] = rollup.to_row(*key)
+        for key, rollup in test_rollups.items():
+            rows["test_rollups"][key] = rollup.to_row(*key)
+    
+    def _load_rollups(
+        self,
+        cursor,
+        scope: Tuple[str, str, str],
+        run_rollups: Dict[tuple, RunRollup],
+        test_rollups: Dict[tuple, TestRollup]
+    ):
+        """Load the stored run and test rollups of one (pipeline, environment, day)."""
+        cursor.execute(self._sql("""
+            SELECT run_count, total_tests_sum, passed_tests_sum, failed_tests_sum, duration, failure_rate
+            FROM run_rollups WHERE pipeline = ? AND environment = ? AND day = ?
+        """), scope)
+        row = cursor.fetchone()
+        run_rollups[scope] = RunRollup.from_row(row) if row else RunRollup()
+        
+        pipeline, environment, day = scope
+        cursor.execute(self._sql("""
+            SELECT test_id, run_count, failed_count, duration
+            FROM test_rollups WHERE pipeline = ? AND environment = ? AND day = ?
+        """), scope)
+        for row in cursor.fetchall():
+            test_rollups[(pipeline, environment, row[0], day)] = TestRollup.from_row(row[1:])
+    
+    @staticmethod
+    def _add_to_rollups(
+        scope: Tuple[str, str, str],
+        duration: Optional[float],
+        total: int,
+        passed: int,
+        failed: int,
+        tests: List[Tuple[str, str, Optional[float]]],
+        run_rollups: Dict[tuple, RunRollup],
+        test_rollups: Dict[tuple, TestRollup]
+    ):
+        run_rollups.setdefault(scope, RunRollup()).add_run(duration, total, passed, failed)
+        pipeline, environment, day = scope
+        for test_id, status, test_duration in tests:
+            test_rollups.setdefault(
+                (pipeline, environment, test_id, day), TestRollup()
+            ).add_result(status, test_duration)
+    
+    def rebuild_rollups(self) -> int:
+        """
+        Recompute the run rollups from the runs table.
+        
+        Backfills run baselines for history saved before rollups existed. The
+        old run rollups are replaced in one transaction. Test rollups are
+        kept as they are: the tests table holds only the latest result of
+        each test_id, so they cannot be recomputed from it.
+        
+        Returns:
+            Number of runs folded into the rollups
+        """
+        if not self.db_connection:
+            return 0
+        
+        self.flush()
+        with self._db_lock, self._transaction() as cursor:
+            cursor.execute(self._sql("""
+                SELECT run_id, pipeline, environment, start_time, duration_seconds,
+                       total_tests, passed_tests, failed_tests
+                FROM runs WHERE status IN (?, ?)
+            """), BASELINE_RUN_STATUSES)
+            runs = cursor.fetchall()
             
-            # Save tests
-            for test_id, test in context.tests.items():
-                cursor.execute("""
-                    INSERT OR REPLACE INTO tests (
-                        test_id, run_id, suite_name, test_name, status,
-                        start_time, end_time, duration_seconds, tags, xray_id, error_message
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    test_id,
-                    context.run_id,
-                    test.suite_name,
-                    test.test_name,
-                    test.status.value,
-                    test.start_time.isoformat() if test.start_time else None,
-                    test.end_time.isoformat() if test.end_time else None,
-                    test.duration_seconds(),
-                    json.dumps(list(test.tags)),
-                    test.xray_id,
-                    test.error_message
-                ))
+            rows: Dict[str, Dict[Any, tuple]] = {"run_rollups": {}, "rolled_up_runs": {}}
+            run_rollups: Dict[tuple, RunRollup] = {}
+            for run_id, pipeline, environment, start_time, duration, total, passed, failed in runs:
+                if isinstance(start_time, str):
+                    start_time = datetime.fromisoformat(start_time)
+                scope = (pipeline, environment, rollup_day(start_time))
+                self._add_to_rollups(
+                    scope, duration, total or 0, passed or 0, failed or 0, [], run_rollups, {}
+                )
+                rows["rolled_up_runs"][run_id] = (run_id, scope[2])
             
-            # Save anomalies
-            for anomaly in context.anomalies:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO anomalies (
-                        anomaly_id, run_id, timestamp, severity, category,
-                        title, description, affected_component, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    anomaly.anomaly_id,
-                    context.run_id,
-                    anomaly.timestamp.isoformat(),
-                    anomaly.severity.value,
-                    anomaly.category.value,
-                    anomaly.title,
-                    anomaly.description,
-                    anomaly.affected_component,
-                    json.dumps(anomaly.metadata)
-                ))
+            for key, rollup in run_rollups.items():
+                rows["run_rollups"][key] = rollup.to_row(*key)
             
-            self.db_connection.commit()
-            self.logger.info(f"Saved run {context.run_id} to history")
+            # Readers see the old rollups until the new ones are committed
+            for table in rows:
+                cursor.execute(f"DELETE FROM {table}")
+            self._execute_upserts(cursor, rows)
         
-        except Exception as e:
-            self.logger.error(f"Error saving run: {e}", exc_info=True)
+        self.logger.info(f"Rebuilt baseline rollups from {len(runs)} runs")
+        return len(runs)
+    
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
     
     def get_run(self, run_id: str) -> Optional[Dict]:
         """
@@ -340,9 +822,10 @@ class RunHistoryStore:
             return self._memory_store.get(run_id)
         
         try:
-            cursor = self.db_connection.cursor()
-            cursor.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,))
-            row = cursor.fetchone()
+            with self._db_lock:
+                cursor = self.db_connection.cursor()
+                cursor.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,))
+                row = cursor.fetchone()
             
             if row:
                 return dict(row)
@@ -358,7 +841,9 @@ class RunHistoryStore:
         environment: Optional[str] = None,
         status: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
     ) -> List[Dict]:
         """
         Query runs with filters.
@@ -368,57 +853,148 @@ class RunHistoryStore:
             environment: Filter by environment
             status: Filter by status
             limit: Maximum results
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored with cursor)
+            cursor: Keyset cursor from query_runs_page()
+            fields: Columns to return (default: all)
             
         Returns:
-            List of run dictionaries
+            List of run dictionaries, newest first
         """
-        if not self.db_connection:
-            # In-memory filtering
-            runs = list(self._memory_store.values())
-            if pipeline:
-                runs = [r for r in runs if r.get("pipeline") == pipeline]
-            if environment:
-                runs = [r for r in runs if r.get("environment") == environment]
-            if status:
-                runs = [r for r in runs if r.get("status") == status]
-            return runs[offset:offset+limit]
+        return self.query_runs_page(
+            pipeline, environment, status, limit, offset, cursor, fields
+        )["runs"]
+    
+    def query_runs_page(
+        self,
+        pipeline: Optional[str] = None,
+        environment: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Query one page of runs ordered by (start_time, run_id) descending.
         
-        try:
-            cursor = self.db_connection.cursor()
-            
-            conditions = []
-            params = []
-            
-            if pipeline:
-                conditions.append("pipeline = ?")
-                params.append(pipeline)
-            if environment:
-                conditions.append("environment = ?")
-                params.append(environment)
-            if status:
-                conditions.append("status = ?")
-                params.append(status)
-            
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
-            
-            query = f"""
-                SELECT * FROM runs
-                WHERE {where_clause}
-                ORDER BY start_time DESC
-                LIMIT ? OFFSET ?
-            """
+        With a cursor the page starts right after the run the cursor was
+        taken from (an index range scan, so deep pages cost the same as the
+        first); runs without start_time come last.
+        
+        Args:
+            pipeline: Filter by pipeline
+            environment: Filter by environment
+            status: Filter by status
+            limit: Maximum results
+            offset: Offset for pagination (ignored with cursor)
+            cursor: next_cursor of the previous page
+            fields: Columns to return (default: all)
             
-            params.extend([limit, offset])
-            cursor.execute(query, params)
+        Returns:
+            {"runs": [...], "next_cursor": str or None on the last page}
             
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        Raises:
+            ValueError: Unknown field or malformed cursor
+        """
+        columns = self._projection(fields)
+        position = decode_cursor(cursor) if cursor else None
+        filters = {"pipeline": pipeline, "environment": environment, "status": status}
+        
+        if not self.db_connection:
+            rows = self._memory_page(filters, limit, offset, position)
+        else:
+            rows = self._db_page(filters, columns, limit, offset, position)
+        
+        next_cursor = encode_cursor(rows[limit - 1]) if limit > 0 and len(rows) > limit else None
+        runs = rows[:limit]
+        if fields:
+            runs = [{column: run.get(column) for column in columns} for run in runs]
+        return {"runs": runs, "next_cursor": next_cursor}
+    
+    @staticmethod
+    def _projection(fields: Optional[List[str]]) -> List[str]:
+        if not fields:
+            return list(RUN_FIELDS)
+        unknown = [field for field in fields if field not in RUN_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown run fields: {', '.join(unknown)}")
+        return list(dict.fromkeys(fields))
+    
+    def _memory_page(
+        self,
+        filters: Dict[str, Optional[str]],
+        limit: int,
+        offset: int,
+        position: Optional[Tuple[Optional[str], str]]
+    ) -> List[Dict]:
+        runs = (
+            run for run in self._memory_store.values()
+            if all(not value or run.get(key) == value for key, value in filters.items())
+        )
+        if position is not None:
+            after = _sort_key(position[0], position[1])
+            runs = (run for run in runs if _sort_key(run.get("start_time"), run["run_id"]) < after)
+            offset = 0
+        # Top-k instead of sorting (or copying) the whole store
+        page = heapq.nlargest(
+            offset + limit + 1, runs, key=lambda run: _sort_key(run.get("start_time"), run["run_id"])
+        )
+        return page[offset:]
+    
+    def _db_page(
+        self,
+        filters: Dict[str, Optional[str]],
+        columns: List[str],
+        limit: int,
+        offset: int,
+        position: Optional[Tuple[Optional[str], str]]
+    ) -> List[Dict]:
+        conditions = []
+        params: List[Any] = []
+        for key, value in filters.items():
+            if value:
+                conditions.append(f"{key} = ?")
+                params.append(value)
+        
+        if position is not None:
+            start_time, run_id = position
+            if start_time is None:
+                conditions.append("(start_time IS NULL AND run_id < ?)")
+                params.append(run_id)
+            else:
+                conditions.append(
+                    "((start_time, run_id) < (?, ?) OR start_time IS NULL)"
+                )
+                params.extend([start_time, run_id])
+            offset = 0
+        
+        # The cursor needs start_time and run_id even if not projected
+        selected = list(dict.fromkeys(columns + ["start_time", "run_id"]))
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        query = f"""
+            SELECT {', '.join(selected)} FROM runs
+            WHERE {where_clause}
+            ORDER BY start_time DESC NULLS LAST, run_id DESC
+            LIMIT ? OFFSET ?
+        """
+        params.extend([limit + 1, offset])
+        
+        try:
+            with self._db_lock:
+                cursor = self.db_connection.cursor()
+                cursor.execute(self._sql(query), params)
+                rows = cursor.fetchall()
+            return [dict(zip(selected, row)) for row in rows]
         
         except Exception as e:
             self.logger.error(f"Error querying runs: {e}", exc_info=True)
             return []
     
+    @property
+    def data_version(self) -> int:
+        """Counter bumped by every committed write (cheap change detection for caches)."""
+        return self._data_version
+    
     def get_baseline(
         self,
         pipeline: str,
@@ -426,7 +1002,9 @@ class RunHistoryStore:
         days: int = 30
     ) -> Optional[Dict]:
         """
-        Calculate baseline statistics for a pipeline/environment.
+        Get baseline statistics for a pipeline/environment.
+        
+        Merges the daily run rollups of the window (O(days) rows).
         
         Args:
             pipeline: Pipeline name
@@ -434,46 +1012,101 @@ class RunHistoryStore:
             days: Number of days to look back
             
         Returns:
-            Baseline dictionary with statistics
+            Baseline dictionary with means (avg_duration, avg_total_tests,
+            avg_passed_tests, avg_failed_tests), run_count and duration /
+            failure_rate mean, stddev and p50/p95/p99; None without runs
         """
         if not self.db_connection:
             return None
         
         try:
-            cursor = self.db_connection.cursor()
-            
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+            with self._db_lock:
+                cursor = self.db_connection.cursor()
+                cursor.execute(self._sql("""
+                    SELECT run_count, total_tests_sum, passed_tests_sum, failed_tests_sum, duration, failure_rate
+                    FROM run_rollups
+                    WHERE pipeline = ? AND environment = ? AND day >= ?
+                """), (pipeline, environment, self._cutoff_day(days)))
+                rows = cursor.fetchall()
             
-            # Get recent runs
-            cursor.execute("""
-                SELECT 
-                    AVG(duration_seconds) as avg_duration,
-                    AVG(total_tests) as avg_total_tests,
-                    AVG(passed_tests) as avg_passed_tests,
-                    AVG(failed_tests) as avg_failed_tests,
-                    COUNT(*) as run_count
-                FROM runs
-                WHERE pipeline = ? AND environment = ? AND start_time >= ?
-            """, (pipeline, environment, cutoff_date))
+            rollup = merge_rollups((RunRollup.from_row(row) for row in rows), RunRollup())
+            if rollup.run_count == 0:
+                return None
+            return {**rollup.baseline(), "pipeline": pipeline, "environment": environment}
+        
+        except Exception as e:
+            self.logger.error(f"Error calculating baseline: {e}", exc_info=True)
+            return None
+    
+    def get_baselines(self, days: int = 30) -> Dict[Tuple[str, str], Dict]:
+        """
+        Get baselines of every pipeline/environment with runs in the window.
+        
+        Returns:
+            {(pipeline, environment): baseline} as returned by get_baseline()
+        """
+        if not self.db_connection:
+            return {}
+        
+        try:
+            with self._db_lock:
+                cursor = self.db_connection.cursor()
+                cursor.execute(self._sql("""
+                    SELECT pipeline, environment, run_count, total_tests_sum, passed_tests_sum,
+                           failed_tests_sum, duration, failure_rate
+                    FROM run_rollups WHERE day >= ?
+                """), (self._cutoff_day(days),))
+                rows = cursor.fetchall()
             
-            row = cursor.fetchone()
-            if row and row[4] > 0:  # run_count > 0
-                return {
-                    "avg_duration": row[0],
-                    "avg_total_tests": row[1],
-                    "avg_passed_tests": row[2],
-                    "avg_failed_tests": row[3],
-                    "run_count": row[4],
-                    "pipeline": pipeline,
-                    "environment": environment
+            rollups: Dict[Tuple[str, str], RunRollup] = {}
+            for row in rows:
+                rollups.setdefault((row[0], row[1]), RunRollup()).merge(RunRollup.from_row(row[2:]))
+            return {
+                (pipeline, environment): {
+                    **rollup.baseline(), "pipeline": pipeline, "environment": environment
                 }
+                for (pipeline, environment), rollup in rollups.items()
+            }
+        
+        except Exception as e:
+            self.logger.error(f"Error calculating baselines: {e}", exc_info=True)
+            return {}
+    
+    def get_test_baselines(
+        self,
+        pipeline: str,
+        environment: str,
+        days: int = 30
+    ) -> Dict[str, Dict]:
+        """
+        Get per-test baselines for a pipeline/environment.
+        
+        Returns:
+            {test_id: {"run_count", "failure_rate", "duration_mean",
+            "duration_stddev", "duration_p50", "duration_p95", "duration_p99"}}
+        """
+        if not self.db_connection:
+            return {}
+        
+        try:
+            with self._db_lock:
+                cursor = self.db_connection.cursor()
+                cursor.execute(self._sql("""
+                    SELECT test_id, run_count, failed_count, duration
+                    FROM test_rollups
+                    WHERE pipeline = ? AND environment = ? AND day >= ?
+                """), (pipeline, environment, self._cutoff_day(days)))
+                rows = cursor.fetchall()
             
-            return None
+            rollups: Dict[str, TestRollup] = {}
+            for row in rows:
+                rollups.setdefault(row[0], TestRollup()).merge(TestRollup.from_row(row[1:]))
+            return {test_id: rollup.baseline() for test_id, rollup in rollups.items()}
         
         except Exception as e:
-            self.logger.error(f"Error calculating baseline: {e}", exc_info=True)
-            return None
-
-
-
-
+            self.logger.error(f"Error calculating test baselines: {e}", exc_info=True)
+            return {}
+    
+    @staticmethod
+    def _cutoff_day(days: int) -> str:
+        return (datetime.now() - timedelta(days=days)).date().isoformat()
@@ -19,11 +19,15 @@ from src.sentinel.core.structure_analyzer import StructureAnalyzer
 from src.sentinel.core.anomaly_engine import AnomalyEngine
 from src.sentinel.core.run_history_store import RunHistoryStore
 from src.sentinel.core.alert_dispatcher import AlertDispatcher
+from src.sentinel.core.run_event_bus import RunEventBus, anomaly_summary
 from src.sentinel.core.models import (
     RunContext,
     PodHealthEvent,
     JobStatusEvent,
     TestEvent,
+    TestCaseRun,
+    TestStatus,
+    SuiteRun,
     StructureViolation
 )
 
@@ -68,10 +72,22 @@ class SentinelService:
         self.history_store = RunHistoryStore(self.config)
         self.alert_dispatcher = AlertDispatcher(self.config)
         
+        # Live deltas for streaming API subscribers
+        stream_config = self.config.get("event_stream", {})
+        self.event_bus = RunEventBus(
+            max_queue=stream_config.get("subscriber_queue_size", 1000),
+            replay_size=stream_config.get("replay_size", 1000)
+        )
+        
         # Service state
         self._running = False
         self._shutdown_event = threading.Event()
         
+        # Live runs are saved every progress interval (0 disables)
+        write_behind = self.config.get("database", {}).get("write_behind", {})
+        self._progress_interval = write_behind.get("progress_interval_seconds", 5)
+        self._progress_thread: Optional[threading.Thread] = None
+        
         # Wire up component callbacks
         self._wire_callbacks()
     
@@ -99,10 +115,21 @@ class SentinelService:
             return
         
         self.logger.info("Starting Automation Run Sentinel service...")
+        self._shutdown_event.clear()
         
         # Start K8s watcher
         self.k8s_watcher.start_watching()
         
+        # Seed structure baselines from the history rollups
+        self.structure_analyzer.load_baseline_from_history(self.history_store)
+        
+        # Periodically persist live runs
+        if self._progress_interval > 0:
+            self._progress_thread = threading.Thread(
+                target=self._progress_loop, name="sentinel-progress", daemon=True
+            )
+            self._progress_thread.start()
+        
         # Start log streaming (will be activated per-run)
         # self.log_streamer is ready but not actively streaming yet
         
@@ -123,7 +150,16 @@ class SentinelService:
         self.k8s_watcher.stop_watching()
         
         # Stop log streaming
-        # Log streams will stop when pods/jobs are deleted
+        self.log_streamer.stop()
+        
+        # Stop progress saves, then write everything still queued
+        if self._progress_thread is not None:
+            self._progress_thread.join(timeout=5)
+            self._progress_thread = None
+        self.history_store.stop()
+        
+        # Send queued alerts and open digests
+        self.alert_dispatcher.stop()
         
         self.logger.info("Sentinel service stopped")
     
@@ -184,6 +220,8 @@ class SentinelService:
         
         # Mark as running
         self.context_manager.mark_running(context.run_id)
+        self.history_store.save_progress(context)
+        self._publish_run(context)
         
         # Start streaming logs from job if available
         if context.k8s_job_name and context.k8s_namespace:
@@ -202,8 +240,18 @@ class SentinelService:
         for violation in violations:
             anomaly = self.anomaly_engine.detect_structure_violation(violation, context)
         
+        # Compare durations with the p95 of previous runs (before this run is rolled up)
+        baseline = self.history_store.get_baseline(context.pipeline, context.environment)
+        if baseline:
+            self.anomaly_engine.detect_duration_regression(
+                context,
+                baseline,
+                self.history_store.get_test_baselines(context.pipeline, context.environment)
+            )
+        
         # Save to history
         self.history_store.save_run(context)
+        self._publish_run(context)
         
         # Update baseline
         self.structure_analyzer.update_baseline(context)
@@ -213,6 +261,12 @@ class SentinelService:
         self.log_streamer.unregister_run(context.run_id)
         self.anomaly_engine.unregister_run(context.run_id)
     
+    def _progress_loop(self):
+        """Queue a progress save of every active run each interval."""
+        while not self._shutdown_event.wait(self._progress_interval):
+            for context in list(self.get_active_runs().values()):
+                self.history_store.save_progress(context)
+    
     def _on_pod_event(self, pod_event: PodHealthEvent, context: Optional[RunContext]):
         """Handle pod health event."""
         if not context:
@@ -224,6 +278,14 @@ class SentinelService:
         # Update context with pod information
         if pod_event.pod_name not in context.k8s_pod_names:
             context.k8s_pod_names.append(pod_event.pod_name)
+        
+        self.event_bus.publish(context.run_id, "pod", {
+            "pod_name": pod_event.pod_name,
+            "namespace": pod_event.namespace,
+            "phase": pod_event.phase,
+            "restarts": pod_event.restarts,
+            "reason": pod_event.reason
+        })
     
     def _on_job_event(self, job_event: JobStatusEvent, context: Optional[RunContext]):
         """Handle job status event."""
@@ -232,6 +294,15 @@ class SentinelService:
         
         # Detect anomalies
         anomaly = self.anomaly_engine.detect_job_anomaly(job_event, context)
+        
+        self.event_bus.publish(context.run_id, "job", {
+            "job_name": job_event.job_name,
+            "namespace": job_event.namespace,
+            "status": job_event.status,
+            "succeeded": job_event.succeeded,
+            "failed": job_event.failed,
+            "active": job_event.active
+        })
     
     def _on_test_event(self, test_event: TestEvent, context: RunContext):
         """Handle test event."""
@@ -239,9 +310,21 @@ class SentinelService:
         if test_event.test_name:
             test_id = f"{test_event.suite_name}:{test_event.test_name}" if test_event.suite_name else test_event.test_name
             
-            if test_id not in context.tests:
-                from src.sentinel.core.models import TestCaseRun, TestStatus
-                test_case = TestCaseRun(
+            # Update suite (first, so a new test is added to its suite's counters)
+            if test_event.suite_name:
+                suite = context.suites.get(test_event.suite_name)
+                if suite is None:
+                    context.add_suite(SuiteRun(
+                        suite_name=test_event.suite_name,
+                        run_id=context.run_id,
+                        start_time=test_event.timestamp if test_event.event_type == "SUITE_START" else None
+                    ))
+                elif test_event.event_type == "SUITE_END":
+                    suite.end_time = test_event.timestamp
+            
+            test_case = context.tests.get(test_id)
+            if test_case is None:
+                context.add_test(TestCaseRun(
                     test_id=test_id,
                     test_name=test_event.test_name,
                     suite_name=test_event.suite_name or "unknown",
@@ -249,39 +332,28 @@ class SentinelService:
                     status=test_event.status or TestStatus.PENDING,
                     start_time=test_event.timestamp if test_event.event_type == "TEST_START" else None,
                     end_time=test_event.timestamp if test_event.event_type in ["TEST_PASS", "TEST_FAIL", "TEST_SKIP"] else None
-                )
-                context.tests[test_id] = test_case
+                ))
             else:
-                test_case = context.tests[test_id]
                 if test_event.status:
-                    test_case.status = test_event.status
+                    context.set_test_status(test_id, test_event.status)
                 if test_event.event_type in ["TEST_PASS", "TEST_FAIL", "TEST_SKIP"]:
                     test_case.end_time = test_event.timestamp
                     if test_case.start_time:
                         test_case.duration_seconds = (test_event.timestamp - test_case.start_time).total_seconds()
+                    context.mark_test_dirty(test_id)
             
-            # Update suite
-            if test_event.suite_name:
-                if test_event.suite_name not in context.suites:
-                    from src.sentinel.core.models import SuiteRun
-                    suite = SuiteRun(
-                        suite_name=test_event.suite_name,
-                        run_id=context.run_id,
-                        start_time=test_event.timestamp if test_event.event_type == "SUITE_START" else None
-                    )
-                    context.suites[test_event.suite_name] = suite
-                else:
-                    suite = context.suites[test_event.suite_name]
-                    if test_event.event_type == "SUITE_END":
-                        suite.end_time = test_event.timestamp
-                    suite.test_ids.append(test_id)
-                    if test_case.status == TestStatus.PASSED:
-                        suite.passed_tests += 1
-                    elif test_case.status == TestStatus.FAILED:
-                        suite.failed_tests += 1
-                    elif test_case.status == TestStatus.SKIPPED:
-                        suite.skipped_tests += 1
-                    suite.total_tests += 1
+            test_case = context.tests[test_id]
+            self.event_bus.publish(context.run_id, "test", {
+                "event_type": test_event.event_type,
+                "test_id": test_id,
+                "test_name": test_case.test_name,
+                "suite_name": test_case.suite_name,
+                "status": test_case.status.value,
+                "total_tests": context.total_tests(),
+                "passed_tests": context.passed_tests(),
+                "failed_tests": context.failed_tests(),
+                "skipped_tests": context.skipped_tests()
+            })
         
         # Detect anomalies
         anomaly = self.anomaly_engine.detect_test_anomaly(test_event, context)
@@ -293,9 +365,23 @@ class SentinelService:
     
     def _on_anomaly(self, anomaly, context: RunContext):
         """Handle anomaly detection."""
+        self.event_bus.publish(context.run_id, "anomaly", anomaly_summary(anomaly))
+        
         # Dispatch alert
         self.alert_dispatcher.dispatch_anomaly(anomaly, context)
     
+    def _publish_run(self, context: RunContext):
+        """Publish a run status delta."""
+        self.event_bus.publish(context.run_id, "run", {
+            "status": context.status.value,
+            "pipeline": context.pipeline,
+            "environment": context.environment,
+            "start_time": context.start_time.isoformat() if context.start_time else None,
+            "end_time": context.end_time.isoformat() if context.end_time else None,
+            "total_tests": context.total_tests(),
+            "failed_tests": context.failed_tests()
+        })
+    
     def get_run(self, run_id: str) -> Optional[RunContext]:
         """Get a run context by ID."""
         return self.context_manager.get_context(run_id)
@@ -307,6 +393,14 @@ class SentinelService:
     def query_runs(self, **filters) -> list:
         """Query historical runs."""
         return self.history_store.query_runs(**filters)
+    
+    def query_runs_page(self, **filters) -> dict:
+        """Query one keyset page of historical runs ({"runs", "next_cursor"})."""
+        return self.history_store.query_runs_page(**filters)
+    
+    def history_version(self) -> int:
+        """Version of the run history (changes whenever a write commits)."""
+        return self.history_store.data_version
 
 
 
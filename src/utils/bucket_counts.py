@@ -0,0 +1,151 @@
+"""
+Bucket Counts
+=============
+
+Dense, mergeable count store for log-bucketed distributions.
+
+Both LatencyHistogram (HDR log-linear buckets) and QuantileSketch
+(DDSketch log-gamma buckets) map each value to an integer bucket key and only
+differ in that mapping. Everything after it - counting, exact merging,
+sparse serialization and finding the bucket that holds a given rank - lives
+here, so the two share one implementation.
+
+Counts are a NumPy int64 array addressed by ``key - offset`` that grows to
+cover the keys seen, so memory is proportional to the key range, not to the
+number of recorded values.
+
+Usage:
+    ```python
+    from src.utils.bucket_counts import BucketCounts
+
+    counts = BucketCounts()
+    counts.add(key)
+    counts.add_keys(np.array([...]))
+    counts.merge(other_counts)
+    key = counts.key_at_rank(rank)
+
+    restored = BucketCounts.from_dict(counts.to_dict())
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+from typing import Any, Dict, Iterator, Tuple
+
+import numpy as np
+
+
+class BucketCounts:
+    """Dense, growable bucket-count array addressed by integer bucket key."""
+
+    __slots__ = ("counts", "offset")
+
+    def __init__(self):
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.offset = 0  # Bucket key of counts[0]
+
+    @property
+    def total(self) -> int:
+        """Sum of all bucket counts."""
+        return int(self.counts.sum())
+
+    def _ensure(self, min_key: int, max_key: int) -> None:
+        if self.counts.size == 0:
+            self.offset = min_key
+            self.counts = np.zeros(max_key - min_key + 1, dtype=np.int64)
+            return
+
+        lo = min(min_key, self.offset)
+        hi = max(max_key, self.offset + self.counts.size - 1)
+        if lo == self.offset and hi == self.offset + self.counts.size - 1:
+            return
+
+        grown = np.zeros(hi - lo + 1, dtype=np.int64)
+        start = self.offset - lo
+        grown[start:start + self.counts.size] = self.counts
+        self.counts = grown
+        self.offset = lo
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def add(self, key: int, count: int = 1) -> None:
+        """Add count to one bucket (O(1) unless the key range grows)."""
+        if not (self.counts.size and self.offset <= key < self.offset + self.counts.size):
+            self._ensure(key, key)
+        self.counts[key - self.offset] += count
+
+    def add_keys(self, keys: np.ndarray) -> None:
+        """Add one to the bucket of every key in an int64 array."""
+        if keys.size == 0:
+            return
+        min_key, max_key = int(keys.min()), int(keys.max())
+        self._ensure(min_key, max_key)
+        self.counts[:max_key - self.offset + 1] += np.bincount(
+            keys - self.offset, minlength=max_key - self.offset + 1
+        )
+
+    def merge(self, other: 'BucketCounts') -> None:
+        """Add every bucket of another store into this one (exact)."""
+        if other.counts.size == 0:
+            return
+        self._ensure(other.offset, other.offset + other.counts.size - 1)
+        start = other.offset - self.offset
+        self.counts[start:start + other.counts.size] += other.counts
+
+    def clear(self) -> None:
+        """Drop all counts."""
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.offset = 0
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def key_at_rank(self, rank: float, descending: bool = False) -> int:
+        """
+        Key of the bucket holding the value at a 0-based rank.
+
+        Args:
+            rank: 0-based rank (fractional ranks fall in the next bucket)
+            descending: Walk from the largest key down instead of up
+
+        Returns:
+            Bucket key (the last non-empty bucket if rank >= total)
+        """
+        counts = self.counts[::-1] if descending else self.counts
+        cumulative = np.cumsum(counts)
+        idx = min(int(np.searchsorted(cumulative, rank, side='right')), counts.size - 1)
+        return self.offset + (counts.size - 1 - idx if descending else idx)
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        """(key, count) of every non-empty bucket in ascending key order."""
+        for idx in np.nonzero(self.counts)[0].tolist():
+            yield self.offset + idx, int(self.counts[idx])
+
+    # -------------------------------------------------------------------------
+    # Serialization
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the non-empty key range as offset + counts."""
+        nonzero = np.nonzero(self.counts)[0]
+        if nonzero.size == 0:
+            return {"offset": 0, "counts": []}
+        first, last = int(nonzero[0]), int(nonzero[-1])
+        return {
+            "offset": self.offset + first,
+            "counts": self.counts[first:last + 1].tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BucketCounts':
+        """Rebuild a store serialized with to_dict()."""
+        store = cls()
+        counts = data.get("counts") or []
+        if counts:
+            store.counts = np.asarray(counts, dtype=np.int64)
+            store.offset = int(data.get("offset", 0))
+        return store
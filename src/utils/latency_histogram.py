@@ -0,0 +1,334 @@
+"""
+Latency Histogram
+=================
+
+HDR-style latency histogram for load testing.
+
+Latencies are recorded as integer microseconds into log-linear buckets: each
+power-of-two range is split into ``sub_bucket_count`` linear sub-buckets, so
+every recorded value is kept to ``significant_figures`` decimal digits of
+precision (0.1% at the default of 3) over an unbounded range. Recording is
+O(1) and memory depends only on the number of distinct buckets hit, not on
+the number of values. Bucket counting, merging and rank lookup are shared
+with QuantileSketch through BucketCounts; only the value-to-bucket mapping
+differs.
+
+Histograms with the same precision merge exactly, so per-thread, per-worker
+or per-process histograms can be combined (e.g. after being serialized with
+``to_dict()``) without losing tail accuracy.
+
+Usage:
+    ```python
+    from src.utils.latency_histogram import LatencyHistogram, PhaseLatencyRecorder
+
+    hist = LatencyHistogram()
+    hist.record(12.5)              # milliseconds
+    p99 = hist.percentile(99)      # milliseconds
+
+    recorder = PhaseLatencyRecorder()
+    recorder.record("configure", 340.2)
+    recorder.merge(PhaseLatencyRecorder.from_dict(worker_payload))
+    recorder.percentiles("configure")   # {"p50": ..., "p99.99": ...}
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import math
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.utils.bucket_counts import BucketCounts
+
+# Percentiles exported into load test results
+DEFAULT_PERCENTILES: Tuple[float, ...] = (50, 75, 90, 95, 99, 99.9, 99.99)
+
+
+def percentile_label(p: float) -> str:
+    """Key used for a percentile in exported dicts (50 -> 'p50', 99.9 -> 'p99.9')."""
+    return f"p{p:g}"
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of latencies (recorded in milliseconds).
+
+    Attributes:
+        significant_figures: Decimal digits of precision kept per value (1-5)
+    """
+
+    def __init__(self, significant_figures: int = 3):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            significant_figures: Value precision in decimal digits (default 3 = 0.1%)
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+
+        self.significant_figures = significant_figures
+
+        largest_single_unit = 2 * 10 ** significant_figures
+        sub_bucket_count_magnitude = math.ceil(math.log2(largest_single_unit))
+        self._sub_bucket_half_count_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        self._sub_bucket_count = 1 << (self._sub_bucket_half_count_magnitude + 1)
+        self._sub_bucket_half_count = self._sub_bucket_count >> 1
+        self._sub_bucket_mask = self._sub_bucket_count - 1
+
+        self._counts = BucketCounts()
+        self._count = 0
+        self._sum_us = 0
+        self._min_us: Optional[int] = None
+        self._max_us: Optional[int] = None
+
+    # -------------------------------------------------------------------------
+    # Bucket math (values in integer microseconds)
+    # -------------------------------------------------------------------------
+
+    def _index_for(self, value_us: int) -> int:
+        bucket_index = (
+            (value_us | self._sub_bucket_mask).bit_length()
+            - self._sub_bucket_half_count_magnitude - 1
+        )
+        sub_bucket_index = value_us >> bucket_index
+        return (
+            ((bucket_index + 1) << self._sub_bucket_half_count_magnitude)
+            + sub_bucket_index - self._sub_bucket_half_count
+        )
+
+    def _bucket_range(self, index: int) -> Tuple[int, int]:
+        """Lowest and highest microsecond value that map to a counts index."""
+        bucket_index = (index >> self._sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self._sub_bucket_half_count
+            bucket_index = 0
+        lowest = sub_bucket_index << bucket_index
+        return lowest, lowest + (1 << bucket_index) - 1
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def record(self, value_ms: float, count: int = 1) -> None:
+        """
+        Record a latency (O(1)).
+
+        Args:
+            value_ms: Latency in milliseconds (negative values are clamped to 0,
+                      NaN is ignored)
+            count: Number of occurrences
+        """
+        if value_ms != value_ms:  # NaN
+            return
+
+        value_us = max(0, int(round(value_ms * 1000)))
+        index = self._index_for(value_us)
+        self._counts.add(index, count)
+
+        self._count += count
+        self._sum_us += value_us * count
+        if self._min_us is None or value_us < self._min_us:
+            self._min_us = value_us
+        if self._max_us is None or value_us > self._max_us:
+            self._max_us = value_us
+
+    def record_many(self, values_ms: Iterable[float]) -> None:
+        """Record several latencies."""
+        for value in values_ms:
+            self.record(value)
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """
+        Merge another histogram into this one (exact for equal precision).
+
+        Raises:
+            ValueError: If the histograms use different significant_figures
+        """
+        if other.significant_figures != self.significant_figures:
+            raise ValueError("Cannot merge histograms with different significant_figures")
+        if other._count == 0:
+            return
+
+        self._counts.merge(other._counts)
+
+        self._count += other._count
+        self._sum_us += other._sum_us
+        self._min_us = other._min_us if self._min_us is None else min(self._min_us, other._min_us)
+        self._max_us = other._max_us if self._max_us is None else max(self._max_us, other._max_us)
+
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        self._counts.clear()
+        self._count = 0
+        self._sum_us = 0
+        self._min_us = None
+        self._max_us = None
+
+    # -------------------------------------------------------------------------
+    # Queries (milliseconds)
+    # -------------------------------------------------------------------------
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """Mean latency (ms), 0.0 if empty."""
+        return self._sum_us / self._count / 1000 if self._count else 0.0
+
+    @property
+    def min(self) -> float:
+        """Minimum latency (ms), 0.0 if empty."""
+        return self._min_us / 1000 if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Maximum latency (ms), 0.0 if empty."""
+        return self._max_us / 1000 if self._count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """
+        Latency at percentile p.
+
+        Reports the highest value equivalent to the bucket holding the
+        ceil(p% * count)-th value (HDR convention), capped at the observed max.
+
+        Args:
+            p: Percentile in [0, 100] (e.g. 99.9)
+
+        Returns:
+            Latency in milliseconds (0.0 if empty)
+        """
+        if not 0 <= p <= 100:
+            raise ValueError("p must be in [0, 100]")
+        if self._count == 0:
+            return 0.0
+        if p == 0:
+            return self.min
+
+        target = max(1, math.ceil(p / 100 * self._count))
+        _, highest = self._bucket_range(self._counts.key_at_rank(target - 1))
+        return min(highest, self._max_us) / 1000
+
+    def percentiles(self, ps: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Several percentiles keyed by label ('p50', 'p99.9', ...)."""
+        return {percentile_label(p): self.percentile(p) for p in sorted(ps)}
+
+    def summary(self, ps: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Count, min/mean/max and percentiles (ms) as a flat dict."""
+        return {
+            "count": self._count,
+            "min": self.min,
+            "mean": self.mean,
+            "max": self.max,
+            **self.percentiles(ps),
+        }
+
+    # -------------------------------------------------------------------------
+    # Serialization
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict (sparse [index, count] pairs)."""
+        return {
+            "significant_figures": self.significant_figures,
+            "unit": "us",
+            "count": self._count,
+            "sum": self._sum_us,
+            "min": self._min_us,
+            "max": self._max_us,
+            "counts": [[index, count] for index, count in self._counts.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        """Rebuild a histogram serialized with to_dict()."""
+        hist = cls(significant_figures=int(data.get("significant_figures", 3)))
+        for index, count in data.get("counts", []):
+            hist._counts.add(int(index), int(count))
+        hist._count = int(data.get("count", 0))
+        hist._sum_us = int(data.get("sum", 0))
+        if hist._count:
+            hist._min_us = int(data["min"])
+            hist._max_us = int(data["max"])
+        return hist
+
+    def __repr__(self) -> str:
+        """String representation."""
+        if not self._count:
+            return "LatencyHistogram(empty)"
+        return (
+            f"LatencyHistogram(count={self._count}, p50={self.percentile(50):.1f}ms, "
+            f"p99={self.percentile(99):.1f}ms, max={self.max:.1f}ms)"
+        )
+
+
+class PhaseLatencyRecorder:
+    """
+    One LatencyHistogram per named phase (e.g. JobPhase values plus 'total').
+
+    Mergeable and serializable as a whole, so each worker can record locally
+    and the coordinator combines the results.
+    """
+
+    def __init__(self, significant_figures: int = 3):
+        self.significant_figures = significant_figures
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Histogram for a phase (created empty on first use)."""
+        hist = self._histograms.get(name)
+        if hist is None:
+            hist = LatencyHistogram(self.significant_figures)
+            self._histograms[name] = hist
+        return hist
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Phases that have a histogram."""
+        return tuple(self._histograms)
+
+    def record(self, name: str, value_ms: float) -> None:
+        """Record one latency for a phase."""
+        self.histogram(name).record(value_ms)
+
+    def percentiles(
+        self,
+        name: str,
+        ps: Iterable[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, float]:
+        """Percentiles for a phase (all 0.0 if nothing was recorded)."""
+        return self.histogram(name).percentiles(ps) if name in self._histograms else \
+            {percentile_label(p): 0.0 for p in ps}
+
+    def merge(self, other: 'PhaseLatencyRecorder') -> None:
+        """Merge every phase histogram of another recorder into this one."""
+        for name, hist in other._histograms.items():
+            self.histogram(name).merge(hist)
+
+    def summary(self, ps: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Dict[str, float]]:
+        """Per-phase count, min/mean/max and percentiles (ms)."""
+        ps = tuple(ps)
+        return {name: hist.summary(ps) for name, hist in self._histograms.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize all phase histograms."""
+        return {name: hist.to_dict() for name, hist in self._histograms.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PhaseLatencyRecorder':
+        """Rebuild a recorder serialized with to_dict()."""
+        recorder = cls()
+        for name, hist_data in data.items():
+            hist = LatencyHistogram.from_dict(hist_data)
+            recorder.significant_figures = hist.significant_figures
+            recorder._histograms[name] = hist
+        return recorder
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"PhaseLatencyRecorder(phases={list(self._histograms)})"
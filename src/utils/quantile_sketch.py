@@ -0,0 +1,271 @@
+"""
+Quantile Sketch
+===============
+
+Mergeable, log-bucketed quantile sketch (DDSketch style) with a fixed
+relative-error guarantee.
+
+Values are mapped to buckets ``ceil(log_gamma(|x|))`` where
+``gamma = (1 + a) / (1 - a)`` for relative accuracy ``a``; every quantile
+estimate is within ``a`` of the true value (relative). Positive and negative
+values use separate bucket stores and values with ``|x| < min_value`` go to a
+zero bucket, so memory is O(log(max/min) / a) regardless of how many values
+are recorded. Bucket counting, merging and rank lookup are shared with
+LatencyHistogram through BucketCounts.
+
+Recording is O(1) per value (``add``) or one vectorized NumPy pass per batch
+(``add_many``). Sketches with the same accuracy merge exactly, so per-worker
+or per-frame sketches can be combined without losing precision.
+
+Usage:
+    ```python
+    from src.utils.quantile_sketch import QuantileSketch
+
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    sketch.add(12.5)
+    sketch.add_many(np.array([...]))
+    p99 = sketch.quantile(0.99)
+
+    merged = QuantileSketch.from_dict(sketch.to_dict())
+    merged.merge(other_sketch)
+    ```
+
+Author: QA Automation Architect
+Date: 2026-10-16
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.utils.bucket_counts import BucketCounts
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch with relative-error guarantee.
+
+    Attributes:
+        relative_accuracy: Max relative error of quantile estimates
+        min_value: Magnitudes below this are counted in the zero bucket
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Relative accuracy a (0 < a < 1), default 1%
+            min_value: Smallest magnitude tracked distinctly from zero
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self._positive = BucketCounts()
+        self._negative = BucketCounts()
+        self._zero_count = 0
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """
+        Record a single value (O(1)).
+
+        Args:
+            value: Value to record (NaN/Inf are ignored, as in add_many)
+            count: Number of occurrences
+        """
+        if not math.isfinite(value):
+            return
+
+        if value > self.min_value:
+            self._positive.add(self._key(value), count)
+        elif value < -self.min_value:
+            self._negative.add(self._key(-value), count)
+        else:
+            self._zero_count += count
+
+        self._count += count
+        self._sum += value * count
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def add_many(self, values: Any) -> None:
+        """
+        Record many values with one vectorized pass.
+
+        Args:
+            values: Array-like of values (NaN/Inf are ignored)
+        """
+        arr = np.asarray(values, dtype=np.float64).ravel()
+        if arr.size == 0:
+            return
+        if not np.isfinite(arr).all():
+            arr = arr[np.isfinite(arr)]
+            if arr.size == 0:
+                return
+
+        pos = arr[arr > self.min_value]
+        neg = arr[arr < -self.min_value]
+        if pos.size:
+            self._positive.add_keys(np.ceil(np.log(pos) / self._log_gamma).astype(np.int64))
+        if neg.size:
+            self._negative.add_keys(np.ceil(np.log(-neg) / self._log_gamma).astype(np.int64))
+        self._zero_count += int(arr.size - pos.size - neg.size)
+
+        self._count += int(arr.size)
+        self._sum += float(arr.sum())
+        self._min = min(self._min, float(arr.min()))
+        self._max = max(self._max, float(arr.max()))
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Merge another sketch into this one (exact for equal accuracy).
+
+        Raises:
+            ValueError: If the sketches use different relative accuracy
+        """
+        if not math.isclose(self._gamma, other._gamma):
+            raise ValueError("Cannot merge sketches with different relative_accuracy")
+        if other._count == 0:
+            return
+
+        self._positive.merge(other._positive)
+        self._negative.merge(other._negative)
+        self._zero_count += other._zero_count
+        self._count += other._count
+        self._sum += other._sum
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Sum of recorded values."""
+        return self._sum
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Exact mean of recorded values (None if empty)."""
+        return self._sum / self._count if self._count else None
+
+    @property
+    def min(self) -> Optional[float]:
+        """Exact minimum (None if empty)."""
+        return self._min if self._count else None
+
+    @property
+    def max(self) -> Optional[float]:
+        """Exact maximum (None if empty)."""
+        return self._max if self._count else None
+
+    def _bucket_value(self, key: int) -> float:
+        # Midpoint (in relative terms) of bucket (gamma^(k-1), gamma^k]
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-quantile.
+
+        Args:
+            q: Quantile in [0, 1] (e.g. 0.99)
+
+        Returns:
+            Estimated value (within relative_accuracy), None if empty
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1]")
+        if self._count == 0:
+            return None
+        if q == 0:
+            return self._min
+        if q == 1:
+            return self._max
+
+        rank = q * (self._count - 1)
+
+        neg_total = self._negative.total
+        if rank < neg_total:
+            # Negative store: walk from most negative (largest key) upwards
+            value = -self._bucket_value(self._negative.key_at_rank(rank, descending=True))
+        elif rank < neg_total + self._zero_count:
+            value = 0.0
+        else:
+            key = self._positive.key_at_rank(rank - neg_total - self._zero_count)
+            value = self._bucket_value(key)
+
+        # Never report outside the observed range
+        return min(max(value, self._min), self._max)
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """Estimate several quantiles."""
+        return [self.quantile(q) for q in qs]
+
+    # -------------------------------------------------------------------------
+    # Serialization
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict (sparse bucket ranges only)."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "min_value": self.min_value,
+            "count": self._count,
+            "sum": self._sum,
+            "min": self.min,
+            "max": self.max,
+            "zero_count": self._zero_count,
+            "positive": self._positive.to_dict(),
+            "negative": self._negative.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QuantileSketch':
+        """Rebuild a sketch serialized with to_dict()."""
+        sketch = cls(
+            relative_accuracy=data["relative_accuracy"],
+            min_value=data.get("min_value", 1e-9),
+        )
+        sketch._positive = BucketCounts.from_dict(data.get("positive", {}))
+        sketch._negative = BucketCounts.from_dict(data.get("negative", {}))
+        sketch._zero_count = int(data.get("zero_count", 0))
+        sketch._count = int(data.get("count", 0))
+        sketch._sum = float(data.get("sum", 0.0))
+        if sketch._count:
+            sketch._min = float(data["min"])
+            sketch._max = float(data["max"])
+        return sketch
+
+    def __repr__(self) -> str:
+        """String representation."""
+        if not self._count:
+            return "QuantileSketch(empty)"
+        return (
+            f"QuantileSketch(count={self._count}, p50={self.quantile(0.5):.4g}, "
+            f"p99={self.quantile(0.99):.4g})"
+        )
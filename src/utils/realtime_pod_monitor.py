@@ -18,7 +18,7 @@ import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 from queue import Queue, Empty
 import paramiko
 
@@ -37,7 +37,8 @@ class PodLogMonitor:
         ssh_user: str,
         ssh_password: str,
         namespace: str = "panda",
-        log_dir: str = "logs/pod_logs"
+        log_dir: str = "logs/pod_logs",
+        cluster_snapshots: Optional[Any] = None
     ):
         """
         Initialize the pod log monitor.
@@ -48,11 +49,14 @@ class PodLogMonitor:
             ssh_password: SSH password
             namespace: Kubernetes namespace to monitor
             log_dir: Directory to save pod logs
+            cluster_snapshots: Shared ClusterSnapshotService used to discover
+                gRPC job pods (default: poll kubectl over SSH)
         """
         self.ssh_host = ssh_host
         self.ssh_user = ssh_user
         self.ssh_password = ssh_password
         self.namespace = namespace
+        self.cluster_snapshots = cluster_snapshots
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
@@ -231,21 +235,9 @@ class PodLogMonitor:
         
         while self.is_monitoring:
             try:
-                # Get all running gRPC job pods
-                cmd = f"kubectl get pods -n {self.namespace} --field-selector=status.phase=Running --no-headers | grep 'grpc-job-'"
-                stdin, stdout, stderr = self.ssh_client.exec_command(cmd)
-                output = stdout.read().decode().strip()
+                current_pods = self._running_grpc_job_pods()
                 
-                if output:
-                    current_pods = set()
-                    for line in output.split('\n'):
-                        parts = line.split()
-                        if len(parts) > 0:
-                            pod_name = parts[0]
-                            # Only monitor grpc-job-* pods, not cleanup-job-*
-                            if pod_name.startswith("grpc-job-") and not pod_name.startswith("grpc-job-cleanup"):
-                                current_pods.add(pod_name)
-                    
+                if current_pods:
                     # Start monitoring new pods
                     new_pods = current_pods - monitored_pods
                     for pod_name in new_pods:
@@ -270,6 +262,23 @@ class PodLogMonitor:
         
         self.logger.info("Stopped dynamic gRPC job monitoring")
     
+    def _running_grpc_job_pods(self) -> Set[str]:
+        """Names of the running gRPC job pods (not grpc-job-cleanup-*)."""
+        if self.cluster_snapshots is not None:
+            snapshot = self.cluster_snapshots.get()
+            pod_names = [pod["metadata"]["name"] for pod in snapshot.pods_with_prefix("grpc-job-", phase="Running")]
+        else:
+            cmd = f"kubectl get pods -n {self.namespace} --field-selector=status.phase=Running --no-headers | grep 'grpc-job-'"
+            stdin, stdout, stderr = self.ssh_client.exec_command(cmd)
+            output = stdout.read().decode().strip()
+            pod_names = [line.split()[0] for line in output.split('\n') if line.split()]
+        
+        # Only monitor grpc-job-* pods, not cleanup-job-*
+        return {
+            name for name in pod_names
+            if name.startswith("grpc-job-") and not name.startswith("grpc-job-cleanup")
+        }
+    
     def _monitor_single_grpc_pod(self, pod_name: str):
         """
         Monitor logs from a single gRPC job pod.